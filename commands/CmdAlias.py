@@ -1,6 +1,5 @@
 from evennia.commands.default.muxcommand import MuxCommand
-from evennia.utils.search import search_object
-from typeclasses.characters import Character
+from utils.character_index import CHARACTER_INDEX
 from utils.search_helpers import search_character
 
 class CmdAlias(MuxCommand):
@@ -39,6 +38,7 @@ class CmdAlias(MuxCommand):
         # Handle alias removal
         if "remove" in self.switches:
             self.caller.attributes.remove("alias")
+            CHARACTER_INDEX.update(self.caller)
             self.caller.msg("Your alias has been removed.")
             return
 
@@ -77,13 +77,12 @@ class CmdAlias(MuxCommand):
             return
 
         # Check if alias is already in use by a character name or alias
-        existing = search_object(new_alias, typeclass=Character)
-        for obj in existing:
-            if obj != self.caller and (obj.key.lower() == new_alias.lower() or 
-                                     obj.attributes.get("alias", "").lower() == new_alias.lower()):
-                self.caller.msg("That alias is already in use.")
-                return
+        existing = CHARACTER_INDEX.find(new_alias)
+        if existing and existing != self.caller:
+            self.caller.msg("That alias is already in use.")
+            return
 
         # Set the alias
         self.caller.attributes.add("alias", new_alias)
+        CHARACTER_INDEX.update(self.caller)
         self.caller.msg(f"Your alias has been set to: {new_alias}") 
\ No newline at end of file
@@ -54,17 +54,6 @@ class CmdHeal(Command):
 
         healing_type_full = {'b': 'bashing', 'l': 'lethal', 'a': 'aggravated'}[healing_type]
         
-        # Initialize health_level_bonuses if it doesn't exist
-        if not hasattr(target.db, 'health_level_bonuses') or target.db.health_level_bonuses is None:
-            target.db.health_level_bonuses = {
-                'bruised': 0,
-                'hurt': 0,
-                'injured': 0,
-                'wounded': 0,
-                'mauled': 0,
-                'crippled': 0
-            }
-        
         # Calculate total health levels including bonuses
         total_health = calculate_total_health_levels(target)
 
@@ -1,5 +1,7 @@
 from evennia.commands.default.muxcommand import MuxCommand
 from world.wod20th.models import Stat, STAT_TYPES
+from world.wod20th.utils.stat_catalog import STAT_CATALOG
+from world.wod20th.utils.stat_search import search_stats
 from world.wod20th.utils.shifter_utils import SHIFTER_IDENTITY_STATS, SHIFTER_RENOWN
 from world.wod20th.utils.stat_mappings import (STAT_TYPES, ARTS, REALMS, CATEGORIES, MAGE_SPHERES, UNIVERSAL_BACKGROUNDS,
                                                TRADITION_SUBFACTION, METHODOLOGIES, VAMPIRE_BACKGROUNDS,
@@ -27,7 +29,8 @@ class CmdInfo(MuxCommand):
       +info/shifter <shifter_type>
 
     Switches:
-      /search   - Search all abilities for a keyword
+      /search   - Search names, descriptions and systems for keywords,
+                  best matches first
       /type     - Show all entries of a specific type (gift, discipline, etc)
       /<splat>  - View only entries matching specified splat
       /shifter  - View gifts for a specific shifter type (garou, ananasi, etc)
@@ -244,15 +247,8 @@ class CmdInfo(MuxCommand):
         if input_str_lower in ['combo', 'combo discipline', 'combodiscipline']:
             input_str_lower = 'combodiscipline'
         
-        # Build query
-        query = Q(name__iexact=input_str_lower)
-        
-        # Add splat filter if specified
-        if only_splat:
-            query &= Q(splat__iexact=only_splat)
-            
-        # Try exact match first
-        result = Stat.objects.filter(query).first()
+        # Try exact match first, filtered by splat if specified
+        result = STAT_CATALOG.get(input_str_lower, splat=only_splat or None)
         if result:
             return result
             
@@ -560,55 +556,35 @@ class CmdInfo(MuxCommand):
         # Remove ignored categories
         valid_stat_types = [st for st in valid_stat_types if st not in self.ignore_categories]
         
-        # First try exact name match
-        exact_matches = Stat.objects.filter(
-            name__iexact=input_str,
-            stat_type__in=valid_stat_types
-        )
-        
-        if exact_matches.exists():
-            if len(exact_matches) == 1:
-                return self.show_subject(exact_matches[0])
-            matches = exact_matches
-        else:
-            # Try partial name match
-            name_matches = Stat.objects.filter(
-                name__icontains=input_str,
-                stat_type__in=valid_stat_types
-            )
-            
-            if name_matches.exists():
-                matches = name_matches
-            else:
-                # If no name matches, search by description
-                matches = Stat.objects.filter(
-                    description__icontains=input_str,
-                    stat_type__in=valid_stat_types
-                )
-                
-        if not matches.exists():
+        total, hits = search_stats(input_str, stat_types=valid_stat_types, limit=10)
+        if not hits:
             return self.caller.msg(f"No matches found containing the text '{input_str}'.")
+
+        # A single stat named exactly what was typed is shown in full
+        exact = [hit for hit in hits if hit.stat.name.lower() == input_str.lower()]
+        if len(exact) == 1:
+            return self.show_subject(exact[0].stat)
             
         string = self.format_header(f"+Info Search: {input_str}", width=78)
-        table = EvTable("|wName|n", "|wSplat|n", "|wType|n", "|wDescription|n", border="none")
+        table = EvTable("|wName|n", "|wSplat|n", "|wType|n", "|wMatch|n", border="none")
         table.reformat_column(0, width=25, align="l")
         table.reformat_column(1, width=15, align="l")
         table.reformat_column(2, width=15, align="l")
         table.reformat_column(3, width=23, align="l")
         
-        for result in matches[:10]:
-            desc = result.description[:30] + "..." if result.description and len(result.description) > 20 else ""
+        for hit in hits:
+            result = hit.stat
             table.add_row(
                 result.name,
                 result.splat or "Any",
                 result.stat_type.title(),
-                desc
+                hit.snippet
             )
             
         string += ANSIString(table)
-        matches_string = f"\r\n    Found |w{len(matches)}|n matches"
-        if len(matches) > 10:
-            matches_string += " (showing first 10)"
+        matches_string = f"\r\n    Found |w{total}|n matches"
+        if total > len(hits):
+            matches_string += f" (showing best {len(hits)})"
         string += matches_string + "\r\n"
         string += self.format_footer(width=78)
         self.caller.msg(string)
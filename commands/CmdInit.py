@@ -2,7 +2,9 @@ from evennia import default_cmds
 from evennia.utils.ansi import ANSIString
 from world.wod20th.models import Stat
 from world.wod20th.utils.dice_rolls import roll_dice
+from world.wod20th.utils.dice_engine import DICE
 from commands.CmdNPC import NameGenerator
+from world.wod20th.utils.npc_stats import NPC_STATS, room_npcs
 from world.wod20th.data.npc.random_stat import get_random_npc_stats, format_npc_stats_display
 import random
 from evennia import create_object, search_object
@@ -220,8 +222,9 @@ class CmdInit(default_cmds.MuxCommand):
         npc.set_as_temporary(self.caller)
         
         # If we have a modifier, set it in the room's NPC data
-        if hasattr(self.caller.location, "db_npcs") and full_name in self.caller.location.db_npcs:
-            self.caller.location.db_npcs[full_name]["modifier"] = modifier
+        roster = room_npcs(self.caller.location)
+        if full_name in roster:
+            roster[full_name]["modifier"] = modifier
         
         # NPC should already be registered in the room by the typeclass
         # Let's make sure it's in the initiative order
@@ -253,7 +256,7 @@ class CmdInit(default_cmds.MuxCommand):
         if not npc or not viewer:
             return
             
-        stats = npc.db.stats
+        stats = NPC_STATS.stats(npc)
         
         # Basic info
         viewer.msg(f"|c== {npc.key}'s Stats ({stats.get('splat', 'unknown').title()}, {stats.get('difficulty', 'MEDIUM')}) ==|n")
@@ -324,6 +327,10 @@ class CmdInit(default_cmds.MuxCommand):
         # Calculate and store initiatives
         initiatives = []
         
+        # Draw every d10 for this round at once
+        npcs = room_npcs(location)
+        d10s = iter(DICE.draw(len(characters) + len(npcs)))
+
         # Roll for PCs
         for char in characters:
             # Get Wits and Dexterity values
@@ -331,7 +338,7 @@ class CmdInit(default_cmds.MuxCommand):
             dexterity = self.get_stat_value(char, "Dexterity")
             
             # Roll 1d10
-            roll = random.randint(1, 10)
+            roll = next(d10s)
             
             # Calculate total initiative
             total = roll + wits + dexterity
@@ -339,31 +346,23 @@ class CmdInit(default_cmds.MuxCommand):
             initiatives.append((char.name, total, roll, wits, dexterity))
 
         # Roll for NPCs
-        if hasattr(location, "db_npcs"):
-            for name, npc_data in location.db_npcs.items():
-                roll = random.randint(1, 10)
-                modifier = npc_data.get("modifier", 0)
-                total = roll + modifier
-                
-                # See if we can get wits and dex from stats
-                wits = 0
-                dex = 0
-                if "stats" in npc_data and "attributes" in npc_data["stats"]:
-                    stats = npc_data["stats"]
-                    if "mental" in stats["attributes"] and "wits" in stats["attributes"]["mental"]:
-                        wits = stats["attributes"]["mental"]["wits"]
-                    if "physical" in stats["attributes"] and "dexterity" in stats["attributes"]["physical"]:
-                        dex = stats["attributes"]["physical"]["dexterity"]
-                    
-                    # If we have stats, use them to calculate initiative
-                    if wits > 0 or dex > 0:
-                        total = roll + wits + dex
-                
-                # Store NPC ID and number to use in display
-                npc_id = npc_data.get("npc_id", "")
-                npc_number = npc_data.get("number", "")
+        for name, npc_data in npcs.items():
+            roll = next(d10s)
+            modifier = npc_data.get("modifier", 0)
+            total = roll + modifier
+            
+            # See if we can get wits and dex from stats
+            wits, dex = self.npc_wits_dex(npc_data)
+            
+            # If we have stats, use them to calculate initiative
+            if wits > 0 or dex > 0:
+                total = roll + wits + dex
                 
-                initiatives.append((name, total, roll, modifier, 0, npc_id, npc_number))  # Add ID and number
+            # Store NPC ID and number to use in display
+            npc_id = npc_data.get("npc_id", "")
+            npc_number = npc_data.get("number", "")
+            
+            initiatives.append((name, total, roll, modifier, 0, npc_id, npc_number))  # Add ID and number
 
         # Sort initiatives from highest to lowest
         initiatives.sort(key=lambda x: x[1], reverse=True)
@@ -413,9 +412,10 @@ class CmdInit(default_cmds.MuxCommand):
         npc.set_as_temporary(self.caller)
 
         # Make sure the NPC is registered in the room
-        if hasattr(self.caller.location, "db_npcs") and name in self.caller.location.db_npcs:
+        roster = room_npcs(self.caller.location)
+        if name in roster:
             # Set initiative modifier
-            self.caller.location.db_npcs[name]["modifier"] = modifier
+            roster[name]["modifier"] = modifier
         
         # Get NPC info for display
         npc_number = npc.db.npc_number
@@ -499,13 +499,13 @@ class CmdInit(default_cmds.MuxCommand):
         Returns:
             tuple: (npc_object, npc_name)
         """
-        if not self.caller.location or not hasattr(self.caller.location, "db_npcs"):
+        if not self.caller.location:
             return None, None
             
         # Check if using UUID format
         if identifier.startswith("&"):
             uuid_prefix = identifier[1:].lower()
-            for npc_name, npc_data in self.caller.location.db_npcs.items():
+            for npc_name, npc_data in room_npcs(self.caller.location).items():
                 if "npc_id" in npc_data and npc_data["npc_id"].lower().startswith(uuid_prefix):
                     npc_obj = npc_data.get("npc_object")
                     return npc_obj, npc_name
@@ -514,7 +514,7 @@ class CmdInit(default_cmds.MuxCommand):
         elif identifier.startswith("#"):
             try:
                 npc_number = int(identifier[1:])
-                for npc_name, npc_data in self.caller.location.db_npcs.items():
+                for npc_name, npc_data in room_npcs(self.caller.location).items():
                     if npc_data.get("number") == npc_number:
                         npc_obj = npc_data.get("npc_object")
                         return npc_obj, npc_name
@@ -522,17 +522,17 @@ class CmdInit(default_cmds.MuxCommand):
                 pass
                 
         # Check for exact name match
-        if identifier in self.caller.location.db_npcs:
-            npc_obj = self.caller.location.db_npcs[identifier].get("npc_object")
+        if identifier in room_npcs(self.caller.location):
+            npc_obj = room_npcs(self.caller.location)[identifier].get("npc_object")
             return npc_obj, identifier
         
         # Try partial name matching
-        matched_npcs = [npc for npc in self.caller.location.db_npcs.keys() 
+        matched_npcs = [npc for npc in room_npcs(self.caller.location).keys() 
                         if identifier.lower() in npc.lower()]
         
         if len(matched_npcs) == 1:
             npc_name = matched_npcs[0]
-            npc_obj = self.caller.location.db_npcs[npc_name].get("npc_object")
+            npc_obj = room_npcs(self.caller.location)[npc_name].get("npc_object")
             return npc_obj, npc_name
             
         return None, None
@@ -553,32 +553,32 @@ class CmdInit(default_cmds.MuxCommand):
                 self.caller.msg(f"No NPC with identifier '{identifier}' found in this scene.")
             else:
                 # If multiple matches might exist, check and inform
-                if hasattr(self.caller.location, "db_npcs"):
-                    matched_npcs = [npc for npc in self.caller.location.db_npcs.keys() 
-                                  if identifier.lower() in npc.lower()]
-                    
-                    if len(matched_npcs) > 1:
-                        matches = []
-                        for name in matched_npcs:
-                            data = self.caller.location.db_npcs[name]
-                            num = data.get("number", "?")
-                            npc_id = data.get("npc_id", "")
-                            if npc_id:
-                                npc_id = npc_id[:8]
-                                matches.append(f"{name} (#{num}, &{npc_id})")
-                            else:
-                                matches.append(f"{name} (#{num})")
-                                
-                        self.caller.msg(f"Multiple NPCs match '{identifier}'. Please be more specific or use #ID: " +
-                                      ", ".join(matches))
-                        return
+                roster = room_npcs(self.caller.location)
+                matched_npcs = [npc for npc in roster.keys() 
+                              if identifier.lower() in npc.lower()]
+                
+                if len(matched_npcs) > 1:
+                    matches = []
+                    for name in matched_npcs:
+                        data = roster[name]
+                        num = data.get("number", "?")
+                        npc_id = data.get("npc_id", "")
+                        if npc_id:
+                            npc_id = npc_id[:8]
+                            matches.append(f"{name} (#{num}, &{npc_id})")
+                        else:
+                            matches.append(f"{name} (#{num})")
+                            
+                    self.caller.msg(f"Multiple NPCs match '{identifier}'. Please be more specific or use #ID: " +
+                                  ", ".join(matches))
+                    return
                 
                 self.caller.msg(f"No NPC named '{identifier}' found in the initiative order.")
             return
 
         # Get display info
-        npc_number = self.caller.location.db_npcs[npc_name].get("number", "")
-        npc_id = self.caller.location.db_npcs[npc_name].get("npc_id", "")
+        npc_number = room_npcs(self.caller.location)[npc_name].get("number", "")
+        npc_id = room_npcs(self.caller.location)[npc_name].get("npc_id", "")
         id_display = ""
         
         if npc_id:
@@ -605,13 +605,13 @@ class CmdInit(default_cmds.MuxCommand):
 
     def clear_npcs(self):
         """Clear all NPCs from the initiative order."""
-        if not hasattr(self.caller.location, "db_npcs"):
+        if not room_npcs(self.caller.location):
             self.caller.msg("No NPCs in the initiative order.")
             return
 
         # Delete all NPC objects
         npc_count = 0
-        for npc_name, npc_data in list(self.caller.location.db_npcs.items()):
+        for npc_name, npc_data in list(room_npcs(self.caller.location).items()):
             if "npc_object" in npc_data:
                 npc_obj = npc_data["npc_object"]
                 if npc_obj:
@@ -635,13 +635,17 @@ class CmdInit(default_cmds.MuxCommand):
         location = self.caller.location
         characters = [obj for obj in location.contents if obj.has_account]
         
-        if not characters and (not hasattr(location, "db_npcs") or not location.db_npcs):
+        if not characters and not room_npcs(location):
             self.caller.msg("There are no characters or NPCs in this scene.")
             return
 
         # Calculate and store initiatives
         initiatives = []
         
+        # Draw every d10 for this round at once
+        npcs = room_npcs(location)
+        d10s = iter(DICE.draw(len(characters) + len(npcs)))
+
         # Roll for PCs
         for char in characters:
             # Get Wits and Dexterity values
@@ -649,7 +653,7 @@ class CmdInit(default_cmds.MuxCommand):
             dexterity = self.get_stat_value(char, "Dexterity")
             
             # Roll 1d10
-            roll = random.randint(1, 10)
+            roll = next(d10s)
             
             # Calculate total initiative
             total = roll + wits + dexterity
@@ -657,34 +661,21 @@ class CmdInit(default_cmds.MuxCommand):
             initiatives.append((char.name, total, roll, wits, dexterity))
 
         # Roll for NPCs
-        if hasattr(location, "db_npcs"):
-            for name, npc_data in location.db_npcs.items():
-                roll = random.randint(1, 10)
-                modifier = npc_data.get("modifier", 0)
-                total = roll + modifier
-                
-                # Check if we have stats to use instead of just the modifier
-                if "stats" in npc_data and "attributes" in npc_data["stats"]:
-                    stats = npc_data["stats"]
-                    if "mental" in stats["attributes"] and "wits" in stats["attributes"]["mental"]:
-                        wits = stats["attributes"]["mental"]["wits"]
-                    else:
-                        wits = 0
-                        
-                    if "physical" in stats["attributes"] and "dexterity" in stats["attributes"]["physical"]:
-                        dex = stats["attributes"]["physical"]["dexterity"]
-                    else:
-                        dex = 0
-                    
-                    # If we have stats, use them to calculate initiative
-                    if wits > 0 or dex > 0:
-                        total = roll + wits + dex
-                
-                # Store NPC ID and number to use in display
-                npc_id = npc_data.get("npc_id", "")
-                npc_number = npc_data.get("number", "")
+        for name, npc_data in npcs.items():
+            roll = next(d10s)
+            modifier = npc_data.get("modifier", 0)
+            total = roll + modifier
+            
+            # Check if we have stats to use instead of just the modifier
+            wits, dex = self.npc_wits_dex(npc_data)
+            if wits > 0 or dex > 0:
+                total = roll + wits + dex
                 
-                initiatives.append((name, total, roll, modifier, 0, npc_id, npc_number))  # Add ID and number
+            # Store NPC ID and number to use in display
+            npc_id = npc_data.get("npc_id", "")
+            npc_number = npc_data.get("number", "")
+            
+            initiatives.append((name, total, roll, modifier, 0, npc_id, npc_number))  # Add ID and number
 
         # Sort initiatives from highest to lowest
         initiatives.sort(key=lambda x: x[1], reverse=True)
@@ -719,8 +710,8 @@ class CmdInit(default_cmds.MuxCommand):
             roll = entry[2]
             
             # Check if it's an NPC
-            if hasattr(self.caller.location, "db_npcs") and char_name in self.caller.location.db_npcs:
-                npc_data = self.caller.location.db_npcs[char_name]
+            npc_data = room_npcs(self.caller.location).get(char_name)
+            if npc_data:
                 modifier = entry[3]
                 npc_number = npc_data.get("number", "")
                 npc_id = npc_data.get("npc_id", "")
@@ -730,24 +721,14 @@ class CmdInit(default_cmds.MuxCommand):
                 number_display = f" (#{npc_number}{id_display})" if npc_number else ""
                 
                 # Get splat type
-                splat_type = npc_data.get("stats", {}).get("splat", "mortal").title()
+                npc = npc_data.get("npc_object")
+                splat_type = (NPC_STATS.stats(npc).get("splat") if npc else None) or "mortal"
+                splat_type = splat_type.title()
                 
                 # Check if we have stats to use
-                if "stats" in npc_data and "attributes" in npc_data["stats"]:
-                    stats = npc_data["stats"]
-                    wits = 0
-                    dex = 0
-                    
-                    if "mental" in stats["attributes"] and "wits" in stats["attributes"]["mental"]:
-                        wits = stats["attributes"]["mental"]["wits"]
-                    
-                    if "physical" in stats["attributes"] and "dexterity" in stats["attributes"]["physical"]:
-                        dex = stats["attributes"]["physical"]["dexterity"]
-                    
-                    if wits > 0 or dex > 0:
-                        mod_display = f"Wits: {wits} + Dex: {dex}"
-                    else:
-                        mod_display = f"Modifier: {modifier}"
+                wits, dex = self.npc_wits_dex(npc_data)
+                if wits > 0 or dex > 0:
+                    mod_display = f"Wits: {wits} + Dex: {dex}"
                 else:
                     mod_display = f"Modifier: {modifier}"
                 
@@ -770,6 +751,14 @@ class CmdInit(default_cmds.MuxCommand):
         result.append(header)
         self.caller.location.msg_contents("\n".join(result))
 
+    def npc_wits_dex(self, npc_data):
+        """Return (wits, dexterity) from a roster NPC's stat block, 0 if missing."""
+        npc = npc_data.get("npc_object")
+        attributes = NPC_STATS.stats(npc).get("attributes", {}) if npc else {}
+        wits = attributes.get("mental", {}).get("wits", 0)
+        dex = attributes.get("physical", {}).get("dexterity", 0)
+        return wits, dex
+
     def get_stat_value(self, character, stat_name):
         """Get the value of a stat for a character."""
         try:
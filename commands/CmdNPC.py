@@ -1,8 +1,10 @@
 from evennia import default_cmds
 from evennia.utils.ansi import ANSIString
 from world.wod20th.utils.dice_rolls import roll_dice, interpret_roll_results
+from world.wod20th.utils.npc_stats import NPC_STATS, health_status, room_npcs, roster_object
 import random
 import os
+import time
 import json
 import re
 
@@ -179,6 +181,7 @@ class CmdNPC(default_cmds.MuxCommand):
       +npc/listall/splat                              - Group NPCs by splat type
       +npc/listall/temp                               - Show only temporary NPCs
       +npc/listall/perm                               - Show only permanent NPCs
+      +npc/expiring                                   - List temporary NPCs by expiry (staff only)
       +npc/remove <name or #n>                        - Remove an NPC from the scene (staff only)
       +npc/remove/force <name or #n>                  - Force-remove a stubborn NPC (staff only)
       +npc/create [name] [splat=<type>] [diff=<level>] - Create a permanent NPC (staff only)
@@ -238,6 +241,15 @@ class CmdNPC(default_cmds.MuxCommand):
                 return
             self.list_all_npcs()
             return
+
+        if "expiring" in self.switches:
+            if not (self.caller.check_permstring("Builder") or 
+                    self.caller.check_permstring("Admin") or 
+                    self.caller.check_permstring("Storyteller")):
+                self.caller.msg("You don't have permission to list expiring NPCs.")
+                return
+            self.list_expiring_npcs()
+            return
             
         if "nationalities" in self.switches:
             self.caller.msg(f"Available nationalities: {NameGenerator.list_nationalities()}")
@@ -304,14 +316,14 @@ class CmdNPC(default_cmds.MuxCommand):
         Resolve an NPC name from either a numeric ID (#1) or partial name match.
         Returns the full NPC name if found, or None if not found.
         """
-        if not hasattr(self.caller.location, "db_npcs") or not self.caller.location.db_npcs:
+        if not room_npcs(self.caller.location):
             return None
             
         # Check if using numeric ID
         if name.startswith("#"):
             try:
                 npc_number = int(name[1:])
-                for npc_name, data in self.caller.location.db_npcs.items():
+                for npc_name, data in room_npcs(self.caller.location).items():
                     if data.get("number") == npc_number:
                         return npc_name
                 return None
@@ -320,11 +332,11 @@ class CmdNPC(default_cmds.MuxCommand):
                 return None
                 
         # Check for exact match
-        if name in self.caller.location.db_npcs:
+        if name in room_npcs(self.caller.location):
             return name
             
         # Try partial name matching
-        matched_npcs = [npc for npc in self.caller.location.db_npcs.keys() 
+        matched_npcs = [npc for npc in room_npcs(self.caller.location).keys() 
                       if name.lower() in npc.lower()]
         
         if len(matched_npcs) == 1:
@@ -332,7 +344,7 @@ class CmdNPC(default_cmds.MuxCommand):
         elif len(matched_npcs) > 1:
             # Multiple matches - return None but inform the user
             self.caller.msg(f"Multiple NPCs match '{name}'. Please be more specific or use #ID: " +
-                          ", ".join([f"{npc} (#{self.caller.location.db_npcs[npc].get('number', '?')})" 
+                          ", ".join([f"{npc} (#{room_npcs(self.caller.location)[npc].get('number', '?')})" 
                                    for npc in matched_npcs]))
             return None
             
@@ -430,12 +442,14 @@ class CmdNPC(default_cmds.MuxCommand):
             old_name = resolved_name
             
             # Preserve NPC number
-            old_number = self.caller.location.db_npcs[old_name].get("number", 0)
+            old_number = room_npcs(self.caller.location)[old_name].get("number", 0)
             
-            # Create a new entry with the generated name and copy the old data
-            npc_data = self.caller.location.db_npcs[old_name].copy()
-            del self.caller.location.db_npcs[old_name]
-            self.caller.location.db_npcs[new_full_name] = npc_data
+            # Rename the NPC and move its roster entry to the new name
+            roster = room_npcs(self.caller.location)
+            npc_data = roster.pop(old_name)
+            roster[new_full_name] = npc_data
+            if npc_data.get("npc_object"):
+                npc_data["npc_object"].key = new_full_name
             
             # Inform about the name change
             first_nat_display = first_nat_used.replace("_", " ").title()
@@ -478,14 +492,13 @@ class CmdNPC(default_cmds.MuxCommand):
 
     def list_npcs(self):
         """List all NPCs in the scene."""
-        if not hasattr(self.caller.location, "db_npcs") or not self.caller.location.db_npcs:
+        if not room_npcs(self.caller.location):
             self.caller.msg("No NPCs in this scene.")
             return
 
         result = ["|wNPCs in Scene:|n"]
-        for name, data in self.caller.location.db_npcs.items():
-            health = data["health"]
-            health_status = self.get_health_status(health)
+        for name, data in room_npcs(self.caller.location).items():
+            health_status = self.get_health_status(NPC_STATS.health(data["npc_object"]))
             npc_number = data.get("number", "")
             
             if npc_number:
@@ -525,7 +538,7 @@ class CmdNPC(default_cmds.MuxCommand):
             return
 
         # Get NPC number for display
-        npc_number = self.caller.location.db_npcs[name].get("number", "")
+        npc_number = room_npcs(self.caller.location)[name].get("number", "")
         npc_display = f"{name} (#{npc_number})" if npc_number else name
 
         # Perform the roll
@@ -583,15 +596,14 @@ class CmdNPC(default_cmds.MuxCommand):
             return
 
         # Apply damage to the NPC
-        health = self.caller.location.db_npcs[name]["health"]
-        health[damage_type] += amount
-        self.caller.location.db_npcs[name]["health"] = health
+        npc = roster_object(self.caller.location, name)
+        health = NPC_STATS.change_health(npc, damage_type, amount)
 
         # Get updated health status
         health_status = self.get_health_status(health)
         
         # Get NPC number for display
-        npc_number = self.caller.location.db_npcs[name].get("number", "")
+        npc_number = room_npcs(self.caller.location)[name].get("number", "")
         npc_display = f"{name} (#{npc_number})" if npc_number else name
 
         # Inform about damage
@@ -600,7 +612,7 @@ class CmdNPC(default_cmds.MuxCommand):
         )
 
         # Check if the NPC should be deleted (incapacitated)
-        if health_status == "Incapacitated" and self.caller.location.db_npcs[name].get("is_temporary", False):
+        if health_status == "Incapacitated" and npc.db.is_temporary:
             # Schedule NPC for removal after a delay
             import time
             from evennia.utils.utils import delay
@@ -609,12 +621,12 @@ class CmdNPC(default_cmds.MuxCommand):
     def remove_incapacitated_npc(self, name):
         """Remove an incapacitated NPC from the scene."""
         # Check if the NPC still exists
-        if not hasattr(self.caller.location, "db_npcs") or name not in self.caller.location.db_npcs:
+        npc = roster_object(self.caller.location, name)
+        if not npc:
             return
             
         # Check if still incapacitated
-        health = self.caller.location.db_npcs[name]["health"]
-        health_status = self.get_health_status(health)
+        health_status = self.get_health_status(NPC_STATS.health(npc))
         
         if health_status == "Incapacitated":
             # Inform about departure
@@ -623,7 +635,7 @@ class CmdNPC(default_cmds.MuxCommand):
             )
             
             # Remove from NPC list
-            del self.caller.location.db_npcs[name]
+            npc.unregister_from_room(self.caller.location)
             
             # If using initiative, also remove from initiative
             if hasattr(self.caller.location, "db_initiative") and self.caller.location.db_initiative:
@@ -660,15 +672,13 @@ class CmdNPC(default_cmds.MuxCommand):
             return
 
         # Apply healing to the NPC
-        health = self.caller.location.db_npcs[name]["health"]
-        health[damage_type] = max(0, health[damage_type] - amount)
-        self.caller.location.db_npcs[name]["health"] = health
+        health = NPC_STATS.change_health(roster_object(self.caller.location, name), damage_type, -amount)
 
         # Get updated health status
         health_status = self.get_health_status(health)
         
         # Get NPC number for display
-        npc_number = self.caller.location.db_npcs[name].get("number", "")
+        npc_number = room_npcs(self.caller.location)[name].get("number", "")
         npc_display = f"{name} (#{npc_number})" if npc_number else name
 
         # Inform about healing
@@ -678,7 +688,7 @@ class CmdNPC(default_cmds.MuxCommand):
 
     def show_health(self, name):
         """Show an NPC's health status."""
-        health = self.caller.location.db_npcs[name]["health"]
+        health = NPC_STATS.health(roster_object(self.caller.location, name))
         health_status = self.get_health_status(health)
         
         # Format the health display
@@ -687,7 +697,7 @@ class CmdNPC(default_cmds.MuxCommand):
         aggravated = health["aggravated"]
         
         # Get NPC number for display
-        npc_number = self.caller.location.db_npcs[name].get("number", "")
+        npc_number = room_npcs(self.caller.location)[name].get("number", "")
         npc_display = f"{name} (#{npc_number})" if npc_number else name
         
         self.caller.msg(f"|w{npc_display}|n Health Status: {health_status}")
@@ -695,24 +705,7 @@ class CmdNPC(default_cmds.MuxCommand):
 
     def get_health_status(self, health):
         """Calculate health status from damage levels."""
-        total_damage = health["bashing"] + health["lethal"] + health["aggravated"]
-        
-        if total_damage == 0:
-            return "Healthy"
-        elif total_damage <= 1:
-            return "Bruised"
-        elif total_damage <= 2:
-            return "Hurt"
-        elif total_damage <= 3:
-            return "Injured"
-        elif total_damage <= 4:
-            return "Wounded"
-        elif total_damage <= 5:
-            return "Mauled"
-        elif total_damage <= 6:
-            return "Crippled"
-        else:
-            return "Incapacitated"
+        return health_status(health)
 
     def pose_npc(self, name, pose_text):
         """Make an NPC pose an action."""
@@ -721,7 +714,7 @@ class CmdNPC(default_cmds.MuxCommand):
             return
             
         # Get NPC number for display
-        npc_number = self.caller.location.db_npcs[name].get("number", "")
+        npc_number = room_npcs(self.caller.location)[name].get("number", "")
         npc_display = f"{name} (#{npc_number})" if npc_number else name
         
         # Check if this NPC can be controlled by the caller
@@ -762,7 +755,7 @@ class CmdNPC(default_cmds.MuxCommand):
             return
             
         # Get NPC number for display
-        npc_number = self.caller.location.db_npcs[name].get("number", "")
+        npc_number = room_npcs(self.caller.location)[name].get("number", "")
         npc_display = f"{name} (#{npc_number})" if npc_number else name
         
         # Check if this NPC can be controlled by the caller
@@ -788,7 +781,7 @@ class CmdNPC(default_cmds.MuxCommand):
             return
             
         # Get NPC number for display
-        npc_number = self.caller.location.db_npcs[name].get("number", "")
+        npc_number = room_npcs(self.caller.location)[name].get("number", "")
         npc_display = f"{name} (#{npc_number})" if npc_number else name
         
         # Check if this NPC can be controlled by the caller
@@ -830,7 +823,7 @@ class CmdNPC(default_cmds.MuxCommand):
             return
             
         # Get the NPC's data
-        npc_data = self.caller.location.db_npcs.get(name)
+        npc_data = room_npcs(self.caller.location).get(name)
         if not npc_data:
             self.caller.msg(f"Could not find NPC '{name}' in this room.")
             return
@@ -842,7 +835,7 @@ class CmdNPC(default_cmds.MuxCommand):
             
         # Set the character as the controller
         npc_data["inhabited_by"] = self.caller.key
-        self.caller.location.db_npcs[name] = npc_data
+        room_npcs(self.caller.location)[name] = npc_data
         
         # Get NPC number for display
         npc_number = npc_data.get("number", "")
@@ -854,7 +847,7 @@ class CmdNPC(default_cmds.MuxCommand):
     def uninhabit_npc(self, name):
         """Release control of an NPC."""
         # Get the NPC's data
-        npc_data = self.caller.location.db_npcs.get(name)
+        npc_data = room_npcs(self.caller.location).get(name)
         if not npc_data:
             self.caller.msg(f"Could not find NPC '{name}' in this room.")
             return
@@ -869,7 +862,7 @@ class CmdNPC(default_cmds.MuxCommand):
                 
         # Release control
         npc_data["inhabited_by"] = None
-        self.caller.location.db_npcs[name] = npc_data
+        room_npcs(self.caller.location)[name] = npc_data
         
         # Get NPC number for display
         npc_number = npc_data.get("number", "")
@@ -886,7 +879,7 @@ class CmdNPC(default_cmds.MuxCommand):
             return True
             
         # Get NPC data
-        npc_data = self.caller.location.db_npcs.get(name)
+        npc_data = room_npcs(self.caller.location).get(name)
         if not npc_data:
             return False
             
@@ -895,7 +888,8 @@ class CmdNPC(default_cmds.MuxCommand):
             return True
             
         # Check if a temporary NPC created by this player
-        if npc_data.get("is_temporary", False) and npc_data.get("creator") == self.caller.key:
+        npc = npc_data.get("npc_object")
+        if npc and npc.db.is_temporary and npc.db.creator == self.caller:
             return True
             
         return False
@@ -919,19 +913,15 @@ class CmdNPC(default_cmds.MuxCommand):
             return
             
         # Get the NPC object
-        npc_data = self.caller.location.db_npcs.get(resolved_name, {})
+        npc_data = room_npcs(self.caller.location).get(resolved_name, {})
         npc_object = npc_data.get("npc_object")
         
+        # First clean up the reference in the room
+        room_npcs(self.caller.location).pop(resolved_name, None)
+
         if not npc_object:
             self.caller.msg(f"Could not find NPC object for '{resolved_name}'.")
-            # Try to clean up the reference at least
-            if resolved_name in self.caller.location.db_npcs:
-                del self.caller.location.db_npcs[resolved_name]
             return
-            
-        # First clean up the reference in the room
-        if resolved_name in self.caller.location.db_npcs:
-            del self.caller.location.db_npcs[resolved_name]
         
         # Get NPC info for reporting
         npc_id = npc_object.id
@@ -977,24 +967,10 @@ class CmdNPC(default_cmds.MuxCommand):
                         self.caller.msg(f"Error removing from location: {e}")
                         
                     # Explicitly unregister from all rooms
-                    if hasattr(npc_object, 'db'):
-                        try:
-                            registered_rooms = list(npc_object.db.registered_in_rooms) if hasattr(npc_object.db, 'registered_in_rooms') else []
-                            for room_dbref in registered_rooms:
-                                try:
-                                    from evennia.utils.search import search_object
-                                    room = search_object(room_dbref)
-                                    if room and len(room) > 0:
-                                        room = room[0]
-                                        if hasattr(room, 'db_npcs') and npc_object.key in room.db_npcs:
-                                            del room.db_npcs[npc_object.key]
-                                except Exception as e:
-                                    self.caller.msg(f"Error unregistering from room {room_dbref}: {e}")
-                            
-                            # Clear the registered rooms
-                            npc_object.attributes.remove('registered_in_rooms')
-                        except Exception as e:
-                            self.caller.msg(f"Error handling registered rooms: {e}")
+                    try:
+                        npc_object.unregister_from_all_rooms()
+                    except Exception as e:
+                        self.caller.msg(f"Error handling registered rooms: {e}")
                 except Exception as e:
                     self.caller.msg(f"Error during force cleanup: {e}")
                 
@@ -1140,7 +1116,7 @@ class CmdNPC(default_cmds.MuxCommand):
             return
             
         # Get NPC object
-        npc_data = self.caller.location.db_npcs.get(resolved_name, {})
+        npc_data = room_npcs(self.caller.location).get(resolved_name, {})
         npc_object = npc_data.get("npc_object")
         
         if not npc_object:
@@ -1148,7 +1124,7 @@ class CmdNPC(default_cmds.MuxCommand):
             return
             
         # Check permissions - only creator, staff, and storytellers can view the sheet
-        if not (self.caller == npc_data.get("creator") or
+        if not (self.caller == npc_object.db.creator or
                 self.caller.check_permstring("Builder") or
                 self.caller.check_permstring("Admin") or
                 self.caller.check_permstring("Storyteller")):
@@ -1157,7 +1133,7 @@ class CmdNPC(default_cmds.MuxCommand):
             
         # Format and display the character sheet
         try:
-            stats = npc_object.db.stats
+            stats = NPC_STATS.stats(npc_object)
             
             # Build the sheet
             sheet = [
@@ -1214,7 +1190,7 @@ class CmdNPC(default_cmds.MuxCommand):
             sheet.append(f"|c{'-' * 78}|n")
             sheet.append("|wHealth:|n")
             health_status = npc_object.get_health_status()
-            health = stats.get("health", {"bashing": 0, "lethal": 0, "aggravated": 0})
+            health = NPC_STATS.health(npc_object)
             sheet.append(f"  Status: {health_status}")
             sheet.append(f"  Bashing: {health['bashing']}")
             sheet.append(f"  Lethal: {health['lethal']}")
@@ -1228,6 +1204,44 @@ class CmdNPC(default_cmds.MuxCommand):
             import traceback
             traceback.print_exc()
 
+    def list_expiring_npcs(self):
+        """List temporary NPCs in the order they will expire (staff only)"""
+        from evennia.objects.models import ObjectDB
+        from evennia.utils import evtable
+        from world.wod20th.utils.npc_expiry import NPC_EXPIRY
+
+        upcoming = NPC_EXPIRY.upcoming()
+        if not upcoming:
+            self.caller.msg("No temporary NPCs are waiting to expire.")
+            return
+
+        npcs = ObjectDB.objects.in_bulk([npc_id for _, npc_id in upcoming])
+        table = evtable.EvTable(
+            "|wNPC|n",
+            "|wLocation|n",
+            "|wCreator|n",
+            "|wExpires In|n",
+            border="table",
+            width=78
+        )
+
+        now = time.time()
+        for expires_at, npc_id in upcoming:
+            npc = npcs.get(npc_id)
+            if not npc:
+                continue
+            loc = npc.location.key if npc.location else "No Location"
+            creator = npc.db.creator.key if npc.db.creator else "Unknown"
+            remaining = int(expires_at - now)
+            if remaining <= 0:
+                expires = "Now"
+            else:
+                hours, minutes = divmod(remaining // 60, 60)
+                expires = f"{hours}h {minutes:02d}m"
+            table.add_row(f"{npc.key} (#{npc.id})", loc, creator, expires)
+
+        self.caller.msg(f"\n|wExpiring NPCs|n ({len(upcoming)} total)\n{table}")
+
     def list_all_npcs(self):
         """List all NPCs in the game (staff only)"""
         from evennia.utils.search import search_object
@@ -1277,7 +1291,7 @@ class CmdNPC(default_cmds.MuxCommand):
             
             for loc_name, loc_npcs in sorted(locations.items()):
                 for i, npc in enumerate(loc_npcs):
-                    splat = npc.db.stats.get('splat', 'Unknown') if hasattr(npc.db, 'stats') else 'Unknown'
+                    splat = NPC_STATS.stats(npc).get('splat', 'Unknown')
                     creator = npc.db.creator.key if npc.db.creator else "Unknown"
                     temp = "Yes" if npc.db.is_temporary else "No"
                     
@@ -1295,7 +1309,7 @@ class CmdNPC(default_cmds.MuxCommand):
             # Group by splat type
             splats = {}
             for npc in npcs:
-                splat = npc.db.stats.get('splat', 'Unknown') if hasattr(npc.db, 'stats') else 'Unknown'
+                splat = NPC_STATS.stats(npc).get('splat', 'Unknown')
                 
                 if splat not in splats:
                     splats[splat] = []
@@ -1342,7 +1356,7 @@ class CmdNPC(default_cmds.MuxCommand):
             
             for npc in sorted(npcs, key=lambda x: x.key):
                 loc = npc.location.key if npc.location else "No Location"
-                splat = npc.db.stats.get('splat', 'Unknown') if hasattr(npc.db, 'stats') else 'Unknown'
+                splat = NPC_STATS.stats(npc).get('splat', 'Unknown')
                 creator = npc.db.creator.key if npc.db.creator else "Unknown"
                 temp = "Yes" if npc.db.is_temporary else "No"
                 
@@ -2,7 +2,7 @@ from evennia import default_cmds
 from evennia.utils import utils
 from world.wod20th.models import Stat
 from evennia import search_object
-from world.wod20th.utils.damage import calculate_total_health_levels, apply_damage_or_healing
+from world.wod20th.utils.damage import calculate_total_health_levels, apply_damage_or_healing, expire_rage_health
 
 class CmdPump(default_cmds.MuxCommand):
     """
@@ -919,6 +919,9 @@ class CmdPump(default_cmds.MuxCommand):
             new_rage = current_rage - amount
             caller.set_stat('pools', 'dual', 'Rage', new_rage, temp=True)
             
+            # A boost that has run out doesn't stack with the new one
+            expire_rage_health(caller)
+
             # Initialize bonus_health_from_rage if it doesn't exist or is None
             if not hasattr(caller.db, 'bonus_health_from_rage') or caller.db.bonus_health_from_rage is None:
                 caller.db.bonus_health_from_rage = 0
@@ -951,21 +954,6 @@ class CmdPump(default_cmds.MuxCommand):
             # Store the health level type for the damage system to use
             caller.db.rage_health_level_type = level_type
             
-            # Initialize health_level_bonuses if needed
-            if not hasattr(caller.db, 'health_level_bonuses'):
-                caller.db.health_level_bonuses = {
-                    'bruised': 0,
-                    'hurt': 0,
-                    'injured': 0,
-                    'wounded': 0,
-                    'mauled': 0,
-                    'crippled': 0
-                }
-            
-            # Recalculate the total health levels to ensure proper display
-            from world.wod20th.utils.damage import calculate_total_health_levels
-            calculate_total_health_levels(caller)
-            
             # Get a new boost ID and add it to the attribute_boosts dictionary
             self._ensure_attribute_boosts(caller)
             boost_id = self._get_next_boost_id(caller)
@@ -1151,18 +1139,6 @@ class CmdPump(default_cmds.MuxCommand):
             if hasattr(caller.db, 'health_boost_timestamp'):
                 delattr(caller.db, 'health_boost_timestamp')
             
-            # Reset the specific level type in health_level_bonuses
-            if hasattr(caller.db, 'health_level_bonuses') and level_type in caller.db.health_level_bonuses:
-                # Save the base bruised bonus before recalculation
-                base_bruised = caller.db.health_level_bonuses.get('bruised', 0)
-                if level_type == 'bruised':
-                    # For bruised, we need to preserve the bonus from things like Huge Size
-                    from world.wod20th.utils.damage import calculate_total_health_levels
-                    calculate_total_health_levels(caller)  # This will set the proper base bruised level
-                else:
-                    # For other levels, just set to 0
-                    caller.db.health_level_bonuses[level_type] = 0
-            
             # Also remove from attribute_boosts if it exists there
             self._ensure_attribute_boosts(caller)
             for stat_name, boost_info in list(caller.db.attribute_boosts.items()):
@@ -1170,17 +1146,16 @@ class CmdPump(default_cmds.MuxCommand):
                     del caller.db.attribute_boosts[stat_name]
                     break
             
-            # Recalculate total health levels to ensure other bonuses (like Huge Size merit) are preserved
-            from world.wod20th.utils.damage import calculate_total_health_levels
-            calculate_total_health_levels(caller)
-            
+            # Bonus health from other sources (like Huge Size merit) remains
+            bonus_health = calculate_total_health_levels(caller)
+
             # Capitalize level type for display
             display_level_type = level_type.capitalize()
             
             caller.msg(f"Your additional {old_bonus} {display_level_type} health levels from Rage expenditure fade away.")
             
             # Add a message to clarify if they still have bonus health from other sources
-            if hasattr(caller.db, 'bonus_health') and caller.db.bonus_health is not None and caller.db.bonus_health > 0:
+            if bonus_health > 0:
                 sources = []
                 
                 # Check for Huge Size merit - check both locations
@@ -1192,7 +1167,7 @@ class CmdPump(default_cmds.MuxCommand):
                 
                 if sources:
                     source_text = ", ".join(sources)
-                    caller.msg(f"You still have {caller.db.bonus_health} bonus health levels from {source_text}.")
+                    caller.msg(f"You still have {bonus_health} bonus health levels from {source_text}.")
             
             return True
         return False
@@ -3,6 +3,7 @@ from evennia.utils.ansi import ANSIString
 from evennia.utils import inherits_from
 from world.wod20th.models import Stat
 from world.wod20th.utils.dice_rolls import roll_dice, interpret_roll_results
+from world.wod20th.utils.dice_engine import roll_odds, MAX_ODDS_POOL
 from world.jobs.models import Job
 from django.utils import timezone
 import re
@@ -20,6 +21,11 @@ class CmdRoll(default_cmds.MuxCommand):
           Note that you must put a space between the stat name and the + or - operator,
           otherwise it will be interpreted as part of the stat name (like a hyphen).
       +roll/log|l - This will display the last 10 rolls made in this location.
+      +roll/odds <expression> [vs <difficulty>]
+          Show the chance of success, the chance of a botch and the expected
+          successes for a roll without rolling it. Add /specialty to count 10s
+          twice and /willpower (or /wp) to add an automatic success. The
+          expression may be a plain number of dice, e.g. +roll/odds 6 vs 7.
       +roll/specialty|spec|s <expression> [vs <difficulty>] [--job <id>]
           This will count any 10s rolled as 2 successes. You can also use this as an
           additional switch on top of another roll, such as +roll/10/specialty 
@@ -67,6 +73,10 @@ class CmdRoll(default_cmds.MuxCommand):
             self.display_roll_log()
             return
 
+        if self.switches and "odds" in self.switches:
+            self.display_roll_odds()
+            return
+
         # Check for job option at the end of the command
         job_id = None
         args = self.args.strip()
@@ -985,6 +995,65 @@ class CmdRoll(default_cmds.MuxCommand):
         # If still no match, return with proper capitalization
         return 0, capitalized_name
 
+    def display_roll_odds(self):
+        """
+        Show exact success and botch odds for a roll without rolling it.
+        """
+        match = re.match(r'(.*?)(?:\s+vs\s+(\d+))?$', self.args.strip(), re.IGNORECASE)
+        expression, difficulty = match.groups() if match else ("", None)
+        if not expression:
+            self.caller.msg("Usage: +roll/odds <expression> [vs <difficulty>]")
+            return
+        difficulty = int(difficulty) if difficulty else 6
+        if not 2 <= difficulty <= 10:
+            self.caller.msg("Difficulty must be between 2 and 10.")
+            return
+
+        if expression.strip().isdigit():
+            dice_pool = int(expression.strip())
+        else:
+            dice_pool = 0
+            # Same standalone + and - splitting as a normal roll
+            for plus_part in re.split(r'(?<!\w)\+(?!\w)', expression):
+                for index, part in enumerate(re.split(r'(?<!\w)-(?!\w)', plus_part)):
+                    value = part.strip().strip('"\'').strip()
+                    if not value:
+                        continue
+                    if value.isdigit():
+                        amount = int(value)
+                    else:
+                        try:
+                            amount, _ = self.get_stat_value_and_name(value)
+                        except AttributeError:
+                            amount = 0
+                    dice_pool += -amount if index else amount
+        dice_pool = max(0, dice_pool)
+        if dice_pool > MAX_ODDS_POOL:
+            self.caller.msg(f"Odds are only calculated for pools of up to {MAX_ODDS_POOL} dice.")
+            return
+
+        specialty = any(s in ['specialty', 'spec', 's'] for s in self.switches)
+        willpower = any(s in ['willpower', 'wp'] for s in self.switches)
+        odds = roll_odds(dice_pool, difficulty, specialty, willpower)
+
+        extras = []
+        if specialty:
+            extras.append("specialty")
+        if willpower:
+            extras.append("willpower")
+        extra_text = f" with {' and '.join(extras)}" if extras else ""
+        lines = [
+            f"|yOdds for {dice_pool} dice vs {difficulty}{extra_text}:|n",
+            f"  Success: |g{odds.success:.1%}|n   Botch: |r{odds.botch:.1%}|n   "
+            f"Expected successes: |w{odds.expected:.2f}|n",
+        ]
+        thresholds = [
+            f"{count}+: {chance:.1%}" for count, chance in enumerate(odds.at_least[:5], start=1)
+        ]
+        if thresholds:
+            lines.append("  At least: " + "  ".join(thresholds))
+        self.caller.msg("\n".join(lines))
+
     def display_roll_log(self):
         """
         Display the roll log for the current room.
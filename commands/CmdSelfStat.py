@@ -59,6 +59,7 @@ from world.wod20th.utils.companion_utils import (
 from world.wod20th.utils.virtue_utils import (
     calculate_willpower, calculate_path, PATH_VIRTUES
 )
+from world.wod20th.utils.fuzzy_index import index_for
 from world.wod20th.utils.stat_initialization import (
     find_similar_stats, check_stat_exists
 )
@@ -257,26 +258,14 @@ class CmdSelfStat(MuxCommand):
         if not value:
             return False, None
             
-        # Try title case
-        if value.title() in valid_set:
-            return True, value.title()
-            
         # Try case-insensitive match
-        value_lower = value.lower()
-        for valid_value in valid_set:
-            if valid_value.lower() == value_lower:
-                return True, valid_value
+        index = index_for(valid_set)
+        matched = index.match(value)
+        if matched:
+            return True, matched
             
         # If no match found, suggest similar values
-        similar_values = []
-        for valid_value in valid_set:
-            # Check if the input is a substring of any valid value
-            if value_lower in valid_value.lower():
-                similar_values.append(valid_value)
-            # Check if input matches the beginning of any word in the valid value
-            elif any(word.lower().startswith(value_lower) 
-                    for word in valid_value.split()):
-                similar_values.append(valid_value)
+        similar_values = index.suggest(value, limit=None)
                 
         if similar_values:
             return False, f"Invalid value. Did you mean one of these?: {', '.join(sorted(similar_values))}"
@@ -299,11 +288,7 @@ class CmdSelfStat(MuxCommand):
             for values in nested_dict.values():
                 all_values.update(values)
             # Try to find similar values across all categories
-            similar_values = []
-            value_lower = value.lower()
-            for valid_value in all_values:
-                if value_lower in valid_value.lower() or any(word.lower().startswith(value_lower) for word in valid_value.split()):
-                    similar_values.append(valid_value)
+            similar_values = index_for(all_values).suggest(value, limit=None)
             if similar_values:
                 return False, f"Invalid value. Similar values found in other categories: {', '.join(sorted(similar_values))}"
             return False, f"Invalid value. No valid options found for {parent_value}"
@@ -314,11 +299,7 @@ class CmdSelfStat(MuxCommand):
             return True, matched_value
             
         # If no match, suggest similar values for this parent
-        value_lower = value.lower()
-        similar_values = []
-        for valid_value in valid_values:
-            if value_lower in valid_value.lower() or any(word.lower().startswith(value_lower) for word in valid_value.split()):
-                similar_values.append(valid_value)
+        similar_values = index_for(valid_values).suggest(value, limit=None)
                 
         if similar_values:
             return False, f"Invalid value for {parent_value}. Did you mean one of these?: {', '.join(sorted(similar_values))}"
@@ -22,6 +22,7 @@ from world.wod20th.utils.stat_mappings import (
     FLAW_SPLAT_RESTRICTIONS
 )
 from world.wod20th.models import Stat
+from world.wod20th.utils.stat_catalog import STAT_CATALOG
 from world.wod20th.utils.vampire_utils import (
     calculate_blood_pool, initialize_vampire_stats, update_vampire_virtues_on_path_change, 
     CLAN_CHOICES, get_clan_disciplines, validate_vampire_stats, validate_vampire_path
@@ -59,6 +60,7 @@ from world.wod20th.utils.companion_utils import (
 from world.wod20th.utils.virtue_utils import (
     calculate_willpower, calculate_path, PATH_VIRTUES
 )
+from world.wod20th.utils.fuzzy_index import index_for
 from world.wod20th.utils.stat_initialization import (
     find_similar_stats, check_stat_exists
 )
@@ -124,10 +126,9 @@ class CmdStats(MuxCommand):
         if value.title() in valid_set:
             return True, value.title()
         # Try case-insensitive match
-        value_lower = value.lower()
-        for valid_value in valid_set:
-            if valid_value.lower() == value_lower:
-                return True, valid_value
+        matched = index_for(valid_set).match(value)
+        if matched:
+            return True, matched
         return False, None
 
     def case_insensitive_in_nested(self, value: str, nested_dict: dict, parent_value: str) -> tuple[bool, str]:
@@ -162,8 +163,7 @@ class CmdStats(MuxCommand):
         char_type = self.target.get_stat('identity', 'lineage', 'Type', temp=False)
 
         # Get the stat definition from the database
-        from world.wod20th.models import Stat
-        stat = Stat.objects.filter(name__iexact=stat_name).first()
+        stat = STAT_CATALOG.get(stat_name)
         if not stat:
             return False, f"Stat '{stat_name}' not found in database"
 
@@ -307,12 +307,7 @@ class CmdStats(MuxCommand):
                 return False, "Only Shifters, Possessed, and Kinfolk can have gifts"
                 
             # Get the gift from the database
-            from world.wod20th.models import Stat
-            gift = Stat.objects.filter(
-                name__iexact=stat_name,
-                category='powers',
-                stat_type='gift'
-            ).first()
+            gift = STAT_CATALOG.get(stat_name, category='powers', stat_type='gift')
             
             if not gift:
                 return False, f"'{stat_name}' is not a valid gift"
@@ -783,22 +778,18 @@ class CmdStats(MuxCommand):
 
         # Special case for gifts: check if it's an alias first
         if splat == 'Shifter':
-            # Instead of hardcoding gift aliases, check the database
-            from world.wod20th.models import Stat
-            
+            # Instead of hardcoding gift aliases, check the stat catalog
             # First check if this stat name exactly matches a gift
-            gift = Stat.objects.filter(
-                name__iexact=self.stat_name,
-                category='powers',
-                stat_type='gift'
-            ).first()
+            gift = STAT_CATALOG.get(self.stat_name, category='powers', stat_type='gift')
             
             if not gift:
                 # If not an exact match, check if it's an alias
-                gifts_with_aliases = Stat.objects.filter(
+                gifts_with_aliases = STAT_CATALOG.filter(
+                    name=self.stat_name,
                     category='powers',
-                    stat_type='gift'
-                ).exclude(gift_alias__isnull=True)
+                    stat_type='gift',
+                    include_aliases=True
+                )
                 
                 for g in gifts_with_aliases:
                     if g.gift_alias and any(alias.lower() == self.stat_name.lower() for alias in g.gift_alias):
@@ -1005,7 +996,7 @@ class CmdStats(MuxCommand):
                 stat_type = 'personal'
 
         # Get the stat definition
-        stat = Stat.objects.filter(name__iexact=self.stat_name).first()
+        stat = STAT_CATALOG.get(self.stat_name)
         if not stat:
             # Special case for Path of Enlightenment
             if self.stat_name.lower() == 'path of enlightenment':
@@ -1397,8 +1388,7 @@ class CmdStats(MuxCommand):
             return True
             
         # Check database for required instance flag
-        from world.wod20th.models import Stat
-        stat = Stat.objects.filter(name__iexact=stat_name).first()
+        stat = STAT_CATALOG.get(stat_name)
         
         if stat and stat.instanced:
             return True
@@ -1424,8 +1414,7 @@ class CmdStats(MuxCommand):
 
     def _display_instance_requirement_message(self, stat_name: str) -> None:
         """Display message indicating an instance is required for a stat."""
-        from world.wod20th.models import Stat
-        stat = Stat.objects.filter(name__iexact=stat_name).first()
+        stat = STAT_CATALOG.get(stat_name)
         
         # Get the category and type if available
         category = stat.category if stat else self.category
@@ -1944,20 +1933,16 @@ class CmdStats(MuxCommand):
                 return 'powers', 'special_advantage'
 
         # Check if it's a gift or gift alias
-        from world.wod20th.models import Stat
-        
         # First check for exact match
-        gift = Stat.objects.filter(
-            name__iexact=stat_name,
-            category='powers',
-            stat_type='gift'
-        ).first()
+        gift = STAT_CATALOG.get(stat_name, category='powers', stat_type='gift')
         
         if not gift:
             # Get all gifts and check their aliases
-            all_gifts = Stat.objects.filter(
+            all_gifts = STAT_CATALOG.filter(
+                name=stat_name,
                 category='powers',
-                stat_type='gift'
+                stat_type='gift',
+                include_aliases=True
             )
             for g in all_gifts:
                 if g.gift_alias:  # Check if gift has aliases
@@ -2082,8 +2067,7 @@ class CmdStats(MuxCommand):
                 return 'powers', 'necromancy'
                 
             # Check if it's a ritual
-            from world.wod20th.models import Stat
-            stat = Stat.objects.filter(name__iexact=stat_name).first()
+            stat = STAT_CATALOG.get(stat_name)
             if stat:
                 if stat.stat_type in ['discipline', 'combodiscipline', 'thaumaturgy', 'thaum_ritual', 'necromancy', 'necromancy_ritual']:
                     return 'powers', stat.stat_type.lower()
@@ -2226,8 +2210,7 @@ class CmdStats(MuxCommand):
             return pool_stats[stat_name.lower()]
 
         # Get the stat definition from the database as a last resort
-        from world.wod20th.models import Stat
-        stat = Stat.objects.filter(name__iexact=stat_name).first()
+        stat = STAT_CATALOG.get(stat_name)
         if stat:
             # Handle pool stats
             if stat.category == 'pools':
@@ -2376,12 +2359,7 @@ class CmdStats(MuxCommand):
             return False, None
             
         # Check if the gift exists in the database
-        from world.wod20th.models import Stat
-        gift = Stat.objects.filter(
-            name__iexact=gift_name,
-            category='powers',
-            stat_type='gift'
-        ).first()
+        gift = STAT_CATALOG.get(gift_name, category='powers', stat_type='gift')
         
         if gift:
             # Check if this character type can use this gift
@@ -2411,9 +2389,11 @@ class CmdStats(MuxCommand):
             return False, gift.name  # Found exact match, no need to check aliases
             
         # Get all gifts and check their aliases
-        all_gifts = Stat.objects.filter(
+        all_gifts = STAT_CATALOG.filter(
+            name=gift_name,
             category='powers',
-            stat_type='gift'
+            stat_type='gift',
+            include_aliases=True
         )
         matched_gift = None
         for g in all_gifts:
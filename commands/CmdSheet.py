@@ -15,9 +15,10 @@ from utils.search_helpers import search_character
 # Core utilities
 from world.wod20th.utils.formatting import format_stat, header, footer, divider, format_abilities, format_secondary_abilities
 from world.wod20th.utils.virtue_utils import calculate_willpower, calculate_path, PATH_VIRTUES
-from world.wod20th.utils.damage import format_damage, format_status, format_damage_stacked, calculate_total_health_levels
+from world.wod20th.utils.damage import format_damage, format_status, format_damage_stacked
 from world.wod20th.utils.stat_initialization import find_similar_stats, check_stat_exists
 from world.wod20th.utils.banality import get_banality_message
+from world.wod20th.utils.sheet_cache import SHEET_CACHE
 
 # Splat-specific utilities
 from world.wod20th.utils.vampire_utils import get_clan_disciplines, initialize_vampire_stats, calculate_blood_pool, get_vampire_identity_stats
@@ -38,6 +39,9 @@ from world.wod20th.utils.stat_mappings import (
     VALID_SPLATS, VALID_DATES, get_identity_stats
 )
 
+# Width the sheet is rendered at; part of the render cache key
+SHEET_WIDTH = 78
+
 class CmdSheet(MuxCommand):
     """
     Show character sheet information.
@@ -52,6 +56,9 @@ class CmdSheet(MuxCommand):
     organized by category.
     
     If no character is specified, shows your own sheet.
+
+    Staff:
+      +sheet/cachestats [reset]  - show (or reset) sheet render cache counters
     """
     key = "+sheet"
     aliases = ["+stats"]
@@ -139,6 +146,10 @@ class CmdSheet(MuxCommand):
     
     def func(self):
         """Execute the command."""
+        if "cachestats" in self.switches:
+            self.show_cache_stats()
+            return
+
         # Reset section lists
         self.reset_lists()
         
@@ -159,23 +170,30 @@ class CmdSheet(MuxCommand):
             self.caller.msg(f"|rYou can't see the sheet of {self.target_character.key}.|n")
             return
 
+        # Static sections are served from the render cache while the sheet is unchanged
+        cache_key = SHEET_CACHE.make_key(self.target_character, self.get_viewer_class(), SHEET_WIDTH)
+        signature = SHEET_CACHE.signature(self.target_character)
+
+        def cached(section, build):
+            return SHEET_CACHE.section(cache_key, signature, section, build)
+
         # Start building the character sheet
         string = header(f"Character Sheet for:|n {self.target_character.get_display_name(self.caller)}")
 
         # Add Identity section
-        string += self.format_identity_section(self.target_character, splat)
+        string += cached('identity', lambda: self.format_identity_section(self.target_character, splat))
 
         # Add Attributes section
-        string += self.format_attributes_section(self.target_character)
+        string += cached('attributes', lambda: self.format_attributes_section(self.target_character))
 
         # Add Abilities section
-        string += self.format_abilities_section(self.target_character)
+        string += cached('abilities', lambda: self.format_abilities_section(self.target_character))
 
         # Add Secondary Abilities section
-        string += self.format_secondary_abilities_section(self.target_character)
+        string += cached('secondary_abilities', lambda: self.format_secondary_abilities_section(self.target_character))
 
         # Process advantages section
-        string += self.process_advantages(self.target_character, string)
+        string += cached('advantages', lambda: self.process_advantages(self.target_character, string))
 
         # Display Pools & Status (or Pools, Virtues & Status for non-Companions)
         if splat in ['Companion', 'Possessed']:
@@ -183,20 +201,14 @@ class CmdSheet(MuxCommand):
         else:
             string += header("Pools, Virtues & Status", width=78, color="|y")
 
-        # Process pools
-        self.process_pools(self.target_character)
-
-        # Calculate health bonuses before getting health status
-        bonus_health = self.calculate_health_bonuses(self.target_character)
+        # Process pools and virtues (virtues only for non-Companions and Possessed)
+        self.pools_list, self.virtues_list = (list(column) for column in cached(
+            'pools_virtues', lambda: self.build_pools_and_virtues(self.target_character, splat)))
 
         # Add health status to status_list without extra padding
         health_status = format_damage_stacked(self.target_character)
         self.status_list.extend(health_status)
 
-        # Handle virtues for non-Companions and Possessed
-        if splat not in ['Companion', 'Possessed']:
-            self.process_virtues(self.target_character, splat)
-
         # Display the pools, virtues and status in columns with adjusted spacing
         if splat in ['Companion', 'Possessed']:
             # Add headers for the two-column layout
@@ -228,6 +240,33 @@ class CmdSheet(MuxCommand):
         # Send the complete sheet to the caller
         self.caller.msg(string)
 
+    def get_viewer_class(self):
+        """Return the permission class the sheet is being rendered for."""
+        if self.caller == self.target_character:
+            return "owner"
+        return "staff"
+
+    def build_pools_and_virtues(self, character, splat):
+        """Build the pools and virtues columns; returns them as tuples for caching."""
+        self.process_pools(character)
+        if splat not in ['Companion', 'Possessed']:
+            self.process_virtues(character, splat)
+        return tuple(self.pools_list), tuple(self.virtues_list)
+
+    def show_cache_stats(self):
+        """Show the sheet render cache counters to staff."""
+        if not self.caller.check_permstring("builders"):
+            self.caller.msg("|rOnly staff can view sheet cache statistics.|n")
+            return
+        stats = SHEET_CACHE.stats()
+        self.caller.msg(
+            f"Sheet cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate), {stats['entries']} cached sheets."
+        )
+        if "reset" in self.args.strip().lower():
+            SHEET_CACHE.reset_stats()
+            self.caller.msg("Sheet cache counters reset.")
+
     def format_stat(self, stat_name, value, width=25, tempvalue=None):
         """Format a stat with dots for display."""
         # Check if this stat is boosted
@@ -1540,10 +1579,6 @@ class CmdSheet(MuxCommand):
                     temp_value = values.get('temp', virtue_value)
                     self.virtues_list.append(format_stat(virtue_name, virtue_value, width=25, tempvalue=temp_value))
 
-    def calculate_health_bonuses(self, character):
-        """Calculate any health level bonuses from merits, etc."""
-        return calculate_total_health_levels(character)
-    
     def format_pool_value(self, character, pool_name):
         """Format a pool value with both permanent and temporary values."""
         perm = character.get_stat('pools', 'dual', pool_name, temp=False)
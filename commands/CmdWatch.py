@@ -7,6 +7,7 @@ from utils.search_helpers import search_character
 from evennia.server.sessionhandler import SESSIONS
 from evennia.server.signals import SIGNAL_OBJECT_POST_PUPPET, SIGNAL_OBJECT_POST_UNPUPPET
 from django.dispatch import receiver
+from utils.watch_index import WATCH_INDEX
 
 # Function to notify watchers when someone logs in or out
 def notify_watchers(character, is_connected):
@@ -21,55 +22,25 @@ def notify_watchers(character, is_connected):
     if not character or character.attributes.get("watch_hidden", False):
         return
         
-    # Get all possible watchers (all accounts with puppets)
-    from evennia.accounts.models import AccountDB
-    for account in AccountDB.objects.filter(db_is_connected=True):
-        # Skip if no puppets
-        if not account.puppet:
-            continue
-            
-        puppet = account.puppet
-        
-        # Skip if the puppet is the character connecting/disconnecting
-        if puppet == character:
-            continue
-            
-        # Check if the character is on the puppet's watch list
-        if not puppet.attributes.has("watch_list") and not puppet.attributes.get("watch_all", False):
-            continue
-            
-        watch_list = puppet.attributes.get("watch_list", [])
-        watch_active = puppet.attributes.get("watch_active", True)
-        watch_all = puppet.attributes.get("watch_all", False)
-        watch_permitted = puppet.attributes.get("watch_permitted", [])
-        
-        # Skip if the watch system is turned off
-        if not watch_active:
-            continue
-            
-        # Check if the character is on the puppet's watch list or if watching all
-        is_watching = character.key in watch_list or watch_all
-        
-        # Check if the character has hidden themselves but permitted this watcher
-        if character.attributes.get("watch_hidden", False) and character.key not in watch_permitted:
-            continue
-            
-        # If the character is being watched, send a notification
-        if is_watching:
-            status = "connected" if is_connected else "disconnected"
-            puppet.msg(f"|g[Watch]|n {character.key} has {status}.")
+    # Only the online characters watching this one are looked at
+    status = "connected" if is_connected else "disconnected"
+    for puppet in WATCH_INDEX.watchers_of(character):
+        puppet.msg(f"|g[Watch]|n {character.key} has {status}.")
 
 # Register signal handlers
 @receiver(SIGNAL_OBJECT_POST_PUPPET)
 def _on_puppet(sender, **kwargs):
     """Called when a character is puppeted"""
     character = sender
+    WATCH_INDEX.add(character)
     notify_watchers(character, True)
 
 @receiver(SIGNAL_OBJECT_POST_UNPUPPET)
 def _on_unpuppet(sender, **kwargs):
     """Called when a character is un-puppeted"""
     character = sender
+    if not character.sessions.count():
+        WATCH_INDEX.discard(character)
     notify_watchers(character, False)
 
 # Connect notification function to the appropriate hooks
@@ -190,11 +161,13 @@ class CmdWatch(MuxCommand):
         # Turn watch on or off
         if "on" in self.switches:
             caller.attributes.add("watch_active", True)
+            WATCH_INDEX.refresh(caller)
             self.msg("Watch system activated. You will now receive notifications.")
             return
             
         if "off" in self.switches:
             caller.attributes.add("watch_active", False)
+            WATCH_INDEX.refresh(caller)
             self.msg("Watch system deactivated. You will no longer receive notifications.")
             return
             
@@ -295,6 +268,7 @@ class CmdWatch(MuxCommand):
             
             # Update their watch list
             target.attributes.add("watch_list", target_watch_list)
+            WATCH_INDEX.refresh(target)
             
             # Now add me to their blocked-by list
             if not target.attributes.has("watch_blocked_by"):
@@ -389,6 +363,7 @@ class CmdWatch(MuxCommand):
             # Add the target to the watch list
             watch_list.append(target.key)
             caller.attributes.add("watch_list", watch_list)
+            WATCH_INDEX.refresh(caller)
             self.msg(f"{target.key} has been added to your watch list.")
             return
             
@@ -410,6 +385,7 @@ class CmdWatch(MuxCommand):
                 
             # Update the watch list
             caller.attributes.add("watch_list", watch_list)
+            WATCH_INDEX.refresh(caller)
             self.msg(f"{args} has been removed from your watch list.")
             return
             
@@ -450,9 +426,11 @@ class CmdWatch(MuxCommand):
                 
             if args.lower() == "on":
                 caller.attributes.add("watch_all", True)
+                WATCH_INDEX.refresh(caller)
                 self.msg("You will now be notified of ALL login/logout activity.")
             else:
                 caller.attributes.add("watch_all", False)
+                WATCH_INDEX.refresh(caller)
                 self.msg("You will no longer be notified of ALL login/logout activity.")
             return
             
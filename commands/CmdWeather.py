@@ -1,11 +1,9 @@
-import requests
 from datetime import datetime, timedelta
-import pytz
-import ephem
 from evennia.utils.ansi import ANSIString
 from evennia import default_cmds
 from world.wod20th.utils import ansi_utils
 import re
+from world.wod20th.utils.weather_snapshot import WEATHER, TIMEZONE
 
 class CmdWeather(default_cmds.MuxCommand):
     """
@@ -27,72 +25,18 @@ class CmdWeather(default_cmds.MuxCommand):
     locks = "cmd:all()"
     help_category = "Game Info"
 
-    def get_moon_phase(self):
-        moon = ephem.Moon()
-        moon.compute()
-        phase = moon.phase
-        if phase < 6.25:
-            return "New Moon"
-        elif phase < 43.75:
-            return "Waxing Crescent"
-        elif phase < 56.25:
-            return "First Quarter"
-        elif phase < 93.75:
-            return "Waxing Gibbous"
-        elif phase < 106.25:
-            return "Full Moon"
-        elif phase < 143.75:
-            return "Waning Gibbous"
-        elif phase < 156.25:
-            return "Last Quarter"
-        else:
-            return "Waning Crescent"
-
     def get_wind_direction(self, degrees):
         directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
                       "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
         index = round(degrees / (360. / len(directions))) % len(directions)
         return directions[index]
 
-    def get_tide_info(self):
-        tide_url = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter?date=today&station=9410170&product=predictions&datum=STND&time_zone=lst_ldt&interval=hilo&units=english&format=json"
-        try:
-            response = requests.get(tide_url)
-            tide_data = response.json()
-            
-            if 'predictions' not in tide_data:
-                return []  # Return empty list if no predictions are available
-
-            predictions = tide_data['predictions']
-            san_diego_tz = pytz.timezone('America/Los_Angeles')
-            now = datetime.now(san_diego_tz)
-            
-            future_tides = [
-                tide for tide in predictions
-                if san_diego_tz.localize(datetime.strptime(tide['t'], "%Y-%m-%d %H:%M")) > now
-            ]
-
-            next_two_tides = future_tides[:2]
-            
-            formatted_tides = []
-            for tide in next_two_tides:
-                tide_time = san_diego_tz.localize(datetime.strptime(tide['t'], "%Y-%m-%d %H:%M"))
-                tide_type = "High" if tide['type'] == 'H' else "Low"
-                formatted_tides.append((
-                    tide_type,
-                    tide_time.strftime("%I:%M %p"),
-                    f"{float(tide['v']):.1f} ft"
-                ))
-
-            return formatted_tides
-
-        except requests.RequestException:
-            # If there's an error fetching the data, return a placeholder
-            now = datetime.now(san_diego_tz)
-            return [
-                ("High", (now + timedelta(hours=2)).strftime("%I:%M %p"), "N/A"),
-                ("Low", (now + timedelta(hours=8)).strftime("%I:%M %p"), "N/A")
-            ]
+    def placeholder_tides(self):
+        now = datetime.now(TIMEZONE)
+        return [
+            ("High", (now + timedelta(hours=2)).strftime("%I:%M %p"), "N/A"),
+            ("Low", (now + timedelta(hours=8)).strftime("%I:%M %p"), "N/A")
+        ]
 
     def func(self):
         if "set" in self.switches:
@@ -120,11 +64,8 @@ class CmdWeather(default_cmds.MuxCommand):
         # Check for custom weather override
         custom_weather = self.caller.db.custom_weather
 
-        # Set the timezone for San Diego
-        san_diego_tz = pytz.timezone('America/Los_Angeles')
-        
         # Get current date and time in San Diego
-        now = datetime.now(san_diego_tz)
+        now = datetime.now(TIMEZONE)
         current_date = now.strftime("%A, %B %d, %Y")
         current_time = now.strftime("%I:%M %p")
 
@@ -139,59 +80,37 @@ class CmdWeather(default_cmds.MuxCommand):
             wrapped_weather = ansi_utils.wrap_ansi(custom_weather, width=width)
             output.extend(wrapped_weather.split('\n'))
         else:
-            # OpenWeatherMap API call
-            api_key = "549ac137ad7db9fb5d6f68b590d488a6"
-            city_id = "5391811"  # San Diego city ID
-            url = f"http://api.openweathermap.org/data/2.5/weather?id={city_id}&appid={api_key}&units=imperial"
-            forecast_url = f"http://api.openweathermap.org/data/2.5/forecast?id={city_id}&appid={api_key}&units=imperial"
-            
-            try:
-                response = requests.get(url)
-                forecast_response = requests.get(forecast_url)
-                data = response.json()
-                forecast_data = forecast_response.json()
-                
-                if response.status_code == 200 and forecast_response.status_code == 200:
-                    temp = data['main']['temp']
-                    feels_like = data['main']['feels_like']
-                    humidity = data['main']['humidity']
-                    description = data['weather'][0]['description']
-                    wind_speed = data['wind']['speed']
-                    wind_deg = data['wind']['deg']
-                    wind_dir = self.get_wind_direction(wind_deg)
-                    
-                    # Convert sunrise and sunset to local time
-                    sunrise = datetime.fromtimestamp(data['sys']['sunrise'], san_diego_tz).strftime("%I:%M %p")
-                    sunset = datetime.fromtimestamp(data['sys']['sunset'], san_diego_tz).strftime("%I:%M %p")
-                    
-                    # Get moon phase
-                    moon_phase = self.get_moon_phase()
-                    
-                    # Get tomorrow's forecast
-                    tomorrow = forecast_data['list'][8]  # Roughly 24 hours from now
-                    tomorrow_temp = tomorrow['main']['temp']
-                    tomorrow_desc = tomorrow['weather'][0]['description']
-                    
-                    # Get tide information
-                    tide_info = self.get_tide_info()
-                    
-                    # Format the weather information
-                    output.append(self.format_stat("Weather", description.capitalize(), width=width))
-                    output.append(self.format_stat("Temperature", f"{temp:.1f}F", "Feels Like", f"{feels_like:.1f}F", width=width))
-                    output.append(self.format_stat("Humidity", f"{humidity}%", "Wind", f"{wind_speed:.1f} mph from the {wind_dir}", width=width))
-                    output.append(self.format_stat("Sunrise", sunrise, "Sunset", sunset, width=width))
-                    output.append(self.format_stat("Moon Sign", moon_phase, width=width))
-                    
-                    # Add tide information
-                    output.append(self.format_divider("Tide Information", width=width))
-                    for tide in tide_info:
-                        output.append(self.format_stat(f"{tide[0]} Tide", f"{tide[1]} ({tide[2]})", width=width))
-                    
-                    output.append(self.format_divider("Tomorrow's Forecast", width=width))
-                    forecast = f"Clear sky, {tomorrow_temp:.1f}F"
-                    output.append(self.format_stat("", forecast, width=width))
-
-            except requests.RequestException:
+            # Shared snapshot, refreshed in the background by WeatherRefreshScript
+            snapshot = WEATHER.current()
+            data = snapshot.weather
+            tomorrow = snapshot.forecast
+
+            if data and tomorrow:
+                wind_dir = self.get_wind_direction(data['wind_deg'])
+
+                # Convert sunrise and sunset to local time
+                sunrise = datetime.fromtimestamp(data['sunrise'], TIMEZONE).strftime("%I:%M %p")
+                sunset = datetime.fromtimestamp(data['sunset'], TIMEZONE).strftime("%I:%M %p")
+
+                # Tide information, or placeholders until the first tide lookup succeeds
+                tide_info = snapshot.upcoming_tides(now=now) if snapshot.tides else self.placeholder_tides()
+
+                # Format the weather information
+                output.append(self.format_stat("Weather", data['description'].capitalize(), width=width))
+                output.append(self.format_stat("Temperature", f"{data['temp']:.1f}F", "Feels Like", f"{data['feels_like']:.1f}F", width=width))
+                output.append(self.format_stat("Humidity", f"{data['humidity']}%", "Wind", f"{data['wind_speed']:.1f} mph from the {wind_dir}", width=width))
+                output.append(self.format_stat("Sunrise", sunrise, "Sunset", sunset, width=width))
+                output.append(self.format_stat("Moon Sign", snapshot.moon_phase, width=width))
+
+                # Add tide information
+                output.append(self.format_divider("Tide Information", width=width))
+                for tide in tide_info:
+                    output.append(self.format_stat(f"{tide[0]} Tide", f"{tide[1]} ({tide[2]})", width=width))
+
+                output.append(self.format_divider("Tomorrow's Forecast", width=width))
+                forecast = f"Clear sky, {tomorrow['temp']:.1f}F"
+                output.append(self.format_stat("", forecast, width=width))
+            else:
                 self.caller.msg("Sorry, there was an error connecting to the weather service.")
 
         output.append(self.format_footer(width=width))
@@ -11,11 +11,7 @@ from world.wod20th.utils.formatting import header, footer, divider
 from evennia.utils.utils import class_from_module
 from evennia.utils.ansi import strip_ansi
 from django.conf import settings
-from world.wod20th.utils.vampire_utils import CLAN_CHOICES
-from world.wod20th.utils.mage_utils import TRADITION, CONVENTION, NEPHANDI_FACTION
-from world.wod20th.utils.shifter_utils import GAROU_TRIBE_CHOICES
-from world.wod20th.utils.changeling_utils import KITH
-from world.wod20th.utils.mortalplus_utils import MORTALPLUS_TYPE_CHOICES
+from world.wod20th.utils.census import CENSUS
 
 COMMAND_DEFAULT_CLASS = class_from_module(settings.COMMAND_DEFAULT_CLASS)
 
@@ -202,272 +198,43 @@ class CmdCensus(COMMAND_DEFAULT_CLASS):
 
     def get_splat_counts(self):
         """Get counts of approved characters by splat type."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        VALID_SPLATS = {
-            'vampire': 'Vampire',
-            'mage': 'Mage',
-            'shifter': 'Shifter',
-            'changeling': 'Changeling',
-            'mortal+': 'Mortal+',
-            'mortal': 'Mortal',
-            'companion': 'Companion',
-            'possessed': 'Possessed'
-        }
-        
-        splat_counts = defaultdict(int)
-        characters = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in characters:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if not splat or splat.lower() in ['none', 'unknown']:
-                continue
-                
-            normalized_splat = VALID_SPLATS.get(splat.lower(), splat)
-            splat_counts[normalized_splat] += 1
-                
-        return dict(splat_counts)
+        return CENSUS.counts('splat')
 
     def get_mage_counts(self):
         """Get counts of approved mage characters by tradition."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        VALID_AFFILIATIONS = {}
-        for tradition in TRADITION:
-            VALID_AFFILIATIONS[tradition.lower()] = tradition
-        for convention in CONVENTION:
-            VALID_AFFILIATIONS[convention.lower()] = convention
-        for faction in NEPHANDI_FACTION:
-            VALID_AFFILIATIONS[faction.lower()] = faction
-        
-        mage_counts = defaultdict(int)
-        mages = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in mages:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if splat == 'Mage':
-                tradition = char.db.stats.get('identity', {}).get('lineage', {}).get('Tradition', {}).get('perm', '')
-                if not tradition or tradition.lower() in ['none', 'unknown']:
-                    continue
-                
-                normalized_trad = VALID_AFFILIATIONS.get(tradition.lower(), tradition)
-                mage_counts[normalized_trad] += 1
-                    
-        return dict(mage_counts)
+        return CENSUS.counts('mage')
 
     def get_mortal_counts(self):
         """Get counts of approved mortal+ characters by type."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        VALID_TYPES = {choice[0].lower(): choice[1] for choice in MORTALPLUS_TYPE_CHOICES}
-        
-        mortal_counts = defaultdict(int)
-        mortals = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in mortals:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if splat == 'Mortal+':
-                type = char.db.stats.get('identity', {}).get('lineage', {}).get('Type', {}).get('perm', '')
-                if not type or type.lower() in ['none', 'unknown']:
-                    continue
-                
-                normalized_type = VALID_TYPES.get(type.lower(), type)
-                mortal_counts[normalized_type] += 1
-                    
-        return dict(mortal_counts)
+        return CENSUS.counts('mortal+')
 
     def get_changeling_counts(self):
         """Get counts of approved changeling characters by kith."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        VALID_KITHS = {kith.lower(): kith for kith in KITH}
-        
-        changeling_counts = defaultdict(int)
-        changelings = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in changelings:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if splat == 'Changeling':
-                kith = char.db.stats.get('identity', {}).get('lineage', {}).get('Kith', {}).get('perm', '')
-                if not kith or kith.lower() in ['none', 'unknown']:
-                    continue
-                
-                normalized_kith = VALID_KITHS.get(kith.lower(), kith)
-                changeling_counts[normalized_kith] += 1
-                    
-        return dict(changeling_counts)
+        return CENSUS.counts('changeling')
 
     def get_vampire_clans(self):
         """Get counts of approved vampire characters by clan."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        VALID_CLANS = {choice[0].lower(): choice[1] for choice in CLAN_CHOICES}
-        
-        clan_counts = defaultdict(int)
-        vampires = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in vampires:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if splat == 'Vampire':
-                clan = char.db.stats.get('identity', {}).get('lineage', {}).get('Clan', {}).get('perm', '')
-                if not clan or clan.lower() in ['none', 'unknown']:
-                    continue
-                
-                normalized_clan = VALID_CLANS.get(clan.lower(), clan)
-                clan_counts[normalized_clan] += 1
-                    
-        return dict(clan_counts)
+        return CENSUS.counts('vampire')
 
     def get_shifter_types(self):
         """Get counts of approved shifter characters by type."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        type_counts = defaultdict(int)
-        shifters = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in shifters:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if splat == 'Shifter':
-                shifter_type = char.db.stats.get('identity', {}).get('lineage', {}).get('Type', {}).get('perm', 'Unknown')
-                type_counts[shifter_type] += 1
-                    
-        return dict(type_counts)
+        return CENSUS.counts('shifter')
 
     def get_garou_tribes(self):
         """Get counts of approved Garou characters by tribe."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        VALID_TRIBES = {choice[0].lower(): choice[1] for choice in GAROU_TRIBE_CHOICES}
-        
-        tribe_counts = defaultdict(int)
-        shifters = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in shifters:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if splat != 'Shifter':
-                continue
-                
-            shifter_type = char.db.stats.get('identity', {}).get('lineage', {}).get('Type', {}).get('perm', '')
-            if shifter_type != 'Garou':
-                continue
-                
-            tribe = char.db.stats.get('identity', {}).get('lineage', {}).get('Tribe', {}).get('perm', '')
-            if not tribe or tribe.lower() in ['none', 'unknown']:
-                continue
-                
-            normalized_tribe = VALID_TRIBES.get(tribe.lower(), tribe)
-            tribe_counts[normalized_tribe] += 1
-                    
-        return dict(tribe_counts)
+        return CENSUS.counts('garou')
 
     def get_discipline_counts(self):
         """Get counts of approved characters with each discipline."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        discipline_counts = defaultdict(int)
-        vampires = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in vampires:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if splat in ['Vampire', 'Mortal+']:  # Include ghouls
-                disciplines = char.db.stats.get('powers', {}).get('discipline', {})
-                for discipline, value in disciplines.items():
-                    if value.get('perm', 0) > 0:
-                        discipline_counts[discipline] += 1
-                    
-        return dict(discipline_counts)
+        return CENSUS.counts('discipline')
 
     def get_merit_counts(self):
         """Get counts of approved characters with each merit."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        merit_counts = defaultdict(int)
-        characters = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in characters:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            merits = char.db.stats.get('merits', {}).get('merit', {})
-            for merit, value in merits.items():
-                if value.get('perm', 0) > 0:
-                    merit_counts[merit] += 1
-                    
-        return dict(merit_counts)
+        return CENSUS.counts('merits')
 
     def get_sphere_counts(self):
         """Get counts of approved mages with each sphere."""
-        from evennia.objects.models import ObjectDB
-        from collections import defaultdict
-        
-        sphere_counts = defaultdict(int)
-        mages = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        for char in mages:
-            if not hasattr(char, 'db') or not char.db.stats or not char.db.approved:
-                continue
-                
-            splat = char.db.stats.get('other', {}).get('splat', {}).get('Splat', {}).get('perm', '')
-            if splat == 'Mage':
-                spheres = char.db.stats.get('powers', {}).get('sphere', {})
-                for sphere, value in spheres.items():
-                    if value.get('perm', 0) > 0:
-                        sphere_counts[sphere] += 1
-                    
-        return dict(sphere_counts)
+        return CENSUS.counts('spheres')
 
     def format_counts(self, counts, title):
         """Format the counts into a nice table with either 2 or 3 columns based on content."""
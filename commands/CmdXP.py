@@ -12,6 +12,7 @@ from world.wod20th.utils.sheet_constants import POWERS
 from world.wod20th.utils.xp_utils import process_xp_spend, _determine_stat_category, validate_xp_purchase
 from world.wod20th.utils.vampire_utils import validate_discipline_purchase
 from world.wod20th.utils.mage_utils import validate_sphere_purchase
+from world.wod20th.utils.scene_tracker import SCENE_TRACKER
 
 class CmdXP(default_cmds.MuxCommand):
     """
@@ -885,6 +886,7 @@ class CmdXP(default_cmds.MuxCommand):
                     
                     # Set the fixed XP data
                     target.attributes.add('xp', new_xp)
+                    SCENE_TRACKER.forget_character(target)
                     
                     self.caller.msg(f"Successfully fixed XP data structure for {target.name}")
                     # Display the fixed XP data
@@ -19,6 +19,7 @@ from evennia.utils.search import search_object
 from evennia.utils import evtable
 from evennia.utils.utils import crop
 from evennia.objects.models import ObjectDB
+from world.wod20th.utils.census import CENSUS
 
 
 class CmdApprove(AdminCommand):
@@ -56,6 +57,7 @@ class CmdApprove(AdminCommand):
 
         # Set both the tag and the attribute
         target.db.approved = True
+        CENSUS.touch(target)
         target.tags.remove("unapproved", category="approval")
         target.tags.add("approved", category="approval")
         
@@ -127,6 +129,7 @@ class CmdUnapprove(AdminCommand):
 
         # Remove approved status and add unapproved tag
         target.db.approved = False
+        CENSUS.touch(target)
         target.tags.remove("approved", category="approval")
         target.tags.add("unapproved", category="approval")
         
@@ -190,6 +193,7 @@ class CmdMassUnapprove(AdminCommand):
         count = 0
         for char in approved_chars:
             char.db.approved = False
+            CENSUS.touch(char)
             char.tags.add("unapproved", category="approval")
             if char.tags.has("approved", category="approval"):
                 char.tags.remove("approved", category="approval")
@@ -1194,20 +1198,13 @@ class CmdForceDeleteObject(MuxCommand):
                     caller.msg(f"Error stopping script {script.key}: {e}")
             
             # Step 2: Unregister from all rooms
-            if hasattr(target, 'db') and hasattr(target.db, 'registered_in_rooms'):
-                registered_rooms = list(target.db.registered_in_rooms) if target.db.registered_in_rooms else []
-                for room_dbref in registered_rooms:
-                    if not quiet:
-                        caller.msg(f"Unregistering from room: {room_dbref}")
-                    try:
-                        from evennia.utils.search import search_object
-                        room = search_object(room_dbref)
-                        if room and len(room) > 0:
-                            room = room[0]
-                            if hasattr(room, 'db_npcs') and target.key in room.db_npcs:
-                                del room.db_npcs[target.key]
-                    except Exception as e:
-                        caller.msg(f"Error unregistering from room {room_dbref}: {e}")
+            if hasattr(target, 'unregister_from_all_rooms'):
+                if not quiet:
+                    caller.msg("Unregistering from rooms...")
+                try:
+                    target.unregister_from_all_rooms()
+                except Exception as e:
+                    caller.msg(f"Error unregistering from rooms: {e}")
             
             # Step 3: Clear all attributes
             if not quiet:
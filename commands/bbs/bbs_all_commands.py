@@ -348,7 +348,7 @@ class CmdBBS(default_cmds.MuxCommand):
             self.caller.msg(f"You do not have write access to post on the board '{board['name']}'.")
             return
             
-        post_number = len(board['posts']) + 1
+        post_number = board['post_count'] + 1
         controller.create_post(board['id'], title, content, self.caller.key)
         
         self.caller.msg(f"Post '{title}' added to board '{board['name']}'.")
@@ -668,44 +668,39 @@ class CmdBBS(default_cmds.MuxCommand):
     def do_scan(self):
         """Handle the scan switch - show unread posts on all accessible boards."""
         controller = get_or_create_bbs_controller()
-        boards = controller.db.boards
+        boards = controller.boards
         if not boards:
             self.caller.msg("No boards available.")
             return
 
         # Get the character's unsubscribed boards list
         unsubscribed_boards = self.caller.attributes.get("unsubscribed_bbs_boards", [])
+        is_staff = self.check_admin_access() or self.check_builder_access()
+        access = controller.get_access_map(self.caller.key, boards)
 
-        # Count total unread posts
-        total_unread = 0
-        unread_boards = []
-
-        # Sort boards by ID
-        sorted_boards = sorted(boards.items(), key=lambda x: x[0])
-
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, self.caller.key):
-                continue
-            
-            # Skip unsubscribed boards unless admin/builder
-            if board_id in unsubscribed_boards and not (self.check_admin_access() or self.check_builder_access()):
-                continue
-
-            unread_posts = controller.get_unread_posts(board_id, self.caller.key)
-            if not unread_posts:
-                continue
-
-            total_unread += len(unread_posts)
-            unread_boards.append((board['name'], len(unread_posts)))
+        # Sort boards by ID, skipping inaccessible and unsubscribed (unless admin/builder) boards
+        sorted_boards = [
+            (board_id, board) for board_id, board in sorted(boards.items(), key=lambda x: x[0])
+            if access[board_id][0] and (board_id not in unsubscribed_boards or is_staff)
+        ]
+        board_ids = [board_id for board_id, _ in sorted_boards]
 
         # If this is a login notification (no explicit command), show concise output
         if not hasattr(self, 'session') or not self.session:
+            unread_counts = controller.get_unread_counts(self.caller.key, board_ids)
+            total_unread = sum(unread_counts.values())
             if total_unread > 0:
-                board_summary = ", ".join(f"{name}: {count}" for name, count in unread_boards)
+                board_summary = ", ".join(
+                    f"{board['name']}: {unread_counts[board_id]}"
+                    for board_id, board in sorted_boards if board_id in unread_counts
+                )
                 self.caller.msg(f"|wYou have {total_unread} unread post{'s' if total_unread != 1 else ''} "
                               f"on the bulletin board ({board_summary}).|n")
             return
 
+        unread_map = controller.get_unread_map(self.caller.key, board_ids)
+        total_unread = sum(len(posts) for posts in unread_map.values())
+
         # Otherwise show detailed scan output
         # Table Header
         output = []
@@ -714,14 +709,7 @@ class CmdBBS(default_cmds.MuxCommand):
         output.append(f"{'|b-|n'*78}")
 
         for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, self.caller.key):
-                continue
-            
-            # Skip unsubscribed boards unless admin/builder
-            if board_id in unsubscribed_boards and not (self.check_admin_access() or self.check_builder_access()):
-                continue
-
-            unread_posts = controller.get_unread_posts(board_id, self.caller.key)
+            unread_posts = unread_map.get(board_id)
             if not unread_posts:
                 continue
 
@@ -732,7 +720,7 @@ class CmdBBS(default_cmds.MuxCommand):
             access_type = ""
             if board.get('roster_names'):  # If board has roster restrictions
                 access_type = "*"  # restricted
-            elif not controller.has_write_access(board_id, self.caller.key):
+            elif not access[board_id][1]:
                 access_type = "-"  # read only
 
             # Format board name with access type
@@ -743,13 +731,13 @@ class CmdBBS(default_cmds.MuxCommand):
         # Add footer with capacity information
         output.append(f"{'|b-|n'*78}")
         if total_unread > 0:
-            total_posts = sum(len(b['posts']) for b in boards.values() if b['id'] not in unsubscribed_boards or (self.check_admin_access() or self.check_builder_access()))
+            total_posts = sum(b['post_count'] for b in boards.values() if b['id'] not in unsubscribed_boards or is_staff)
             if total_posts > 0:  # Avoid division by zero
                 capacity = (total_unread / total_posts) * 100
                 output.append(f"Total unread posts: {total_unread} ({capacity:.1f}% of all posts)")
         
         # Show unsubscribe reminder if there are unsubscribed boards
-        if unsubscribed_boards and (self.check_admin_access() or self.check_builder_access()):
+        if unsubscribed_boards and is_staff:
             output.append("Note: Some boards are hidden due to unsubscribe settings. Use +bbs/subscribe to show them again.")
         
         output.append(f"{'|b=|n'*78}")
@@ -786,20 +774,23 @@ class CmdBBS(default_cmds.MuxCommand):
             return
             
         # Mark all posts as read
-        for i in range(len(board['posts'])):
-            controller.mark_post_read(board_ref, i, self.caller.key)
+        controller.mark_board_read(board['id'], self.caller.key)
             
         self.caller.msg(f"All posts in board '{board['name']}' have been marked as read.")
 
     def list_boards(self, controller):
         """List all available boards."""
-        boards = controller.db.boards
+        boards = controller.boards
         if not boards:
             self.caller.msg("No boards available.")
             return
 
         # Get the character's unsubscribed boards list
         unsubscribed_boards = self.caller.attributes.get("unsubscribed_bbs_boards", [])
+        is_staff = self.check_admin_access() or self.check_builder_access()
+        access = controller.get_access_map(self.caller.key, boards)
+        unread_counts = controller.get_unread_counts(
+            self.caller.key, [board_id for board_id, (can_read, _) in access.items() if can_read])
 
         # Table Header
         output = []
@@ -812,17 +803,17 @@ class CmdBBS(default_cmds.MuxCommand):
 
         for board_id, board in sorted_boards:
             # Skip boards the character doesn't have access to
-            if not controller.has_access(board_id, self.caller.key):
+            if not access[board_id][0]:
                 # Only admins and builders can see boards they don't have access to
-                if not (self.check_admin_access() or self.check_builder_access()):
+                if not is_staff:
                     continue
                 
             # Skip unsubscribed boards unless admin/builder
-            if board_id in unsubscribed_boards and not (self.check_admin_access() or self.check_builder_access()):
+            if board_id in unsubscribed_boards and not is_staff:
                 continue
 
             # Check if user has write access, considering admin/builder status
-            has_write = controller.has_write_access(board_id, self.caller.key) or self.check_admin_access() or self.check_builder_access()
+            has_write = access[board_id][1] or is_staff
             read_only = "*" if not has_write else " "
             
             # Determine access type
@@ -835,17 +826,14 @@ class CmdBBS(default_cmds.MuxCommand):
             
             # Get last post time, ensuring it's a date/time string
             last_post = "No posts"
-            if board['posts']:
-                last_post = max((post['created_at'] for post in board['posts']), default="No posts")
-                if last_post != "No posts":
-                    # Only show date, not time
-                    last_post = self.format_date(last_post)
+            if board['last_post_at']:
+                # Only show date, not time
+                last_post = self.format_date(board['last_post_at'])
 
-            num_posts = len(board['posts'])
+            num_posts = board['post_count']
             
             # Get unread post count
-            unread_posts = controller.get_unread_posts(board_id, self.caller.key)
-            unread_count = len(unread_posts)
+            unread_count = unread_counts.get(board_id, 0)
             unread_display = str(unread_count) if unread_count > 0 else "-"
 
             # Fix alignment by using format string with exact spacing
@@ -877,6 +865,7 @@ class CmdBBS(default_cmds.MuxCommand):
             return
 
         posts = board['posts']
+        read_ids = controller.get_read_post_ids(board['id'], self.caller.key)
         pinned_posts = [post for post in posts if post.get('pinned', False)]
         unpinned_posts = [post for post in posts if not post.get('pinned', False)]
 
@@ -910,7 +899,7 @@ class CmdBBS(default_cmds.MuxCommand):
         for i, post in enumerate(pinned_posts):
             post_id = posts.index(post) + 1
             formatted_time = self.format_datetime(post['created_at'])
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, self.caller.key)
+            is_unread = post['id'] not in read_ids
             unread_flag = "|rU|n" if is_unread else " "
             output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} [Pinned] |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
@@ -918,7 +907,7 @@ class CmdBBS(default_cmds.MuxCommand):
         for post in unpinned_posts:
             post_id = posts.index(post) + 1
             formatted_time = self.format_datetime(post['created_at'])
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, self.caller.key)
+            is_unread = post['id'] not in read_ids
             unread_flag = "|rU|n" if is_unread else " "
             output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
@@ -1050,6 +1039,7 @@ class CmdBBS(default_cmds.MuxCommand):
             return
 
         posts = board['posts']
+        read_ids = controller.get_read_post_ids(board['id'], target_player.key)
         pinned_posts = [post for post in posts if post.get('pinned', False)]
         unpinned_posts = [post for post in posts if not post.get('pinned', False)]
 
@@ -1071,7 +1061,7 @@ class CmdBBS(default_cmds.MuxCommand):
         for i, post in enumerate(pinned_posts):
             post_id = posts.index(post) + 1
             formatted_time = self.format_datetime(post['created_at'], target_player)
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, target_player.key)
+            is_unread = post['id'] not in read_ids
             unread_flag = "|rU|n" if is_unread else " "
             output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} [Pinned] |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
@@ -1079,7 +1069,7 @@ class CmdBBS(default_cmds.MuxCommand):
         for post in unpinned_posts:
             post_id = posts.index(post) + 1
             formatted_time = self.format_datetime(post['created_at'], target_player)
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, target_player.key)
+            is_unread = post['id'] not in read_ids
             unread_flag = "|rU|n" if is_unread else " "
             output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
@@ -1090,10 +1080,13 @@ class CmdBBS(default_cmds.MuxCommand):
 
     def list_boards_as_player(self, controller, target_player):
         """List all available boards as if viewed by the target player."""
-        boards = controller.db.boards
+        boards = controller.boards
         if not boards:
             self.caller.msg("No boards available.")
             return
+        access = controller.get_access_map(target_player.key, boards)
+        unread_counts = controller.get_unread_counts(
+            target_player.key, [board_id for board_id, (can_read, _) in access.items() if can_read])
 
         # Table Header
         output = []
@@ -1107,11 +1100,11 @@ class CmdBBS(default_cmds.MuxCommand):
 
         for board_id, board in sorted_boards:
             # Skip boards the character doesn't have access to
-            if not controller.has_access(board_id, target_player.key):
+            if not access[board_id][0]:
                 continue
 
             # Check if user has write access
-            has_write = controller.has_write_access(board_id, target_player.key)
+            has_write = access[board_id][1]
             read_only = "*" if not has_write else " "
             
             # Determine access type
@@ -1124,17 +1117,14 @@ class CmdBBS(default_cmds.MuxCommand):
             
             # Get last post time, ensuring it's a date/time string
             last_post = "No posts"
-            if board['posts']:
-                last_post = max((post['created_at'] for post in board['posts']), default="No posts")
-                if last_post != "No posts":
-                    # Only show date, not time
-                    last_post = self.format_date(last_post, target_player)
+            if board['last_post_at']:
+                # Only show date, not time
+                last_post = self.format_date(board['last_post_at'], target_player)
 
-            num_posts = len(board['posts'])
+            num_posts = board['post_count']
             
             # Get unread post count
-            unread_posts = controller.get_unread_posts(board_id, target_player.key)
-            unread_count = len(unread_posts)
+            unread_count = unread_counts.get(board_id, 0)
             unread_display = str(unread_count) if unread_count > 0 else "-"
 
             # Fix alignment by using format string with exact spacing
@@ -1151,37 +1141,36 @@ class CmdBBS(default_cmds.MuxCommand):
     def do_scan_as_player(self, target_player):
         """Handle the scan switch - show unread posts on all accessible boards as if viewed by the target player."""
         controller = get_or_create_bbs_controller()
-        boards = controller.db.boards
+        boards = controller.boards
         if not boards:
             self.caller.msg("No boards available.")
             return
 
-        # Count total unread posts
-        total_unread = 0
-        unread_boards = []
+        access = controller.get_access_map(target_player.key, boards)
 
-        # Sort boards by ID
-        sorted_boards = sorted(boards.items(), key=lambda x: x[0])
-
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, target_player.key):
-                continue
-
-            unread_posts = controller.get_unread_posts(board_id, target_player.key)
-            if not unread_posts:
-                continue
-
-            total_unread += len(unread_posts)
-            unread_boards.append((board['name'], len(unread_posts)))
+        # Sort boards by ID, skipping boards the player can't read
+        sorted_boards = [
+            (board_id, board) for board_id, board in sorted(boards.items(), key=lambda x: x[0])
+            if access[board_id][0]
+        ]
+        board_ids = [board_id for board_id, _ in sorted_boards]
 
         # If this is a login notification (no explicit command), show concise output
         if not hasattr(self, 'session') or not self.session:
+            unread_counts = controller.get_unread_counts(target_player.key, board_ids)
+            total_unread = sum(unread_counts.values())
             if total_unread > 0:
-                board_summary = ", ".join(f"{name}: {count}" for name, count in unread_boards)
+                board_summary = ", ".join(
+                    f"{board['name']}: {unread_counts[board_id]}"
+                    for board_id, board in sorted_boards if board_id in unread_counts
+                )
                 self.caller.msg(f"|w{target_player.key} has {total_unread} unread post{'s' if total_unread != 1 else ''} "
                               f"on the bulletin board ({board_summary}).|n")
             return
 
+        unread_map = controller.get_unread_map(target_player.key, board_ids)
+        total_unread = sum(len(posts) for posts in unread_map.values())
+
         # Otherwise show detailed scan output
         # Table Header
         output = []
@@ -1190,10 +1179,7 @@ class CmdBBS(default_cmds.MuxCommand):
         output.append(f"{'|b-|n'*78}")
 
         for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, target_player.key):
-                continue
-
-            unread_posts = controller.get_unread_posts(board_id, target_player.key)
+            unread_posts = unread_map.get(board_id)
             if not unread_posts:
                 continue
 
@@ -1204,7 +1190,7 @@ class CmdBBS(default_cmds.MuxCommand):
             access_type = ""
             if board.get('roster_names'):  # If board has roster restrictions
                 access_type = "*"  # restricted
-            elif not controller.has_write_access(board_id, target_player.key):
+            elif not access[board_id][1]:
                 access_type = "-"  # read only
 
             # Format board name with access type
@@ -1215,7 +1201,7 @@ class CmdBBS(default_cmds.MuxCommand):
         # Add footer with capacity information
         output.append(f"{'|b-|n'*78}")
         if total_unread > 0:
-            total_posts = sum(len(b['posts']) for b in boards.values())
+            total_posts = sum(b['post_count'] for b in boards.values())
             if total_posts > 0:  # Avoid division by zero
                 capacity = (total_unread / total_posts) * 100
                 output.append(f"Total unread posts: {total_unread} ({capacity:.1f}% of all posts)")
@@ -1241,8 +1227,7 @@ class CmdBBS(default_cmds.MuxCommand):
             return
             
         # Mark all posts as read
-        for i in range(len(board['posts'])):
-            controller.mark_post_read(board_ref, i, target_player.key)
+        controller.mark_board_read(board['id'], target_player.key)
             
         self.caller.msg(f"All posts in board '{board['name']}' have been marked as read for {target_player.key}.")
 
@@ -61,11 +61,10 @@ class CmdCreateBoard(default_cmds.MuxCommand):
             controller = BBSController.objects.get(db_key="BBSController")
         except BBSController.DoesNotExist:
             controller = create_object(BBSController, key="BBSController")
-            controller.db.boards = {}  # Initialize with an empty boards dictionary if needed
             self.caller.msg("BBSController created.")
 
         # Create the board
-        controller.create_board(name, description, public, roster_names=roster_names)
+        controller.create_board(name, description, roster_names=roster_names, public=public)
         msg = f"Board '{name}' created as {'public' if public else 'private'}"
         if roster_names:
             msg += f" (restricted to rosters: {', '.join(roster_names)})"
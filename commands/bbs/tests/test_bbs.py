@@ -193,8 +193,7 @@ class TestCmdResetBBS(unittest.TestCase):
         self.caller.ndb.confirmation = "yes"
         self.cmd.func()
         self.caller.msg.assert_called_with("BBSController has been reset. All boards and posts have been deleted.")
-        self.assertEqual(self.bbs_controller.db.boards, {})
-        self.assertEqual(self.bbs_controller.db.next_board_id, 1)
+        self.assertEqual(self.bbs_controller.boards, {})
 
     def test_create_bbs_controller_if_not_exist(self):
         """
@@ -210,8 +209,7 @@ class TestCmdResetBBS(unittest.TestCase):
         self.caller.msg.assert_any_call("BBSController has been reset. All boards and posts have been deleted.")
         new_controller = BBSController.objects.get(db_key="BBSController")
         self.assertIsNotNone(new_controller)
-        self.assertEqual(new_controller.db.boards, {})
-        self.assertEqual(new_controller.db.next_board_id, 1)
+        self.assertEqual(new_controller.boards, {})
 
 
 class TestBBSAllCommands(unittest.TestCase):
@@ -0,0 +1,115 @@
+"""
+Test cases for the BBS tables behind BBSController.
+"""
+from datetime import datetime, timezone as dt_timezone
+from django.utils import timezone
+from evennia import create_object
+from evennia.utils.test_resources import EvenniaTest
+from typeclasses.bbs_controller import BBSController, _parse_time
+from world.wod20th.models import BBSBoard, BBSPost, BBSPostRead
+
+
+class TestBBSStorage(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.bbs = create_object(BBSController, key="BBSController")
+
+    def post(self, board, *titles):
+        """Create posts on a board in order."""
+        for title in titles:
+            self.bbs.create_post(board, title, f"About {title}", "Author")
+
+    def test_parse_time(self):
+        """Test legacy timestamps become aware datetimes and bad ones fall back to now."""
+        self.assertEqual(_parse_time("2024-01-02 03:04:05"),
+                         datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc))
+        self.assertIsNone(_parse_time(None))
+        before = timezone.now()
+        self.assertGreaterEqual(_parse_time("last Tuesday"), before)
+
+    def test_import_legacy_boards(self):
+        """Test a legacy board dict becomes board, post and read rows."""
+        self.bbs.attributes.add('boards', {
+            3: {
+                'name': "Announcements",
+                'description': "Staff news",
+                'read_only': True,
+                'posts': [
+                    {'title': "Welcome", 'content': "Hello", 'author': "Staff",
+                     'created_at': "2024-01-02 03:04:05", 'edited_at': None, 'pinned': True},
+                    {'title': "Rules", 'content': "Be nice", 'author': "Staff",
+                     'created_at': "2024-01-03 10:00:00", 'edited_at': "2024-01-04 11:00:00"},
+                    {'title': "Events", 'content': "Soon", 'author': "Staff",
+                     'created_at': "2024-01-05 12:00:00"},
+                ],
+            },
+        })
+        self.bbs.attributes.add('read_posts', {"Reader": {3: [0, 2]}})
+        self.bbs.import_legacy_boards()
+
+        board = BBSBoard.objects.get(board_id=3)
+        self.assertEqual((board.name, board.description, board.read_only), ("Announcements", "Staff news", True))
+        posts = list(BBSPost.objects.filter(board=board).order_by('id'))
+        self.assertEqual([post.title for post in posts], ["Welcome", "Rules", "Events"])
+        self.assertTrue(posts[0].pinned)
+        self.assertEqual(posts[0].created_at, datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc))
+        self.assertIsNone(posts[0].edited_at)
+        self.assertEqual(posts[1].edited_at, datetime(2024, 1, 4, 11, 0, tzinfo=dt_timezone.utc))
+        self.assertEqual(set(BBSPostRead.objects.filter(reader="Reader").values_list('post_id', flat=True)),
+                         {posts[0].id, posts[2].id})
+
+        self.assertIsNone(self.bbs.attributes.get('boards'))
+        self.assertIsNone(self.bbs.attributes.get('read_posts'))
+        self.assertIn(3, self.bbs.attributes.get('legacy_bbs')['boards'])
+
+        # A second import finds nothing left to move
+        self.bbs.import_legacy_boards()
+        self.assertEqual(BBSPost.objects.filter(board=board).count(), 3)
+
+    def test_post_order(self):
+        """Test posts are numbered in creation order and renumber after a delete."""
+        self.bbs.create_board("General", "Chat")
+        self.post("General", "First", "Second", "Third")
+        self.bbs.pin_post("General", 2)
+        self.assertEqual([post['title'] for post in self.bbs.get_posts("General")], ["First", "Second", "Third"])
+
+        self.bbs.delete_post("General", 0)
+        self.assertEqual([post['title'] for post in self.bbs.get_posts("General")], ["Second", "Third"])
+        self.assertEqual(self.bbs.boards[self.bbs.get_board_id("General")]['post_count'], 2)
+
+    def test_unread_counts(self):
+        """Test unread counts and numbers drop as a character reads."""
+        board_id = self.bbs.create_board("General", "Chat")['id']
+        other_id = self.bbs.create_board("Other", "More chat")['id']
+        self.post("General", "First", "Second", "Third")
+        self.post("Other", "Elsewhere")
+
+        self.assertEqual(self.bbs.get_unread_counts("Reader", [board_id, other_id]), {board_id: 3, other_id: 1})
+        self.assertTrue(self.bbs.mark_post_read("General", 1, "Reader"))
+        self.assertEqual(self.bbs.get_unread_counts("Reader", [board_id, other_id]), {board_id: 2, other_id: 1})
+        self.assertEqual(self.bbs.get_unread_posts("General", "Reader"), [1, 3])
+        self.assertFalse(self.bbs.is_post_unread("General", 1, "Reader"))
+
+        # Another reader's markers are their own
+        self.assertEqual(self.bbs.get_unread_counts("Someone", [board_id]), {board_id: 3})
+
+        self.assertEqual(self.bbs.mark_board_read("General", "Reader"), 2)
+        self.assertEqual(self.bbs.get_unread_counts("Reader", [board_id, other_id]), {other_id: 1})
+        self.assertEqual(self.bbs.get_unread_map("Reader", [board_id]), {})
+
+    def test_edit_keeps_created_at(self):
+        """Test editing a post sets edited_at and leaves created_at alone."""
+        self.bbs.create_board("General", "Chat")
+        self.post("General", "First")
+        post = BBSPost.objects.get(title="First")
+        created_at = post.created_at
+        self.assertIsNone(post.edited_at)
+
+        self.bbs.edit_post("General", 0, "Updated")
+        post.refresh_from_db()
+        self.assertEqual(post.content, "Updated")
+        self.assertEqual(post.created_at, created_at)
+        self.assertIsNotNone(post.edited_at)
+        self.assertGreaterEqual(post.edited_at, created_at)
+        self.assertEqual(self.bbs.get_posts("General")[0]['edited_at'],
+                         post.edited_at.astimezone(dt_timezone.utc).strftime("%Y-%m-%d %H:%M:%S"))
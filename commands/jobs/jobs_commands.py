@@ -10,6 +10,7 @@ from evennia.utils.utils import crop
 from evennia.utils.ansi import ANSIString
 from world.wod20th.utils.ansi_utils import wrap_ansi
 from world.wod20th.utils.formatting import header, footer, divider, format_stat
+from world.wod20th.utils import sequences
 from textwrap import fill
 from django.utils import timezone
 from world.jobs.github_integration import create_issue
@@ -161,13 +162,14 @@ class CmdJobs(MuxCommand):
 
     def list_jobs(self):
         if self.caller.check_permstring("Admin"):
-            jobs = Job.objects.filter(status__in=['open', 'claimed']).order_by('-created_at')
+            jobs = Job.objects.filter(status__in=['open', 'claimed'])
         else:
             jobs = Job.objects.filter(
                 models.Q(requester=self.caller.account) |
                 models.Q(participants=self.caller.account),
                 status__in=['open', 'claimed']
-            ).distinct().order_by('-created_at')
+            ).distinct()
+        jobs = list(jobs.for_listing(self.caller.account).order_by('-created_at'))
 
         if not jobs:
             self.caller.msg("You have no open jobs.")
@@ -202,8 +204,8 @@ class CmdJobs(MuxCommand):
             assignee = job.assignee.username if job.assignee else "-----"
             originator = job.requester.username if job.requester else "-----"
             
-            # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            # Check if job has activity this user hasn't seen
+            unread = job.unread
             title_marker = "|r*|n " if unread else "  "
             
             # Format each field with proper width
@@ -368,11 +370,7 @@ class CmdJobs(MuxCommand):
 
             if queue.name.lower() in ("bug", "code"):
                 issue_title = f"Job {job.id}: {title}"
-                num = create_issue(issue_title, description)
-                if num:
-                    job.github_issue_number = num
-                    job.save()
-                    self.caller.msg(f"GitHub issue #{num} created.")
+                create_issue(issue_title, description).addCallback(self.link_github_issue, job.id)
 
             # Notify the creator
             self.caller.msg(f"|gJob '{title}' created with ID {job.id} in category {category}.|n")
@@ -481,11 +479,7 @@ class CmdJobs(MuxCommand):
 
             if category.lower() in ("bug", "code"):
                 issue_title = f"Job {job.id}: {title}"
-                num = create_issue(issue_title, description)
-                if num:
-                    job.github_issue_number = num
-                    job.save()
-                    self.caller.msg(f"GitHub issue #{num} created.")
+                create_issue(issue_title, description).addCallback(self.link_github_issue, job.id)
 
 
             # Notify the creator
@@ -564,7 +558,12 @@ class CmdJobs(MuxCommand):
             if job.github_issue_number:
                 from world.jobs.github_integration import add_comment
                 body = f"**{self.caller.account.username}** commented:\n\n{comment}"
-                add_comment(job.github_issue_number, body)
+
+                def _failed(failure, caller=self.caller):
+                    logger.error(f"Error commenting on GitHub issue: {failure.getErrorMessage()}")
+                    caller.msg(f"Warning: Failed to add the comment to GitHub: {failure.getErrorMessage()}")
+
+                add_comment(job.github_issue_number, body).addErrback(_failed)
 
             self.caller.msg(f"Comment added to job #{job_id}.")
             self.post_to_jobs_channel(self.caller.name, job.id, "commented on")
@@ -1006,20 +1005,7 @@ class CmdJobs(MuxCommand):
 
             # Use transaction to ensure consistency
             with transaction.atomic():
-                # Get the maximum archive_id from both tables
-                max_archived = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                max_job = Job.objects.exclude(archive_id__isnull=True).aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max(max_archived, max_job) + 1
-                
-                logger.log_info(f"Max archive_id from ArchivedJob: {max_archived}")
-                logger.log_info(f"Max archive_id from Job: {max_job}")
-                logger.log_info(f"Calculated next_archive_id: {next_archive_id}")
-
-                # Verify the archive_id is truly unique
-                while (ArchivedJob.objects.filter(archive_id=next_archive_id).exists() or 
-                       Job.objects.filter(archive_id=next_archive_id).exists()):
-                    next_archive_id += 1
-                    logger.log_info(f"Archive ID {next_archive_id-1} was taken, trying {next_archive_id}")
+                next_archive_id = ArchivedJob.next_archive_id()
 
                 # Create comments text
                 comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
@@ -1118,9 +1104,7 @@ class CmdJobs(MuxCommand):
 
             # Use transaction to ensure consistency
             with transaction.atomic():
-                # Get the next archive_id
-                max_archive_id = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max_archive_id + 1
+                next_archive_id = ArchivedJob.next_archive_id()
 
                 # Create comments text
                 comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
@@ -1291,7 +1275,7 @@ class CmdJobs(MuxCommand):
         queue_name = self.args.strip()
         try:
             queue = Queue.objects.get(name__iexact=queue_name)
-            jobs = Job.objects.filter(queue=queue).order_by('status')
+            jobs = Job.objects.filter(queue=queue).select_related('requester', 'assignee').order_by('status')
 
             if not jobs.exists():
                 self.caller.msg(f"No jobs found in the queue '{queue_name}'.")
@@ -1422,6 +1406,17 @@ class CmdJobs(MuxCommand):
             except ArchivedJob.DoesNotExist:
                 self.caller.msg(f"Archived job #{job_id} not found.")
 
+    def link_github_issue(self, num, job_id):
+        """Store a newly created GitHub issue number on its job."""
+        if num:
+            # Set it on the shared (idmapper) instance so later saves keep it
+            job = Job.objects.filter(id=job_id).first()
+            if job:
+                job.github_issue_number = num
+                job.save(update_fields=["github_issue_number"])
+            self.caller.msg(f"GitHub issue #{num} created for job #{job_id}.")
+        return num
+
     def post_to_jobs_channel(self, player_name, job_id, action):
         """Post a message to the Jobs channel for admin visibility."""
         from evennia.comms.models import ChannelDB
@@ -1648,9 +1643,7 @@ class CmdJobs(MuxCommand):
 
             # Use transaction to ensure consistency
             with transaction.atomic():
-                # Get the next archive_id
-                max_archive_id = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max_archive_id + 1
+                next_archive_id = ArchivedJob.next_archive_id()
 
                 # Create comments text
                 comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
@@ -1688,19 +1681,23 @@ class CmdJobs(MuxCommand):
 
                 # Close the GitHub issue if one exists and the job is being cancelled
                 if new_status == "cancelled" and job.github_issue_number:
-                    try:
-                        from world.jobs.github_integration import close_issue, add_comment
-                        
-                        # Add a comment indicating why the issue was cancelled
-                        comment_body = f"Job was cancelled by {self.caller.account.username}\n\nReason: {reason}"
-                        add_comment(job.github_issue_number, comment_body)
-                        
-                        # Close the issue
-                        close_issue(job.github_issue_number)
-                        self.caller.msg(f"GitHub issue #{job.github_issue_number} has been closed.")
-                    except Exception as e:
-                        logger.error(f"Error closing GitHub issue: {e}")
-                        self.caller.msg(f"Warning: Failed to close GitHub issue: {e}")
+                    from world.jobs.github_integration import comment_and_close
+
+                    # Comment with the reason, then close the issue
+                    issue_number = job.github_issue_number
+                    comment_body = f"Job was cancelled by {self.caller.account.username}\n\nReason: {reason}"
+
+                    def _closed(closed, caller=self.caller):
+                        if closed:
+                            caller.msg(f"GitHub issue #{issue_number} has been closed.")
+                        else:
+                            caller.msg(f"Warning: Failed to close GitHub issue #{issue_number}.")
+
+                    def _failed(failure, caller=self.caller):
+                        logger.error(f"Error closing GitHub issue: {failure.getErrorMessage()}")
+                        caller.msg(f"Warning: Failed to close GitHub issue: {failure.getErrorMessage()}")
+
+                    comment_and_close(issue_number, comment_body).addCallbacks(_closed, _failed)
 
                 job.save()
 
@@ -1774,13 +1771,14 @@ class CmdJobs(MuxCommand):
                 models.Q(requester=self.caller.account) |
                 models.Q(assignee=self.caller.account),
                 status__in=['open', 'claimed']
-            ).distinct().order_by('-created_at')
+            ).distinct()
         else:
             # For players, show only jobs they created
             jobs = Job.objects.filter(
                 requester=self.caller.account,
                 status__in=['open', 'claimed']
-            ).order_by('-created_at')
+            )
+        jobs = list(jobs.for_listing(self.caller.account).order_by('-created_at'))
 
         if not jobs:
             self.caller.msg("You have no open jobs.")
@@ -1798,8 +1796,8 @@ class CmdJobs(MuxCommand):
             assignee = job.assignee.username if job.assignee else "-----"
             originator = job.requester.username if job.requester else "-----"
             
-            # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            # Check if job has activity this user hasn't seen
+            unread = job.unread
             title_marker = "|r*|n " if unread else "  "
             
             row = (
@@ -1916,10 +1914,10 @@ class CmdJobs(MuxCommand):
             self.caller.msg("You don't have permission to use this command.")
             return
 
-        jobs = Job.objects.filter(
+        jobs = list(Job.objects.filter(
             assignee=self.caller.account,
             status__in=['open', 'claimed']
-        ).order_by('-created_at')
+        ).for_listing(self.caller.account).order_by('-created_at'))
 
         if not jobs:
             self.caller.msg("You have no jobs assigned to you.")
@@ -1936,8 +1934,8 @@ class CmdJobs(MuxCommand):
         for job in jobs:
             originator = job.requester.username if job.requester else "-----"
             
-            # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            # Check if job has activity this user hasn't seen
+            unread = job.unread
             title_marker = "|r*|n " if unread else "  "
             
             row = (
@@ -2064,6 +2062,10 @@ class CmdJobs(MuxCommand):
                         # SQLite - just delete from sqlite_sequence
                         cursor.execute("DELETE FROM sqlite_sequence WHERE name IN ('jobs_job', 'jobs_archivedjob');")
 
+                # Restart job and archive numbering from 1
+                sequences.reset('jobs.job')
+                sequences.reset('jobs.archive')
+
                 # Recreate jobs in order
                 old_to_new_mapping = {}
                 for job_info in job_data:
@@ -2239,13 +2241,15 @@ class CmdJobs(MuxCommand):
                 models.Q(participants=player) |
                 models.Q(assignee=player),
                 archive_id__isnull=True
-            ).distinct().order_by('-created_at')
+            ).distinct().select_related('requester', 'assignee', 'queue').prefetch_related(
+                'participants'
+            ).order_by('-created_at')
             
             # Find archived jobs where player was requester or assignee
             archived_jobs = ArchivedJob.objects.filter(
                 models.Q(requester=player) |
                 models.Q(assignee=player)
-            ).distinct().order_by('-closed_at')
+            ).distinct().select_related('requester', 'assignee', 'queue').order_by('-closed_at')
             
             # Count of each type
             active_count = active_jobs.count()
@@ -4,11 +4,84 @@ Mail command implementation that filters out page messages from the display.
 from evennia.contrib.game_systems.mail import CmdMail as EvenniaCmdMail
 from evennia.utils import evtable, logger
 from evennia.comms.models import Msg
-from django.db.models import Q
+from django.db.models import BooleanField, Count, Exists, ExpressionWrapper, OuterRef, Q, Subquery
 import datetime
 from django.utils import timezone
 from evennia.accounts.models import AccountDB
 
+# Messages shown per @mail page
+MAIL_PAGE_SIZE = 20
+# Account Attribute marking that legacy untagged mail has been tagged
+MAIL_INDEX_ATTR = "mail_indexed"
+# Senders whose old notifications predate mail tagging
+LEGACY_MAIL_SENDERS = ("Nicole", "Jimmy", "Soma", "Frank", "Marid")
+
+JOB_MAIL = Q(db_header__contains="Job #") | Q(db_message__contains="Job #")
+
+MsgTag = Msg.db_tags.through
+
+
+def _msg_tags(**kwargs):
+    """Tag rows of the message being annotated."""
+    return MsgTag.objects.filter(msg_id=OuterRef("pk"), **kwargs)
+
+
+def mailbox_queryset(receiver):
+    """
+    Return every mail message received by an account in one query, oldest
+    first.
+
+    A message is mail if it has any tag in the 'mail' category (new, read,
+    sent, folder_*) or the old 'MAIL' tag. Pages, sent copies addressed to
+    someone else and relayed pages are left out. Each message is annotated
+    with is_new, is_job and mail_folder, and its senders are prefetched, so
+    listing a page needs no per-message queries.
+    """
+    mail_tags = MsgTag.objects.filter(msg_id=OuterRef("pk")).filter(
+        Q(tag__db_category="mail") | Q(tag__db_key="MAIL")
+    )
+    return (
+        Msg.objects.filter(db_receivers_accounts=receiver)
+        .filter(Exists(mail_tags))
+        .exclude(Exists(_msg_tags(tag__db_key="page")))
+        .exclude(Q(db_header__startswith="TO:") & ~Q(db_header__contains=receiver.username))
+        .exclude(Q(db_message__contains="From afar,") & Q(db_message__contains="pages:"))
+        .annotate(
+            is_new=Exists(_msg_tags(tag__db_key="new", tag__db_category="mail")),
+            is_job=ExpressionWrapper(JOB_MAIL, output_field=BooleanField()),
+            mail_folder=Subquery(
+                _msg_tags(tag__db_category="mail", tag__db_key__startswith="folder_")
+                .values("tag__db_key")[:1]
+            ),
+        )
+        .prefetch_related("db_sender_accounts", "db_sender_objects", "db_sender_scripts")
+        .order_by("db_date_created", "id")
+    )
+
+
+def index_legacy_mail(receiver):
+    """
+    Tag an account's untagged legacy mail once, so the mailbox can be found
+    by tag alone.
+
+    Older job notifications and mail from a few staff senders were stored
+    without mail tags and used to be found by scanning message text on
+    every @mail. They get the 'mail' tag the first time the account opens
+    its mailbox.
+    """
+    if receiver.attributes.get(MAIL_INDEX_ATTR):
+        return
+    legacy = (
+        Msg.objects.filter(db_receivers_accounts=receiver)
+        .exclude(db_tags__db_category="mail")
+        .exclude(db_tags__db_key__in=("MAIL", "page"))
+        .filter(JOB_MAIL | Q(db_sender_accounts__username__in=LEGACY_MAIL_SENDERS))
+        .distinct()
+    )
+    for message in legacy:
+        message.tags.add("mail", category="mail")
+    receiver.attributes.add(MAIL_INDEX_ATTR, True)
+
 class CmdMail(EvenniaCmdMail):
     """
     Communicate with others by sending mail.
@@ -16,6 +89,7 @@ class CmdMail(EvenniaCmdMail):
     Usage:
       @mail                    - Displays all the mail an account has in their mailbox
       @mail <#>                - Displays a specific message
+      @mail/page <#>           - Displays another page of your mailbox
       @mail <accounts>=<subject>/<message>
                               - Sends a message to the comma separated list of accounts.
       @mail/delete <#>         - Deletes a specific message
@@ -27,6 +101,7 @@ class CmdMail(EvenniaCmdMail):
                               - Replies to a message #. Prepends message to the original
                                 message text.
     Switches:
+      page    - shows a page of the mailbox, oldest messages first
       delete  - deletes a message or range of messages
       forward - forward a received message to another object with an optional message attached.
       reply   - Replies to a received message, appending the original message to the bottom.
@@ -252,6 +327,16 @@ class CmdMail(EvenniaCmdMail):
         elif not self.switches and not self.args:
             self.display_mail_list()
             return
+
+        # Case 2b: View another page of the mail list
+        elif "page" in self.switches:
+            try:
+                page = int(self.args.strip() or 1)
+            except ValueError:
+                self.caller.msg("Usage: @mail/page <#>")
+                return
+            self.display_mail_list(page)
+            return
         
         # Case 3: View individual message (no switches, numeric arg)
         elif not self.switches and self.args and not self.rhs:
@@ -259,13 +344,11 @@ class CmdMail(EvenniaCmdMail):
                 # Try to convert to an integer
                 mind = int(self.args) - 1
                 
-                # Get all mail messages
-                all_mail = self.get_all_mail()
+                # Fetch just the requested message
+                message = self.get_mailbox()[mind:mind + 1].first() if mind >= 0 else None
                 
                 # Check if the index is valid
-                if 0 <= mind < len(all_mail):
-                    message = all_mail[mind]
-                    
+                if message:
                     # Display message with custom formatting
                     self.display_message(message)
                     return
@@ -569,37 +652,37 @@ class CmdMail(EvenniaCmdMail):
         # For all other cases, let the parent handle it
         super().func()
 
-    def display_mail_list(self):
+    def display_mail_list(self, page=1):
         """
-        Display the full list of mail messages.
+        Display one page of the mail list.
         """
-        messages = self.get_all_mail()
+        mailbox = self.get_mailbox()
+        counts = mailbox.aggregate(
+            total=Count("id"),
+            jobs=Count("id", filter=JOB_MAIL),
+        )
+        total = counts["total"]
 
-        if messages:
+        if total:
             # Create table
             _HEAD_CHAR = "|-"
             _WIDTH = 78
-            
+
+            pages = (total + MAIL_PAGE_SIZE - 1) // MAIL_PAGE_SIZE
+            page = max(1, min(page, pages))
+            offset = (page - 1) * MAIL_PAGE_SIZE
+            messages = mailbox[offset:offset + MAIL_PAGE_SIZE]
+
             # Count job notifications vs regular mail
-            job_count = 0
-            regular_count = 0
-            for message in messages:
-                is_job = False
-                if message.db_message and "Job #" in message.db_message:
-                    job_count += 1
-                    is_job = True
-                if message.db_header and "Job #" in message.db_header:
-                    job_count += 1
-                    is_job = True
-                if not is_job:
-                    regular_count += 1
+            job_count = counts["jobs"]
+            regular_count = total - job_count
             
             # Display header with counts
             self.caller.msg("|015" + "-" * _WIDTH + "|n")
             if job_count > 0:
-                self.caller.msg(f"|wMailbox:|n {len(messages)} messages ({regular_count} regular, {job_count} job notifications)")
+                self.caller.msg(f"|wMailbox:|n {total} messages ({regular_count} regular, {job_count} job notifications)")
             else:
-                self.caller.msg(f"|wMailbox:|n {len(messages)} messages")
+                self.caller.msg(f"|wMailbox:|n {total} messages")
             
             # Create table with headers
             table = evtable.EvTable(
@@ -613,16 +696,8 @@ class CmdMail(EvenniaCmdMail):
             )
             
             # Add each message
-            for i, message in enumerate(messages, 1):
-                # Determine if the message is new
-                is_new = False
-                for tag in message.tags.all():
-                    if hasattr(tag, 'db_category') and tag.db_category == "mail" and tag.db_key == "new":
-                        is_new = True
-                        break
-                    elif isinstance(tag, str) and tag == "new":
-                        is_new = True
-                        break
+            for i, message in enumerate(messages, offset + 1):
+                is_new = message.is_new
                 
                 # Get sender name
                 sender_name = "Unknown"
@@ -638,11 +713,7 @@ class CmdMail(EvenniaCmdMail):
                 subject = message.db_header or ""
                 
                 # Check if this is a job notification
-                is_job = False
-                if message.db_message and "Job #" in message.db_message:
-                    is_job = True
-                if message.db_header and "Job #" in message.db_header:
-                    is_job = True
+                is_job = message.is_job
                 
                 # Apply special formatting for job notifications
                 if is_job:
@@ -684,6 +755,8 @@ class CmdMail(EvenniaCmdMail):
             
             # Display table
             self.caller.msg(str(table))
+            if pages > 1:
+                self.caller.msg(f"Page {page} of {pages}. Use @mail/page <#> to see another page.")
             self.caller.msg("|015" + "-" * _WIDTH + "|n")
         else:
             self.caller.msg("There are no messages in your inbox.")
@@ -744,17 +817,20 @@ class CmdMail(EvenniaCmdMail):
         
         # Mark as read by removing 'new' tag and ensuring 'mail' tag is present
         try:
-            has_new_tag = False
+            # Mailbox messages come annotated with their 'new' state
+            has_new_tag = getattr(message, "is_new", None)
             
             # Check if message has 'new' tag
-            for tag in message.tags.all():
-                if (hasattr(tag, 'db_category') and hasattr(tag, 'db_key') and 
-                    tag.db_category == "mail" and tag.db_key == "new"):
-                    has_new_tag = True
-                    break
-                elif isinstance(tag, str) and tag == "new":
-                    has_new_tag = True
-                    break
+            if has_new_tag is None:
+                has_new_tag = False
+                for tag in message.tags.all():
+                    if (hasattr(tag, 'db_category') and hasattr(tag, 'db_key') and 
+                        tag.db_category == "mail" and tag.db_key == "new"):
+                        has_new_tag = True
+                        break
+                    elif isinstance(tag, str) and tag == "new":
+                        has_new_tag = True
+                        break
             
             # If message was new, remove 'new' tag and add tracking for this read
             if has_new_tag:
@@ -804,125 +880,23 @@ class CmdMail(EvenniaCmdMail):
 
     def get_all_mail(self):
         """
-        Get all the mail for the caller, with page messages filtered out.
-        Uses a comprehensive multi-stage approach.
+        Get all the mail for the caller, with page messages filtered out,
+        oldest first. Each message carries is_new, is_job and mail_folder
+        annotations.
+        """
+        return list(self.get_mailbox())
+
+    def get_mailbox(self):
+        """
+        Return the caller's mailbox as a lazy queryset, so listings can be
+        counted and sliced a page at a time.
         """
-        # Get receiver account
         if self.account_caller:
             receiver = self.caller
         else:
             receiver = self.caller.account
-        
-        # APPROACH 1: Get messages using parent implementation
-        try:
-            parent_messages = super().get_all_mail()
-        except Exception as e:
-            logger.log_err(f"Error in parent mail retrieval: {str(e)}")
-            parent_messages = []
-            
-        # APPROACH 2: Direct database query for all potential mail
-        try:
-            # Look for any message with mail or new tags
-            tagged_messages = Msg.objects.filter(
-                db_receivers_accounts=receiver
-            ).filter(
-                Q(db_tags__db_key='mail', db_tags__db_category='mail') |
-                Q(db_tags__db_key='new', db_tags__db_category='mail') |
-                Q(db_tags__db_key='MAIL')
-            ).distinct()
-        except Exception as e:
-            logger.log_err(f"Error in tagged messages query: {str(e)}")
-            tagged_messages = []
-            
-        # APPROACH 3: Look for messages from specific senders
-        try:
-            sender_messages = Msg.objects.filter(
-                db_receivers_accounts=receiver
-            ).filter(
-                Q(db_sender_accounts__username='Nicole') |
-                Q(db_sender_accounts__username='Jimmy') |
-                Q(db_sender_accounts__username='Soma') |
-                Q(db_sender_accounts__username='Frank') |
-                Q(db_sender_accounts__username='Marid')
-            ).distinct()
-        except Exception as e:
-            logger.log_err(f"Error in sender messages query: {str(e)}")
-            sender_messages = []
-            
-        # APPROACH 4: Look specifically for job-related messages
-        try:
-            job_messages = Msg.objects.filter(
-                db_receivers_accounts=receiver,
-                db_message__contains="Job #"
-            ).distinct()
-        except Exception as e:
-            logger.log_err(f"Error in job messages query: {str(e)}")
-            job_messages = []
-            
-        # Add a more specific query for job subject lines
-        try:
-            job_subject_messages = Msg.objects.filter(
-                db_receivers_accounts=receiver,
-                db_header__contains="Job #"
-            ).distinct()
-        except Exception as e:
-            logger.log_err(f"Error in job subject query: {str(e)}")
-            job_subject_messages = []
-            
-        # APPROACH 5: Get recent messages (last 24 hours)
-        try:
-            one_day_ago = timezone.now() - datetime.timedelta(days=1)
-            recent_messages = Msg.objects.filter(
-                db_receivers_accounts=receiver,
-                db_date_created__gte=one_day_ago
-            ).distinct()
-        except Exception as e:
-            logger.log_err(f"Error in recent messages query: {str(e)}")
-            recent_messages = []
-            
-        # Combine all approaches
-        all_messages = list(parent_messages)
-        message_ids = {msg.id for msg in all_messages}
-        
-        # Add messages from other approaches, avoiding duplicates
-        for msg_set in [tagged_messages, sender_messages, job_messages, job_subject_messages, recent_messages]:
-            for msg in msg_set:
-                if msg.id not in message_ids:
-                    all_messages.append(msg)
-                    message_ids.add(msg.id)
-        
-        # Only filter out messages that are DEFINITELY pages
-        filtered_messages = []
-        for msg in all_messages:
-            # Skip only very obvious page messages
-            
-            # Check for page tag
-            is_page = False
-            for tag in msg.tags.all():
-                tag_key = str(tag)
-                if tag_key == "page":
-                    is_page = True
-                    break
-            
-            if is_page:
-                continue
-                
-            # Skip sent mail copies that aren't TO us
-            if msg.db_header and msg.db_header.startswith("TO:") and receiver.username not in msg.db_header:
-                continue
-                
-            # Only skip messages that are clearly pages by having BOTH indicators
-            if msg.db_message and isinstance(msg.db_message, str):
-                if "From afar," in msg.db_message and "pages:" in msg.db_message:
-                    continue
-            
-            # Keep the message if it passed the minimal filters
-            filtered_messages.append(msg)
-        
-        # Sort by date created, oldest first
-        filtered_messages = sorted(filtered_messages, key=lambda x: x.db_date_created)
-            
-        return filtered_messages
+        index_legacy_mail(receiver)
+        return mailbox_queryset(receiver)
 
     def get_sender_name(self, message):
         """
@@ -963,6 +937,7 @@ class CmdMailCharacter(CmdMail):
     Usage:
       @mail             - Displays all the mail an account has in their mailbox
       @mail <#>         - Displays a specific message
+      @mail/page <#>    - Displays another page of your mailbox
       @mail <accounts>=<subject>/<message>
                         - Sends a message to the comma separated list of accounts.
       @mail/delete <#>  - Deletes a specific message
@@ -975,6 +950,7 @@ class CmdMailCharacter(CmdMail):
                         - Replies to a message #. Prepends message
                          to the original message text.
     Switches:
+      page    - shows a page of the mailbox, oldest messages first
       delete  - deletes a message or range of messages
       forward - forward a received message to another object with an optional message attached.
       reply   - Replies to a received message, appending the original message to the bottom.
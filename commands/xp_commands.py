@@ -23,6 +23,8 @@ from django.db import transaction
 import re
 import decimal
 from utils.search_helpers import search_character
+from world.wod20th.utils.scene_tracker import SCENE_TRACKER
+from world.wod20th.utils.xp_awards import apply_weekly_xp, plan_weekly_xp
 
 """
 Helper functions
@@ -956,12 +958,14 @@ class CmdXP(default_cmds.MuxCommand):
             # Update scene count
             self.caller.db.xp['scenes_this_week'] += 1
             self.caller.db.xp['last_scene'] = now.isoformat()
+            SCENE_TRACKER.forget_character(self.caller)
             
             self.caller.msg(f"Scene ended. You now have {self.caller.db.xp['scenes_this_week']} scenes this week.")
             
         except (ValueError, TypeError):
             self.caller.msg("Error processing scene time. Scene tracking has been reset.")
             self.caller.db.xp['last_scene'] = datetime.now().isoformat()
+            SCENE_TRACKER.forget_character(self.caller)
     
     @transaction.atomic
     def add_xp(self):
@@ -1255,79 +1259,25 @@ class CmdXP(default_cmds.MuxCommand):
         
         self.caller.msg(message)
     
-    @transaction.atomic
     def force_weekly_xp(self):
         """Force weekly XP distribution (staff only)."""
         if not self.caller.check_permstring("builders"):
             self.caller.msg("You don't have permission to force weekly XP distribution.")
             return
             
-        eligible_count, total_xp, report = check_weekly_xp_eligibility()
+        # Dry run: the same plan the weekly script commits
+        plan = plan_weekly_xp()
         
-        self.caller.msg(report)
+        self.caller.msg(plan.report())
         
         if not self.args or self.args.lower() != "confirm":
             self.caller.msg("\nTo actually distribute XP, use: +xp/forceweekly confirm")
             return
             
-        # Process the weekly XP distribution
-        from evennia.objects.models import ObjectDB
-        characters = ObjectDB.objects.filter(
-            db_typeclass_path__contains='typeclasses.characters.Character'
-        )
-        
-        xp_amount = Decimal('4.00')
-        distributed_count = 0
+        # Commit every award in one transaction, with an audit record
+        run = apply_weekly_xp(plan, awarded_by=self.caller.key)
         
-        for char in characters:
-            try:
-                # Skip if character is staff
-                if hasattr(char, 'check_permstring') and char.check_permstring("builders"):
-                    continue
-                    
-                # Get character's XP data
-                xp_data = None
-                if hasattr(char, 'db') and hasattr(char.db, 'xp'):
-                    xp_data = char.db.xp
-                if not xp_data:
-                    continue
-                    
-                # Check scenes this week
-                scenes_this_week = xp_data.get('scenes_this_week', 0)
-                if scenes_this_week <= 0:
-                    continue
-                    
-                # Award XP
-                char.db.xp['total'] = Decimal(str(char.db.xp.get('total', 0))) + xp_amount
-                char.db.xp['current'] = Decimal(str(char.db.xp.get('current', 0))) + xp_amount
-                char.db.xp['ic_xp'] = Decimal(str(char.db.xp.get('ic_xp', 0))) + xp_amount
-                
-                # Log the award
-                log_entry = {
-                    'type': 'receive',
-                    'amount': float(xp_amount),
-                    'reason': 'Weekly Activity',
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                if 'spends' not in char.db.xp:
-                    char.db.xp['spends'] = []
-                char.db.xp['spends'].insert(0, log_entry)
-                
-                # Reset scene count
-                char.db.xp['scenes_this_week'] = 0
-                
-                # Update the counter
-                distributed_count += 1
-                
-                # Notify the character if they're online
-                if hasattr(char, 'msg') and char.sessions.all():
-                    char.msg(f"You have received {xp_amount} XP for weekly activity.")
-                    
-            except Exception as e:
-                logger.log_err(f"Error processing weekly XP for {char.key}: {str(e)}")
-                
-        self.caller.msg(f"Weekly XP distribution complete! {distributed_count} characters received {xp_amount} XP each.")
+        self.caller.msg(f"Weekly XP distribution complete! {run.awarded_count} characters received {plan.amount} XP each.")
     
     @transaction.atomic
     def staff_spend_xp(self):
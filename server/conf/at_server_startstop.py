@@ -55,6 +55,23 @@ def cleanup_scripts():
         puppet_scripts_to_clean.delete()
         logger.log_info(f"Cleaned up {count} Puppet Freeze scripts")
 
+def cleanup_npc_expiration_scripts():
+    """
+    Delete the old per-NPC expiration scripts.
+
+    Only called once NPC_EXPIRY has started, so their NPCs are already queued.
+    """
+    from evennia.scripts.models import ScriptDB
+
+    npc_scripts_to_clean = ScriptDB.objects.filter(
+        db_typeclass_path__contains="NPCExpirationScript"
+    )
+
+    if npc_scripts_to_clean.exists():
+        count = npc_scripts_to_clean.count()
+        npc_scripts_to_clean.delete()
+        logger.log_info(f"Cleaned up {count} NPC expiration scripts")
+
 def initialize_systems():
     """Helper function to initialize game systems."""
     try:
@@ -112,6 +129,23 @@ def create_maintenance_scripts():
             logger.log_info("Created and started new Puppet Freeze script")
         else:
             logger.log_err("Failed to create Puppet Freeze script")
+
+        # The weather script is persistent and survives restarts; create it once
+        from evennia.scripts.models import ScriptDB
+        from world.wod20th.utils.weather_snapshot import REFRESH_INTERVAL
+        if not ScriptDB.objects.filter(db_key="weather_refresh").exists():
+            script = create_script(
+                "world.wod20th.scripts.weather_refresh.WeatherRefreshScript",
+                key="weather_refresh",
+                interval=REFRESH_INTERVAL,
+                persistent=True,
+                autostart=True,
+                desc="Refreshes the shared weather, moon and tide snapshot"
+            )
+            if script and script.is_active:
+                logger.log_info("Created and started new Weather Refresh script")
+            else:
+                logger.log_err("Failed to create Weather Refresh script")
             
     except Exception as e:
         logger.log_err(f"Error creating maintenance scripts: {e}")
@@ -125,6 +159,41 @@ def at_server_start():
     """
     logger.log_info("Server start sequence initiated")
     cleanup_scripts()
+
+    # The +watch index is rebuilt from live sessions on first use
+    from utils.watch_index import WATCH_INDEX
+    WATCH_INDEX.reset()
+
+    # Schema changes can drop the +info search triggers on SQLite
+    try:
+        from world.wod20th.utils.stat_search import install
+        install()
+    except Exception as e:
+        logger.log_err(f"Error checking stat search index: {e}")
+
+    # Load the character name index before the first lookup needs it
+    try:
+        from utils.character_index import CHARACTER_INDEX
+        CHARACTER_INDEX.rebuild()
+    except Exception as e:
+        logger.log_err(f"Error building character name index: {e}")
+
+    # The website character directory is filled once, then kept current by signals
+    try:
+        from world.wod20th.utils.character_directory import ensure_directory
+        built = ensure_directory()
+        if built:
+            logger.log_info(f"Built character directory ({built} characters)")
+    except Exception as e:
+        logger.log_err(f"Error building character directory: {e}")
+
+    # Load the temporary NPC expiry queue and wait for the next NPC due
+    try:
+        from world.wod20th.utils.npc_expiry import NPC_EXPIRY
+        NPC_EXPIRY.start()
+        cleanup_npc_expiration_scripts()
+    except Exception as e:
+        logger.log_err(f"Error starting NPC expiry queue: {e}")
     logger.log_info("Server start sequence completed")
 
 def at_server_cold_start():
@@ -151,6 +220,13 @@ def at_server_stop():
     """
     logger.log_info("Server stopping...")
 
+    # Write out coalesced scene activity before the process goes away
+    try:
+        from world.wod20th.utils.scene_tracker import SCENE_TRACKER
+        SCENE_TRACKER.flush()
+    except Exception as e:
+        logger.log_err(f"Error flushing scene data: {e}")
+
 def at_server_reload_start():
     """
     This is called only when server starts back up after a reload.
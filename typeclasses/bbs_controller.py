@@ -1,58 +1,200 @@
 from evennia import DefaultObject, evennia
-from evennia.utils.utils import datetime_format
+from evennia.utils import logger
 from datetime import datetime
-from world.wod20th.models import RosterMember
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+from world.wod20th.models import RosterMember, BBSBoard, BBSPost, BBSPostRead
+from world.wod20th.utils.sequences import allocate, release, reset
+
+POST_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+BOARD_SEQUENCE = "bbs.board"
+
+
+def _format_time(value):
+    """Format a post timestamp the way the BBS commands expect it."""
+    if not value:
+        return None
+    if timezone.is_aware(value):
+        value = timezone.make_naive(value, timezone.utc)
+    return value.strftime(POST_TIME_FORMAT)
+
+
+def _parse_time(value):
+    """Parse a legacy post timestamp string."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.strptime(value, POST_TIME_FORMAT)
+    except (TypeError, ValueError):
+        return timezone.now()
+    return timezone.make_aware(parsed, timezone.utc) if timezone.is_naive(parsed) else parsed
+
+
+def _post_dict(post):
+    return {
+        'id': post.id,
+        'title': post.title,
+        'content': post.content,
+        'author': post.author,
+        'created_at': _format_time(post.created_at),
+        'edited_at': _format_time(post.edited_at),
+        'pinned': post.pinned,
+    }
+
+
+class BoardView(dict):
+    """
+    A board as the plain dict the BBS commands work with. The 'posts' list
+    is only queried when it is first used.
+    """
+
+    def __missing__(self, key):
+        if key == 'posts':
+            posts = [_post_dict(post) for post in BBSPost.objects.filter(board_id=self['pk']).order_by('id')]
+            self['posts'] = posts
+            return posts
+        if key in ('post_count', 'last_post_at'):
+            stats = BBSPost.objects.filter(board_id=self['pk']).aggregate(
+                post_count=Count('id'), last_post_at=Max('created_at'))
+            self['post_count'] = stats['post_count']
+            self['last_post_at'] = _format_time(stats['last_post_at'])
+            return self[key]
+        raise KeyError(key)
+
+    @classmethod
+    def from_model(cls, board):
+        view = cls(
+            pk=board.pk,
+            id=board.board_id,
+            name=board.name,
+            description=board.description,
+            public=board.public,
+            read_only=board.read_only,
+            locked=board.locked,
+            roster_names=list(board.roster_names or []),
+            access_list=dict(board.access_list or {}),
+        )
+        if hasattr(board, 'post_count'):
+            view['post_count'] = board.post_count
+            view['last_post_at'] = _format_time(board.last_post_at)
+        return view
+
 
 class BBSController(DefaultObject):
     """
     This object manages the bulletin boards and posts in the game.
     It should be placed in the game world and used to handle all BBS-related
     functionality, such as creating boards, posts, and managing access.
+
+    Boards, posts and read markers are stored in the BBSBoard, BBSPost and
+    BBSPostRead tables; boards are handed to commands as BoardView dicts.
     """
     def at_server_start(self):
         """
         Called when the server starts.
         """
-        # Initialize read_posts if it doesn't exist
-        if not self.attributes.has('read_posts'):
-            self.attributes.add('read_posts', {})
+        self.import_legacy_boards()
         return super().at_server_start()
 
     def at_object_creation(self):
         """
-        Initialize the BBSController object. This is called only once, 
+        Initialize the BBSController object. This is called only once,
         when the object is first created.
         """
-        self.db.boards = {}  # Dictionary to store all boards
-        self.db.next_board_id = 1  # Start board numbering from 1
-        self.attributes.add('read_posts', {})  # Dictionary to store read posts per character
+        self.import_legacy_boards()
 
-    @property
-    def read_posts(self):
+    def import_legacy_boards(self):
         """
-        Property to ensure read_posts is always initialized.
+        Move boards, posts and read markers kept in this object's Attributes
+        into the BBS tables. The old data is kept in 'legacy_bbs' afterwards.
         """
-        if not self.attributes.has('read_posts'):
-            self.attributes.add('read_posts', {})
-        return self.attributes.get('read_posts')
+        boards = self.attributes.get('boards')
+        read_posts = self.attributes.get('read_posts') or {}
+        if not boards and not read_posts:
+            return
+        try:
+            with transaction.atomic():
+                post_ids = {}
+                for board_id, board in sorted((boards or {}).items()):
+                    if BBSBoard.objects.filter(board_id=board_id).exists():
+                        continue
+                    board_obj = BBSBoard.objects.create(
+                        board_id=board_id,
+                        name=board.get('name', f"Board {board_id}"),
+                        description=board.get('description', ''),
+                        public=board.get('public', True),
+                        read_only=board.get('read_only', False),
+                        locked=board.get('locked', False),
+                        roster_names=list(board.get('roster_names') or []),
+                        access_list=dict(board.get('access_list') or {}),
+                    )
+                    for index, post in enumerate(board.get('posts', [])):
+                        post_obj = BBSPost.objects.create(
+                            board=board_obj,
+                            title=post.get('title', ''),
+                            content=post.get('content', ''),
+                            author=post.get('author', ''),
+                            created_at=_parse_time(post.get('created_at')) or timezone.now(),
+                            edited_at=_parse_time(post.get('edited_at')),
+                            pinned=post.get('pinned', False),
+                        )
+                        post_ids[(board_id, index)] = post_obj.id
+
+                reads = []
+                for reader, boards_read in read_posts.items():
+                    for board_id, indexes in boards_read.items():
+                        for index in indexes:
+                            post_id = post_ids.get((board_id, index))
+                            if post_id:
+                                reads.append(BBSPostRead(post_id=post_id, reader=reader))
+                BBSPostRead.objects.bulk_create(reads, ignore_conflicts=True)
+
+            self.attributes.add('legacy_bbs', {'boards': boards, 'read_posts': read_posts})
+            self.attributes.remove('boards')
+            self.attributes.remove('read_posts')
+            self.attributes.remove('next_board_id')
+            # Imported boards keep their old IDs; reseed around them
+            reset(BOARD_SEQUENCE)
+            logger.log_info(f"Imported {len(boards or {})} BBS boards into the BBS tables")
+        except Exception as e:
+            logger.log_err(f"Error importing legacy BBS boards: {e}")
+
+    # ------------------------------------------------------------------
+    # Boards
+    # ------------------------------------------------------------------
 
     def _find_next_available_board_id(self):
         """
-        Find the next available board ID by looking for gaps in the sequence
-        or returning the next number after the highest existing ID.
+        Allocate a board ID, filling gaps left by deleted boards before
+        moving past the highest ID.
+        """
+        return allocate(BOARD_SEQUENCE, lambda: BBSBoard.objects.values_list('board_id', flat=True),
+                        reuse_gaps=True)
+
+    def _get_board_obj(self, board_reference):
+        """Return the BBSBoard for an ID or name, or None."""
+        try:
+            board_id = int(board_reference)
+            board = BBSBoard.objects.filter(board_id=board_id).first()
+            if board:
+                return board
+        except (ValueError, TypeError):
+            pass
+        return BBSBoard.objects.filter(name__iexact=str(board_reference)).first()
+
+    @property
+    def boards(self):
+        """
+        All boards keyed by board ID, each with post_count and last_post_at,
+        loaded with a single query.
         """
-        if not self.db.boards:
-            return 1
-            
-        existing_ids = sorted(self.db.boards.keys())
-        # Look for gaps in the sequence
-        for i, board_id in enumerate(existing_ids, 1):
-            if i != board_id:
-                return i
-        # If no gaps found, return next number after highest
-        return existing_ids[-1] + 1
+        queryset = BBSBoard.objects.annotate(
+            post_count=Count('posts'), last_post_at=Max('posts__created_at')
+        ).order_by('board_id')
+        return {board.board_id: BoardView.from_model(board) for board in queryset}
 
-    def create_board(self, name, description, read_only=False, roster_names=None):
+    def create_board(self, name, description, read_only=False, roster_names=None, public=True):
         """
         Create a new board.
         Args:
@@ -60,81 +202,129 @@ class BBSController(DefaultObject):
             description (str): Board description
             read_only (bool): Whether the board is read-only
             roster_names (list, optional): List of roster names this board is restricted to
+            public (bool): Whether the board is listed as public
         """
-        if any(board['name'].lower() == name.lower() for board in self.db.boards.values()):
+        if BBSBoard.objects.filter(name__iexact=name).exists():
             raise ValueError("A board with this name already exists.")
-        
-        # Use next available ID instead of next_board_id
-        board_id = self._find_next_available_board_id()
-        board = {
-            'id': board_id,
-            'name': name,
-            'description': description,
-            'read_only': read_only,
-            'posts': [],
-            'roster_names': roster_names or [],  # Store as list of roster names
-        }
-        self.db.boards[board_id] = board
-        self.db.next_board_id = self._find_next_available_board_id()
+
+        board = BBSBoard.objects.create(
+            board_id=self._find_next_available_board_id(),
+            name=name,
+            description=description,
+            public=public,
+            read_only=read_only,
+            roster_names=roster_names or [],
+        )
+        return BoardView.from_model(board)
 
     def get_board(self, board_reference):
         """
         Get a board by either its ID or name.
-        
+
         Args:
             board_reference: Either a board ID (integer) or board name (string)
-            
+
         Returns:
             dict: The board data if found, None otherwise
         """
-        boards = self.db.boards
-        
-        # Try to convert to integer for ID lookup
-        try:
-            board_id = int(board_reference)
-            if board_id in boards:
-                return boards[board_id]
-        except (ValueError, TypeError):
-            pass
-            
-        # If not found by ID or not a valid ID, try name lookup
-        for board in boards.values():
-            if board['name'].lower() == str(board_reference).lower():
-                return board
-                
-        return None
+        board = self._get_board_obj(board_reference)
+        return BoardView.from_model(board) if board else None
 
     def get_board_id(self, board_reference):
         """
         Get a board ID from either an ID or name reference.
-        
+
         Args:
             board_reference: Either a board ID (integer) or board name (string)
-            
+
         Returns:
             int: The board ID if found, None otherwise
         """
-        board = self.get_board(board_reference)
-        return board['id'] if board else None
+        board = self._get_board_obj(board_reference)
+        return board.board_id if board else None
+
+    def delete_board(self, board_reference):
+        """
+        Delete an entire board along with its posts.
+        :param board_reference: (str or int) The name or ID of the board to delete.
+        """
+        board = self._get_board_obj(board_reference)
+        if board:
+            name, board_id = board.name, board.board_id
+            board.delete()
+            release(BOARD_SEQUENCE, board_id)
+            return f"Board '{name}' and all its posts have been deleted."
+        return "Board not found"
+
+    def delete_all_boards(self):
+        """Delete every board, post and read marker."""
+        BBSBoard.objects.all().delete()
+        reset(BOARD_SEQUENCE)
+
+    def save_board(self, board_reference, updated_board_data):
+        """
+        Update board data with provided changes.
+        :param board_reference: (str or int) The name or ID of the board to update.
+        :param updated_board_data: (dict) Dictionary containing updated board data.
+        """
+        board = self._get_board_obj(board_reference)
+        if not board:
+            return "Board not found"
+        editable = ('name', 'description', 'public', 'read_only', 'locked', 'roster_names', 'access_list')
+        changed = [key for key in editable if key in updated_board_data]
+        for key in changed:
+            setattr(board, key, updated_board_data[key])
+        if changed:
+            board.save(update_fields=changed)
+        return f"Board '{board.name}' has been updated."
+
+    def lock_board(self, board_reference):
+        """
+        Lock a board to prevent new posts from being made.
+        :param board_reference: (str or int) The name or ID of the board to lock.
+        """
+        board = self._get_board_obj(board_reference)
+        if board:
+            board.locked = True
+            board.save(update_fields=['locked'])
+            return f"Board '{board.name}' has been locked."
+        return "Board not found"
+
+    def set_read_only(self, board_name, read_only=True):
+        """Set a board to read-only mode."""
+        board = self._get_board_obj(board_name)
+        if not board:
+            return f"No board found with the name '{board_name}'."
+
+        board.read_only = read_only
+        board.save(update_fields=['read_only'])
+        return f"Board '{board_name}' has been set to {'read-only' if read_only else 'writable'} mode."
+
+    # ------------------------------------------------------------------
+    # Posts
+    # ------------------------------------------------------------------
+
+    def _get_post_obj(self, board, post_index):
+        """Return the post at a 0-based position on a board, or None."""
+        if post_index < 0:
+            return None
+        return BBSPost.objects.filter(board=board).order_by('id')[post_index:post_index + 1].first()
 
     def create_post(self, board_reference, title, content, author):
         """
         Create a new post on a specified board.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_obj(board_reference)
         if not board:
             return "Board not found"
-        now = datetime.now()
-        post = {
-            'title': title,
-            'content': content,
-            'author': author,
-            'created_at': now.strftime("%Y-%m-%d %H:%M:%S"),  # Format as YYYY-MM-DD HH:MM:SS
-            'edited_at': None,
-            'pinned': False  # Initialize pinned status
-        }
-        board['posts'].append(post)
-        return f"Post '{title}' created on board '{board['name']}'."
+        BBSPost.objects.create(
+            board=board,
+            title=title,
+            content=content,
+            author=author,
+            created_at=timezone.now(),
+        )
+        return f"Post '{title}' created on board '{board.name}'."
 
     def get_posts(self, board_reference):
         """
@@ -147,42 +337,49 @@ class BBSController(DefaultObject):
         """
         Edit an existing post's content.
         """
-        board = self.get_board(board_reference)
-        if board and 0 <= post_index < len(board['posts']):
-            board['posts'][post_index]['content'] = new_content
-            board['posts'][post_index]['edited_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Format as YYYY-MM-DD HH:MM:SS
+        board = self._get_board_obj(board_reference)
+        post = self._get_post_obj(board, post_index) if board else None
+        if post:
+            post.content = new_content
+            post.edited_at = timezone.now()
+            post.save(update_fields=['content', 'edited_at'])
 
     def delete_post(self, board_reference, post_index):
         """
         Delete a post from a board.
         """
-        board = self.get_board(board_reference)
-        if board and 0 <= post_index < len(board['posts']):
-            del board['posts'][post_index]
+        board = self._get_board_obj(board_reference)
+        post = self._get_post_obj(board, post_index) if board else None
+        if post:
+            post.delete()
+
+    def _set_pinned(self, board_reference, post_index, pinned):
+        board = self._get_board_obj(board_reference)
+        if not board:
+            return "Board not found"
+        post = self._get_post_obj(board, post_index)
+        if not post:
+            return "Post not found"
+        post.pinned = pinned
+        post.save(update_fields=['pinned'])
+        action = "pinned" if pinned else "unpinned"
+        return f"Post {post_index + 1} in board '{board.name}' has been {action}."
 
     def pin_post(self, board_reference, post_index):
         """
         Pin a post to the top of the board.
         """
-        board = self.get_board(board_reference)
-        if not board:
-            return "Board not found"
-        if 0 <= post_index < len(board['posts']):
-            board['posts'][post_index]['pinned'] = True
-            return f"Post {post_index + 1} in board '{board['name']}' has been pinned."
-        return "Post not found"
+        return self._set_pinned(board_reference, post_index, True)
 
     def unpin_post(self, board_reference, post_index):
         """
         Unpin a post from the top of the board.
         """
-        board = self.get_board(board_reference)
-        if not board:
-            return "Board not found"
-        if 0 <= post_index < len(board['posts']):
-            board['posts'][post_index]['pinned'] = False
-            return f"Post {post_index + 1} in board '{board['name']}' has been unpinned."
-        return "Post not found"
+        return self._set_pinned(board_reference, post_index, False)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
 
     def grant_access(self, board_reference, character_name, access_level="full_access"):
         """
@@ -191,9 +388,12 @@ class BBSController(DefaultObject):
         :param character_name: (str) The name of the character to grant access.
         :param access_level: (str) "full_access" or "read_only".
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_obj(board_reference)
         if board:
-            board['access_list'][character_name] = access_level
+            access_list = dict(board.access_list or {})
+            access_list[character_name] = access_level
+            board.access_list = access_list
+            board.save(update_fields=['access_list'])
 
     def revoke_access(self, board_reference, character_name):
         """
@@ -201,9 +401,31 @@ class BBSController(DefaultObject):
         :param board_reference: (str or int) The name or ID of the board.
         :param character_name: (str) The name of the character to revoke access.
         """
-        board = self.get_board(board_reference)
-        if board and character_name in board['access_list']:
-            del board['access_list'][character_name]
+        board = self._get_board_obj(board_reference)
+        if board and character_name in (board.access_list or {}):
+            access_list = dict(board.access_list)
+            del access_list[character_name]
+            board.access_list = access_list
+            board.save(update_fields=['access_list'])
+
+    def _is_staff(self, character_name):
+        """Return True if the named character is an admin or builder."""
+        try:
+            character = evennia.search_object(character_name)[0]
+            return (character.locks.check_lockstring(character, "perm(Admin)") or
+                    character.locks.check_lockstring(character, "perm(Builder)"))
+        except Exception:
+            return False
+
+    def _roster_names_for(self, character_name):
+        """Return the names of every roster the character is an approved member of."""
+        try:
+            return set(RosterMember.objects.filter(
+                character__db_key=character_name,
+                approved=True
+            ).values_list('roster__name', flat=True))
+        except Exception:
+            return set()
 
     def has_roster_access(self, board, character_name):
         """
@@ -216,39 +438,22 @@ class BBSController(DefaultObject):
         """
         if not board.get('roster_names'):
             return True  # No roster restriction
-            
-        try:
-            # Check if character is a member of any of the required rosters
-            for roster_name in board['roster_names']:
-                member = RosterMember.objects.filter(
-                    character__db_key=character_name,
-                    roster__name=roster_name,
-                    approved=True
-                ).exists()
-                if member:
-                    return True
-            return False
-        except Exception:
-            return False
+        return bool(self._roster_names_for(character_name) & set(board['roster_names']))
 
     def has_access(self, board_id, character_name):
         """Check if a character has access to a board."""
         board = self.get_board(board_id)
         if not board:
             return False
-            
+
         # Check if character is an admin/builder
-        try:
-            character = evennia.search_object(character_name)[0]
-            if character.locks.check_lockstring(character, "perm(Admin)") or character.locks.check_lockstring(character, "perm(Builder)"):
-                return True
-        except:
-            pass
-            
+        if self._is_staff(character_name):
+            return True
+
         # If board has roster restrictions, check roster access
         if board.get('roster_names'):
             return self.has_roster_access(board, character_name)
-            
+
         # If no roster restrictions, everyone has access
         return True
 
@@ -257,64 +462,119 @@ class BBSController(DefaultObject):
         board = self.get_board(board_id)
         if not board:
             return False
-            
+
         # Check if character is an admin/builder
-        try:
-            character = evennia.search_object(character_name)[0]
-            if character.locks.check_lockstring(character, "perm(Admin)") or character.locks.check_lockstring(character, "perm(Builder)"):
-                return True
-        except:
-            pass
-            
+        if self._is_staff(character_name):
+            return True
+
         # Read-only boards only allow admin/builder writes
         if board.get('read_only', False):
             return False
-            
+
         # If board has roster restrictions, check roster access
         if board.get('roster_names'):
             return self.has_roster_access(board, character_name)
-            
+
         # If no roster restrictions, everyone has write access unless read-only
         return True
 
-    def delete_board(self, board_reference):
+    def get_access_map(self, character_name, boards=None):
         """
-        Delete an entire board along with its posts.
-        :param board_reference: (str or int) The name or ID of the board to delete.
+        Work out read and write access to many boards at once.
+
+        Args:
+            character_name (str): The character to check.
+            boards (dict, optional): Boards as returned by the boards property.
+
+        Returns:
+            dict: board ID -> (can_read, can_write)
+        """
+        boards = self.boards if boards is None else boards
+        if self._is_staff(character_name):
+            return {board_id: (True, True) for board_id in boards}
+        rosters = None
+        access = {}
+        for board_id, board in boards.items():
+            can_read = True
+            if board.get('roster_names'):
+                if rosters is None:
+                    rosters = self._roster_names_for(character_name)
+                can_read = bool(rosters & set(board['roster_names']))
+            access[board_id] = (can_read, can_read and not board.get('read_only', False))
+        return access
+
+    # ------------------------------------------------------------------
+    # Roster restrictions
+    # ------------------------------------------------------------------
+
+    def add_roster_to_board(self, board_reference, roster_name):
         """
-        board = self.get_board(board_reference)
-        if board:
-            del self.db.boards[board['id']]
-            # Update next_board_id to recycle IDs
-            self.db.next_board_id = self._find_next_available_board_id()
-            return f"Board '{board['name']}' and all its posts have been deleted."
-        return "Board not found"
+        Add a roster restriction to a board.
+        Args:
+            board_reference (str or int): The board to modify
+            roster_name (str): The name of the roster to add
+        Returns:
+            str: Status message
+        """
+        board = self._get_board_obj(board_reference)
+        if not board:
+            return "Board not found"
 
-    def save_board(self, board_reference, updated_board_data):
+        # Verify roster exists
+        from world.wod20th.models import Roster
+        try:
+            Roster.objects.get(name=roster_name)
+        except Roster.DoesNotExist:
+            return f"Error: Roster '{roster_name}' does not exist"
+
+        roster_names = list(board.roster_names or [])
+        if roster_name in roster_names:
+            return f"Roster '{roster_name}' is already associated with this board"
+
+        roster_names.append(roster_name)
+        board.roster_names = roster_names
+        board.save(update_fields=['roster_names'])
+        return f"Added roster '{roster_name}' to board '{board.name}'"
+
+    def remove_roster_from_board(self, board_reference, roster_name):
         """
-        Update board data with provided changes.
-        :param board_reference: (str or int) The name or ID of the board to update.
-        :param updated_board_data: (dict) Dictionary containing updated board data.
+        Remove a roster restriction from a board.
+        Args:
+            board_reference (str or int): The board to modify
+            roster_name (str): The name of the roster to remove
+        Returns:
+            str: Status message
         """
-        board = self.get_board(board_reference)
-        if board:
-            # Update the board's dictionary with new values
-            for key, value in updated_board_data.items():
-                board[key] = value
-            return f"Board '{board['name']}' has been updated."
-        return "Board not found"
+        board = self._get_board_obj(board_reference)
+        if not board:
+            return "Board not found"
+
+        roster_names = list(board.roster_names or [])
+        if roster_name not in roster_names:
+            return f"Roster '{roster_name}' is not associated with this board"
 
+        roster_names.remove(roster_name)
+        board.roster_names = roster_names
+        board.save(update_fields=['roster_names'])
+        return f"Removed roster '{roster_name}' from board '{board.name}'"
 
-    def lock_board(self, board_reference):
+    def get_board_rosters(self, board_reference):
         """
-        Lock a board to prevent new posts from being made.
-        :param board_reference: (str or int) The name or ID of the board to lock.
+        Get all rosters associated with a board.
+        Args:
+            board_reference (str or int): The board to check
+        Returns:
+            list: List of roster names
         """
-        board = self.get_board(board_reference)
-        if board:
-            board['locked'] = True
-            return f"Board '{board['name']}' has been locked."
-        return "Board not found"
+        board = self._get_board_obj(board_reference)
+        if not board:
+            return []
+
+        return list(board.roster_names or [])
+
+    # ------------------------------------------------------------------
+    # Read state
+    # ------------------------------------------------------------------
 
     def mark_post_read(self, board_reference, post_index, character_name):
         """
@@ -323,26 +583,47 @@ class BBSController(DefaultObject):
         :param post_index: (int) The index of the post.
         :param character_name: (str) The name of the character who read the post.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_obj(board_reference)
         if not board:
             return False
-            
-        if not self.has_access(board_reference, character_name):
+
+        if not self.has_access(board.board_id, character_name):
             return False
-            
-        board_id = board['id']
-        read_posts = self.read_posts
-            
-        if character_name not in read_posts:
-            read_posts[character_name] = {}
-            
-        if board_id not in read_posts[character_name]:
-            read_posts[character_name][board_id] = set()
-            
-        read_posts[character_name][board_id].add(post_index)
-        self.attributes.add('read_posts', read_posts)
+
+        post = self._get_post_obj(board, post_index)
+        if not post:
+            return False
+        BBSPostRead.objects.get_or_create(post=post, reader=character_name)
         return True
 
+    def mark_board_read(self, board_reference, character_name):
+        """
+        Mark every post on a board as read by a character.
+        :return: (int) Number of posts newly marked read.
+        """
+        board = self._get_board_obj(board_reference)
+        if not board:
+            return 0
+        unread_ids = list(
+            BBSPost.objects.filter(board=board)
+            .exclude(reads__reader=character_name)
+            .values_list('id', flat=True)
+        )
+        BBSPostRead.objects.bulk_create(
+            [BBSPostRead(post_id=post_id, reader=character_name) for post_id in unread_ids],
+            ignore_conflicts=True,
+        )
+        return len(unread_ids)
+
+    def get_read_post_ids(self, board_reference, character_name):
+        """Return the ids of the posts on a board the character has read."""
+        board = self._get_board_obj(board_reference)
+        if not board:
+            return set()
+        return set(BBSPostRead.objects.filter(
+            post__board=board, reader=character_name
+        ).values_list('post_id', flat=True))
+
     def is_post_unread(self, board_reference, post_index, character_name):
         """
         Check if a post is unread by a character.
@@ -351,23 +632,17 @@ class BBSController(DefaultObject):
         :param character_name: (str) The name of the character.
         :return: (bool) True if the post is unread, False otherwise.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_obj(board_reference)
         if not board:
             return False
-            
-        if not self.has_access(board_reference, character_name):
+
+        if not self.has_access(board.board_id, character_name):
             return False
-            
-        board_id = board['id']
-        read_posts = self.read_posts
-            
-        if character_name not in read_posts:
-            return True
-            
-        if board_id not in read_posts[character_name]:
+
+        post = self._get_post_obj(board, post_index)
+        if not post:
             return True
-            
-        return post_index not in read_posts[character_name][board_id]
+        return not BBSPostRead.objects.filter(post=post, reader=character_name).exists()
 
     def get_unread_posts(self, board_reference, character_name):
         """
@@ -376,87 +651,59 @@ class BBSController(DefaultObject):
         :param character_name: (str) The name of the character.
         :return: (list) List of unread post indices.
         """
-        board = self.get_board(board_reference)
+        board = self._get_board_obj(board_reference)
         if not board:
             return []
-            
-        if not self.has_access(board_reference, character_name):
+
+        if not self.has_access(board.board_id, character_name):
             return []
-            
-        unread = []
-        for i in range(len(board['posts'])):
-            if self.is_post_unread(board_reference, i, character_name):
-                unread.append(i + 1)  # Convert to 1-based index
-        return unread
 
-    def add_roster_to_board(self, board_reference, roster_name):
-        """
-        Add a roster restriction to a board.
-        Args:
-            board_reference (str or int): The board to modify
-            roster_name (str): The name of the roster to add
-        Returns:
-            str: Status message
-        """
-        board = self.get_board(board_reference)
-        if not board:
-            return "Board not found"
-            
-        # Verify roster exists
-        from world.wod20th.models import Roster
-        try:
-            Roster.objects.get(name=roster_name)
-        except Roster.DoesNotExist:
-            return f"Error: Roster '{roster_name}' does not exist"
-            
-        if 'roster_names' not in board:
-            board['roster_names'] = []
-            
-        if roster_name in board['roster_names']:
-            return f"Roster '{roster_name}' is already associated with this board"
-            
-        board['roster_names'].append(roster_name)
-        return f"Added roster '{roster_name}' to board '{board['name']}'"
+        return self.get_unread_map(character_name, [board.board_id]).get(board.board_id, [])
 
-    def remove_roster_from_board(self, board_reference, roster_name):
+    def get_unread_counts(self, character_name, board_ids):
         """
-        Remove a roster restriction from a board.
+        Count unread posts per board in one aggregate query.
+
         Args:
-            board_reference (str or int): The board to modify
-            roster_name (str): The name of the roster to remove
+            character_name (str): The reader.
+            board_ids (iterable): Board IDs to count; access is not checked here.
+
         Returns:
-            str: Status message
-        """
-        board = self.get_board(board_reference)
-        if not board:
-            return "Board not found"
-            
-        if 'roster_names' not in board or roster_name not in board['roster_names']:
-            return f"Roster '{roster_name}' is not associated with this board"
-            
-        board['roster_names'].remove(roster_name)
-        return f"Removed roster '{roster_name}' from board '{board['name']}'"
+            dict: board ID -> unread count, only for boards with unread posts.
+        """
+        rows = (
+            BBSPost.objects.filter(board__board_id__in=list(board_ids))
+            .exclude(reads__reader=character_name)
+            .values('board__board_id')
+            .annotate(unread=Count('id'))
+        )
+        return {row['board__board_id']: row['unread'] for row in rows}
 
-    def get_board_rosters(self, board_reference):
+    def get_unread_map(self, character_name, board_ids):
         """
-        Get all rosters associated with a board.
+        Return the 1-based numbers of unread posts per board, using one query
+        for post positions and one for read markers.
+
         Args:
-            board_reference (str or int): The board to check
-        Returns:
-            list: List of roster names
-        """
-        board = self.get_board(board_reference)
-        if not board:
-            return []
-            
-        return board.get('roster_names', [])
+            character_name (str): The reader.
+            board_ids (iterable): Board IDs to check; access is not checked here.
 
-    def set_read_only(self, board_name, read_only=True):
-        """Set a board to read-only mode."""
-        board = self.get_board(board_name)
-        if not board:
-            return f"No board found with the name '{board_name}'."
-            
-        board['read_only'] = read_only
-        self.save_board(board_name, board)
-        return f"Board '{board_name}' has been set to {'read-only' if read_only else 'writable'} mode."
\ No newline at end of file
+        Returns:
+            dict: board ID -> list of unread post numbers, only for boards with unread posts.
+        """
+        board_ids = list(board_ids)
+        read_ids = set(BBSPostRead.objects.filter(
+            post__board__board_id__in=board_ids, reader=character_name
+        ).values_list('post_id', flat=True))
+        positions = {}
+        unread = {}
+        posts = (
+            BBSPost.objects.filter(board__board_id__in=board_ids)
+            .order_by('board__board_id', 'id')
+            .values_list('board__board_id', 'id')
+        )
+        for board_id, post_id in posts:
+            positions[board_id] = positions.get(board_id, 0) + 1
+            if post_id not in read_ids:
+                unread.setdefault(board_id, []).append(positions[board_id])
+        return unread
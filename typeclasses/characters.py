@@ -11,6 +11,9 @@ from evennia.utils.ansi import ANSIString
 from world.wod20th.utils.stat_mappings import FLAW_CATEGORIES, FLAW_SPLAT_RESTRICTIONS, FLAW_VALUES, MERIT_CATEGORIES, MERIT_SPLAT_RESTRICTIONS, MERIT_VALUES, SPECIAL_ADVANTAGES
 from world.wod20th.models import Stat
 from world.wod20th.utils.ansi_utils import wrap_ansi
+from world.wod20th.utils.stat_store import StatStore
+from world.wod20th.utils.scene_tracker import SCENE_TRACKER
+from world.wod20th.utils.xp_ledger import record_xp_event
 import re
 import random
 from world.wod20th.utils.language_data import AVAILABLE_LANGUAGES
@@ -319,10 +322,10 @@ class Character(DefaultCharacter):
                             Q(requester=self.account) |
                             Q(participants=self.account),
                             status__in=['open', 'claimed']
-                        )
+                        ).distinct()
                         
                         # Count jobs with updates since last view
-                        updated_jobs = sum(1 for job in jobs if job.is_updated_since_last_view(self.account))
+                        updated_jobs = jobs.for_listing(self.account).filter(unread=True).count()
 
                         if updated_jobs > 0:
                             self.msg(f"|wYou have {updated_jobs} job{'s' if updated_jobs != 1 else ''} with new activity.|n")
@@ -640,6 +643,8 @@ class Character(DefaultCharacter):
                 self.attributes.add('in_umbra', True)
                 self.tags.remove("in_material", category="state")
                 self.tags.add("in_umbra", category="state")
+                if hasattr(self.location, "invalidate_audience"):
+                    self.location.invalidate_audience()
                 self.location.msg_contents(f"{self.name} shimmers and fades from view as they step into the Umbra.", exclude=[self])
             return success
         return False
@@ -654,6 +659,8 @@ class Character(DefaultCharacter):
         self.attributes.add('in_umbra', False)
         self.tags.remove("in_umbra", category="state")
         self.tags.add("in_material", category="state")
+        if hasattr(self.location, "invalidate_audience"):
+            self.location.invalidate_audience()
         self.location.msg_contents(f"{self.name} shimmers into view as they return from the Umbra.", exclude=[self])
         return True
 
@@ -877,8 +884,15 @@ class Character(DefaultCharacter):
                 obj.has_account)):
             self.record_scene_activity()
 
+    @lazy_property
+    def stat_store(self):
+        """In-memory, write-through index over the ``stats`` Attribute."""
+        return StatStore(self)
+
     def get_stat(self, stat_type, category, stat_name, temp=False):
         """Get a stat value."""
+        store = self.stat_store
+
         # Handle attributes by using their category as the stat_type
         if stat_type == 'attributes':
             stat_type = category  # Use physical/social/mental as the stat_type
@@ -893,18 +907,17 @@ class Character(DefaultCharacter):
                 # Try to find the stat in any secondary ability category
                 for subcat in ['secondary_talent', 'secondary_skill', 'secondary_knowledge']:
                     # Check both original case and lowercase
-                    if subcat in self.db.stats.get('secondary_abilities', {}):
-                        if stat_name in self.db.stats['secondary_abilities'][subcat]:
-                            stat_type = subcat
-                            category = 'secondary_abilities'
-                            break
-                        # Check lowercase version
-                        stat_name_lower = stat_name.lower()
-                        if stat_name_lower in self.db.stats['secondary_abilities'][subcat]:
-                            stat_name = stat_name_lower  # Use the stored version
-                            stat_type = subcat
-                            category = 'secondary_abilities'
-                            break
+                    if store.has('secondary_abilities', subcat, stat_name):
+                        stat_type = subcat
+                        category = 'secondary_abilities'
+                        break
+                    # Check lowercase version
+                    stat_name_lower = stat_name.lower()
+                    if store.has('secondary_abilities', subcat, stat_name_lower):
+                        stat_name = stat_name_lower  # Use the stored version
+                        stat_type = subcat
+                        category = 'secondary_abilities'
+                        break
 
         # Normalize subcategory for powers
         if stat_type == 'powers':
@@ -917,121 +930,65 @@ class Character(DefaultCharacter):
         # Special handling for instanced backgrounds
         if stat_type == 'backgrounds' and category == 'background' and '(' in stat_name and ')' in stat_name:
             # For backgrounds like "Allies(Police)", check if it exists directly
-            if stat_type not in self.db.stats:
-                return 0
-            if category not in self.db.stats[stat_type]:
-                return 0
-            if stat_name in self.db.stats[stat_type][category]:
+            if store.has(stat_type, category, stat_name):
                 # The background exists as a direct entry (correct format)
-                value = self.db.stats[stat_type][category][stat_name].get('temp' if temp else 'perm', 0)
-                return value
-            else:
-                # Check if it might be stored in the old format with 'instances'
-                base_name = stat_name[:stat_name.find('(')].strip()
-                instance = stat_name[stat_name.find('(')+1:stat_name.find(')')].strip()
-                
-                if (base_name in self.db.stats[stat_type][category] and
-                    'instances' in self.db.stats[stat_type][category][base_name] and
-                    instance in self.db.stats[stat_type][category][base_name]['instances']):
-                    # Found in old format, return the value
-                    return self.db.stats[stat_type][category][base_name]['instances'][instance].get('temp' if temp else 'perm', 0)
-                return 0
-
-        # Handle other stats
-        if stat_type not in self.db.stats:
-            return 0
-        if category not in self.db.stats[stat_type]:
-            return 0
-        if stat_name not in self.db.stats[stat_type][category]:
+                return store.get(stat_type, category, stat_name, temp=temp)
+
+            # Check if it might be stored in the old format with 'instances'
+            base_name = stat_name[:stat_name.find('(')].strip()
+            instance = stat_name[stat_name.find('(')+1:stat_name.find(')')].strip()
+
+            entry = store.entry(stat_type, category, base_name)
+            if (isinstance(entry, dict) and
+                'instances' in entry and
+                instance in entry['instances']):
+                # Found in old format, return the value
+                return entry['instances'][instance].get('temp' if temp else 'perm', 0)
             return 0
 
-        value = self.db.stats[stat_type][category][stat_name].get('temp' if temp else 'perm', 0)
-        return value
+        # Handle other stats
+        return store.get(stat_type, category, stat_name, temp=temp)
 
     def set_stat(self, stat_type, category, stat_name, value, temp=False):
         """Set a stat value."""
-        try:
-            # Initialize the stats structure if needed
-            if not hasattr(self, 'db') or not hasattr(self.db, 'stats'):
-                self.db.stats = {}
+        store = self.stat_store
+        with store.batch():
+            try:
+                # Handle secondary abilities similar to attributes
+                if stat_type == 'secondary_abilities':
+                    if category in ['secondary_talent', 'secondary_skill', 'secondary_knowledge']:
+                        # Store the secondary ability in the correct location
+                        store.set('secondary_abilities', category, stat_name, value, temp=temp)
+                        return
+                    else:
+                        # Try to find the stat in any secondary ability category
+                        for subcat in ['secondary_talent', 'secondary_skill', 'secondary_knowledge']:
+                            if store.has('secondary_abilities', subcat, stat_name):
+                                store.set('secondary_abilities', subcat, stat_name, value, temp=temp)
+                                return
+                            # Check lowercase version, keeping the existing key's case
+                            existing = store.find_name('secondary_abilities', subcat, stat_name)
+                            if existing:
+                                store.set('secondary_abilities', subcat, existing, value, temp=temp)
+                                return
+
+                # Set the stat value
+                store.set(stat_type, category, stat_name, value, temp=temp)
+
+            except Exception as e:
+                self.msg(f"|rError processing stat value: {str(e)}|n")
+                return
 
-            # Handle secondary abilities similar to attributes
-            if stat_type == 'secondary_abilities':
-                if category in ['secondary_talent', 'secondary_skill', 'secondary_knowledge']:
-                    # Ensure the secondary_abilities structure exists
-                    if 'secondary_abilities' not in self.db.stats:
-                        self.db.stats['secondary_abilities'] = {}
-                    if category not in self.db.stats['secondary_abilities']:
-                        self.db.stats['secondary_abilities'][category] = {}
-                    
-                    # Store the secondary ability in the correct location
-                    if stat_name not in self.db.stats['secondary_abilities'][category]:
-                        self.db.stats['secondary_abilities'][category][stat_name] = {}
-                    
-                    # Set the value
-                    self.db.stats['secondary_abilities'][category][stat_name]['perm' if not temp else 'temp'] = value
-                    return
-                else:
-                    # Try to find the stat in any secondary ability category
-                    found = False
-                    for subcat in ['secondary_talent', 'secondary_skill', 'secondary_knowledge']:
-                        if (subcat in self.db.stats.get('secondary_abilities', {}) and
-                            stat_name in self.db.stats['secondary_abilities'][subcat]):
-                            # Ensure the secondary_abilities structure exists
-                            if 'secondary_abilities' not in self.db.stats:
-                                self.db.stats['secondary_abilities'] = {}
-                            if subcat not in self.db.stats['secondary_abilities']:
-                                self.db.stats['secondary_abilities'][subcat] = {}
-                            
-                            # Store the secondary ability in the correct location
-                            if stat_name not in self.db.stats['secondary_abilities'][subcat]:
-                                self.db.stats['secondary_abilities'][subcat][stat_name] = {}
-                            
-                            # Set the value
-                            self.db.stats['secondary_abilities'][subcat][stat_name]['perm' if not temp else 'temp'] = value
-                            return
-                        # Check lowercase version
-                        stat_name_lower = stat_name.lower()
-                        if (subcat in self.db.stats.get('secondary_abilities', {}) and
-                            any(k.lower() == stat_name_lower for k in self.db.stats['secondary_abilities'][subcat])):
-                            # Find the existing key with the correct case
-                            for k in self.db.stats['secondary_abilities'][subcat]:
-                                if k.lower() == stat_name_lower:
-                                    # Set the value
-                                    self.db.stats['secondary_abilities'][subcat][k]['perm' if not temp else 'temp'] = value
-                                    return
-
-            # Initialize the stat_type if it doesn't exist
-            if stat_type not in self.db.stats:
-                self.db.stats[stat_type] = {}
-
-            # Initialize the category if it doesn't exist
-            if category not in self.db.stats[stat_type]:
-                self.db.stats[stat_type][category] = {}
-
-            # Initialize the stat if it doesn't exist
-            if stat_name not in self.db.stats[stat_type][category]:
-                self.db.stats[stat_type][category][stat_name] = {'perm': 0, 'temp': 0}
-
-            # Set the stat value
-            self.db.stats[stat_type][category][stat_name]['temp' if temp else 'perm'] = value
+            # Handle identity stats
+            if stat_type in ['personal', 'lineage']:
+                store.put('identity', stat_type, stat_name, {'perm': value, 'temp': value})
 
-        except Exception as e:
-            self.msg(f"|rError processing stat value: {str(e)}|n")
-            return
-        
-        # Handle identity stats
         if stat_type in ['personal', 'lineage']:
-            if 'identity' not in self.db.stats:
-                self.db.stats['identity'] = {'personal': {}, 'lineage': {}}
-            self.db.stats['identity'][stat_type][stat_name] = {'perm': value, 'temp': value}
-            
             # Check if this is a shifter and update pools if needed
             splat = self.get_stat('other', 'splat', 'Splat', temp=False)
             if splat == 'Shifter':
                 from world.wod20th.utils.shifter_utils import update_shifter_pools_on_stat_change
                 update_shifter_pools_on_stat_change(self, stat_name, value)
-            return
 
     def check_stat_value(self, category, stat_type, stat_name, value, temp=False):
         """
@@ -1191,17 +1148,9 @@ class Character(DefaultCharacter):
         Returns:
             Character or None: The character with matching alias, if any
         """
-        from evennia.utils.search import search_object
-        
-        # Search for objects with matching alias attribute
-        matches = search_object(
-            searchstring, 
-            attribute_name="alias",
-            exact=True,
-            typeclass='typeclasses.characters.Character'
-        )
-        
-        return matches[0] if matches else None
+        from utils.character_index import CHARACTER_INDEX
+
+        return CHARACTER_INDEX.find_alias(searchstring)
 
     def handle_language_merit_change(self):
         """
@@ -1310,6 +1259,7 @@ class Character(DefaultCharacter):
                     'last_scene': None,
                     'scenes_this_week': 0
                 }
+                SCENE_TRACKER.forget_character(self)
 
             xp_amount = Decimal(str(amount)).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
             self.db.xp['total'] += xp_amount
@@ -1330,6 +1280,7 @@ class Character(DefaultCharacter):
             self.db.xp['spends'].insert(0, award)
             self.db.xp['spends'] = self.db.xp['spends'][:10]  # Keep only last 10 entries
             
+            record_xp_event(self, 'receive', xp_amount, reason)
             return True
         except Exception as e:
             logger.error(f"Error adding XP to {self.name}: {str(e)}")
@@ -1388,6 +1339,7 @@ class Character(DefaultCharacter):
             # Keep only last 10 entries
             self.db.xp['spends'] = self.db.xp['spends'][:10]
             
+            record_xp_event(self, 'spend', xp_amount, reason)
             return True
         except (ValueError, TypeError, InvalidOperation):
             return False
@@ -1404,6 +1356,7 @@ class Character(DefaultCharacter):
         
         self.db.xp['last_scene'] = now.isoformat()
         self.db.xp['scenes_this_week'] += 1
+        SCENE_TRACKER.forget_character(self)
 
     def start_scene(self):
         """Start tracking a new scene."""
@@ -1439,6 +1392,10 @@ class Character(DefaultCharacter):
             if not self.location or not hasattr(self.location.db, 'scene_data'):
                 return False
 
+            # Write out any coalesced activity before reading it back
+            SCENE_TRACKER.flush_character(self)
+            SCENE_TRACKER.flush_room(self.location)
+
             now = datetime.now()
             room_scene = self.location.db.scene_data
             
@@ -1454,8 +1411,8 @@ class Character(DefaultCharacter):
 
             # Remove this character from participants
             if isinstance(room_scene.get('participants'), set):
-                room_scene['participants'].discard(self.key)
-                self.location.db.scene_data = room_scene
+                SCENE_TRACKER.discard_participant(self.location, self)
+                SCENE_TRACKER.flush_room(self.location)
 
             # If this was a valid scene (20+ mins), increment completed scenes
             if duration >= 20 and hasattr(self.db, 'scene_data'):
@@ -1532,16 +1489,15 @@ class Character(DefaultCharacter):
             ]
             
             # Check if there's an active scene with participants
-            if hasattr(self.location.db, 'scene_data'):
-                scene_data = self.location.db.scene_data
-                if scene_data and isinstance(scene_data.get('participants'), set):
-                    active_participants = [
-                        obj for obj in self.location.contents
-                        if obj.key in scene_data['participants'] and
-                        obj.db.in_umbra == self.db.in_umbra
-                    ]
-                    if active_participants:
-                        return True
+            participants = SCENE_TRACKER.get_participants(self.location)
+            if participants:
+                active_participants = [
+                    obj for obj in self.location.contents
+                    if obj.key in participants and
+                    obj.db.in_umbra == self.db.in_umbra
+                ]
+                if active_participants:
+                    return True
             
             return len(other_players) > 0
 
@@ -1559,125 +1515,13 @@ class Character(DefaultCharacter):
             if (getattr(self.location.db, 'roomtype', None) == 'OOC Area'):
                 return
 
-            now = datetime.now()
-
-            # Preserve character stats before any modifications using a deep copy
-            stats_backup = None
-            if hasattr(self.db, 'stats') and isinstance(self.db.stats, dict):
-                import copy
-                stats_backup = copy.deepcopy(self.db.stats)
-
-            # Handle room's scene data
-            if not hasattr(self.location.db, 'scene_data'):
-                self.location.db.scene_data = {
-                    'start_time': now,
-                    'participants': set(),
-                    'last_activity': now,
-                    'completed': False
-                }
-            elif not isinstance(self.location.db.scene_data, dict):
-                # Convert non-dict scene_data to proper format
-                self.location.db.scene_data = {
-                    'start_time': now,
-                    'participants': set(),
-                    'last_activity': now,
-                    'completed': False
-                }
-            else:
-                # Check for scene inactivity
-                last_activity = self.location.db.scene_data.get('last_activity')
-                if last_activity:
-                    if isinstance(last_activity, str):
-                        last_activity = datetime.fromisoformat(last_activity)
-                    inactivity_time = (now - last_activity).total_seconds() / 3600  # Convert to hours
-                    
-                    # If more than 2 hours of inactivity, start a new scene
-                    if inactivity_time > 2:
-                        self.location.db.scene_data.update({
-                            'start_time': now,
-                            'participants': set(),
-                            'last_activity': now,
-                            'completed': False
-                        })
-
-            # Initialize scene_data if it doesn't exist
-            if not hasattr(self.db, 'scene_data') or not isinstance(self.db.scene_data, dict):
-                # Initialize with default values
-                self.db.scene_data = {
-                    'current_scene': None,
-                    'scene_location': None,
-                    'last_activity': None,
-                    'completed_scenes': 0
-                    #'last_weekly_reset': now  # Only set this if scene_data doesn't exist at all
-                }
-
-            # Initialize participants as a set if needed
-            if not isinstance(self.location.db.scene_data.get('participants'), set):
-                self.location.db.scene_data['participants'] = set()
-
-            # Update participants list - only add active participants
-            active_participants = set()
-            for obj in self.location.contents:
-                if (hasattr(obj, 'has_account') and obj.has_account and 
-                    obj.db.in_umbra == self.db.in_umbra):
-                    active_participants.add(obj.key)
-
-            # Remove any participants no longer in the room
-            self.location.db.scene_data['participants'] = active_participants
-
-            # Update room's last activity time
-            self.location.db.scene_data['last_activity'] = now
-
-            # Only start a new scene if there isn't one already
-            if not self.location.db.scene_data.get('start_time'):
-                self.location.db.scene_data['start_time'] = now
-
-            # Get a copy of the current scene data
-            scene_data = dict(self.db.scene_data)
-            
-            # Update only the necessary fields
-            scene_data['current_scene'] = self.location.db.scene_data['start_time']
-            scene_data['scene_location'] = self.location
-            scene_data['last_activity'] = now
-            
-            # Save the updated scene data back
-            self.db.scene_data = scene_data
-
-            # Handle XP tracking
-            if not hasattr(self.db, 'xp'):
-                self.db.xp = {
-                    'total': Decimal('0.00'),
-                    'current': Decimal('0.00'),
-                    'spent': Decimal('0.00'),
-                    'ic_xp': Decimal('0.00'),
-                    'monthly_spent': Decimal('0.00'),
-                    'last_reset': now,
-                    'spends': [],
-                    'last_scene': None,
-                    'scenes_this_week': 0
-                }
-
-            # Only update scene participation if enough time has passed
-            last_scene = self.db.xp.get('last_scene')
-            if not last_scene:
-                self.db.xp['last_scene'] = now.isoformat()
-                self.db.xp['scenes_this_week'] = self.db.xp.get('scenes_this_week', 0) + 1
-            elif isinstance(last_scene, str):
-                last_scene_time = datetime.fromisoformat(last_scene)
-                time_diff = (now - last_scene_time).total_seconds()
-                if time_diff > 1200:  # 20 minutes
-                    self.db.xp['last_scene'] = now.isoformat()
-                    self.db.xp['scenes_this_week'] = self.db.xp.get('scenes_this_week', 0) + 1
-
-            # Restore character stats if they were lost
-            if stats_backup is not None and (not hasattr(self.db, 'stats') or not self.db.stats):
-                self.db.stats = stats_backup
+            # Room and character scene data are coalesced in memory and
+            # flushed periodically; the weekly scene count is written as
+            # soon as it changes.
+            SCENE_TRACKER.record_activity(self)
 
         except Exception as e:
             logger.log_err(f"Error in record_scene_activity for {self.key}: {str(e)}")
-            # Restore stats if they were lost during an error
-            if stats_backup is not None:
-                self.db.stats = stats_backup
 
     def at_say(self, message, msg_self=None, msg_location=None, receivers=None, msg_receivers=None, **kwargs):
         """Hook method for the say command."""
@@ -1794,6 +1638,7 @@ class Character(DefaultCharacter):
             elif not self.db.xp and existing_xp:
                 # If XP is empty but we have a backup, restore from backup
                 self.db.xp = existing_xp
+            SCENE_TRACKER.forget_character(self)
 
             # Handle stats initialization/recovery
             if not hasattr(self.db, 'stats'):
@@ -1917,6 +1762,7 @@ class Character(DefaultCharacter):
                     'scenes_this_week': 0
                 }
                 target.attributes.add('xp', xp_data)
+                SCENE_TRACKER.forget_character(target)
 
             # Format XP values
             total = Decimal(str(xp_data['total'])).quantize(Decimal('0.01'))
@@ -2012,6 +1858,7 @@ class Character(DefaultCharacter):
             self.db.xp['spends'].insert(0, award)
             self.db.xp['spends'] = self.db.xp['spends'][:10]
             
+            record_xp_event(self, 'award', xp_amount, "Weekly IC XP")
             return True
         except Exception as e:
             self.msg(f"Error awarding IC XP: {str(e)}")
@@ -2055,29 +1902,20 @@ class Character(DefaultCharacter):
 
     def del_stat(self, stat_type, category, stat_name, temp=False):
         """Delete a stat."""
+        store = self.stat_store
         try:
             # Handle secondary abilities similar to attributes
             if stat_type == 'secondary_abilities':
                 if category in ['secondary_talent', 'secondary_skill', 'secondary_knowledge']:
-                    # Check if the stat exists
-                    if (category in self.db.stats.get('secondary_abilities', {}) and
-                        stat_name in self.db.stats['secondary_abilities'][category]):
-                        del self.db.stats['secondary_abilities'][category][stat_name]
-                        return True
-                    return False
+                    return store.delete('secondary_abilities', category, stat_name)
                 else:
                     # Try to find the stat in any secondary ability category
                     for subcat in ['secondary_talent', 'secondary_skill', 'secondary_knowledge']:
-                        if (subcat in self.db.stats.get('secondary_abilities', {}) and
-                            stat_name in self.db.stats['secondary_abilities'][subcat]):
-                            del self.db.stats['secondary_abilities'][subcat][stat_name]
+                        if store.delete('secondary_abilities', subcat, stat_name):
                             return True
                     return False
 
-            # Check if the stat exists
-            if stat_type in self.db.stats and category in self.db.stats[stat_type] and stat_name in self.db.stats[stat_type][category]:
-                del self.db.stats[stat_type][category][stat_name]
-                return True
+            return store.delete(stat_type, category, stat_name)
         except Exception as e:
             self.msg(f"|rError deleting stat: {str(e)}|n")
         return False
@@ -2096,21 +1934,10 @@ class Character(DefaultCharacter):
             str: The proper case version of the stat name if found, or the original stat_name
         """
         # For powers like spheres, disciplines, arts, etc. do case-insensitive lookup
-        if category == 'powers' and subcategory in self.db.stats.get('powers', {}):
-            # Look for a case-insensitive match
-            stat_name_lower = stat_name.lower()
-            for existing_name in self.db.stats['powers'][subcategory]:
-                if existing_name.lower() == stat_name_lower:
-                    return existing_name
-                    
-        # Check secondary abilities
-        if category == 'secondary_abilities':
-            if subcategory in self.db.stats.get('secondary_abilities', {}):
-                # Look for a case-insensitive match
-                stat_name_lower = stat_name.lower()
-                for existing_name in self.db.stats['secondary_abilities'][subcategory]:
-                    if existing_name.lower() == stat_name_lower:
-                        return existing_name
+        if category in ('powers', 'secondary_abilities'):
+            existing_name = self.stat_store.find_name(category, subcategory, stat_name)
+            if existing_name:
+                return existing_name
             
         # No match found, return the original name
         return stat_name
@@ -29,12 +29,13 @@ room, able to be viewed by players and staff.
 """
 from datetime import datetime, timedelta
 from evennia.objects.objects import DefaultCharacter
-from evennia import create_script, utils
 from evennia.locks.lockhandler import LockException
-from evennia.utils.utils import inherits_from
+from evennia.utils.utils import delay, inherits_from
 import uuid
 import random
 from evennia.typeclasses.attributes import AttributeProperty
+from world.wod20th.utils.npc_expiry import NPC_EXPIRY
+from world.wod20th.utils.npc_stats import NPC_STATS, health_status, room_npcs
 
 
 class NPC(DefaultCharacter):
@@ -62,9 +63,6 @@ class NPC(DefaultCharacter):
         # Create a unique NPC ID using UUID - this will be consistent across restarts
         self.db.npc_id = str(uuid.uuid4())
         
-        # Initialize tracking for which rooms this NPC is registered in
-        self.db.registered_in_rooms = set()
-        
         # Store the dbref as a string for easier reference - use a distinct format
         self.db.dbref_str = f"#NPC{self.id}"
         
@@ -197,7 +195,7 @@ class NPC(DefaultCharacter):
         self._init_powers(stats, splat_type, points)
         
         # Set the stats
-        self.db.stats = stats
+        NPC_STATS.set_stats(self, stats)
         
         return stats
 
@@ -520,22 +518,8 @@ class NPC(DefaultCharacter):
         # Reinitialize stats with new splat type
         self.initialize_npc_stats(splat_type, difficulty)
         
-        # Update in all rooms where this NPC is registered
-        self.update_stats_in_rooms()
-        
         return True
 
-    def update_stats_in_rooms(self):
-        """Update stats in all rooms where this NPC is registered."""
-        from evennia import search_object
-        
-        for room_dbref in self.db.registered_in_rooms:
-            room = search_object(room_dbref)
-            if room and len(room) > 0:
-                room = room[0]
-                if hasattr(room, "db_npcs") and self.key in room.db_npcs:
-                    room.db_npcs[self.key]["stats"] = self.db.stats
-
     def set_as_temporary(self, creator, lifespan=48):
         """
         Set this NPC as temporary with specified lifespan.
@@ -551,16 +535,8 @@ class NPC(DefaultCharacter):
         expiration = datetime.now() + timedelta(hours=lifespan)
         self.db.expiration_time = expiration
         
-        # Create a script to delete this NPC when expired
-        create_script(
-            "typeclasses.scripts.npc_scripts.NPCExpirationScript",
-            key=f"npc_expiration_{self.id}",
-            desc=f"Handles expiration of temporary NPC {self.name}",
-            obj=self,
-            interval=3600,  # Check every hour
-            persistent=True,
-            start_delay=True
-        )
+        # Queue this NPC for deletion when it expires
+        NPC_EXPIRY.schedule(self)
         
         # If this NPC is in a room, register it in the room's NPC tracker
         if self.location:
@@ -572,77 +548,69 @@ class NPC(DefaultCharacter):
         """Set this NPC as permanent (won't expire)."""
         self.db.is_temporary = False
         self.db.expiration_time = None
-        
-        # Stop any expiration scripts
-        for script in self.scripts.get("NPCExpirationScript"):
-            script.stop()
+        NPC_EXPIRY.cancel(self)
             
         return True
     
-    def register_in_room(self, room):
+    def register_in_room(self, room, number=None):
         """
-        Register this NPC in a room's NPC tracker.
+        Register this NPC in a room's NPC roster.
         
         Args:
             room (Object): The room to register in
+            number (int, optional): Scene number to keep, if still free
         """
         if not room:
             return False
             
-        # Initialize room's NPC list if needed
-        if not hasattr(room, "db_npcs"):
-            room.db_npcs = {}
-            
-        # Initialize room's NPC counter if needed
-        if not hasattr(room, "db_npc_counter"):
-            room.db_npc_counter = 0
-            
-        # Only increment counter if this NPC isn't already registered
-        if self.key not in room.db_npcs:
-            room.db_npc_counter += 1
-            npc_number = room.db_npc_counter
-            self.db.npc_number = npc_number
-            
-            # Add to room's NPC database
-            room.db_npcs[self.key] = {
-                "modifier": 0,  # Default initiative modifier
-                "health": self.db.stats["health"],
-                "number": npc_number,
-                "stats": self.db.stats,
-                "is_temporary": self.db.is_temporary,
-                "creator": self.db.creator.key if self.db.creator else None,
-                "npc_object": self,
-                "npc_id": self.db.npc_id,
-                "dbref": self.db.dbref_str
-            }
-            
-            # Add room to NPC's registered rooms
-            self.db.registered_in_rooms.add(room.dbref)
-            
-            return True
-        return False
+        roster = room_npcs(room)
+        if self.key in roster:
+            return False
+
+        # Number NPCs in the order they join the scene
+        taken = {ref["number"] for ref in roster.values()}
+        if not number or number in taken:
+            number = max(taken | {room.ndb.npc_counter or 0}) + 1
+            self.db.npc_number = number
+        room.ndb.npc_counter = max(number, room.ndb.npc_counter or 0)
+
+        # The roster only points at the NPC; stats and health live in NPC_STATS
+        roster[self.key] = {
+            "modifier": 0,  # Default initiative modifier
+            "number": number,
+            "npc_object": self,
+            "npc_id": self.db.npc_id,
+            "inhabited_by": self.db.inhabited_by.key if self.db.inhabited_by else None,
+        }
+
+        if self.ndb.rooms is None:
+            self.ndb.rooms = set()
+        self.ndb.rooms.add(room)
+        return True
     
     def unregister_from_room(self, room):
         """
-        Unregister this NPC from a room's NPC tracker.
+        Unregister this NPC from a room's NPC roster.
         
         Args:
             room (Object): The room to unregister from
         """
-        if not room or not hasattr(room, "db_npcs"):
+        if not room:
             return False
             
-        # Remove from room's NPC list
-        if self.key in room.db_npcs:
-            del room.db_npcs[self.key]
-            
-            # Remove from NPC's registered rooms
-            if room.dbref in self.db.registered_in_rooms:
-                self.db.registered_in_rooms.remove(room.dbref)
-                
+        if self.ndb.rooms:
+            self.ndb.rooms.discard(room)
+        roster = room.ndb.npcs
+        if roster and roster.get(self.key, {}).get("npc_object") is self:
+            del roster[self.key]
             return True
         return False
 
+    def unregister_from_all_rooms(self):
+        """Remove this NPC from every room roster it is in."""
+        for room in set(self.ndb.rooms or ()) | ({self.location} if self.location else set()):
+            self.unregister_from_room(room)
+
     def at_post_move(self, source_location, **kwargs):
         """Called after the NPC moves to a new location."""
         # Call parent method first
@@ -736,14 +704,10 @@ class NPC(DefaultCharacter):
     
     def update_inhabited_status_in_rooms(self):
         """Update the inhabited status in all rooms where this NPC is registered."""
-        from evennia import search_object
-        
-        for room_dbref in self.db.registered_in_rooms:
-            room = search_object(room_dbref)
-            if room and len(room) > 0:
-                room = room[0]
-                if hasattr(room, "db_npcs") and self.key in room.db_npcs:
-                    room.db_npcs[self.key]["inhabited_by"] = self.db.inhabited_by.key if self.db.inhabited_by else None
+        for room in self.ndb.rooms or ():
+            ref = (room.ndb.npcs or {}).get(self.key)
+            if ref:
+                ref["inhabited_by"] = self.db.inhabited_by.key if self.db.inhabited_by else None
 
     def get_display_name(self, looker, **kwargs):
         """
@@ -777,27 +741,28 @@ class NPC(DefaultCharacter):
             
         # For staff, show NPC stats
         if looker.check_permstring("Builder"):
+            stats = NPC_STATS.stats(self)
             string += "\n|yNPC Information:|n\n"
-            string += f"  |wSplat:|n {self.db.stats.get('splat', 'unknown').title()}\n"
-            string += f"  |wDifficulty:|n {self.db.stats.get('difficulty', 'MEDIUM')}\n"
+            string += f"  |wSplat:|n {stats.get('splat', 'unknown').title()}\n"
+            string += f"  |wDifficulty:|n {stats.get('difficulty', 'MEDIUM')}\n"
             string += f"  |wNPC ID:|n {self.db.npc_id}\n"
             string += f"  |wDBRef:|n {self.db.dbref_str}\n"
             string += f"  |wCreator:|n {self.db.creator.key if self.db.creator else 'N/A'}\n"
             
             # Show some basic stats
-            if "attributes" in self.db.stats:
+            if "attributes" in stats:
                 string += "  |wKey Attributes:|n "
                 attrs = []
                 for category in ["physical", "social", "mental"]:
-                    if category in self.db.stats["attributes"]:
-                        for attr, val in self.db.stats["attributes"][category].items():
+                    if category in stats["attributes"]:
+                        for attr, val in stats["attributes"][category].items():
                             if val >= 3:  # Only show high attributes
                                 attrs.append(f"{attr.title()}: {val}")
                 string += ", ".join(attrs[:5]) + "\n"  # Limit to 5 attributes
                 
             # Show supernatural powers if any
-            if "powers" in self.db.stats:
-                for power_type, powers in self.db.stats["powers"].items():
+            if "powers" in stats:
+                for power_type, powers in stats["powers"].items():
                     if powers:
                         string += f"  |w{power_type.title()}s:|n "
                         if isinstance(powers, dict):
@@ -823,21 +788,8 @@ class NPC(DefaultCharacter):
         # NPCs cannot be logged into directly
         return False
 
-    def at_init(self):
-        """
-        Called when the typeclass is cached from memory.
-        """
-        # Check for expiration if this is a temporary NPC
-        if getattr(self.db, "is_temporary", False) and self.is_expired():
-            # Schedule deletion to happen after init completes
-            from evennia.scripts.taskhandler import TaskHandlerPool
-            TaskHandlerPool.add_task(self.delete, (), {}, priority=10)
-
     def at_object_delete(self):
         """Called just before the NPC is deleted from the database."""
-        # Unregister from all rooms
-        from evennia import search_object
-        
         try:
             # Clear all command sets to make sure nothing persists
             try:
@@ -850,24 +802,14 @@ class NPC(DefaultCharacter):
                 from evennia.utils import logger
                 logger.log_err(f"Error clearing command sets for NPC {self.key}: {e}")
             
-            # Get a safe copy of registered rooms
-            registered_rooms = set(self.db.registered_in_rooms) if hasattr(self.db, "registered_in_rooms") else set()
-            
-            # Clear the attribute first in case something fails
-            self.attributes.remove("registered_in_rooms")
-            
-            # Now try to unregister from each room
-            for room_dbref in registered_rooms:
-                try:
-                    room = search_object(room_dbref)
-                    if room and len(room) > 0:
-                        room = room[0]
-                        if hasattr(room, "db_npcs") and self.key in room.db_npcs:
-                            del room.db_npcs[self.key]
-                except Exception as e:
-                    from evennia.utils import logger
-                    logger.log_err(f"Error unregistering NPC {self.key} from room {room_dbref}: {e}")
-                    # Continue to next room even if there's an error
+            # Unregister from all rooms
+            try:
+                self.unregister_from_all_rooms()
+            except Exception as e:
+                from evennia.utils import logger
+                logger.log_err(f"Error unregistering NPC {self.key} from its rooms: {e}")
+            NPC_STATS.forget(self)
+            NPC_EXPIRY.cancel(self)
                 
             # Call parent method
             super().at_object_delete()
@@ -879,25 +821,7 @@ class NPC(DefaultCharacter):
 
     def get_health_status(self):
         """Get a text representation of health status."""
-        health = self.db.stats.get("health", {"bashing": 0, "lethal": 0, "aggravated": 0})
-        total_damage = health['bashing'] + health['lethal'] + health['aggravated']
-        
-        if total_damage == 0:
-            return "Healthy"
-        elif total_damage <= 1:
-            return "Bruised"
-        elif total_damage <= 2:
-            return "Hurt"
-        elif total_damage <= 3:
-            return "Injured"
-        elif total_damage <= 4:
-            return "Wounded"
-        elif total_damage <= 5:
-            return "Mauled"
-        elif total_damage <= 6:
-            return "Crippled"
-        else:
-            return "Incapacitated"
+        return health_status(NPC_STATS.health(self))
 
     def apply_damage(self, damage_type, amount):
         """
@@ -910,37 +834,16 @@ class NPC(DefaultCharacter):
         Returns:
             str: New health status after damage
         """
-        if damage_type not in ["bashing", "lethal", "aggravated"]:
-            return self.get_health_status()
-            
-        # Ensure health dict exists
-        if not self.db.stats.get("health"):
-            self.db.stats["health"] = {"bashing": 0, "lethal": 0, "aggravated": 0}
-            
-        # Apply damage
-        self.db.stats["health"][damage_type] += amount
-        
-        # Update health in all rooms where this NPC is registered
-        self.update_health_in_rooms()
-        
+        if damage_type in ["bashing", "lethal", "aggravated"]:
+            NPC_STATS.change_health(self, damage_type, amount)
+        status = self.get_health_status()
+
         # Check if NPC should be deleted due to incapacitation
-        if self.db.is_temporary and self.get_health_status() == "Incapacitated":
+        if self.db.is_temporary and status == "Incapacitated":
             # Schedule deletion with a slight delay
-            from evennia.scripts.taskhandler import TaskHandlerPool
-            TaskHandlerPool.add_task(self.delete, (), {}, priority=10, delay=60)
+            delay(60, self.delete)
             
-        return self.get_health_status()
-    
-    def update_health_in_rooms(self):
-        """Update health status in all rooms where this NPC is registered."""
-        from evennia import search_object
-        
-        for room_dbref in self.db.registered_in_rooms:
-            room = search_object(room_dbref)
-            if room and len(room) > 0:
-                room = room[0]
-                if hasattr(room, "db_npcs") and self.key in room.db_npcs:
-                    room.db_npcs[self.key]["health"] = self.db.stats["health"]
+        return status
 
     def heal_damage(self, damage_type, amount):
         """
@@ -953,19 +856,8 @@ class NPC(DefaultCharacter):
         Returns:
             str: New health status after healing
         """
-        if damage_type not in ["bashing", "lethal", "aggravated"]:
-            return self.get_health_status()
-            
-        # Ensure health dict exists
-        if not self.db.stats.get("health"):
-            self.db.stats["health"] = {"bashing": 0, "lethal": 0, "aggravated": 0}
-            
-        # Apply healing (minimum 0)
-        self.db.stats["health"][damage_type] = max(0, self.db.stats["health"][damage_type] - amount)
-        
-        # Update health in all rooms where this NPC is registered
-        self.update_health_in_rooms()
-        
+        if damage_type in ["bashing", "lethal", "aggravated"]:
+            NPC_STATS.change_health(self, damage_type, -amount)
         return self.get_health_status()
 
     def get_language(self):
@@ -1045,16 +937,3 @@ class NPC(DefaultCharacter):
         """
         self.msg_contents(f"{self.key} has been released from {self.account}'s control.")
         super().at_pre_unpuppet()
-
-    def at_heartbeat(self):
-        """
-        Called regularly by the server.
-        
-        We use this to check if temporary NPCs should be cleaned up.
-        """
-        # Check if this is a temporary NPC with expiration
-        if self.db.is_temporary and self.db.expiration_time:
-            now = datetime.now()
-            if now >= self.db.expiration_time:
-                self.delete()
-
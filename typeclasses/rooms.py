@@ -4,11 +4,50 @@ from evennia.utils.ansi import ANSIString
 from evennia.utils import ansi
 from world.wod20th.utils.ansi_utils import wrap_ansi
 from world.wod20th.utils.formatting import header, footer, divider
+from world.wod20th.utils.scene_tracker import SCENE_TRACKER
 from datetime import datetime
 import random
 from evennia.utils.search import search_channel
 import re
 
+
+# Reality layers a character can share with a looker
+REALM_STATES = frozenset(("in_umbra", "in_material", "in_dreaming"))
+# Most cached appearance pieces kept per room
+APPEARANCE_CACHE_SIZE = 64
+
+
+class AudiencePlan:
+    """
+    Who in a room hears a message, and who sees whom, worked out once per
+    change of contents.
+
+    ``contents`` is everyone in the room. ``realms`` maps a sender's plane
+    (True for the Umbra, False for the material world) to the contents that
+    hear them: every non-character object plus the characters in that plane.
+    ``states`` maps each object to its realm state tags, and
+    ``object_states`` does the same but counts untagged objects as material.
+    """
+
+    __slots__ = ("contents", "realms", "states", "object_states")
+
+    def __init__(self, contents):
+        self.contents = list(contents)
+        self.realms = {True: [], False: []}
+        self.states = {}
+        self.object_states = {}
+        for obj in self.contents:
+            tags = getattr(obj, 'tags', None)
+            states = REALM_STATES.intersection(tags.get(category="state", return_list=True) or []) if tags else frozenset()
+            self.states[obj] = states
+            self.object_states[obj] = states if states & {"in_umbra", "in_dreaming"} else states | {"in_material"}
+            if getattr(obj, 'is_character', False):
+                self.realms["in_umbra" in states].append(obj)
+            else:
+                self.realms[True].append(obj)
+                self.realms[False].append(obj)
+
+
 class RoomParent(DefaultRoom):
 
  
@@ -93,7 +132,8 @@ class RoomParent(DefaultRoom):
         name = self.get_display_name(looker, **kwargs)
         
         # Check if the looker is in the Umbra or peeking into it
-        in_umbra = looker.tags.get("in_umbra", category="state")
+        looker_states = set(looker.tags.get(category="state", return_list=True) or [])
+        in_umbra = "in_umbra" in looker_states
         peeking_umbra = kwargs.get("peek_umbra", False)
         
         # Set color scheme based on realm type and state
@@ -105,33 +145,34 @@ class RoomParent(DefaultRoom):
         # Choose the appropriate description
         if (in_umbra or peeking_umbra) and self.db.umbra_desc:
             desc = self.db.umbra_desc
-        elif looker.tags.get("in_dreaming", category="state") and self.db.fae_desc:
+        elif "in_dreaming" in looker_states and self.db.fae_desc:
             desc = self.db.fae_desc
         else:
             desc = self.db.desc
 
         # Update all dividers to use the new color scheme
-        string = header(name, width=78, bcolor=border_color, fillchar=ANSIString(f"{border_color}-|n")) + "\n"
+        string = self.cached_appearance(
+            ("header", name, border_color),
+            lambda: header(name, width=78, bcolor=border_color, fillchar=ANSIString(f"{border_color}-|n")) + "\n"
+        )
         
         # Process room description
         if desc:
             # Use format_description to handle the formatting
-            formatted_desc = self.format_description(desc)
+            formatted_desc = self.cached_appearance(("desc", desc), lambda: self.format_description(desc))
             if formatted_desc:
                 string += formatted_desc + "\n"
 
-        # List all characters in the room
-        characters = []
-        for obj in self.contents:
-            if obj.has_account:
-                # Check if they share the same reality layer
-                if ((looker.tags.get("in_umbra", category="state") and obj.tags.get("in_umbra", category="state")) or
-                    (looker.tags.get("in_material", category="state") and obj.tags.get("in_material", category="state")) or
-                    (looker.tags.get("in_dreaming", category="state") and obj.tags.get("in_dreaming", category="state"))):
-                    characters.append(obj)
+        # Realm tags of everything in the room, from the audience plan
+        plan = self.get_audience_plan()
+        looker_realms = looker_states & REALM_STATES
+
+        # List all characters that share a reality layer with the looker
+        characters = [obj for obj in plan.contents
+                      if obj.has_account and looker_realms & plan.states[obj]]
 
         if characters:
-            string += divider("Characters", width=78, fillchar=ANSIString(f"{border_color}-|n")) + "\n"
+            string += self.divider_for("Characters", border_color)
             for character in characters:
                 idle_time = self.idle_time_display(character.idle_time)
 
@@ -154,21 +195,13 @@ class RoomParent(DefaultRoom):
                 string += f"{name_part}{idle_part} {ANSIString(shortdesc_str)}\n"
 
         # List all objects in the room that are in the same reality layer
-        objects = []
-        for obj in self.contents:
-            if not obj.has_account and not obj.destination:
-                # Check if object is visible in current reality layer
-                # If object has no reality layer tags, assume it's in material plane
-                is_in_material = not (obj.tags.get("in_umbra", category="state") or 
-                                    obj.tags.get("in_dreaming", category="state"))
-                
-                if ((looker.tags.get("in_umbra", category="state") and obj.tags.get("in_umbra", category="state")) or
-                    (looker.tags.get("in_material", category="state") and (obj.tags.get("in_material", category="state") or is_in_material)) or
-                    (looker.tags.get("in_dreaming", category="state") and obj.tags.get("in_dreaming", category="state"))):
-                    objects.append(obj)
+        # (objects with no realm tags count as material)
+        objects = [obj for obj in plan.contents
+                   if not obj.has_account and not obj.destination
+                   and looker_realms & plan.object_states[obj]]
 
         if objects:
-            string += divider("Objects", width=78, fillchar=ANSIString(f"{border_color}-|n")) + "\n"
+            string += self.divider_for("Objects", border_color)
             for obj in objects:
                 if obj.db.shortdesc:
                     shortdesc = obj.db.shortdesc
@@ -177,51 +210,102 @@ class RoomParent(DefaultRoom):
                 string += " " + ANSIString(f"{obj.get_display_name(looker)}").ljust(25) + ANSIString(f"{shortdesc}").ljust(53, ' ') + "\n"
 
         # List all NPCs in the room
-        npcs = []
-        for obj in self.contents:
-            if hasattr(obj, 'is_npc') and obj.is_npc:
-                npcs.append(obj)
+        npcs = [obj for obj in plan.contents if getattr(obj, 'is_npc', False)]
 
         if npcs:
-            string += divider("NPCs", width=78, fillchar=ANSIString(f"{border_color}-|n")) + "\n"
+            string += self.divider_for("NPCs", border_color)
             for npc in npcs:
                 string += f" {ANSIString(npc.get_display_name(looker))}\n"
 
-        # List all exits that are accessible in the current reality layer
-        exits = []
-        for ex in self.contents:
-            if ex.destination and ex.access(looker, "view"):
-                # Add logging to help diagnose visibility
-                exits.append(ex)
+        # List all exits that are accessible in the current reality layer;
+        # the layout is cached per set of visible exits
+        exits = [ex for ex in plan.contents if ex.destination and ex.access(looker, "view")]
 
         if exits:
-            direction_strings = []
-            exit_strings = []
-            for exit in exits:
-                aliases = exit.aliases.all() or []
-                exit_name = exit.get_display_name(looker)
-                short = min(aliases, key=len) if aliases else ""
-                
-                exit_string = ANSIString(f" <|y{short.upper()}|n> {exit_name}")
-                
-                if any(word in exit_name for word in ['Sector', 'District', 'Neighborhood']):
-                    direction_strings.append(exit_string)
-                else:
-                    exit_strings.append(exit_string)
-
-            # Display Directions
-            if direction_strings:
-                string += divider("Directions", width=78, fillchar=ANSIString(f"{border_color}-|n")) + "\n"
-                string += self.format_exit_columns(direction_strings)
-
-            # Display Exits
-            if exit_strings:
-                string += divider("Exits", width=78, fillchar=ANSIString(f"{border_color}-|n")) + "\n"
-                string += self.format_exit_columns(exit_strings)
+            # Builders see dbrefs in exit names
+            is_builder = hasattr(looker, 'check_permstring') and looker.check_permstring("builders")
+            exits_key = tuple((ex.id, ex.key, tuple(ex.aliases.all() or ())) for ex in exits)
+            string += self.cached_appearance(
+                ("exits", border_color, is_builder, exits_key),
+                lambda: self.format_exits(exits, looker, border_color)
+            )
 
         # Get room type and resources
         room_type = self.db.roomtype or "Unknown"
         resources = self.db.resources
+        has_views = bool(self.db.views)
+        has_places = bool(self.db.places)
+        string += self.cached_appearance(
+            ("footer", border_color, room_type, resources, has_views, has_places),
+            lambda: self.format_footer(border_color, room_type, resources, has_views, has_places)
+        )
+
+        # Add freezer warning if applicable
+        if self.db.roomtype == "freezer":
+            warning = "\n|r[FROZEN ROOM - No Speaking or Movement Allowed]|n\n"
+            # Insert warning after the room name but before description
+            lines = string.split('\n')
+            lines.insert(2, warning)  # Insert after header
+            string = '\n'.join(lines)
+
+        return string
+
+    def cached_appearance(self, key, build):
+        """
+        Return a piece of the room's appearance, building it on first use.
+
+        Keys hold everything the piece depends on (description text, exit
+        names, realm colour...), so an edit simply misses the cache. The
+        cache is also cleared when anything enters or leaves the room.
+        """
+        cache = self.ndb.appearance_cache
+        if cache is None or len(cache) >= APPEARANCE_CACHE_SIZE:
+            cache = self.ndb.appearance_cache = {}
+        if key not in cache:
+            cache[key] = build()
+        return cache[key]
+
+    def invalidate_appearance(self):
+        """Drop the cached appearance pieces."""
+        self.ndb.appearance_cache = None
+
+    def divider_for(self, title, border_color):
+        """Return a section divider line in the given realm colour."""
+        return self.cached_appearance(
+            ("divider", title, border_color),
+            lambda: divider(title, width=78, fillchar=ANSIString(f"{border_color}-|n")) + "\n"
+        )
+
+    def format_exits(self, exits, looker, border_color):
+        """Lay out the Directions and Exits sections."""
+        string = ""
+        direction_strings = []
+        exit_strings = []
+        for exit in exits:
+            aliases = exit.aliases.all() or []
+            exit_name = exit.get_display_name(looker)
+            short = min(aliases, key=len) if aliases else ""
+            
+            exit_string = ANSIString(f" <|y{short.upper()}|n> {exit_name}")
+            
+            if any(word in exit_name for word in ['Sector', 'District', 'Neighborhood']):
+                direction_strings.append(exit_string)
+            else:
+                exit_strings.append(exit_string)
+
+        # Display Directions
+        if direction_strings:
+            string += self.divider_for("Directions", border_color)
+            string += self.format_exit_columns(direction_strings)
+
+        # Display Exits
+        if exit_strings:
+            string += self.divider_for("Exits", border_color)
+            string += self.format_exit_columns(exit_strings)
+        return string
+
+    def format_footer(self, border_color, room_type, resources, has_views, has_places):
+        """Build the footer line with room type, resources and +views/+places indicators."""
         resources_str = f"Res:{resources}" if resources is not None else ""
 
         # Create the footer with room type and resources
@@ -229,9 +313,9 @@ class RoomParent(DefaultRoom):
         
         # Add indicators for views and places if available
         indicators = []
-        if hasattr(self.db, 'views') and self.db.views:
+        if has_views:
             indicators.append("+views set")
-        if hasattr(self.db, 'places') and self.db.places:
+        if has_places:
             indicators.append("+places set")
             
         if indicators:
@@ -240,17 +324,7 @@ class RoomParent(DefaultRoom):
         footer_length = len(ANSIString(footer_text))
         padding = 78 - footer_length - 2  # -2 for the brackets
 
-        string += ANSIString(f"{border_color}{'-' * padding}[|c{footer_text}{border_color}]|n")
-
-        # Add freezer warning if applicable
-        if self.db.roomtype == "freezer":
-            warning = "\n|r[FROZEN ROOM - No Speaking or Movement Allowed]|n\n"
-            # Insert warning after the room name but before description
-            lines = string.split('\n')
-            lines.insert(2, warning)  # Insert after header
-            string = '\n'.join(lines)
-
-        return string
+        return ANSIString(f"{border_color}{'-' * padding}[|c{footer_text}{border_color}]|n")
 
     def format_exit_columns(self, exit_strings):
         # Split into two columns
@@ -425,69 +499,67 @@ class RoomParent(DefaultRoom):
         
         return '\n'.join(result)
 
+    def get_audience_plan(self):
+        """
+        Return this room's AudiencePlan, rebuilding it if it is stale.
+
+        The plan is dropped when something enters or leaves, and when a
+        character in the room changes realm (see invalidate_audience). The
+        contents check also catches objects deleted or moved without the
+        room's hooks running.
+        """
+        contents = self.contents
+        plan = self.ndb.audience_plan
+        if plan is None or plan.contents != contents:
+            plan = AudiencePlan(contents)
+            self.ndb.audience_plan = plan
+        return plan
+
+    def invalidate_audience(self):
+        """Drop the cached audience plan; call after changing a character's realm tags."""
+        self.ndb.audience_plan = None
+
     def msg_contents(self, text=None, exclude=None, from_obj=None, mapping=None, **kwargs):
         """
         Send a message to all objects inside the room, excluding the sender and those in a different plane.
         Players in Quiet Rooms will not receive any room messages.
         """
-        # Suppress movement messages if this is a Quiet Room
-        if self.db.roomtype == "Quiet Room" and text:
-            # Check for standard movement messages
-            if from_obj and hasattr(from_obj, "name"):
-                # Message patterns that indicate movement
-                arrival_pattern = f"{from_obj.name} arrives to"
-                leaving_pattern = f"{from_obj.name} is leaving"
-                
-                # Check if this is a movement message
-                if (arrival_pattern in text or leaving_pattern in text):
-                    return  # Suppress movement messages in quiet rooms
-        
-        # If this is a source or destination of a quiet room, check the text
-        # to see if it's an arrival or departure message
-        if text and from_obj and hasattr(from_obj, "location") and hasattr(from_obj, "name"):
-            from_location = getattr(from_obj, "location", None)
-            
-            # Check if the from_obj's location is a quiet room
-            if (from_location and hasattr(from_location, "db") and 
-                getattr(from_location.db, "roomtype", None) == "Quiet Room"):
-                
-                # Message patterns that indicate movement from a quiet room
-                arrival_pattern = f"{from_obj.name} arrives to"
-                leaving_pattern = f"{from_obj.name} is leaving"
-                
-                # Check if this is a movement message
-                if (arrival_pattern in text or leaving_pattern in text):
-                    return  # Suppress message about movement from a quiet room
-        
-        if from_obj and hasattr(from_obj, "location"):
-            if from_obj.location.db.roomtype == "freezer":
-                if from_obj.has_account:  # Only block player characters
-                    from_obj.msg("|rYou are frozen and cannot speak.|n")
-                    return
-            elif from_obj.location.db.roomtype == "Quiet Room":
-                if from_obj.has_account:  # Only block player characters
-                    from_obj.msg("|rYou are in a Quiet Room and cannot speak.|n")
-                    return
-        
-        contents = self.contents
-        if exclude:
-            exclude = make_iter(exclude)
-            contents = [obj for obj in contents if obj not in exclude]
+        from_location = getattr(from_obj, "location", None) if from_obj else None
+        from_roomtype = getattr(from_location.db, "roomtype", None) if hasattr(from_location, "db") else None
+
+        # Movement messages about someone in a quiet room are suppressed
+        if from_roomtype == "Quiet Room" and text and hasattr(from_obj, "name"):
+            # Message patterns that indicate movement from a quiet room
+            arrival_pattern = f"{from_obj.name} arrives to"
+            leaving_pattern = f"{from_obj.name} is leaving"
+            if (arrival_pattern in text or leaving_pattern in text):
+                return
+
+        if from_roomtype == "freezer":
+            if from_obj.has_account:  # Only block player characters
+                from_obj.msg("|rYou are frozen and cannot speak.|n")
+                return
+        elif from_roomtype == "Quiet Room":
+            if from_obj.has_account:  # Only block player characters
+                from_obj.msg("|rYou are in a Quiet Room and cannot speak.|n")
+                return
+
+        # Nobody in a Quiet Room receives room messages
+        if self.db.roomtype == "Quiet Room":
+            return
 
-        for obj in contents:
-            # Skip sending to players who are in Quiet Rooms
-            if hasattr(obj, 'location') and obj.location and hasattr(obj.location, 'db') and getattr(obj.location.db, 'roomtype', None) == "Quiet Room":
-                continue
+        plan = self.get_audience_plan()
+        if from_obj and hasattr(from_obj, 'tags'):
+            # Only characters in the sender's plane (Umbra or material) hear it
+            recipients = plan.realms[bool(from_obj.tags.get("in_umbra", category="state"))]
+        else:
+            recipients = plan.contents
 
-            if hasattr(obj, 'is_character') and obj.is_character:
-                # Check if the character is in the same plane (Umbra or material)
-                if from_obj and hasattr(from_obj, 'tags'):
-                    sender_in_umbra = from_obj.tags.get("in_umbra", category="state")
-                    receiver_in_umbra = obj.tags.get("in_umbra", category="state")
-                    
-                    if sender_in_umbra != receiver_in_umbra:
-                        continue  # Skip this character if they're in a different plane
+        if exclude:
+            exclude = make_iter(exclude)
+            recipients = [obj for obj in recipients if obj not in exclude]
 
+        for obj in recipients:
             obj.msg(text=text, from_obj=from_obj, mapping=mapping, **kwargs)
 
     def can_step_sideways(self, character):
@@ -617,6 +689,7 @@ class RoomParent(DefaultRoom):
             if successes > 0:
                 character.tags.remove("in_umbra", category="state")
                 character.tags.add("in_material", category="state")
+                self.invalidate_audience()
                 character.msg("You step back into the material world.")
                 self.msg_contents(f"{character.name} shimmers into view as they return from the Umbra.", exclude=character, from_obj=character)
                 return True
@@ -656,6 +729,7 @@ class RoomParent(DefaultRoom):
             if successes > 0:
                 character.tags.remove("in_material", category="state")
                 character.tags.add("in_umbra", category="state")
+                self.invalidate_audience()
                 character.msg("You successfully step sideways into the Umbra.")
                 self.msg_contents(f"{character.name} shimmers and fades from view as they step into the Umbra.", exclude=character, from_obj=character)
                 return True
@@ -1205,6 +1279,8 @@ class RoomParent(DefaultRoom):
     def at_object_receive(self, moved_obj, source_location, **kwargs):
         """Called when an object enters the room."""
         super().at_object_receive(moved_obj, source_location, **kwargs)
+        self.invalidate_audience()
+        self.invalidate_appearance()
         
         # If this is a freezer room, notify the character
         if self.db.roomtype == "freezer" and moved_obj.has_account:
@@ -1222,6 +1298,8 @@ class RoomParent(DefaultRoom):
             moved_obj.msg("|gYou have left the Quiet Room. Communication commands are now available.|n")
             
         super().at_object_leave(moved_obj, target_location, **kwargs)
+        self.invalidate_audience()
+        self.invalidate_appearance()
 
     def prevent_exit_use(self, exit_obj, character):
         """
@@ -1313,6 +1391,7 @@ class RoomParent(DefaultRoom):
             character (Object): The character starting the scene
         """
         now = datetime.now()
+        SCENE_TRACKER.flush_room(self)
         
         # Initialize scene data if needed
         if not hasattr(self.db, 'scene_data') or not isinstance(self.db.scene_data, dict):
@@ -1331,9 +1410,11 @@ class RoomParent(DefaultRoom):
                     'last_activity': now,
                     'completed': False
                 })
+        SCENE_TRACKER.forget_room(self)
 
     def end_scene(self):
         """End the current scene in this room."""
+        SCENE_TRACKER.flush_room(self)
         if not hasattr(self.db, 'scene_data') or not self.db.scene_data.get('start_time'):
             return
             
@@ -1344,6 +1425,7 @@ class RoomParent(DefaultRoom):
             'last_activity': None,
             'completed': True
         })
+        SCENE_TRACKER.forget_room(self)
 
     def add_scene_participant(self, character):
         """
@@ -1352,17 +1434,7 @@ class RoomParent(DefaultRoom):
         Args:
             character (Object): The character to add
         """
-        if not hasattr(self.db, 'scene_data'):
-            self.start_scene(character)
-            return
-            
-        # Initialize participants as a set if needed
-        if not isinstance(self.db.scene_data.get('participants'), set):
-            self.db.scene_data['participants'] = set()
-            
-        # Add the character
-        self.db.scene_data['participants'].add(character.key)
-        self.db.scene_data['last_activity'] = datetime.now()
+        SCENE_TRACKER.add_participant(self, character)
 
     def remove_scene_participant(self, character):
         """
@@ -1371,14 +1443,8 @@ class RoomParent(DefaultRoom):
         Args:
             character (Object): The character to remove
         """
-        if not hasattr(self.db, 'scene_data') or not isinstance(self.db.scene_data.get('participants'), set):
-            return
-            
-        # Remove the character
-        self.db.scene_data['participants'].discard(character.key)
-        
         # If no participants left, end the scene
-        if not self.db.scene_data['participants']:
+        if not SCENE_TRACKER.discard_participant(self, character):
             self.end_scene()
 
     def get_scene_participants(self):
@@ -1388,9 +1454,7 @@ class RoomParent(DefaultRoom):
         Returns:
             set: Set of character keys participating in the scene
         """
-        if not hasattr(self.db, 'scene_data'):
-            return set()
-        return self.db.scene_data.get('participants', set())
+        return SCENE_TRACKER.get_participants(self)
 
     def record_scene_activity(self, character):
         """
@@ -1399,28 +1463,7 @@ class RoomParent(DefaultRoom):
         Args:
             character (Object): The character performing the activity
         """
-        now = datetime.now()
-        
-        # Ensure scene_data exists and has proper structure
-        if not hasattr(self.db, 'scene_data') or not isinstance(self.db.scene_data, dict):
-            self.db.scene_data = {
-                'start_time': now,
-                'participants': set(),
-                'last_activity': now,
-                'completed': False
-            }
-        
-        # Initialize participants as a set if needed
-        if not isinstance(self.db.scene_data.get('participants'), set):
-            self.db.scene_data['participants'] = set()
-        
-        # Add character as participant and update activity time
-        self.db.scene_data['participants'].add(character.key)
-        self.db.scene_data['last_activity'] = now
-        
-        # If no active scene, start one
-        if not self.db.scene_data.get('start_time'):
-            self.db.scene_data['start_time'] = now
+        SCENE_TRACKER.add_participant(self, character)
 
     def is_valid_scene_location(self):
         """
@@ -5,7 +5,7 @@ This script hooks into the connection and disconnection events to notify people
 who are watching the connecting/disconnecting character.
 """
 from evennia import DefaultScript
-from evennia.utils.utils import connected_players
+from utils.watch_index import WATCH_INDEX
 
 
 class WatchNotifier(DefaultScript):
@@ -97,37 +97,10 @@ class WatchNotifier(DefaultScript):
         # Get the status message
         status = "connected to" if is_connecting else "disconnected from"
         
-        # Iterate through all connected players to find watchers
-        for account in connected_players():
-            # Skip if no valid puppet or account
-            if not account or not account.puppet:
-                continue
-                
-            watcher = account.puppet
-            
-            # Skip if it's the same character
-            if watcher == character:
-                continue
-                
-            # Skip if watch system is deactivated
-            if not watcher.attributes.get("watch_active", True):
-                continue
-                
-            should_notify = False
-            
-            # Check if this watcher is watching all connections
-            if watcher.attributes.get("watch_all", False):
-                should_notify = True
-            
-            # Check if this character is on the watcher's watch list
-            watch_list = watcher.attributes.get("watch_list", [])
-            if character.key in watch_list:
-                should_notify = True
-                
+        # Only the online characters watching this one are looked at
+        for watcher in WATCH_INDEX.watchers_of(character):
             # If we're only notifying permitted watchers, check if this watcher is permitted
             if only_permitted is not None and watcher.key not in only_permitted:
-                should_notify = False
+                continue
                 
-            # Notify the watcher if appropriate
-            if should_notify:
-                watcher.msg(f"{character.key} has {status} the game.") 
\ No newline at end of file
+            watcher.msg(f"{character.key} has {status} the game.")
@@ -0,0 +1,160 @@
+"""
+In-memory name, alias and dbref index of player characters.
+
+search_character used to fall through up to five database searches, the
+last of which loaded every character and read its ``alias`` Attribute, so
+naming someone who didn't exist cost a full roster scan. The CharacterIndex
+maps case-folded names and aliases to characters, so a lookup is a dict hit
+and a prefix lookup a bisect over a sorted key list.
+
+Each character is indexed under its key, its Evennia aliases and the alias
+set with the ``alias`` command. The index is built at server start (or on
+first use) and kept current by the character signal handlers in
+world.wod20th.signals, which catch creation, renames, alias tag changes and
+deletion. The ``alias`` command updates it directly.
+
+Usage:
+    from utils.character_index import CHARACTER_INDEX
+
+    CHARACTER_INDEX.find("lys")          # by name, alias or #dbref
+    CHARACTER_INDEX.complete("lysa")     # every character with a matching prefix
+"""
+from bisect import bisect_left, insort
+
+CHARACTER_TYPECLASS = 'typeclasses.characters.Character'
+
+
+def fold(text) -> str:
+    """Return the case-folded form used for index keys."""
+    return str(text).strip().casefold()
+
+
+class CharacterIndex:
+    """Folded name or alias -> characters."""
+
+    def __init__(self):
+        self._built = False
+        # Character id -> character
+        self._objects = {}
+        # Character id -> (folded names, folded aliases) it is indexed under
+        self._keys = {}
+        # Folded key or Evennia alias -> character ids
+        self._by_name = {}
+        # Folded ``alias`` Attribute -> character ids
+        self._by_alias = {}
+        # Every folded name and alias, sorted, for prefix lookups
+        self._sorted = []
+
+    def reset(self):
+        """Forget everything; the index rebuilds on next use."""
+        self.__init__()
+
+    def rebuild(self):
+        """Index every character in three queries."""
+        from evennia.objects.models import ObjectDB
+
+        self.__init__()
+        self._built = True
+        in_scope = {'objectdb__db_typeclass_path': CHARACTER_TYPECLASS}
+        aliases = {}
+        for char_id, alias in ObjectDB.db_attributes.through.objects.filter(
+            attribute__db_key='alias', attribute__db_category__isnull=True, **in_scope
+        ).values_list('objectdb_id', 'attribute__db_value'):
+            aliases.setdefault(char_id, []).append(alias)
+        tag_aliases = {}
+        for char_id, alias in ObjectDB.db_tags.through.objects.filter(
+            tag__db_tagtype='alias', **in_scope
+        ).values_list('objectdb_id', 'tag__db_key'):
+            tag_aliases.setdefault(char_id, []).append(alias)
+
+        for character in ObjectDB.objects.filter(db_typeclass_path=CHARACTER_TYPECLASS):
+            self._link(character, [character.db_key, *tag_aliases.get(character.id, ())],
+                       aliases.get(character.id, ()))
+
+    def _ensure_built(self):
+        if not self._built:
+            self.rebuild()
+
+    def update(self, character):
+        """Index (or re-index) one character from the database."""
+        from evennia.objects.models import ObjectDB
+
+        if not self._built:
+            # The first lookup builds the whole index anyway
+            return
+        self.discard(character)
+        if character.db_typeclass_path != CHARACTER_TYPECLASS:
+            return
+        aliases = ObjectDB.db_attributes.through.objects.filter(
+            objectdb_id=character.id, attribute__db_key='alias', attribute__db_category__isnull=True
+        ).values_list('attribute__db_value', flat=True)
+        tag_aliases = ObjectDB.db_tags.through.objects.filter(
+            objectdb_id=character.id, tag__db_tagtype='alias'
+        ).values_list('tag__db_key', flat=True)
+        self._link(character, [character.db_key, *tag_aliases], list(aliases))
+
+    def discard(self, character):
+        """Drop a character from the index."""
+        names, aliases = self._keys.pop(character.id, ((), ()))
+        self._objects.pop(character.id, None)
+        for table, keys in ((self._by_name, names), (self._by_alias, aliases)):
+            for key in keys:
+                ids = table.get(key)
+                if ids is None:
+                    continue
+                ids.discard(character.id)
+                if not ids:
+                    del table[key]
+                    if key not in self._by_name and key not in self._by_alias:
+                        self._sorted.pop(bisect_left(self._sorted, key))
+
+    def _link(self, character, names, aliases):
+        names = frozenset(fold(name) for name in names if isinstance(name, str) and name.strip())
+        aliases = frozenset(fold(alias) for alias in aliases if isinstance(alias, str) and alias.strip())
+        self._objects[character.id] = character
+        self._keys[character.id] = (names, aliases)
+        for table, keys in ((self._by_name, names), (self._by_alias, aliases)):
+            for key in keys:
+                if key not in self._by_name and key not in self._by_alias:
+                    insort(self._sorted, key)
+                table.setdefault(key, set()).add(character.id)
+
+    def _first(self, ids):
+        return self._objects[min(ids)] if ids else None
+
+    def find(self, text):
+        """
+        Return the character named by a name, alias or #dbref, or None.
+
+        Names and Evennia aliases win over ``alias`` Attributes. If several
+        characters share a name, the oldest one is returned.
+        """
+        self._ensure_built()
+        text = str(text).strip()
+        if text.startswith('#') and text[1:].isdigit():
+            return self._objects.get(int(text[1:]))
+        key = fold(text)
+        return self._first(self._by_name.get(key)) or self._first(self._by_alias.get(key))
+
+    def find_alias(self, text):
+        """Return the character whose ``alias`` Attribute matches text, or None."""
+        self._ensure_built()
+        return self._first(self._by_alias.get(fold(text)))
+
+    def complete(self, prefix):
+        """Return every character with a name or alias starting with prefix, oldest first."""
+        self._ensure_built()
+        prefix = fold(prefix)
+        if not prefix:
+            return []
+        ids = set()
+        for position in range(bisect_left(self._sorted, prefix), len(self._sorted)):
+            key = self._sorted[position]
+            if not key.startswith(prefix):
+                break
+            ids.update(self._by_name.get(key, ()))
+            ids.update(self._by_alias.get(key, ()))
+        return [self._objects[char_id] for char_id in sorted(ids)]
+
+
+CHARACTER_INDEX = CharacterIndex()
@@ -0,0 +1,117 @@
+"""
+Outbound HTTP for game code.
+
+Commands run on Twisted's reactor thread, so a blocking ``requests.get``
+there freezes the whole game until the remote host answers. ``fetch`` and
+``fetch_json`` run the request on the reactor's thread pool with
+``deferToThread`` and return a Deferred whose callbacks fire back on the
+reactor thread, where it is safe to message players and touch the database.
+
+All requests share one ``requests.Session``. Its pooled connections keep
+TLS handshakes to the same hosts down. Every request has a connect/read
+timeout. Connection failures, and 429/5xx answers to idempotent methods,
+are retried with backoff.
+
+Code that already runs off the reactor (web views, management commands)
+can call ``request`` directly and still get the pool, timeout and retries.
+
+Usage:
+    from utils.http_client import fetch_json
+
+    def _show(data):
+        caller.msg(data['name'])
+
+    fetch_json(url).addCallbacks(_show, lambda failure: caller.msg("Service unavailable."))
+"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from twisted.internet.threads import deferToThread
+from urllib3.util.retry import Retry
+
+from evennia.utils import logger
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+RETRIES = 2
+BACKOFF = 0.5
+POOL_SIZE = 10
+USER_AGENT = "DiesIrae-MUSH (+https://github.com/Dies-Irae-mu/game)"
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the shared, pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=RETRIES,
+                    connect=RETRIES,
+                    read=RETRIES,
+                    status=RETRIES,
+                    backoff_factor=BACKOFF,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = USER_AGENT
+                _session = session
+    return _session
+
+
+def request(method: str, url: str, timeout=DEFAULT_TIMEOUT, **kwargs) -> requests.Response:
+    """
+    Make a blocking request through the shared session.
+
+    Never call this on the reactor thread; use fetch() there.
+    """
+    return get_session().request(method, url, timeout=timeout, **kwargs)
+
+
+def _log_failure(failure, method, url):
+    logger.log_err(f"HTTP {method} {url} failed: {failure.getErrorMessage()}")
+    return failure
+
+
+def fetch(method: str, url: str, **kwargs):
+    """
+    Make a request on the thread pool.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Address to request.
+        **kwargs: Passed on to requests (json, headers, params, timeout...).
+
+    Returns:
+        Deferred: Fires with the requests.Response. Network errors are
+            logged and passed on to the errback chain.
+    """
+    deferred = deferToThread(request, method, url, **kwargs)
+    deferred.addErrback(_log_failure, method, url)
+    return deferred
+
+
+def _json_or_raise(response):
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_json(url: str, method: str = "GET", **kwargs):
+    """
+    Fetch and decode a JSON document on the thread pool.
+
+    Returns:
+        Deferred: Fires with the decoded JSON. Non-2xx answers fail with
+            requests.HTTPError.
+    """
+    return deferToThread(lambda: _json_or_raise(request(method, url, **kwargs))).addErrback(
+        _log_failure, method, url
+    )
@@ -0,0 +1,97 @@
+"""
+In-memory reverse index for the +watch system.
+
+Connect and disconnect notices used to walk every connected player and read
+their watch Attributes. The WatchIndex instead maps each watched name to the
+online characters watching it, plus the set of online characters watching
+everyone, so a notice only touches the people who will receive it.
+
+Only online watchers are indexed. A watcher is added when they puppet a
+character, dropped when their last session leaves it, and re-read whenever
++watch changes their settings. The index is rebuilt from the live sessions
+the first time it is used after a server start or reload.
+
+Usage:
+    from utils.watch_index import WATCH_INDEX
+
+    for watcher in WATCH_INDEX.watchers_of(character):
+        watcher.msg(...)
+"""
+
+
+class WatchIndex:
+    """Watched name -> online watchers."""
+
+    def __init__(self):
+        self._built = False
+        # Watcher id -> character, for every indexed watcher
+        self._online = {}
+        # Watcher id -> lower-cased names that watcher is indexed under
+        self._names = {}
+        # Lower-cased watched name -> watcher ids
+        self._by_name = {}
+        # Watcher ids with +watch/all on
+        self._watch_all = set()
+
+    def reset(self):
+        """Forget everything; the index rebuilds on next use."""
+        self.__init__()
+
+    def rebuild(self):
+        """Index the current puppet of every connected session."""
+        from evennia.server.sessionhandler import SESSIONS
+
+        self.__init__()
+        self._built = True
+        for session in SESSIONS.get_sessions():
+            puppet = session.get_puppet() if session.logged_in else None
+            if puppet:
+                self.add(puppet)
+
+    def _ensure_built(self):
+        if not self._built:
+            self.rebuild()
+
+    def add(self, watcher):
+        """Index (or re-index) an online character from its watch settings."""
+        self._ensure_built()
+        self._unlink(watcher.id)
+        self._online[watcher.id] = watcher
+        if not watcher.attributes.get("watch_active", True):
+            return
+        if watcher.attributes.get("watch_all", False):
+            self._watch_all.add(watcher.id)
+        names = {name.lower() for name in watcher.attributes.get("watch_list", []) or [] if isinstance(name, str)}
+        self._names[watcher.id] = names
+        for name in names:
+            self._by_name.setdefault(name, set()).add(watcher.id)
+
+    def refresh(self, watcher):
+        """Re-read a watcher's settings after +watch changed them."""
+        if watcher.id in self._online or watcher.sessions.count():
+            self.add(watcher)
+
+    def discard(self, watcher):
+        """Drop a character that went offline."""
+        self._ensure_built()
+        self._unlink(watcher.id)
+        self._online.pop(watcher.id, None)
+
+    def _unlink(self, watcher_id):
+        self._watch_all.discard(watcher_id)
+        for name in self._names.pop(watcher_id, ()):
+            watchers = self._by_name.get(name)
+            if watchers:
+                watchers.discard(watcher_id)
+                if not watchers:
+                    del self._by_name[name]
+
+    def watchers_of(self, character):
+        """Return the online characters watching this one, excluding itself."""
+        self._ensure_built()
+        ids = self._by_name.get(character.key.lower(), set()) | self._watch_all
+        ids.discard(character.id)
+        return [self._online[watcher_id] for watcher_id in ids if watcher_id in self._online]
+
+
+WATCH_INDEX = WatchIndex()
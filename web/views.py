@@ -6,6 +6,7 @@ from django.contrib import messages
 from evennia.objects.models import ObjectDB
 from evennia.utils.utils import inherits_from
 from world.wod20th.models import CharacterSheet, CharacterImage
+from world.wod20th.utils.character_directory import listed_entries
 from django.core.paginator import Paginator
 from evennia.utils.search import search_channel
 from evennia.help.models import HelpEntry
@@ -180,31 +181,8 @@ def format_attributes(stats):
 @login_required
 def character_list(request):
     """View for displaying list of characters."""
-    # Get base character queryset
-    characters = ObjectDB.objects.filter(
-        db_typeclass_path__contains='character'
-    ).exclude(
-        db_typeclass_path__contains='npc'
-    )
-    
-    # Filter for approved characters only, excluding staff and storytellers
-    # A character is included if:
-    # 1. They have the approved attribute set to True AND
-    # 2. They are not staff AND
-    # 3. They are not storytellers
-    approved_characters = []
-    for character in characters:
-        # Check for staff/storyteller permissions
-        permission_tags = [tag.db_key for tag in character.db_tags.filter(db_tagtype="permission")]
-        is_staff = any(perm in permission_tags for perm in ["developer", "admin", "builder"])
-        is_storyteller = "storyteller" in permission_tags
-        
-        # Only include approved characters that are not staff/storyteller
-        if character.db.approved and not is_staff and not is_storyteller:
-            approved_characters.append(character)
-    
-    # Sort the approved characters by name
-    approved_characters.sort(key=lambda x: x.key)
+    # Approved characters, excluding staff and storytellers, sorted by name
+    approved_characters = listed_entries()
     
     # Set up pagination
     paginator = Paginator(approved_characters, 75)  # Show 75 characters per page/25 per column
@@ -216,7 +194,7 @@ def character_list(request):
     third_count = (current_page_count + 2) // 3  # Using ceiling division to handle numbers not divisible by 3
     
     context = {
-        'characters': page_obj.object_list,
+        'characters': [entry.character for entry in page_obj.object_list],
         'third_count': third_count,
         'is_paginated': paginator.num_pages > 1,
         'page_obj': page_obj
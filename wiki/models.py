@@ -3,7 +3,7 @@ from evennia.utils.idmapper.models import SharedMemoryModel
 from django.urls import reverse
 from evennia.accounts.models import AccountDB
 from django.core.files.base import ContentFile
-import requests
+from utils.http_client import request
 from urllib.parse import urlparse
 import os
 from django.utils import timezone
@@ -293,7 +293,8 @@ class FeaturedImage(models.Model):
     def download_image(self, url, field_name):
         """Download image from URL and save to ImageField."""
         try:
-            response = requests.get(url)
+            # Saves run in a web worker thread, so a blocking (but bounded) request is fine here
+            response = request("GET", url)
             if response.status_code == 200:
                 # Get filename from URL
                 filename = os.path.basename(urlparse(url).path)
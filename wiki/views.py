@@ -6,6 +6,7 @@ from django.db.models.functions import Length
 from django.core.paginator import Paginator
 import logging
 from evennia.objects.models import ObjectDB
+from world.wod20th.utils.character_directory import search_entries
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponseForbidden, JsonResponse, Http404
 from django.urls import reverse
@@ -141,60 +142,12 @@ def search_wiki(request):
                 logger.error(f"Error searching wiki pages: {str(e)}", exc_info=True)
                 wiki_results = []
             
-            # Search Characters - More carefully now
+            # Search Characters through the character directory
             try:
-                # First get all character objects
-                base_char_qs = ObjectDB.objects.filter(
-                    db_typeclass_path__icontains='characters'
-                ).exclude(
-                    db_typeclass_path__icontains='npc'
-                )
-                logger.debug(f"Base character query found {base_char_qs.count()} characters")
-                logger.debug(f"Character typeclass paths: {list(base_char_qs.values_list('db_typeclass_path', flat=True))}")
-                
-                # Build character search query more carefully
-                char_results = []
-                for character in base_char_qs:
-                    score = 0
-                    matches = False
-                    
-                    # Check character key (name)
-                    char_name = character.key.lower()
-                    for word in query_words:
-                        word = word.lower()
-                        if word in char_name:
-                            matches = True
-                            score += 50 if word == char_name else 10
-                    
-                    # Check attributes one by one
-                    attr_fields = {
-                        'biography': character.db.biography or "",
-                        'rp_hooks': character.db.rp_hooks or "",
-                        'full_name': character.db.full_name or "",
-                        'appears_as': character.db.appears_as or "",
-                        'occupation': character.db.occupation or "",
-                        'affiliation': character.db.affiliation or ""
-                    }
-                    
-                    for field_name, field_value in attr_fields.items():
-                        if not isinstance(field_value, str):
-                            logger.warning(f"Non-string value for {field_name} on character {character.key}: {type(field_value)}")
-                            continue
-                            
-                        field_value = field_value.lower()
-                        for word in query_words:
-                            word = word.lower()
-                            if word in field_value:
-                                matches = True
-                                score += 2
-                    
-                    if matches:
-                        character.search_rank = score
-                        character.result_type = 'character'
-                        char_results.append(character)
-                
-                logger.debug(f"Found {len(char_results)} matching characters")
-                character_results = char_results
+                character_results = search_entries(query_words)
+                for character in character_results:
+                    character.result_type = 'character'
+                logger.debug(f"Found {len(character_results)} matching characters")
                 
             except Exception as e:
                 logger.error(f"Error searching characters: {str(e)}", exc_info=True)
@@ -222,11 +175,11 @@ def search_wiki(request):
             all_results.extend(character_results)
             
             # Sort results
-            all_results.sort(key=lambda x: (-x.search_rank, x.key.lower() if hasattr(x, 'key') else x.title.lower()))
+            all_results.sort(key=lambda x: (-x.search_rank, x.name.lower() if x.result_type == 'character' else x.title.lower()))
             
             logger.debug(f"Combined results before pagination: {len(all_results)} total")
             if all_results:
-                logger.debug(f"First few results: {[r.key if hasattr(r, 'key') else r.title for r in all_results[:5]]}")
+                logger.debug(f"First few results: {[r.name if r.result_type == 'character' else r.title for r in all_results[:5]]}")
             
             # Pagination
             paginator = Paginator(all_results, 10)
@@ -11,6 +11,7 @@ from evennia.utils.utils import make_iter
 import random
 from world.wod20th.utils.dice_rolls import roll_dice, interpret_roll_results
 from world.wod20th.utils.damage import calculate_total_health_levels, apply_damage_or_healing
+from world.wod20th.utils.npc_stats import is_scene_npc
 from .maneuvers import get_maneuver, MANEUVERS, MANEUVER_GROUPS
 from .martial_arts_maneuvers import (get_martial_arts_maneuver, check_martial_arts_requirements, 
                                     get_martial_arts_equipment_bonus, ALL_MARTIAL_ARTS_MANEUVERS, 
@@ -652,11 +653,15 @@ class CombatHandler(DefaultScript):
     
     def apply_damage(self, character, amount, damage_type):
         """Apply damage to a character."""
-        # Use the existing damage application system
-        apply_damage_or_healing(character, amount, damage_type)
+        if is_scene_npc(character):
+            # NPC health lives in the shared NPC stat store
+            injury_level = character.apply_damage(damage_type, amount)
+        else:
+            # Use the existing damage application system
+            injury_level = apply_damage_or_healing(character, amount, damage_type)
         
         # Check if character should be removed from combat
-        if character.db.injury_level in ["Incapacitated", "Dead", "Final Death", "Torpor"]:
+        if injury_level in ["Incapacitated", "Dead", "Final Death", "Torpor"]:
             self.obj.msg_contents(f"|w{character.name}|n is |rincapacitated|n and can no longer fight!")
             
             # Remove from combat at end of turn
@@ -665,7 +670,10 @@ class CombatHandler(DefaultScript):
     def get_health_penalty(self, character):
         """Calculate dice penalty based on character's health levels."""
         # Get current injury level
-        injury_level = character.db.injury_level or "Healthy"
+        if is_scene_npc(character):
+            injury_level = character.get_health_status()
+        else:
+            injury_level = character.db.injury_level or "Healthy"
         
         # Apply penalty based on injury level
         if injury_level == "Healthy" or injury_level == "Bruised":
@@ -3,6 +3,9 @@ from evennia.utils.idmapper.models import SharedMemoryModel
 from evennia.typeclasses.models import TypedObject
 from evennia.utils import logger
 from world.wod20th.models import CharacterSheet, Roster
+from world.wod20th.utils.sequences import allocate, release
+
+GROUP_SEQUENCE = 'groups.group'
 
 class Group(SharedMemoryModel):
     """
@@ -30,25 +33,21 @@ class Group(SharedMemoryModel):
         logger.log_info(f"Saving Group: {self.name}")
         logger.log_info(f"Current leader: {self.leader}")
         
-        # If group_id is not set, find the next available ID
+        # If group_id is not set, take the lowest free ID
         if self.group_id is None:
-            # Get all existing group IDs
-            used_ids = list(Group.objects.exclude(id=self.id).values_list('group_id', flat=True))
-            used_ids = [id for id in used_ids if id is not None]
-            
-            if used_ids:
-                # Find the smallest unused ID (including gaps)
-                all_ids = set(range(1, max(used_ids) + 2))
-                available_ids = all_ids - set(used_ids)
-                if available_ids:
-                    self.group_id = min(available_ids)
-            else:
-                # No existing groups with IDs, start with 1
-                self.group_id = 1
-        
+            self.group_id = allocate(GROUP_SEQUENCE, lambda: Group.objects.values_list('group_id', flat=True),
+                                     reuse_gaps=True)
+
         super().save(*args, **kwargs)
         logger.log_info(f"Group saved. Leader after save: {self.leader}. Group ID: {self.group_id}")
 
+    def delete(self, *args, **kwargs):
+        """Delete the group and free its group ID for the next new group."""
+        group_id = self.group_id
+        result = super().delete(*args, **kwargs)
+        release(GROUP_SEQUENCE, group_id)
+        return result
+
     @property
     def leader_object(self):
         """Returns the leader's db_object if it exists, otherwise None."""
@@ -4,6 +4,9 @@ Provides utility functions for managing and querying hangouts.
 """
 
 from evennia.objects.models import ObjectDB
+from world.wod20th.utils.sequences import allocate, reset
+
+HANGOUT_SEQUENCE = "hangouts.hangout"
 
 # Categories for hangout locations
 HANGOUT_CATEGORIES = [
@@ -23,20 +26,14 @@ class HangoutDB(ObjectDB):
     @classmethod
     def _get_next_hangout_id(cls):
         """
-        Get the next available hangout ID.
+        Allocate the next hangout ID.
         """
-        hangouts = cls.get_all_hangouts()
-        if not hangouts:
-            return 1
-        
-        # Get all hangout_ids, including None values
-        existing_ids = [h.db.hangout_id for h in hangouts]
-        # Filter out None values and get max
-        valid_ids = [id for id in existing_ids if id is not None]
-        if not valid_ids:
-            return 1
-            
-        return max(valid_ids) + 1
+        def used_ids():
+            return ObjectDB.db_attributes.through.objects.filter(
+                objectdb__db_typeclass_path="typeclasses.hangouts.Hangout",
+                attribute__db_key="hangout_id", attribute__db_category__isnull=True,
+            ).values_list("attribute__db_value", flat=True)
+        return allocate(HANGOUT_SEQUENCE, used_ids)
 
     @classmethod
     def create(cls, key, room, category, district, description, restricted=False, 
@@ -150,6 +147,7 @@ class HangoutDB(ObjectDB):
         for hangout in all_hangouts:
             hangout.attributes.add("hangout_id", current_id)
             current_id += 1
+        reset(HANGOUT_SEQUENCE)
         
         return len(all_hangouts)  # Return total number of hangouts processed
 
@@ -52,15 +52,12 @@ class JobAdminForm(forms.ModelForm):
         # Make these fields not required
         self.fields['template_args'].required = False
         self.fields['comments'].required = False
-        self.fields['last_viewed'].required = False
         
         # Set default values for fields that should never be empty
         if not self.instance.template_args:
             self.instance.template_args = {}
         if not self.instance.comments:
             self.instance.comments = []
-        if not self.instance.last_viewed:
-            self.instance.last_viewed = {}
 
         # Format existing comments for display
         if self.instance.pk:
@@ -83,9 +80,6 @@ class JobAdminForm(forms.ModelForm):
         # Ensure comments is a list
         if not cleaned_data.get('comments'):
             cleaned_data['comments'] = []
-        # Ensure last_viewed is a dict
-        if not cleaned_data.get('last_viewed'):
-            cleaned_data['last_viewed'] = {}
         return cleaned_data
 
     def save(self, commit=True):
@@ -106,11 +100,6 @@ class JobAdminForm(forms.ModelForm):
                 'text': formatted_text,
                 'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
             })
-
-            # Update last_viewed timestamp for admin
-            if not instance.last_viewed:
-                instance.last_viewed = {}
-            instance.last_viewed['admin'] = timezone.now().isoformat()
         
         if commit:
             instance.save()
@@ -21,7 +21,7 @@ class JobForm(forms.ModelForm):
         fields = ['title', 'description', 'queue', 'assignee', 'participants', 
                  'due_date', 'template', 'template_args', 'comments', 'attached_objects']
         exclude = ['id', 'archive_id', 'requester', 'created_at', 'updated_at', 
-                  'closed_at', 'status', 'approved', 'last_viewed']
+                  'closed_at', 'status', 'approved', 'last_activity_at']
 
     def __init__(self, *args, **kwargs):
         self.requester = kwargs.pop('requester', None)
@@ -33,7 +33,6 @@ class JobForm(forms.ModelForm):
             self.fields['status'].initial = 'open'
             self.fields['comments'].initial = []
             self.fields['template_args'].initial = {}
-            self.fields['last_viewed'].initial = {}
 
 class QueueForm(forms.ModelForm):
     """Form for creating and editing queues."""
@@ -1,6 +1,15 @@
-import requests
+"""
+GitHub issue mirroring for bug and code jobs.
+
+The public functions return Deferreds: the HTTP calls run on the reactor's
+thread pool through utils.http_client, so a slow GitHub never stalls the
+game. Callbacks fire back on the reactor thread with the same values the
+blocking versions return (an issue number or None, True or False).
+"""
 from django.conf import settings
 from evennia.utils import logger
+from twisted.internet.threads import deferToThread
+from utils.http_client import request
 import sys
 import traceback
 
@@ -51,7 +60,7 @@ def _headers():
     return headers
 
 
-def create_issue(title: str, body: str):
+def _create_issue(title: str, body: str):
     """Create a new GitHub issue. Returns the issue number or None."""
 
     logger.log_info(f"Attempting to create GitHub issue: {title}")
@@ -68,10 +77,9 @@ def create_issue(title: str, body: str):
     
     try:
         headers = _headers()
-        logger.log_info(f"Using headers: {headers}")
         
-        resp = requests.post(
-            url, json={"title": title, "body": body}, headers=headers
+        resp = request(
+            "POST", url, json={"title": title, "body": body}, headers=headers
         )
         logger.log_info(f"GitHub API response status: {resp.status_code}")
         logger.log_info(f"GitHub API response body: {resp.text[:500]}") # Log first 500 chars of response
@@ -87,7 +95,7 @@ def create_issue(title: str, body: str):
     return None
 
 
-def add_comment(issue_number: int, body: str):
+def _add_comment(issue_number: int, body: str):
     """Add a comment to an existing GitHub issue."""
     logger.log_info(f"Attempting to add comment to GitHub issue #{issue_number}")
     
@@ -103,9 +111,8 @@ def add_comment(issue_number: int, body: str):
     
     try:
         headers = _headers()
-        logger.log_info(f"Using headers: {headers}")
         
-        resp = requests.post(url, json={"body": body}, headers=headers)
+        resp = request("POST", url, json={"body": body}, headers=headers)
         logger.log_info(f"GitHub API response status: {resp.status_code}")
         logger.log_info(f"GitHub API response body: {resp.text[:500]}") # Log first 500 chars of response
         
@@ -121,7 +128,7 @@ def add_comment(issue_number: int, body: str):
     return False
 
 
-def close_issue(issue_number: int):
+def _close_issue(issue_number: int):
     """Close an existing GitHub issue."""
     logger.log_info(f"Attempting to close GitHub issue #{issue_number}")
     
@@ -137,10 +144,9 @@ def close_issue(issue_number: int):
     
     try:
         headers = _headers()
-        logger.log_info(f"Using headers: {headers}")
         
         # First get the current state of the issue
-        get_resp = requests.get(url, headers=headers)
+        get_resp = request("GET", url, headers=headers)
         logger.log_info(f"GitHub API GET response status: {get_resp.status_code}")
         
         if get_resp.status_code != 200:
@@ -155,7 +161,7 @@ def close_issue(issue_number: int):
             return True
         
         # GitHub API requires a PATCH request with state=closed to close an issue
-        resp = requests.patch(url, json={"state": "closed"}, headers=headers)
+        resp = request("PATCH", url, json={"state": "closed"}, headers=headers)
         logger.log_info(f"GitHub API PATCH response status: {resp.status_code}")
         logger.log_info(f"GitHub API PATCH response body: {resp.text}")
         
@@ -172,3 +178,33 @@ def close_issue(issue_number: int):
         logger.log_err(f"Error traceback: {traceback.format_exc()}")
     
     return False
+
+
+def _comment_and_close(issue_number: int, body: str):
+    _add_comment(issue_number, body)
+    return _close_issue(issue_number)
+
+
+def create_issue(title: str, body: str):
+    """Create a GitHub issue. Returns a Deferred firing with its number or None."""
+    return deferToThread(_create_issue, title, body)
+
+
+def add_comment(issue_number: int, body: str):
+    """Comment on a GitHub issue. Returns a Deferred firing with True on success."""
+    return deferToThread(_add_comment, issue_number, body)
+
+
+def close_issue(issue_number: int):
+    """Close a GitHub issue. Returns a Deferred firing with True on success."""
+    return deferToThread(_close_issue, issue_number)
+
+
+def comment_and_close(issue_number: int, body: str):
+    """
+    Comment on a GitHub issue, then close it.
+
+    Both requests run in order on one pool thread. Returns a Deferred firing
+    with True if the issue ended up closed.
+    """
+    return deferToThread(_comment_and_close, issue_number, body)
@@ -0,0 +1,108 @@
+# Generated by Django 4.2.13 on 2026-10-17 20:00
+
+from datetime import datetime
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+import django.db.models.deletion
+
+
+def _aware(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def forwards(apps, schema_editor):
+    """Fill last_activity_at and move the last_viewed dicts into JobView rows."""
+    Job = apps.get_model("jobs", "Job")
+    JobView = apps.get_model("jobs", "JobView")
+    AccountDB = apps.get_model("accounts", "AccountDB")
+
+    account_ids = set(AccountDB.objects.values_list("id", flat=True))
+    views = []
+    for job in Job.objects.all().iterator():
+        moments = [_aware(job.created_at), _aware(job.closed_at)]
+        moments.extend(_aware(comment.get("created_at")) for comment in job.comments or []
+                       if isinstance(comment, dict))
+        moments = [moment for moment in moments if moment is not None]
+        job.last_activity_at = max(moments) if moments else timezone.now()
+        job.save(update_fields=["last_activity_at"])
+
+        for account_id, viewed_at in (job.last_viewed or {}).items():
+            viewed_at = _aware(viewed_at)
+            if not str(account_id).isdigit() or int(account_id) not in account_ids or viewed_at is None:
+                continue
+            views.append(JobView(job_id=job.id, account_id=int(account_id), viewed_at=viewed_at))
+    JobView.objects.bulk_create(views, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("jobs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="last_activity_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(fields=["status", "created_at"], name="jobs_job_status_277b31_idx"),
+        ),
+        migrations.CreateModel(
+            name="JobView",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("viewed_at", models.DateTimeField()),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_views",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="views",
+                        to="jobs.job",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("job", "account"), name="jobs_jobview_unique_job_account"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="job",
+            name="last_viewed",
+        ),
+    ]
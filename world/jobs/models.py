@@ -4,8 +4,10 @@ from evennia.objects.models import ObjectDB  # Assuming objects are instances of
 from django.utils import timezone
 from evennia.utils.idmapper.models import SharedMemoryModel
 from django.utils.functional import lazy
-from django.db.models import Max
+from django.db.models import BooleanField, Case, F, Max, OuterRef, Subquery, When
 from evennia.accounts.models import AccountDB
+from evennia.utils.idmapper.manager import SharedMemoryManager
+from world.wod20th.utils.sequences import allocate
 import logging
 
 # Remove this line:
@@ -13,6 +15,29 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+class JobQuerySet(models.QuerySet):
+    def for_listing(self, account):
+        """
+        Prepare jobs for a +jobs listing in one query.
+
+        Pulls in the requester, assignee and queue rows and annotates each job
+        with ``viewed_at`` (when ``account`` last read it) and ``unread``
+        (never read, or active since). Read the annotations straight after
+        the query: the idmapper shares job instances between callers.
+        """
+        last_view = JobView.objects.filter(job=OuterRef('pk'), account=account).values('viewed_at')[:1]
+        return self.select_related('requester', 'assignee', 'queue').annotate(
+            viewed_at=Subquery(last_view),
+        ).annotate(
+            unread=Case(
+                When(viewed_at__isnull=True, then=True),
+                When(last_activity_at__gt=F('viewed_at'), then=True),
+                default=False,
+                output_field=BooleanField(),
+            ),
+        )
+
+
 class Job(SharedMemoryModel):
     id = models.AutoField(primary_key=True)
     archive_id = models.IntegerField(null=True, blank=True, unique=True)
@@ -32,11 +57,29 @@ class Job(SharedMemoryModel):
     due_date = models.DateTimeField(null=True, blank=True)
     attached_objects = models.ManyToManyField(ObjectDB, through='JobAttachment', related_name="attached_jobs", blank=True)
     template = models.ForeignKey('JobTemplate', on_delete=models.SET_NULL, null=True, blank=True, related_name='jobs')
-    last_viewed = models.JSONField(default=dict)  # Store last viewed timestamps per user
     github_issue_number = models.IntegerField(null=True, blank=True)
+    # Last comment, status change or close; drives the unread marker
+    last_activity_at = models.DateTimeField(null=True, blank=True)
+
+    objects = SharedMemoryManager.from_queryset(JobQuerySet)()
 
     class Meta:
         app_label = 'jobs'
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The idmapper hands back the cached instance, which may hold unsaved edits
+        if not hasattr(instance, '_saved_activity'):
+            instance._saved_activity = instance._activity_state()
+        return instance
+
+    def _activity_state(self):
+        """What a viewer would notice changing: status, comment count and close time."""
+        return (self.status, len(self.comments or ()), self.closed_at)
 
     def claim(self, user):
         if self.status == 'open':
@@ -66,19 +109,15 @@ class Job(SharedMemoryModel):
 
         # Close the GitHub issue if one exists
         if self.github_issue_number:
-            try:
-                from world.jobs.github_integration import close_issue, add_comment
-                
-                # Add a comment indicating why the issue was closed
-                comment_body = f"Job was {self.status} by {closer.username}"
-                if reason:
-                    comment_body += f"\n\nReason: {reason}"
-                add_comment(self.github_issue_number, comment_body)
-                
-                # Close the issue
-                close_issue(self.github_issue_number)
-            except Exception as e:
-                logger.error(f"Error closing GitHub issue: {e}")
+            from world.jobs.github_integration import comment_and_close
+
+            # Comment with the reason, then close the issue in the background
+            comment_body = f"Job was {self.status} by {closer.username}"
+            if reason:
+                comment_body += f"\n\nReason: {reason}"
+            comment_and_close(self.github_issue_number, comment_body).addErrback(
+                lambda failure: logger.error(f"Error closing GitHub issue: {failure.getErrorMessage()}")
+            )
 
         # Archive the job
         comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" for comment in self.comments])
@@ -139,48 +178,45 @@ Comments:
 
     def save(self, *args, **kwargs):
         if not self.id:
-            max_id = Job.objects.aggregate(Max('id'))['id__max'] or 0
-            self.id = max_id + 1
+            self.id = allocate('jobs.job', lambda: Job.objects.order_by('-id').values_list('id', flat=True)[:1])
+        activity = self._activity_state()
+        if activity != getattr(self, '_saved_activity', None):
+            self.last_activity_at = timezone.now()
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = set(kwargs['update_fields']) | {'last_activity_at'}
         super().save(*args, **kwargs)
+        self._saved_activity = activity
 
     def mark_viewed(self, account):
         """Mark the job as viewed by an account."""
-        if not self.last_viewed:
-            self.last_viewed = {}
-        # Store as timezone-aware ISO format string
-        self.last_viewed[str(account.id)] = timezone.now().isoformat()
-        self.save()
+        JobView.objects.update_or_create(job=self, account=account, defaults={'viewed_at': timezone.now()})
 
     def is_updated_since_last_view(self, account):
-        """Check if the job has been updated since the account last viewed it."""
-        if not self.last_viewed or str(account.id) not in self.last_viewed:
+        """
+        Check if the job has had activity since the account last viewed it.
+
+        Listings should read the ``unread`` annotation from
+        Job.objects.for_listing() instead of calling this per job.
+        """
+        view = JobView.objects.filter(job=self, account=account).values_list('viewed_at', flat=True).first()
+        if view is None:
             return True
-            
-        last_viewed = timezone.datetime.fromisoformat(self.last_viewed[str(account.id)])
-        # Ensure last_viewed is timezone-aware
-        if timezone.is_naive(last_viewed):
-            last_viewed = timezone.make_aware(last_viewed)
-        
-        # Check if any comments were added after last view
-        if self.comments:
-            latest_comment = max(
-                timezone.make_aware(timezone.datetime.fromisoformat(comment['created_at']))
-                if timezone.is_naive(timezone.datetime.fromisoformat(comment['created_at']))
-                else timezone.datetime.fromisoformat(comment['created_at'])
-                for comment in self.comments
-            )
-            if latest_comment > last_viewed:
-                return True
-                
-        # Check if status changed after last view
-        if self.closed_at:
-            closed_at = self.closed_at
-            if timezone.is_naive(closed_at):
-                closed_at = timezone.make_aware(closed_at)
-            if closed_at > last_viewed:
-                return True
-        
-        return False
+        return bool(self.last_activity_at and self.last_activity_at > view)
+
+class JobView(models.Model):
+    """When an account last read a job."""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='views')
+    account = models.ForeignKey("accounts.AccountDB", on_delete=models.CASCADE, related_name='job_views')
+    viewed_at = models.DateTimeField()
+
+    class Meta:
+        app_label = 'jobs'
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'account'], name='jobs_jobview_unique_job_account'),
+        ]
+
+    def __str__(self):
+        return f"Job #{self.job_id} viewed by {self.account_id} at {self.viewed_at}"
 
 class JobAttachment(SharedMemoryModel):
     job = models.ForeignKey(Job, on_delete=models.CASCADE)
@@ -231,11 +267,19 @@ class ArchivedJob(SharedMemoryModel):
     def __str__(self):
         return f"Archived Job {self.original_id}: {self.title}"
 
+    @classmethod
+    def next_archive_id(cls):
+        """Allocate an archive number, shared by archived jobs and the jobs they came from."""
+        def used_ids():
+            return [
+                cls.objects.aggregate(Max('archive_id'))['archive_id__max'],
+                Job.objects.aggregate(Max('archive_id'))['archive_id__max'],
+            ]
+        return allocate('jobs.archive', used_ids)
+
     def save(self, *args, **kwargs):
         if not self.archive_id:
-            # If archive_id is not set, get the maximum archive_id and increment by 1
-            max_archive_id = ArchivedJob.objects.aggregate(Max('archive_id'))['archive_id__max'] or 0
-            self.archive_id = max_archive_id + 1
+            self.archive_id = ArchivedJob.next_archive_id()
         super().save(*args, **kwargs)
 
     class Meta:
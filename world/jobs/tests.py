@@ -0,0 +1,71 @@
+"""
+Test cases for the +jobs listing query and job activity tracking.
+"""
+from datetime import timedelta
+from django.utils import timezone
+from evennia.utils.test_resources import EvenniaTest
+from world.jobs.models import Job, JobView, Queue
+
+
+class TestJobListing(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.queue = Queue.objects.create(name="REQ")
+        self.job = Job.objects.create(title="New merit", description="Please", requester=self.account,
+                                      queue=self.queue)
+
+    def listed(self, account):
+        """Return the job as annotated by the listing query."""
+        return Job.objects.for_listing(account).get(pk=self.job.pk)
+
+    def test_new_job_is_unread(self):
+        """Test a new job has activity and is unread by everyone."""
+        self.assertIsNotNone(self.job.last_activity_at)
+        job = self.listed(self.account)
+        self.assertIsNone(job.viewed_at)
+        self.assertTrue(job.unread)
+
+    def test_viewing_marks_read_for_that_account_only(self):
+        """Test read state is per account."""
+        self.job.mark_viewed(self.account)
+        self.assertFalse(self.listed(self.account).unread)
+        self.assertTrue(self.listed(self.account2).unread)
+
+    def test_comment_makes_job_unread_again(self):
+        """Test a comment bumps last_activity_at past the last view."""
+        self.job.mark_viewed(self.account)
+        JobView.objects.filter(job=self.job, account=self.account).update(
+            viewed_at=timezone.now() - timedelta(minutes=5))
+        before = self.job.last_activity_at
+
+        self.job.comments.append({"author": "Staff", "text": "Approved", "created_at": timezone.now().isoformat()})
+        self.job.save()
+        self.assertGreater(self.job.last_activity_at, before)
+        self.assertTrue(self.listed(self.account).unread)
+
+    def test_edits_without_activity_keep_read_state(self):
+        """Test changing the title is not activity a viewer needs to see."""
+        self.job.mark_viewed(self.account)
+        before = self.job.last_activity_at
+        self.job.title = "New merit (Resources)"
+        self.job.save()
+        self.assertEqual(self.job.last_activity_at, before)
+        self.assertFalse(self.listed(self.account).unread)
+
+    def test_status_change_is_activity(self):
+        """Test claiming a job counts as activity."""
+        before = self.job.last_activity_at
+        self.job.claim(self.account2)
+        self.assertEqual(self.job.status, "claimed")
+        self.assertGreaterEqual(self.job.last_activity_at, before)
+        self.assertEqual(Job.objects.filter(pk=self.job.pk).values_list("last_activity_at", flat=True)[0],
+                         self.job.last_activity_at)
+
+    def test_listing_is_one_query(self):
+        """Test the listing loads related rows and read state without per-job queries."""
+        Job.objects.create(title="Second", description="Also", requester=self.account2, queue=self.queue,
+                           assignee=self.account)
+        with self.assertNumQueries(1):
+            rows = [(job.requester.username, job.assignee and job.assignee.username, job.queue.name, job.unread)
+                    for job in Job.objects.for_listing(self.account)]
+        self.assertEqual(len(rows), 2)
@@ -105,12 +105,23 @@ def sync_npc_to_game(sender, instance, created, **kwargs):
             obj.db.desc = instance.db_description
             
         # Update temporary status
+        expiry_changed = False
         if hasattr(obj.db, 'is_temporary') and obj.db.is_temporary != instance.db_is_temporary:
             obj.db.is_temporary = instance.db_is_temporary
+            expiry_changed = True
             
         # Update expiration time
         if hasattr(obj.db, 'expiration_time') and obj.db.expiration_time != instance.db_expiration_time:
             obj.db.expiration_time = instance.db_expiration_time
+            expiry_changed = True
+
+        # Keep the temporary NPC expiry queue in step with admin edits
+        if expiry_changed:
+            from world.wod20th.utils.npc_expiry import NPC_EXPIRY
+            if obj.db.is_temporary:
+                NPC_EXPIRY.schedule(obj)
+            else:
+                NPC_EXPIRY.cancel(obj)
 
 
 @receiver(post_save, sender='npc_manager.NPCGroup')
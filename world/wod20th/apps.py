@@ -8,3 +8,6 @@ class WoD20thConfig(AppConfig):
     name = 'world.wod20th'
     label = 'wod20th'
     verbose_name = 'World of Darkness 20th Anniversary Edition'
+
+    def ready(self):
+        import world.wod20th.signals
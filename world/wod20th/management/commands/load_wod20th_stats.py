@@ -15,6 +15,7 @@ django.setup()
 
 # Import the Stat model
 from world.wod20th.models import Stat, CATEGORIES, STAT_TYPES
+from world.wod20th.utils.stat_loader import StatLoader
 
 class Command(BaseCommand):
     help = 'Load WoD20th stats from JSON files in a directory'
@@ -25,18 +26,27 @@ class Command(BaseCommand):
         self.failed_files = []
         self.failed_stats = []
         self.processed_files = 0
+        self.skipped_files = 0
         self.processed_stats = 0
+        self.created_stats = 0
+        self.updated_stats = 0
         self.failed_count = 0
+        self.elapsed = 0.0
+        self.loader = None
 
     def add_arguments(self, parser):
         parser.add_argument('--dir', type=str, default='data', help='Directory containing JSON files')
         parser.add_argument('--file', type=str, help='Specific JSON file to load (optional)')
-        parser.add_argument('--delay', type=int, default=5, help='Delay in seconds between processing files (default: 5)')
+        parser.add_argument('--delay', type=int, default=0, help='Delay in seconds between processing files (default: 0)')
+        parser.add_argument('--force', action='store_true', help='Reload files even if they are unchanged since the last load')
 
     def handle(self, *args, **options):
         data_dir = options['dir']
         specific_file = options['file']
         delay = options['delay']
+        # Keep the update_or_create(name, stat_type) matching this command has always used
+        self.loader = StatLoader(key_fields=('name', 'stat_type'), force=options['force'])
+        start = time.monotonic()
 
         if specific_file:
             # Process single file
@@ -48,8 +58,8 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR(f'Directory not found: {data_dir}'))
                 return
 
-            self.stdout.write(self.style.NOTICE(f'Processing JSON files in {data_dir} with {delay} second delay between files...'))
-            json_files = [f for f in os.listdir(data_dir) if f.endswith('.json')]
+            self.stdout.write(self.style.NOTICE(f'Processing JSON files in {data_dir}...'))
+            json_files = sorted(f for f in os.listdir(data_dir) if f.endswith('.json'))
             
             for i, filename in enumerate(json_files):
                 file_path = os.path.join(data_dir, filename)
@@ -60,6 +70,7 @@ class Command(BaseCommand):
                     self.stdout.write(self.style.NOTICE(f'Waiting {delay} seconds before processing next file...'))
                     time.sleep(delay)
 
+        self.elapsed = time.monotonic() - start
         # Display summary at the end
         self.display_summary()
 
@@ -67,8 +78,12 @@ class Command(BaseCommand):
         """Display a summary of the processing results"""
         self.stdout.write("\n=== Processing Summary ===")
         self.stdout.write(f"Total files processed: {self.processed_files}")
+        self.stdout.write(f"Unchanged files skipped: {self.skipped_files}")
         self.stdout.write(f"Total stats processed: {self.processed_stats}")
+        self.stdout.write(f"Stats created: {self.created_stats}")
+        self.stdout.write(f"Stats updated: {self.updated_stats}")
         self.stdout.write(f"Total failures: {self.failed_count}")
+        self.stdout.write(f"Elapsed time: {self.elapsed:.2f}s")
 
         if self.failed_files:
             self.stdout.write("\nFailed Files:")
@@ -92,59 +107,64 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f'File not found: {file_path}'))
             return
 
-        try:
-            self.stdout.write(self.style.NOTICE(f'Processing {file_path}...'))
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # Handle different data structures
-            if isinstance(data, list):
-                # Handle flat array of stats
-                for stat_data in data:
-                    self.process_stat(stat_data, file_path)
-            elif isinstance(data, dict):
-                # Check if this is a splat-specific abilities file
-                if any(isinstance(v, dict) and any(k in ['talents', 'skills', 'knowledges'] for k in v.keys()) for v in data.values()):
-                    # Process splat-specific abilities
-                    for splat, categories in data.items():
-                        for category_type, abilities in categories.items():
-                            for ability_name, ability_data in abilities.items():
-                                # Ensure the ability data has the splat information
-                                ability_data['splat'] = splat
-                                ability_data['name'] = ability_name
-                                self.process_stat(ability_data, file_path)
-                else:
-                    # Handle regular dictionary of stats
-                    for stat_name, stat_data in data.items():
-                        if isinstance(stat_data, dict):
-                            stat_data['name'] = stat_name
-                            self.process_stat(stat_data, file_path)
-                        else:
-                            self.process_stat({
-                                'name': stat_name,
-                                'value': stat_data,
-                                'category': 'other',
-                                'stat_type': 'other'
-                            }, file_path)
+        self.stdout.write(self.style.NOTICE(f'Processing {file_path}...'))
+        result = self.loader.load_file(file_path, lambda data: self.build_rows(data, file_path))
 
-            self.processed_files += 1
-            self.stdout.write(self.style.SUCCESS(f'Successfully loaded stats from {file_path}'))
-        except json.JSONDecodeError:
+        if result.error:
             self.failed_files.append({
                 'file': file_path,
-                'error': 'Invalid JSON format'
+                'error': result.error
             })
             self.failed_count += 1
-            self.stdout.write(self.style.ERROR(f'Invalid JSON in file: {file_path}'))
-        except Exception as e:
-            self.failed_files.append({
-                'file': file_path,
-                'error': str(e)
-            })
-            self.failed_count += 1
-            self.stdout.write(self.style.ERROR(f'Error processing {file_path}: {str(e)}'))
+            self.stdout.write(self.style.ERROR(f'Error processing {file_path}: {result.error}'))
+            return
+
+        if result.skipped:
+            self.skipped_files += 1
+        else:
+            self.processed_files += 1
+            self.processed_stats += result.created + result.updated + result.unchanged
+            self.created_stats += result.created
+            self.updated_stats += result.updated
+        self.stdout.write(self.style.SUCCESS(result.summary()))
+
+    def build_rows(self, data, file_path):
+        """Yield Stat field dicts for every stat in a parsed JSON file."""
+        # Handle different data structures
+        if isinstance(data, list):
+            # Handle flat array of stats
+            for stat_data in data:
+                yield self.build_stat_fields(stat_data, file_path)
+        elif isinstance(data, dict):
+            # Check if this is a splat-specific abilities file
+            if any(isinstance(v, dict) and any(k in ['talents', 'skills', 'knowledges'] for k in v.keys()) for v in data.values()):
+                # Process splat-specific abilities
+                for splat, categories in data.items():
+                    for category_type, abilities in categories.items():
+                        for ability_name, ability_data in abilities.items():
+                            # Ensure the ability data has the splat information
+                            ability_data['splat'] = splat
+                            ability_data['name'] = ability_name
+                            yield self.build_stat_fields(ability_data, file_path)
+            else:
+                # Handle regular dictionary of stats
+                for stat_name, stat_data in data.items():
+                    if isinstance(stat_data, dict):
+                        stat_data['name'] = stat_name
+                        yield self.build_stat_fields(stat_data, file_path)
+                    else:
+                        yield self.build_stat_fields({
+                            'name': stat_name,
+                            'value': stat_data,
+                            'category': 'other',
+                            'stat_type': 'other'
+                        }, file_path)
 
-    def process_stat(self, stat_data, file_path):
+    def build_stat_fields(self, stat_data, file_path):
+        """
+        Return the Stat field values for one entry, or a ValueError for
+        malformed entries (which is also recorded as a failed stat).
+        """
         if not isinstance(stat_data, dict):
             self.failed_stats.append({
                 'name': 'Unknown',
@@ -153,7 +173,7 @@ class Command(BaseCommand):
             })
             self.failed_count += 1
             self.stdout.write(self.style.ERROR(f'Invalid stat data format: {stat_data}'))
-            return
+            return ValueError(f'Invalid stat data format: {stat_data}')
 
         name = stat_data.get('name')
         if not name:
@@ -164,7 +184,7 @@ class Command(BaseCommand):
             })
             self.failed_count += 1
             self.stdout.write(self.style.ERROR('Stat missing name'))
-            return
+            return ValueError('Stat missing name')
 
         # Handle shifter_type for gifts and merits
         stat_type = stat_data.get('stat_type', 'other')
@@ -177,45 +197,29 @@ class Command(BaseCommand):
         else:
             shifter_type = None
 
-        # Create or update the stat using both name and stat_type as unique identifiers
-        try:
-            stat, created = Stat.objects.update_or_create(
-                name=name,
-                stat_type=stat_type,  # Add stat_type to unique identifier
-                defaults={
-                    'description': stat_data.get('description', ''),
-                    'game_line': stat_data.get('game_line', 'general'),
-                    'category': stat_data.get('category', 'other'),
-                    'values': stat_data.get('values', []),
-                    'system': stat_data.get('system', ''),
-                    'splat': stat_data.get('splat'),
-                    'notes': stat_data.get('notes', ''),
-                    'hidden': stat_data.get('hidden', False),
-                    'locked': stat_data.get('locked', False),
-                    'instanced': stat_data.get('instanced', False),
-                    'default': stat_data.get('default'),
-                    'xp_cost': stat_data.get('xp_cost', 0),
-                    'prerequisites': stat_data.get('prerequisites', []),
-                    'shifter_type': shifter_type,
-                    'gift_alias': stat_data.get('gift_alias', []),
-                    'tribe': stat_data.get('tribe', []),
-                    'breed': stat_data.get('breed', ''),
-                    'auspice': stat_data.get('auspice', ''),
-                    'camp': stat_data.get('camp', ''),
-                }
-            )
-
-            self.processed_stats += 1
-            action = 'Created' if created else 'Updated'
-            self.stdout.write(self.style.SUCCESS(f'{action} stat: {name}'))
-        except Exception as e:
-            self.failed_stats.append({
-                'name': name,
-                'file': file_path,
-                'error': str(e)
-            })
-            self.failed_count += 1
-            self.stdout.write(self.style.ERROR(f'Error saving stat {name}: {str(e)}'))
+        return {
+            'name': name,
+            'stat_type': stat_type,
+            'description': stat_data.get('description', ''),
+            'game_line': stat_data.get('game_line', 'general'),
+            'category': stat_data.get('category', 'other'),
+            'values': stat_data.get('values', []),
+            'system': stat_data.get('system', ''),
+            'splat': stat_data.get('splat'),
+            'notes': stat_data.get('notes', ''),
+            'hidden': stat_data.get('hidden', False),
+            'locked': stat_data.get('locked', False),
+            'instanced': stat_data.get('instanced', False),
+            'default': stat_data.get('default'),
+            'xp_cost': stat_data.get('xp_cost', 0),
+            'prerequisites': stat_data.get('prerequisites', []),
+            'shifter_type': shifter_type,
+            'gift_alias': stat_data.get('gift_alias', []),
+            'tribe': stat_data.get('tribe', []),
+            'breed': stat_data.get('breed', ''),
+            'auspice': stat_data.get('auspice', ''),
+            'camp': stat_data.get('camp', ''),
+        }
 
     def handle_ability(self, ability_data):
         """Handle loading an ability stat"""
@@ -0,0 +1,16 @@
+"""
+Management command to rebuild the website character directory.
+"""
+from django.core.management.base import BaseCommand
+from world.wod20th.utils.character_directory import rebuild_directory
+
+
+class Command(BaseCommand):
+    """
+    Repopulate the character directory from the characters' Attributes and tags
+    """
+    help = "Rebuild the character directory used by the web character list and wiki search"
+
+    def handle(self, *args, **options):
+        count = rebuild_directory()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt character directory: {count} characters"))
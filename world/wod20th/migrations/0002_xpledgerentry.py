@@ -0,0 +1,66 @@
+# Generated by Django 4.2.13 on 2026-10-17 12:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("objects", "0014_defaultobject_crisis_defaultcharacter_defaultexit_and_more"),
+        ("wod20th", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="XPLedgerEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("receive", "Receive"),
+                            ("award", "IC Award"),
+                            ("spend", "Spend"),
+                            ("deduct", "Deduct"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=8)),
+                ("reason", models.CharField(blank=True, max_length=255)),
+                ("total", models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ("current", models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ("spent", models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ("ic_xp", models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ("scenes_this_week", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "character",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="xp_ledger",
+                        to="objects.objectdb",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["character", "created_at"],
+                        name="wod20th_xpl_charact_7e932d_idx",
+                    )
+                ],
+            },
+        ),
+    ]
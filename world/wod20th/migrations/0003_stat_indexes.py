@@ -0,0 +1,27 @@
+# Generated by Django 4.2.13 on 2026-10-17 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wod20th", "0002_xpledgerentry"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="stat",
+            index=models.Index(fields=["name"], name="wod20th_sta_name_db2512_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="stat",
+            index=models.Index(
+                fields=["category", "stat_type"], name="wod20th_sta_categor_5444ba_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stat",
+            index=models.Index(fields=["splat"], name="wod20th_sta_splat_554160_idx"),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.13 on 2026-10-17 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wod20th", "0003_stat_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataFileHash",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("filename", models.CharField(max_length=255, unique=True)),
+                ("sha256", models.CharField(max_length=64)),
+                ("row_count", models.PositiveIntegerField(default=0)),
+                ("loaded_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["filename"],
+            },
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 4.2.13 on 2026-10-17 14:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wod20th", "0004_datafilehash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BBSBoard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("board_id", models.PositiveIntegerField(unique=True)),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("description", models.TextField(blank=True)),
+                ("public", models.BooleanField(default=True)),
+                ("read_only", models.BooleanField(default=False)),
+                ("locked", models.BooleanField(default=False)),
+                ("roster_names", models.JSONField(blank=True, default=list)),
+                ("access_list", models.JSONField(blank=True, default=dict)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["board_id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="BBSPost",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("content", models.TextField(blank=True)),
+                ("author", models.CharField(max_length=255)),
+                ("created_at", models.DateTimeField()),
+                ("edited_at", models.DateTimeField(blank=True, null=True)),
+                ("pinned", models.BooleanField(default=False)),
+                (
+                    "board",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="posts",
+                        to="wod20th.bbsboard",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["board", "id"], name="wod20th_bbs_board_i_6bee87_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="BBSPostRead",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("reader", models.CharField(max_length=255)),
+                ("read_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reads",
+                        to="wod20th.bbspost",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["reader", "post"], name="wod20th_bbs_reader_f600de_idx"
+                    )
+                ],
+                "unique_together": {("post", "reader")},
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.13 on 2026-10-17 15:00
+
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    from world.wod20th.utils.stat_search import install
+
+    install(schema_editor.connection, rebuild=True)
+
+
+def drop_search_index(apps, schema_editor):
+    from world.wod20th.utils.stat_search import uninstall
+
+    uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wod20th", "0005_bbs_tables"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.13 on 2026-10-17 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wod20th", "0006_stat_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="XPAwardRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("awarded_by", models.CharField(default="System", max_length=255)),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=8)),
+                ("awarded_count", models.PositiveIntegerField(default=0)),
+                ("total_xp", models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ("issue_count", models.PositiveIntegerField(default=0)),
+                ("report", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.13 on 2026-10-17 19:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("objects", "0014_defaultobject_crisis_defaultcharacter_defaultexit_and_more"),
+        ("wod20th", "0007_xpawardrun"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CharacterDirectoryEntry",
+            fields=[
+                (
+                    "character",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="directory_entry",
+                        serialize=False,
+                        to="objects.objectdb",
+                    ),
+                ),
+                ("name", models.CharField(db_index=True, max_length=255)),
+                ("approved", models.BooleanField(default=False)),
+                ("is_staff", models.BooleanField(default=False)),
+                ("is_storyteller", models.BooleanField(default=False)),
+                ("splat", models.CharField(blank=True, max_length=50)),
+                ("full_name", models.CharField(blank=True, max_length=255)),
+                ("appears_as", models.CharField(blank=True, max_length=255)),
+                ("occupation", models.CharField(blank=True, max_length=255)),
+                ("affiliation", models.CharField(blank=True, max_length=255)),
+                ("biography", models.TextField(blank=True)),
+                ("rp_hooks", models.TextField(blank=True)),
+                ("search_text", models.TextField(blank=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["name"],
+                "indexes": [
+                    models.Index(
+                        fields=["approved", "is_staff", "is_storyteller", "name"],
+                        name="wod20th_cha_approve_2821d7_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.13 on 2026-10-17 21:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wod20th", "0008_characterdirectoryentry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdSequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=64, unique=True)),
+                ("next_value", models.PositiveIntegerField(default=1)),
+                ("free_ids", models.JSONField(default=list)),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+    ]
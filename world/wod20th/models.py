@@ -109,6 +109,11 @@ class Stat(models.Model):
     class Meta:
         app_label = 'wod20th'
         unique_together = ('name', 'category', 'stat_type', 'splat')
+        indexes = [
+            models.Index(fields=['name']),
+            models.Index(fields=['category', 'stat_type']),
+            models.Index(fields=['splat']),
+        ]
         
     def __str__(self):
         return f"{self.name} ({self.category}/{self.stat_type})"
@@ -130,11 +135,15 @@ class Stat(models.Model):
         # Perform the access check
         return temp_lock_handler.check(accessing_obj, access_type)
 
-    def save(self, *args, **kwargs):
+    def apply_defaults(self):
+        """Apply the field rules enforced on save; also used before bulk writes."""
         if self.stat_type == 'renown':
             # Ensure renown stats use the dual value structure
             if self.name in SHIFTER_RENOWN:
                 self.values = SHIFTER_RENOWN[self.name]
+
+    def save(self, *args, **kwargs):
+        self.apply_defaults()
         super().save(*args, **kwargs)
 
     def clean(self):
@@ -178,13 +187,23 @@ class CharacterSheet(SharedMemoryModel):
     class Meta:
         app_label = 'wod20th'
 
+    def _stat_tree(self) -> Optional[Dict[str, Any]]:
+        """Return the character's stats as a plain dict, preferring the stat store."""
+        store = getattr(self.character, 'stat_store', None)
+        if store is not None:
+            return store.stats
+        if not hasattr(self.character, 'db') or not hasattr(self.character.db, 'stats'):
+            return None
+        return self.character.db.stats
+
     def get_stat(self, category: str, stat_type: str, stat_name: str, temp: bool = False) -> Optional[Any]:
         """Get a stat value from the character's stats."""
         try:
-            if not hasattr(self.character, 'db') or not hasattr(self.character.db, 'stats'):
+            stats = self._stat_tree()
+            if stats is None:
                 return None
             
-            stat_dict = self.character.db.stats.get(category, {}).get(stat_type, {})
+            stat_dict = stats.get(category, {}).get(stat_type, {})
             if not stat_dict:
                 return None
             
@@ -197,39 +216,48 @@ class CharacterSheet(SharedMemoryModel):
 
     def set_stat(self, category: str, stat_type: str, stat_name: str, value: Any, temp: bool = False) -> None:
         """Set a stat value in the character's stats."""
-        if not hasattr(self.character, 'db') or not hasattr(self.character.db, 'stats'):
-            self.character.db.stats = {}
-        
-        if category not in self.character.db.stats:
-            self.character.db.stats[category] = {}
-        if stat_type not in self.character.db.stats[category]:
-            self.character.db.stats[category][stat_type] = {}
-            
-        current_value = self.character.db.stats[category][stat_type].get(stat_name, {})
+        store = getattr(self.character, 'stat_store', None)
+        if store is None:
+            if not hasattr(self.character, 'db') or not hasattr(self.character.db, 'stats'):
+                self.character.db.stats = {}
+            stats = self.character.db.stats
+            stats.setdefault(category, {}).setdefault(stat_type, {})
+            current_value = stats[category][stat_type].get(stat_name, {})
+        else:
+            current_value = store.entry(category, stat_type, stat_name)
+            if current_value is None:
+                current_value = {}
+
         if isinstance(current_value, dict) and ('temp' in current_value or 'perm' in current_value):
+            current_value = dict(current_value)
             if temp:
                 current_value['temp'] = value
             else:
                 current_value['perm'] = value
                 if 'temp' not in current_value:
                     current_value['temp'] = value
-            self.character.db.stats[category][stat_type][stat_name] = current_value
+            new_value = current_value
+        elif temp:
+            new_value = {'perm': current_value, 'temp': value}
         else:
-            if temp:
-                self.character.db.stats[category][stat_type][stat_name] = {'perm': current_value, 'temp': value}
-            else:
-                self.character.db.stats[category][stat_type][stat_name] = value
+            new_value = value
+
+        if store is None:
+            self.character.db.stats[category][stat_type][stat_name] = new_value
+        else:
+            store.put(category, stat_type, stat_name, new_value)
 
     def get_all_stats(self, category: Optional[str] = None, stat_type: Optional[str] = None) -> Dict[str, Any]:
         """Get all stats for a category and/or type."""
-        if not hasattr(self.character, 'db') or not hasattr(self.character.db, 'stats'):
+        stats = self._stat_tree()
+        if stats is None:
             return {}
         
         if category and stat_type:
-            return self.character.db.stats.get(category, {}).get(stat_type, {})
+            return stats.get(category, {}).get(stat_type, {})
         elif category:
-            return self.character.db.stats.get(category, {})
-        return self.character.db.stats
+            return stats.get(category, {})
+        return stats
 
 def calculate_willpower(character):
     """Calculate Willpower based on virtues."""
@@ -623,6 +651,132 @@ class CharacterArchidTrait(models.Model):
         
         super().save(*args, **kwargs) 
 
+class XPLedgerEntry(models.Model):
+    """Append-only record of a change to a character's XP."""
+    EVENT_CHOICES = [
+        ('receive', 'Receive'),
+        ('award', 'IC Award'),
+        ('spend', 'Spend'),
+        ('deduct', 'Deduct'),
+    ]
+
+    character = models.ForeignKey('objects.ObjectDB', on_delete=models.CASCADE, related_name='xp_ledger')
+    event = models.CharField(max_length=20, choices=EVENT_CHOICES)
+    amount = models.DecimalField(max_digits=8, decimal_places=2)
+    reason = models.CharField(max_length=255, blank=True)
+    # Snapshot of the XP totals right after the change
+    total = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    current = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    spent = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    ic_xp = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    scenes_this_week = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = 'wod20th'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['character', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.character.key}: {self.event} {self.amount} XP"
+
+    def as_state(self):
+        """Return the XP snapshot in the shape XPMonitor tracks."""
+        return {
+            'total': self.total,
+            'current': self.current,
+            'spent': self.spent,
+            'ic_xp': self.ic_xp,
+            'scenes_this_week': self.scenes_this_week,
+        }
+
+
+class XPAwardRun(models.Model):
+    """Audit record of one committed weekly XP distribution."""
+    awarded_by = models.CharField(max_length=255, default='System')
+    amount = models.DecimalField(max_digits=8, decimal_places=2)
+    awarded_count = models.PositiveIntegerField(default=0)
+    total_xp = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    issue_count = models.PositiveIntegerField(default=0)
+    report = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = 'wod20th'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Weekly XP {self.created_at:%Y-%m-%d}: {self.awarded_count} characters"
+
+
+class CharacterDirectoryEntry(models.Model):
+    """
+    Denormalized website listing of one player character.
+
+    Maintained by world.wod20th.utils.character_directory; do not edit by hand.
+    """
+    character = models.OneToOneField(
+        'objects.ObjectDB', on_delete=models.CASCADE, primary_key=True, related_name='directory_entry'
+    )
+    name = models.CharField(max_length=255, db_index=True)
+    approved = models.BooleanField(default=False)
+    is_staff = models.BooleanField(default=False)
+    is_storyteller = models.BooleanField(default=False)
+    splat = models.CharField(max_length=50, blank=True)
+    full_name = models.CharField(max_length=255, blank=True)
+    appears_as = models.CharField(max_length=255, blank=True)
+    occupation = models.CharField(max_length=255, blank=True)
+    affiliation = models.CharField(max_length=255, blank=True)
+    biography = models.TextField(blank=True)
+    rp_hooks = models.TextField(blank=True)
+    # Lower-cased profile fields, one per line, for substring search
+    search_text = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'wod20th'
+        ordering = ['name']
+        indexes = [
+            models.Index(fields=['approved', 'is_staff', 'is_storyteller', 'name']),
+        ]
+
+    def __str__(self):
+        return self.name
+
+class IdSequence(models.Model):
+    """
+    Counter row behind one player-facing ID sequence (job numbers, group IDs...).
+
+    Maintained by world.wod20th.utils.sequences; do not edit by hand.
+    """
+    name = models.CharField(max_length=64, unique=True)
+    next_value = models.PositiveIntegerField(default=1)
+    # Released IDs below next_value, ascending, for sequences that reuse gaps
+    free_ids = models.JSONField(default=list)
+
+    class Meta:
+        app_label = 'wod20th'
+        ordering = ['name']
+
+    def __str__(self):
+        return f"{self.name}: next {self.next_value}"
+
+class DataFileHash(models.Model):
+    """Content hash of a stat data file as of its last successful load."""
+    filename = models.CharField(max_length=255, unique=True)
+    sha256 = models.CharField(max_length=64)
+    row_count = models.PositiveIntegerField(default=0)
+    loaded_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'wod20th'
+        ordering = ['filename']
+
+    def __str__(self):
+        return f"{self.filename} ({self.sha256[:12]})"
+
 from django.contrib.auth.models import User
 from django.db import models
 from django.conf import settings
@@ -722,4 +876,58 @@ class RosterMember(models.Model):
         ordering = ['character__db_key']
 
     def __str__(self):
-        return f"{self.character} in {self.roster}" 
\ No newline at end of file
+        return f"{self.character} in {self.roster}" 
+
+class BBSBoard(models.Model):
+    """A bulletin board. board_id is the number players use; gaps are reused."""
+    board_id = models.PositiveIntegerField(unique=True)
+    name = models.CharField(max_length=255, unique=True)
+    description = models.TextField(blank=True)
+    public = models.BooleanField(default=True)
+    read_only = models.BooleanField(default=False)
+    locked = models.BooleanField(default=False)
+    roster_names = models.JSONField(default=list, blank=True)
+    access_list = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = 'wod20th'
+        ordering = ['board_id']
+
+    def __str__(self):
+        return f"#{self.board_id} {self.name}"
+
+
+class BBSPost(models.Model):
+    """A post on a board. Post numbers are positions in id order."""
+    board = models.ForeignKey(BBSBoard, on_delete=models.CASCADE, related_name='posts')
+    title = models.CharField(max_length=255)
+    content = models.TextField(blank=True)
+    author = models.CharField(max_length=255)
+    created_at = models.DateTimeField()
+    edited_at = models.DateTimeField(null=True, blank=True)
+    pinned = models.BooleanField(default=False)
+
+    class Meta:
+        app_label = 'wod20th'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['board', 'id']),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.board.name})"
+
+
+class BBSPostRead(models.Model):
+    """Marks a post as read by one character, keyed by character name."""
+    post = models.ForeignKey(BBSPost, on_delete=models.CASCADE, related_name='reads')
+    reader = models.CharField(max_length=255)
+    read_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        app_label = 'wod20th'
+        unique_together = ('post', 'reader')
+        indexes = [
+            models.Index(fields=['reader', 'post']),
+        ]
@@ -0,0 +1,21 @@
+"""
+Script that holds the temporary NPC expiry schedule.
+
+It has no interval: NPC_EXPIRY arms a single timer for the next NPC due and
+keeps its schedule in this script's ``entries`` Attribute, so the schedule
+survives reloads.
+"""
+
+from evennia.scripts.scripts import DefaultScript as Script
+
+
+class NPCExpiryScript(Script):
+    """
+    Script for storing the temporary NPC expiry schedule.
+    """
+
+    def at_script_creation(self):
+        """Set up the script."""
+        self.key = "npc_expiry"
+        self.desc = "Deletes temporary NPCs once they expire"
+        self.persistent = True
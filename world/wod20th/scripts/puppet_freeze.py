@@ -13,6 +13,7 @@ from evennia.scripts.scripts import DefaultScript as Script
 from evennia.utils import create
 from datetime import datetime, timedelta
 from django.utils.timezone import now
+from world.wod20th.utils.census import CENSUS
 
 INACTIVE_DAYS = 60  # Number of days before a puppet is considered inactive
 FREEZER_ROOM = "#2029"  # Dbref of the freezer room
@@ -72,6 +73,7 @@ class PuppetFreezeScript(Script):
         """
         # Set character as unapproved
         puppet.db.approved = False
+        CENSUS.touch(puppet)
         
         # Move to freezer room
         freezer = search.search_object(FREEZER_ROOM)[0]
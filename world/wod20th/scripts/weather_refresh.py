@@ -0,0 +1,27 @@
+"""
+Script that keeps the shared weather snapshot current.
+
+Every REFRESH_INTERVAL seconds it refreshes WEATHER in the background, so
++weather and anything that needs the moon phase read a ready snapshot.
+"""
+
+from evennia.scripts.scripts import DefaultScript as Script
+from world.wod20th.utils.weather_snapshot import REFRESH_INTERVAL, WEATHER
+
+
+class WeatherRefreshScript(Script):
+    """
+    Script for refreshing the weather, moon and tide snapshot.
+    """
+
+    def at_script_creation(self):
+        """Set up the script."""
+        self.key = "weather_refresh"
+        self.desc = "Refreshes the shared weather, moon and tide snapshot"
+        self.interval = REFRESH_INTERVAL
+        self.start_delay = False  # Refresh as soon as the script starts
+        self.persistent = True
+
+    def at_repeat(self):
+        """Fetch a new snapshot; the lookups run off the reactor thread."""
+        WEATHER.refresh()
@@ -18,6 +18,8 @@ from evennia.commands.default.muxcommand import MuxCommand
 import logging
 from evennia.objects.models import ObjectDB
 from django.db.models import Q
+from world.wod20th.utils.xp_ledger import get_xp_events_since, get_latest_xp_event_id
+from world.wod20th.utils.xp_awards import award_weekly_xp
 
 # Initialize logger properly
 log = logging.getLogger('evennia')
@@ -214,9 +216,9 @@ class CmdDebugXP(MuxCommand):
             
         # Add staff note about forcing XP update
         if self.caller.check_permstring("builders"):
-            msg += "\n|yStaff Note:|n To force XP update for this character:\n"
-            msg += "@py from evennia import GLOBAL_SCRIPTS; GLOBAL_SCRIPTS.weekly_xp_award._award_weekly_xp(obj)\n"
-            msg += "Where obj is the character object (#dbref)"
+            msg += "\n|yStaff Note:|n To run the weekly XP award now (with ledger entries and an audit record):\n"
+            msg += "+xp/forceweekly, or @py from world.wod20th.utils.xp_awards import award_weekly_xp; award_weekly_xp(awarded_by=me.key)\n"
+            msg += "This awards every eligible character with scenes this week"
             
         self.caller.msg(msg)
 
@@ -262,60 +264,6 @@ class WeeklyXPScript(DefaultScript):
         except Exception as e:
             log.error(f"Error in WeeklyXPScript at_server_shutdown: {e}")
             
-    def _award_weekly_xp(self, char):
-        """
-        Award weekly XP to a character if they qualify.
-        """
-        try:
-            if not char:
-                return False
-            
-            # Skip staff characters
-            if char.check_permstring("builders"):
-                return False
-            
-            # Initialize XP data if it doesn't exist
-            if not hasattr(char.db, 'xp') or not char.db.xp:
-                char.db.xp = {
-                    'total': Decimal('0.00'),
-                    'current': Decimal('0.00'),
-                    'spent': Decimal('0.00'),
-                    'ic_xp': Decimal('0.00'),
-                    'monthly_spent': Decimal('0.00'),
-                    'last_reset': datetime.now(),
-                    'spends': [],
-                    'last_scene': None,
-                    'scenes_this_week': 0
-                }
-            
-            # Check if they had any scenes this week
-            scenes_this_week = char.db.xp.get('scenes_this_week', 0)
-            if scenes_this_week > 0:
-                # Award XP and reset scene counter
-                prev_total = char.db.xp.get('total', Decimal('0.00'))
-                prev_current = char.db.xp.get('current', Decimal('0.00'))
-                prev_ic_xp = char.db.xp.get('ic_xp', Decimal('0.00'))
-                
-                # Award XP
-                success = char.add_xp(WEEKLY_XP_AMOUNT, "Weekly Activity")
-                if success:
-                    # Update IC XP tracking
-                    char.db.xp['ic_xp'] = prev_ic_xp + Decimal(str(WEEKLY_XP_AMOUNT))
-                    # Reset scene counter
-                    char.db.xp['scenes_this_week'] = 0
-                    # Notify the character if they're online
-                    if hasattr(char, 'msg'):
-                        char.msg(f"|gYou received {WEEKLY_XP_AMOUNT} XP for Weekly Activity.|n")
-                    return True
-                else:
-                    return False
-                    
-            return False
-            
-        except Exception as e:
-            log.error(f"Error awarding XP to {char.key}: {e}")
-            return False
-            
     def at_repeat(self):
         """
         Called every week to distribute XP.
@@ -325,24 +273,22 @@ class WeeklyXPScript(DefaultScript):
             # Store last run time
             self.db.last_run = current_time
 
-            characters = Character.objects.filter(db_typeclass_path__contains='characters.Character')
-
-            awarded_count = 0
-            for char in characters:
-                try:
-                    with transaction.atomic():
-                        if self._award_weekly_xp(char):
-                            awarded_count += 1
-                except Exception as e:
-                    log.error(f"Error processing XP for {char.key}: {str(e)}")
-                    continue
+            # Load, plan and commit the whole week in one pass
+            plan, run = award_weekly_xp()
+            for name, issue in plan.issues:
+                log.warning(f"Weekly XP skipped {name}: {issue}")
 
         except Exception as e:
             log.error(f"Critical error during XP distribution: {str(e)}")
             raise
 
 class XPMonitor(DefaultScript):
-    """Monitors XP changes for characters"""
+    """
+    Monitors XP changes for characters.
+
+    XP mutations append to the XP ledger; each tick only reads the entries
+    added since the last one seen, so an idle server does no work.
+    """
     
     def at_script_creation(self):
         """Called when script is first created."""
@@ -354,81 +300,36 @@ class XPMonitor(DefaultScript):
         
         # Initialize storage
         self.db.last_xp_states = {}
+        self.db.last_ledger_id = None
     
     def at_start(self):
         """Called when script starts running"""
         if not self.db.last_xp_states:
             self.db.last_xp_states = {}
-        self.record_current_states()
-    
-    def record_current_states(self):
-        """Record current XP states for all characters."""
-        try:
-            with transaction.atomic():
-                characters = Character.objects.filter(db_typeclass_path__contains='characters.Character')
-                
-                for char in characters:
-                    try:
-                        xp_data = char.db.xp
-                        if xp_data:
-                            # Create a new dict with the values we want to track
-                            state = {
-                                'total': xp_data.get('total', Decimal('0.00')),
-                                'current': xp_data.get('current', Decimal('0.00')),
-                                'spent': xp_data.get('spent', Decimal('0.00')),
-                                'ic_xp': xp_data.get('ic_xp', Decimal('0.00')),
-                                'scenes_this_week': xp_data.get('scenes_this_week', 0)
-                            }
-                            self.db.last_xp_states[char.key] = state
-                    except Exception as e:
-                        log.error(f"Could not record XP state for {char.key}: {e}")
-        except Exception as e:
-            log.error(f"Database error in record_current_states: {e}")
+        if self.db.last_ledger_id is None:
+            # Start from the current end of the ledger
+            self.db.last_ledger_id = get_latest_xp_event_id()
     
     def at_repeat(self):
-        """Called every minute to check for XP changes."""
+        """Called every minute to consume new XP ledger entries."""
         try:
-            with transaction.atomic():
-                characters = Character.objects.filter(db_typeclass_path__contains='characters.Character')
-                
-                for char in characters:
-                    try:
-                        self._check_character_xp(char)
-                    except Exception as e:
-                        log.error(f"Error checking XP for {char.key}: {e}")
-        except Exception as e:
-            log.error(f"Database error in at_repeat: {e}")
+            entries = get_xp_events_since(self.db.last_ledger_id)
+            if not entries:
+                return
 
-    def _check_character_xp(self, char):
-        """Check XP changes for a single character."""
-        try:
-            if not self.db.last_xp_states:
-                self.db.last_xp_states = {}
-                
-            current_xp = char.db.xp
-            last_state = self.db.last_xp_states.get(char.key, {})
-            
-            if current_xp and last_state:
-                # Check for changes in key values
-                changed = False
-                for key in ['total', 'current', 'spent', 'ic_xp', 'scenes_this_week']:
-                    if current_xp.get(key) != last_state.get(key):
-                        changed = True
-                        break
-                
-                if changed:
-                    # Update stored state without logging
-                    new_state = {
-                        'total': current_xp.get('total', Decimal('0.00')),
-                        'current': current_xp.get('current', Decimal('0.00')),
-                        'spent': current_xp.get('spent', Decimal('0.00')),
-                        'ic_xp': current_xp.get('ic_xp', Decimal('0.00')),
-                        'scenes_this_week': current_xp.get('scenes_this_week', 0)
-                    }
-                    self.db.last_xp_states[char.key] = new_state
-                    
+            changed = {}
+            for entry in entries:
+                try:
+                    changed[entry.character.key] = entry.as_state()
+                except Exception as e:
+                    log.error(f"Error reading XP ledger entry {entry.id}: {e}")
+
+            states = self.db.last_xp_states or {}
+            states.update(changed)
+            self.db.last_xp_states = states
+            self.db.last_ledger_id = entries[-1].id
         except Exception as e:
-            log.error(f"Error in _check_character_xp for {char.key}: {e}")
+            log.error(f"Database error in at_repeat: {e}")
 
 def start_xp_monitor():
     """
@@ -0,0 +1,123 @@
+"""
+Signal handlers for the WoD20th app.
+"""
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+from evennia.typeclasses.tags import Tag
+from utils.character_index import CHARACTER_INDEX, CHARACTER_TYPECLASS as INDEXED_TYPECLASS
+from .models import Stat
+from .utils.character_directory import DIRECTORY_ATTRIBUTES, is_directory_character, refresh_entry, update_splat
+from .utils.stat_catalog import STAT_CATALOG
+from .utils.stat_store import add_change_listener
+
+
+@receiver(post_save, sender=Stat)
+@receiver(post_delete, sender=Stat)
+def invalidate_stat_catalog(sender, instance, **kwargs):
+    """Drop the cached stat catalog whenever a Stat row changes."""
+    STAT_CATALOG.invalidate()
+
+
+# ----------------------------------------------------------------------
+# Character directory
+# ----------------------------------------------------------------------
+
+def _directory_owners(attribute):
+    """Return the directory characters an Attribute belongs to."""
+    if attribute.db_key not in DIRECTORY_ATTRIBUTES or attribute.db_category is not None:
+        return []
+    return [obj for obj in ObjectDB.objects.filter(db_attributes=attribute) if is_directory_character(obj)]
+
+
+@receiver(post_save)
+def directory_character_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Keep the directory row in step with a character's name and typeclass."""
+    if not isinstance(instance, ObjectDB):
+        return
+    if update_fields is not None and not {'db_key', 'db_typeclass_path'} & set(update_fields):
+        return
+    if is_directory_character(instance) or not created:
+        refresh_entry(instance)
+
+
+@receiver(post_save, sender=Attribute)
+def directory_attribute_saved(sender, instance, **kwargs):
+    """Refresh the directory when an approval or profile Attribute changes."""
+    for character in _directory_owners(instance):
+        refresh_entry(character)
+
+
+@receiver(pre_delete, sender=Attribute)
+def directory_attribute_deleted(sender, instance, **kwargs):
+    """Refresh the directory when an approval or profile Attribute is removed."""
+    for character in _directory_owners(instance):
+        refresh_entry(character, exclude_attribute=instance.id)
+
+
+@receiver(m2m_changed, sender=ObjectDB.db_attributes.through)
+def directory_attribute_added(sender, instance, action, reverse, pk_set, **kwargs):
+    """New Attributes are linked to their object after their first save."""
+    if action != 'post_add' or reverse or not is_directory_character(instance):
+        return
+    if Attribute.objects.filter(
+        pk__in=pk_set, db_key__in=DIRECTORY_ATTRIBUTES, db_category__isnull=True
+    ).exists():
+        refresh_entry(instance)
+
+
+@receiver(m2m_changed, sender=ObjectDB.db_tags.through)
+def directory_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh the staff and storyteller flags when permission tags change."""
+    if action not in ('post_add', 'post_remove', 'post_clear') or reverse:
+        return
+    if not is_directory_character(instance):
+        return
+    if pk_set is None or Tag.objects.filter(pk__in=pk_set, db_tagtype='permission').exists():
+        refresh_entry(instance)
+
+
+add_change_listener(update_splat)
+
+
+# ----------------------------------------------------------------------
+# Character name index
+# ----------------------------------------------------------------------
+
+@receiver(post_save)
+def index_character_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Re-index a character that was created, renamed or changed typeclass."""
+    if not isinstance(instance, ObjectDB):
+        return
+    if update_fields is not None and not {'db_key', 'db_typeclass_path'} & set(update_fields):
+        return
+    if instance.db_typeclass_path == INDEXED_TYPECLASS or not created:
+        CHARACTER_INDEX.update(instance)
+
+
+@receiver(post_delete)
+def index_character_deleted(sender, instance, **kwargs):
+    """Drop a deleted character from the name index."""
+    if isinstance(instance, ObjectDB):
+        CHARACTER_INDEX.discard(instance)
+
+
+@receiver(post_save, sender=Attribute)
+def index_alias_attribute_saved(sender, instance, **kwargs):
+    """Re-index characters whose ``alias`` Attribute was edited in place."""
+    if instance.db_key != 'alias' or instance.db_category is not None:
+        return
+    for obj in ObjectDB.objects.filter(db_attributes=instance):
+        CHARACTER_INDEX.update(obj)
+
+
+@receiver(m2m_changed, sender=ObjectDB.db_tags.through)
+def index_aliases_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Re-index a character whose Evennia aliases changed."""
+    if action not in ('post_add', 'post_remove', 'post_clear') or reverse:
+        return
+    if instance.db_typeclass_path != INDEXED_TYPECLASS:
+        return
+    if pk_set is None or Tag.objects.filter(pk__in=pk_set, db_tagtype='alias').exists():
+        CHARACTER_INDEX.update(instance)
@@ -0,0 +1,66 @@
+"""
+Test cases for the room audience plan and appearance cache.
+"""
+from unittest.mock import MagicMock
+from django.test import TestCase
+from typeclasses.rooms import AudiencePlan, RoomParent
+
+
+def make_obj(key, is_character=True, states=("in_material",)):
+    """Build a room content double carrying the given state tags."""
+    obj = MagicMock()
+    obj.key = key
+    obj.is_character = is_character
+
+    def get_tags(key=None, category=None, return_list=False):
+        if key is None:
+            return list(states)
+        return key if key in states else None
+
+    obj.tags.get.side_effect = get_tags
+    return obj
+
+
+class TestAudiencePlan(TestCase):
+    def test_characters_are_bucketed_by_plane(self):
+        """Test Umbra and material characters hear only their own plane."""
+        walker = make_obj("Walker", states=("in_umbra",))
+        mortal = make_obj("Mortal")
+        plan = AudiencePlan([walker, mortal])
+        self.assertEqual(plan.realms[True], [walker])
+        self.assertEqual(plan.realms[False], [mortal])
+        self.assertEqual(plan.contents, [walker, mortal])
+
+    def test_objects_hear_both_planes(self):
+        """Test non-character objects such as recorders hear everyone, in room order."""
+        recorder = make_obj("Recorder", is_character=False, states=())
+        walker = make_obj("Walker", states=("in_umbra",))
+        mortal = make_obj("Mortal")
+        plan = AudiencePlan([recorder, walker, mortal])
+        self.assertEqual(plan.realms[True], [recorder, walker])
+        self.assertEqual(plan.realms[False], [recorder, mortal])
+
+    def test_untagged_objects_count_as_material(self):
+        """Test objects without realm tags are seen from the material world only."""
+        lamp = make_obj("Lamp", is_character=False, states=())
+        spirit = make_obj("Spirit", is_character=False, states=("in_umbra",))
+        plan = AudiencePlan([lamp, spirit])
+        self.assertEqual(plan.states[lamp], frozenset())
+        self.assertEqual(plan.object_states[lamp], {"in_material"})
+        self.assertEqual(plan.object_states[spirit], {"in_umbra"})
+
+
+class TestAppearanceCache(TestCase):
+    def setUp(self):
+        """Set up a room double with an empty ndb."""
+        self.room = MagicMock()
+        self.room.ndb.appearance_cache = None
+        self.room.cached_appearance = RoomParent.cached_appearance.__get__(self.room)
+
+    def test_pieces_are_built_once_per_key(self):
+        """Test a piece is only rebuilt when its key changes."""
+        build = MagicMock(side_effect=lambda: "formatted")
+        for _ in range(3):
+            self.assertEqual(self.room.cached_appearance(("desc", "A room."), build), "formatted")
+        self.room.cached_appearance(("desc", "An edited room."), build)
+        self.assertEqual(build.call_count, 2)
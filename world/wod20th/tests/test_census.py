@@ -0,0 +1,88 @@
+"""
+Test cases for the +census aggregator.
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+from django.test import TestCase
+from world.wod20th.utils.census import Census, character_census
+
+
+def make_stats(splat, lineage=None, **powers):
+    """Build a minimal sheet for one splat."""
+    stats = {
+        'other': {'splat': {'Splat': {'perm': splat, 'temp': splat}}},
+        'identity': {'lineage': {name: {'perm': value, 'temp': value}
+                                 for name, value in (lineage or {}).items()}},
+        'powers': {},
+    }
+    for category, ratings in powers.items():
+        stats['powers'][category] = {name: {'perm': value, 'temp': value} for name, value in ratings.items()}
+    return stats
+
+
+class TestCharacterCensus(TestCase):
+    def test_vampire_contribution(self):
+        """Test a vampire counts towards splat, clan and rated disciplines."""
+        stats = make_stats('Vampire', {'Clan': 'brujah'}, discipline={'Potence': 2, 'Celerity': 0})
+        self.assertEqual(character_census(stats, True), {
+            'splat': ('Vampire',),
+            'vampire': ('Brujah',),
+            'discipline': ('Potence',),
+        })
+
+    def test_garou_counts_as_shifter_and_tribe(self):
+        """Test Garou count towards both shifter types and tribes."""
+        stats = make_stats('Shifter', {'Type': 'Garou', 'Tribe': 'Unknown'})
+        self.assertEqual(character_census(stats, True), {
+            'splat': ('Shifter',),
+            'shifter': ('Garou',),
+        })
+
+    def test_unapproved_characters_are_not_counted(self):
+        """Test unapproved characters and empty sheets contribute nothing."""
+        self.assertEqual(character_census(make_stats('Mage'), False), {})
+        self.assertEqual(character_census({}, True), {})
+
+
+class TestCensus(TestCase):
+    def setUp(self):
+        """Set up a census built from two characters."""
+        self.census = Census()
+
+        def rebuild():
+            self.census._apply(1, character_census(make_stats('Vampire', {'Clan': 'Brujah'}), True))
+            self.census._apply(2, character_census(make_stats('Mage', {'Tradition': 'Verbena'}), True))
+            self.census._built_at = 1e12  # never stale during the test
+
+        patcher = patch.object(self.census, 'rebuild', side_effect=rebuild)
+        self.rebuild = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_counts_come_from_one_build(self):
+        """Test every breakdown is served from a single build."""
+        self.assertEqual(self.census.counts('splat'), {'Vampire': 1, 'Mage': 1})
+        self.assertEqual(self.census.counts('mage'), {'Verbena': 1})
+        self.assertEqual(self.census.counts('vampire'), {'Brujah': 1})
+        self.assertEqual(self.rebuild.call_count, 1)
+
+    def test_touch_recounts_only_that_character(self):
+        """Test a touched character's old contribution is replaced."""
+        self.census.counts('splat')
+        self.census.touch(SimpleNamespace(id=1))
+
+        def recount(char_ids):
+            self.assertEqual(char_ids, {1})
+            self.census._apply(1, {})  # unapproved
+
+        with patch.object(self.census, '_recount', side_effect=recount) as recount_mock:
+            self.assertEqual(self.census.counts('splat'), {'Mage': 1})
+            self.assertEqual(self.census.counts('vampire'), {})
+        self.assertEqual(recount_mock.call_count, 1)
+        self.assertEqual(self.rebuild.call_count, 1)
+
+    def test_invalidate_rebuilds(self):
+        """Test invalidate() forces a full rebuild."""
+        self.census.counts('splat')
+        self.census.invalidate()
+        self.census.counts('splat')
+        self.assertEqual(self.rebuild.call_count, 2)
@@ -0,0 +1,46 @@
+"""
+Test cases for the website character directory.
+"""
+from types import SimpleNamespace
+from django.test import TestCase
+from world.wod20th.utils.character_directory import entry_fields, is_directory_character, search_rank
+
+
+class TestCharacterDirectory(TestCase):
+    def test_entry_fields(self):
+        """Test the directory columns built from a character's data."""
+        stats = {'other': {'splat': {'Splat': {'perm': 'Mage', 'temp': 'Mage'}}}}
+        attributes = {'approved': True, 'full_name': "Alice Liddell", 'biography': 42}
+        fields = entry_fields("Alice", attributes, ["Player", "Storyteller"], stats)
+
+        self.assertTrue(fields['approved'])
+        self.assertFalse(fields['is_staff'])
+        self.assertTrue(fields['is_storyteller'])
+        self.assertEqual(fields['splat'], 'Mage')
+        self.assertEqual(fields['full_name'], "Alice Liddell")
+        # Non-text profile values are ignored
+        self.assertEqual(fields['biography'], '')
+        self.assertIn("alice liddell", fields['search_text'])
+
+    def test_staff_and_missing_sheet(self):
+        """Test staff permissions are flagged and a missing sheet has no splat."""
+        fields = entry_fields("Admin", {}, ["Admin"], None)
+        self.assertTrue(fields['is_staff'])
+        self.assertFalse(fields['approved'])
+        self.assertEqual(fields['splat'], '')
+
+    def test_npcs_are_not_listed(self):
+        """Test only non-NPC character typeclasses belong in the directory."""
+        self.assertTrue(is_directory_character(SimpleNamespace(db_typeclass_path='typeclasses.characters.Character')))
+        self.assertFalse(is_directory_character(SimpleNamespace(db_typeclass_path='typeclasses.characters.NPC')))
+        self.assertFalse(is_directory_character(SimpleNamespace(db_typeclass_path='typeclasses.rooms.Room')))
+
+    def test_search_rank(self):
+        """Test exact names outrank partial names, which outrank profile matches."""
+        def entry(name, **profile):
+            fields = entry_fields(name, profile, (), None)
+            return SimpleNamespace(**fields)
+
+        self.assertEqual(search_rank(entry("Alice"), ["alice"]), 50)
+        self.assertEqual(search_rank(entry("Alicent"), ["alice"]), 10)
+        self.assertEqual(search_rank(entry("Bob", rp_hooks="Knows Alice", biography="alice's friend"), ["alice"]), 4)
@@ -0,0 +1,50 @@
+"""
+Test cases for the character name and alias index.
+"""
+from types import SimpleNamespace
+from django.test import TestCase
+from utils.character_index import CharacterIndex
+
+
+class TestCharacterIndex(TestCase):
+    def setUp(self):
+        """Set up an index with three characters, skipping the database rebuild."""
+        self.index = CharacterIndex()
+        self.index._built = True
+        self.lysander = SimpleNamespace(id=5, key="Lysander")
+        self.lyssa = SimpleNamespace(id=7, key="Lyssa")
+        self.bob = SimpleNamespace(id=9, key="Bob")
+        self.index._link(self.lysander, ["Lysander"], ["Lys"])
+        self.index._link(self.lyssa, ["Lyssa"], [])
+        self.index._link(self.bob, ["Bob", "Robert"], [])
+
+    def test_find_by_name_alias_and_dbref(self):
+        """Test exact lookups are case-insensitive and cover every kind of key."""
+        self.assertIs(self.index.find("lysander"), self.lysander)
+        self.assertIs(self.index.find("LYS"), self.lysander)
+        self.assertIs(self.index.find("robert"), self.bob)
+        self.assertIs(self.index.find("#7"), self.lyssa)
+        self.assertIsNone(self.index.find("Carol"))
+        self.assertIs(self.index.find_alias("lys"), self.lysander)
+        self.assertIsNone(self.index.find_alias("Lyssa"))
+
+    def test_names_win_over_alias_attributes(self):
+        """Test a character's name beats someone else's alias."""
+        impostor = SimpleNamespace(id=11, key="Impostor")
+        self.index._link(impostor, ["Impostor"], ["Bob"])
+        self.assertIs(self.index.find("bob"), self.bob)
+
+    def test_prefix_completion(self):
+        """Test prefix lookups return every match, oldest first."""
+        self.assertEqual(self.index.complete("lys"), [self.lysander, self.lyssa])
+        self.assertEqual(self.index.complete("lysa"), [self.lysander])
+        self.assertEqual(self.index.complete("rob"), [self.bob])
+        self.assertEqual(self.index.complete("z"), [])
+
+    def test_discard_removes_every_key(self):
+        """Test a discarded character can no longer be found or completed."""
+        self.index.discard(self.lysander)
+        self.assertIsNone(self.index.find("Lys"))
+        self.assertEqual(self.index.complete("lys"), [self.lyssa])
+        self.assertEqual(self.index._sorted, sorted(self.index._sorted))
+        self.assertNotIn("lys", self.index._sorted)
@@ -0,0 +1,31 @@
+"""
+Test cases for the dice engine.
+"""
+from django.test import TestCase
+from world.wod20th.utils.dice_engine import DiceEngine, roll_odds
+
+
+class TestDiceEngine(TestCase):
+    def test_seeded_engines_replay(self):
+        """Test two engines with the same seed roll the same dice."""
+        self.assertEqual(DiceEngine(seed=7).roll(10, 6), DiceEngine(seed=7).roll(10, 6))
+
+    def test_tally(self):
+        """Test successes have ones subtracted."""
+        self.assertEqual(DiceEngine.tally([1, 6, 10, 3], 6), (1, 1))
+        self.assertEqual(DiceEngine.tally([1, 1, 2], 6), (-2, 2))
+
+    def test_roll_many_matches_single_draw(self):
+        """Test batch rolls split one draw in order."""
+        results = DiceEngine(seed=3).roll_many([(3, 6), (0, 6), (2, 8)])
+        dice = DiceEngine(seed=3).draw(5).tolist()
+        self.assertEqual([r[0] for r in results], [dice[:3], [], dice[3:]])
+
+    def test_odds(self):
+        """Test exact odds against hand-computed values."""
+        odds = roll_odds(1, 6)
+        self.assertAlmostEqual(odds.success, 0.5)
+        self.assertAlmostEqual(odds.botch, 0.1)
+        self.assertAlmostEqual(roll_odds(1, 6, willpower=True).success, 1.0)
+        self.assertEqual(roll_odds(2, 6, willpower=True).botch, 0.0)
+        self.assertAlmostEqual(roll_odds(1, 10, specialty=True).expected, 0.2)
@@ -0,0 +1,48 @@
+"""
+Test cases for the fuzzy stat-name index.
+"""
+from unittest.mock import patch
+from types import SimpleNamespace
+from django.test import TestCase
+from world.wod20th.utils.fuzzy_index import FuzzyIndex, StatNameIndex, index_for, levenshtein
+
+
+class TestFuzzyIndex(TestCase):
+    def setUp(self):
+        """Set up an index over a few stat names."""
+        self.index = FuzzyIndex(["Alertness", "Athletics", "Awareness", "Primal Urge", "Razor Claws", "Dodge"])
+
+    def test_levenshtein(self):
+        """Test edit distance and its early cutoff."""
+        self.assertEqual(levenshtein("kitten", "sitting"), 3)
+        self.assertEqual(levenshtein("dodge", "dodge"), 0)
+        self.assertEqual(levenshtein("abc", "abcdef", 1), 2)
+
+    def test_match_is_case_insensitive(self):
+        """Test exact matches return the stored spelling."""
+        self.assertEqual(self.index.match("razor claws"), "Razor Claws")
+        self.assertIsNone(self.index.match("Razor"))
+
+    def test_suggest_ranks_prefix_before_typo(self):
+        """Test substring, word-prefix and typo suggestions."""
+        self.assertEqual(self.index.suggest("Alertnes"), ["Alertness"])
+        self.assertEqual(self.index.suggest("urge"), ["Primal Urge"])
+        self.assertEqual(self.index.suggest("Razr Claws"), ["Razor Claws"])
+        self.assertEqual(self.index.suggest("a", limit=2), ["Alertness", "Athletics"])
+
+    def test_index_for_is_cached(self):
+        """Test identity vocabularies share one index per value set."""
+        self.assertIs(index_for(["Sidhe", "Pooka"]), index_for(("Pooka", "Sidhe")))
+
+    def test_stat_names_rebuild_on_invalidate(self):
+        """Test the stat index picks up catalog changes."""
+        catalog = SimpleNamespace(listeners=[])
+        catalog.add_listener = catalog.listeners.append
+        catalog.all = lambda: [SimpleNamespace(name="Alertness", gift_alias=None)]
+        names = StatNameIndex()
+        with patch("world.wod20th.utils.stat_catalog.STAT_CATALOG", catalog):
+            self.assertEqual(names.suggest("alertnes"), ["Alertness"])
+            catalog.all = lambda: [SimpleNamespace(name="Razor Claws", gift_alias=["Claws of the Wyld"])]
+            for listener in catalog.listeners:
+                listener()
+            self.assertEqual(names.match("claws of the wyld"), "Claws of the Wyld")
@@ -0,0 +1,89 @@
+"""
+Test cases for the health track computation.
+"""
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from django.test import TestCase
+from world.wod20th.utils.damage import apply_damage_or_healing, build_health_track, format_status, health_track
+
+
+class TestHealthTrack(TestCase):
+    def make_character(self, stats=None, attributes=None):
+        """A character stand-in whose sheet version can be bumped."""
+        stats = stats or {}
+        attributes = attributes or {}
+        character = SimpleNamespace(
+            ndb=SimpleNamespace(health_track=None),
+            stat_store=SimpleNamespace(version=1),
+            attributes=SimpleNamespace(get=attributes.get),
+            get_stat=MagicMock(side_effect=lambda stat_type, category, name, temp=False: stats.get(name)),
+        )
+        character.stat_store.current_version = lambda: character.stat_store.version
+        return character
+
+    def test_standard_track(self):
+        """Test a character with no bonuses has seven boxes ending in Dead."""
+        track = build_health_track()
+        self.assertEqual(track.bonus, 0)
+        self.assertEqual([name for name, _ in track.levels],
+                         ["Bruised", "Hurt", "Injured", "Wounded", "Mauled", "Crippled", "Incapacitated"])
+        self.assertEqual(track.levels[5], ("Crippled", " (-5)"))
+        self.assertEqual(track.final, ("Dead",))
+
+    def test_bonus_levels(self):
+        """Test Bruised and Rage bonus levels land in the right place."""
+        track = build_health_track(bruised_bonus=2, rage_bonus=3, rage_level='Wounded', vampire=True)
+        self.assertEqual(track.bonuses, (2, 0, 0, 3, 0, 0))
+        self.assertEqual(track.bonus, 5)
+        self.assertEqual(len(track.levels), 12)
+        self.assertEqual([name for name, _ in track.levels].count("Wounded"), 4)
+        self.assertEqual(track.final, ("Torpor", "Final Death"))
+
+    def test_memoized_per_sheet_version(self):
+        """Test the track is reused until the sheet changes."""
+        character = self.make_character(stats={'Kith': 'Troll'})
+        self.assertEqual(health_track(character).bonus, 1)
+        lookups = character.get_stat.call_count
+        self.assertEqual(health_track(character).bonus, 1)
+        self.assertEqual(character.get_stat.call_count, lookups)
+
+        character.stat_store.version = 2
+        health_track(character)
+        self.assertGreater(character.get_stat.call_count, lookups)
+
+    def test_expired_rage_boost_is_ignored(self):
+        """Test a stale Rage boost adds nothing and isn't cleared by reading."""
+        attributes = {'bonus_health_from_rage': 2, 'rage_health_level_type': 'hurt',
+                      'health_boost_timestamp': time.time()}
+        self.assertEqual(health_track(self.make_character(attributes=attributes)).bonuses, (0, 2, 0, 0, 0, 0))
+
+        attributes['health_boost_timestamp'] = time.time() - 30000
+        self.assertEqual(health_track(self.make_character(attributes=attributes)).bonus, 0)
+        self.assertEqual(attributes['bonus_health_from_rage'], 2)
+
+    def test_injury_marker(self):
+        """Test the injury marker follows the boxes, including bonus levels and death."""
+        track = build_health_track(bruised_bonus=1)
+        self.assertEqual(track.injury(0), ("Healthy", ""))
+        self.assertEqual(track.injury(2), ("Bruised", ""))
+        self.assertEqual(track.injury(3), ("Hurt", " (-1)"))
+        self.assertEqual(track.injury(8), ("Incapacitated", ""))
+        self.assertEqual(track.injury(9, agg_damage=9), ("Dead", ""))
+
+        vampire = build_health_track(vampire=True)
+        self.assertEqual(vampire.injury(8, agg_damage=8), ("Torpor", ""))
+        self.assertEqual(vampire.injury(9, agg_damage=9), ("Final Death", ""))
+
+    def test_damage_and_status_use_the_track(self):
+        """Test the stored and displayed markers both count bonus levels."""
+        character = self.make_character(stats={'Kith': 'Troll'})
+        character.db = SimpleNamespace(bashing=0, lethal=0, agg=0, injury_level=None)
+
+        self.assertEqual(apply_damage_or_healing(character, 2, "lethal"), "Bruised")
+        self.assertEqual(character.db.injury_level, "Bruised")
+        self.assertEqual(apply_damage_or_healing(character, 1, "bashing"), "Hurt")
+        self.assertIn("Hurt (-1)", str(format_status(character)))
+
+        self.assertEqual(apply_damage_or_healing(character, 9, "aggravated"), "Dead")
+        self.assertEqual(character.db.agg, 9)
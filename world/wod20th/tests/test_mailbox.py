@@ -0,0 +1,60 @@
+"""
+Test cases for the single-query mailbox and @mail paging.
+"""
+from unittest.mock import MagicMock, patch
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+from commands.mail_commands import MAIL_PAGE_SIZE, CmdMail, mailbox_queryset
+
+
+class TestMailbox(EvenniaTest):
+    def send(self, header, tags=(("new", "mail"),)):
+        """Send self.account a message from account2 with the given tags."""
+        message = create.create_message(self.account2, "Hello", receivers=self.account, header=header)
+        for key, category in tags:
+            message.tags.add(key, category=category)
+        return message
+
+    def test_mailbox_holds_only_mail(self):
+        """Test pages and untagged messages are left out and the rest annotated."""
+        first = self.send("First")
+        job = self.send("Job #12 updated", tags=(("mail", "mail"),))
+        filed = self.send("Filed", tags=(("folder_work", "mail"),))
+        self.send("Paged", tags=(("new", "mail"), ("page", "comms")))
+        self.send("Untagged", tags=())
+
+        mailbox = list(mailbox_queryset(self.account))
+        self.assertEqual([message.id for message in mailbox], [first.id, job.id, filed.id])
+        self.assertEqual([message.is_new for message in mailbox], [True, False, False])
+        self.assertEqual([message.is_job for message in mailbox], [False, True, False])
+        self.assertEqual([message.mail_folder for message in mailbox], [None, None, "folder_work"])
+
+    def test_mail_list_is_paged(self):
+        """Test @mail shows one page of messages, numbered across pages."""
+        for number in range(1, MAIL_PAGE_SIZE + 6):
+            self.send(f"Letter {number:02d}")
+        cmd = CmdMail()
+        cmd.caller = self.account
+        self.account.msg = MagicMock()
+
+        with patch.object(CmdMail, "get_mailbox", return_value=mailbox_queryset(self.account)):
+            cmd.display_mail_list(2)
+        output = "\n".join(str(call.args[0]) for call in self.account.msg.call_args_list)
+        self.assertIn(f"Letter {MAIL_PAGE_SIZE + 1:02d}", output)
+        self.assertIn(f"Letter {MAIL_PAGE_SIZE + 5:02d}", output)
+        self.assertNotIn(f"Letter {MAIL_PAGE_SIZE:02d}", output)
+        self.assertIn("Page 2 of 2", output)
+
+    def test_out_of_range_page_shows_last_page(self):
+        """Test asking for a page past the end shows the last one."""
+        for number in range(1, MAIL_PAGE_SIZE + 2):
+            self.send(f"Letter {number:02d}")
+        cmd = CmdMail()
+        cmd.caller = self.account
+        self.account.msg = MagicMock()
+
+        with patch.object(CmdMail, "get_mailbox", return_value=mailbox_queryset(self.account)):
+            cmd.display_mail_list(9)
+        output = "\n".join(str(call.args[0]) for call in self.account.msg.call_args_list)
+        self.assertIn("Page 2 of 2", output)
+        self.assertIn(f"Letter {MAIL_PAGE_SIZE + 1:02d}", output)
@@ -0,0 +1,91 @@
+"""
+Test cases for the temporary NPC expiry queue.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from django.test import TestCase
+from world.wod20th.utils.npc_expiry import NPCExpiryQueue
+
+
+class TestNPCExpiryQueue(TestCase):
+    def setUp(self):
+        """Set up a queue whose saves and timer are recorded instead of run."""
+        self.queue = NPCExpiryQueue()
+        self.queue._save = MagicMock()
+        self.queue._arm = MagicMock()
+
+    def test_pop_due_in_batches(self):
+        """Test due NPCs come off soonest first, at most limit at a time."""
+        for npc_id, expires_at in ((1, 300), (2, 100), (3, 200), (4, 900)):
+            self.queue.push(npc_id, expires_at)
+        self.assertEqual(self.queue.pop_due(now=500, limit=2), [2, 3])
+        self.assertEqual(self.queue.pop_due(now=500, limit=2), [1])
+        self.assertEqual(self.queue.pop_due(now=500), [])
+        self.assertEqual(self.queue.next_due(), 900)
+
+    def test_cancel_and_reschedule_skip_stale_entries(self):
+        """Test cancelled and moved NPCs are not returned at their old time."""
+        self.queue.push(1, 100)
+        self.queue.push(2, 200)
+        self.queue.push(1, 400)
+        self.queue.discard(2)
+        self.assertEqual(self.queue.pop_due(now=300), [])
+        self.assertEqual(self.queue.next_due(), 400)
+        self.assertEqual(self.queue.upcoming(), [(400, 1)])
+        self.assertEqual(len(self.queue), 1)
+
+    def test_timer_only_rearmed_for_new_head(self):
+        """Test scheduling re-arms the timer only when the NPC is due first."""
+        def npc(npc_id, hour):
+            return SimpleNamespace(id=npc_id, db=SimpleNamespace(expiration_time=datetime(2030, 1, 1, hour)))
+
+        self.queue.schedule(npc(1, 12))
+        self.queue.schedule(npc(2, 18))
+        self.assertEqual(self.queue._arm.call_count, 1)
+        self.queue.schedule(npc(3, 6))
+        self.assertEqual(self.queue._arm.call_count, 2)
+        self.assertEqual(self.queue._save.call_count, 3)
+        self.assertEqual([npc_id for _, npc_id in self.queue.upcoming(2)], [3, 1])
+
+    def test_load_round_trips_entries(self):
+        """Test a saved schedule loads back into the same order."""
+        self.queue.push(5, 50)
+        self.queue.push(6, 25)
+        restored = NPCExpiryQueue()
+        restored.load(self.queue.entries())
+        self.assertEqual(restored.upcoming(), [(25.0, 6), (50.0, 5)])
+        self.assertEqual(restored.pop_due(now=60), [6, 5])
+
+    def test_admin_expiry_edit_reaches_queue(self):
+        """Test npc_manager admin edits schedule and cancel the NPC's expiry."""
+        from world.npc_manager.signals import sync_npc_to_game
+
+        npc = SimpleNamespace(id=7, key="Guard", db=SimpleNamespace(desc="", is_temporary=False,
+                                                                    expiration_time=None))
+        model = SimpleNamespace(db_object=npc, db_key="Guard", db_description="",
+                                db_is_temporary=True, db_expiration_time=datetime(2030, 1, 1, 12))
+        with patch("world.wod20th.utils.npc_expiry.NPC_EXPIRY", self.queue):
+            sync_npc_to_game(None, model, created=False)
+            self.assertEqual(self.queue.upcoming(), [(datetime(2030, 1, 1, 12).timestamp(), 7)])
+
+            model.db_is_temporary = False
+            model.db_expiration_time = None
+            sync_npc_to_game(None, model, created=False)
+            self.assertEqual(self.queue.upcoming(), [])
+
+    def test_start_seeds_and_keeps_npcs_queued_before_it(self):
+        """Test a new schedule is seeded and NPCs scheduled earlier are not lost."""
+        queue = NPCExpiryQueue()
+        script = MagicMock()
+        script.attributes.get.return_value = None
+        queue._get_script = MagicMock(return_value=script)
+        queue._arm = MagicMock()
+
+        queue.schedule(SimpleNamespace(id=9, db=SimpleNamespace(expiration_time=datetime(2030, 1, 1, 6))))
+        script.attributes.add.assert_not_called()
+
+        with patch("world.wod20th.utils.npc_expiry.seed_entries", return_value=[(4, 100.0)]):
+            queue.start()
+        self.assertEqual(queue.upcoming(), [(100.0, 4), (datetime(2030, 1, 1, 6).timestamp(), 9)])
+        script.attributes.add.assert_called_once_with("entries", queue.entries())
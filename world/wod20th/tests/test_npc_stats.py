@@ -0,0 +1,44 @@
+"""
+Test cases for the shared NPC stat store.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from django.test import TestCase
+from world.wod20th.utils.npc_stats import NPCStatStore, health_status, room_npcs
+
+
+class TestNPCStats(TestCase):
+    def make_npc(self, stats, npc_id=1):
+        """An NPC stand-in whose Attribute reads and writes are recorded."""
+        return SimpleNamespace(id=npc_id, attributes=MagicMock(get=MagicMock(return_value=stats)))
+
+    def test_health_status(self):
+        """Test damage totals map onto wound levels."""
+        self.assertEqual(health_status(None), "Healthy")
+        self.assertEqual(health_status({"bashing": 1, "lethal": 1, "aggravated": 0}), "Hurt")
+        self.assertEqual(health_status({"bashing": 0, "lethal": 6, "aggravated": 0}), "Crippled")
+        self.assertEqual(health_status({"bashing": 3, "lethal": 3, "aggravated": 2}), "Incapacitated")
+
+    def test_change_health_is_one_write(self):
+        """Test damage loads the block once and saves it with a single write."""
+        store = NPCStatStore()
+        npc = self.make_npc({"splat": "mortal"})
+
+        health = store.change_health(npc, "lethal", 2)
+        self.assertEqual(health, {"bashing": 0, "lethal": 2, "aggravated": 0})
+        store.change_health(npc, "lethal", -5)
+        self.assertEqual(store.health(npc)["lethal"], 0)
+
+        npc.attributes.get.assert_called_once_with("stats")
+        self.assertEqual(npc.attributes.add.call_count, 2)
+
+    def test_room_roster_rebuilt_from_contents(self):
+        """Test an empty room roster is rebuilt from the NPCs in the room."""
+        room = SimpleNamespace(ndb=SimpleNamespace(npcs=None, npc_counter=None))
+
+        def register(target, number=None):
+            room_npcs(target)["Guard"] = {"number": number}
+
+        guard = SimpleNamespace(is_npc=True, register_in_room=register, db=SimpleNamespace(npc_number=3))
+        room.contents = [guard, SimpleNamespace(is_npc=False)]
+        self.assertEqual(room_npcs(room), {"Guard": {"number": 3}})
@@ -0,0 +1,72 @@
+"""
+Test cases for in-memory scene tracking.
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from django.test import TestCase
+from world.wod20th.utils.scene_tracker import SCENE_XP_WINDOW, SceneTracker
+
+
+def make_attributes(**values):
+    """An Attribute handler stand-in backed by a dict, recording writes."""
+    return MagicMock(get=MagicMock(side_effect=values.get), add=MagicMock(side_effect=values.__setitem__))
+
+
+class TestSceneTracker(TestCase):
+    def setUp(self):
+        """Set up a tracker with one room and one character, without the flush timer."""
+        patcher = patch("world.wod20th.utils.scene_tracker.delay")
+        self.delay = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tracker = SceneTracker()
+        self.room = SimpleNamespace(id=1, attributes=make_attributes())
+        self.char = SimpleNamespace(id=2, key="Lysander", location=self.room,
+                                    attributes=make_attributes(xp={"scenes_this_week": 0, "last_scene": None}))
+        self.now = datetime(2026, 10, 17, 20, 0)
+
+    def test_scene_counted_once_per_window(self):
+        """Test the weekly scene count only rises once per XP window."""
+        self.tracker.record_activity(self.char, now=self.now)
+        self.tracker.record_activity(self.char, now=self.now + timedelta(seconds=60))
+        self.assertEqual(self.char.attributes.get("xp")["scenes_this_week"], 1)
+        self.tracker.record_activity(self.char, now=self.now + timedelta(seconds=SCENE_XP_WINDOW + 1))
+        self.assertEqual(self.char.attributes.get("xp")["scenes_this_week"], 2)
+
+    def test_forget_character_rereads_last_scene(self):
+        """Test an XP reset is seen once the cached timing is dropped."""
+        self.tracker.record_activity(self.char, now=self.now)
+        self.char.attributes.add("xp", {"scenes_this_week": 0, "last_scene": None})
+        self.tracker.forget_character(self.char)
+        self.tracker.record_activity(self.char, now=self.now + timedelta(seconds=60))
+        self.assertEqual(self.char.attributes.get("xp")["scenes_this_week"], 1)
+
+    def test_activity_is_written_on_flush(self):
+        """Test room and character scene data are coalesced until a flush."""
+        self.tracker.record_activity(self.char, now=self.now)
+        self.tracker.record_activity(self.char, now=self.now + timedelta(seconds=30))
+        self.assertIsNone(self.room.attributes.get("scene_data"))
+        self.assertEqual(self.delay.call_count, 1)
+
+        self.tracker.flush()
+        room_scene = self.room.attributes.get("scene_data")
+        self.assertEqual(room_scene["participants"], {"Lysander"})
+        self.assertEqual(room_scene["start_time"], self.now)
+        self.assertEqual(room_scene["last_activity"], self.now + timedelta(seconds=30))
+        self.assertEqual(self.char.attributes.get("scene_data")["current_scene"], self.now)
+
+        writes = self.room.attributes.add.call_count
+        self.tracker.flush()
+        self.assertEqual(self.room.attributes.add.call_count, writes)
+
+    def test_participants_and_inactivity_reset(self):
+        """Test participants come and go and a quiet room starts a new scene."""
+        other = SimpleNamespace(key="Lyssa")
+        self.tracker.add_participant(self.room, other, now=self.now)
+        self.tracker.record_activity(self.char, now=self.now)
+        self.assertEqual(self.tracker.get_participants(self.room), {"Lyssa", "Lysander"})
+        self.assertEqual(self.tracker.discard_participant(self.room, other), {"Lysander"})
+
+        later = self.now + timedelta(hours=3)
+        self.tracker.record_activity(self.char, now=later)
+        self.assertEqual(self.tracker.get_room_scene(self.room).start_time, later)
@@ -0,0 +1,36 @@
+"""
+Test cases for the shared ID sequence allocator.
+"""
+from types import SimpleNamespace
+from django.test import TestCase
+from world.wod20th.utils.sequences import give_back, seed_values, take
+
+
+class TestSequences(TestCase):
+    def test_seed_values(self):
+        """Test a new sequence starts after the highest ID and lists the gaps."""
+        self.assertEqual(seed_values([3, None, 1, 6]), (7, []))
+        self.assertEqual(seed_values([3, None, 1, 6], reuse_gaps=True), (7, [2, 4, 5]))
+        self.assertEqual(seed_values([], reuse_gaps=True), (1, []))
+
+    def test_take_prefers_free_ids(self):
+        """Test gap-reusing sequences hand out free IDs lowest first."""
+        sequence = SimpleNamespace(next_value=7, free_ids=[2, 4])
+        self.assertEqual(take(sequence, reuse_gaps=True), 2)
+        self.assertEqual(take(sequence, reuse_gaps=True), 4)
+        self.assertEqual(take(sequence, reuse_gaps=True), 7)
+        self.assertEqual(sequence.next_value, 8)
+
+        sequence = SimpleNamespace(next_value=7, free_ids=[2])
+        self.assertEqual(take(sequence), 7)
+        self.assertEqual(sequence.free_ids, [2])
+
+    def test_give_back(self):
+        """Test released IDs are kept sorted and never duplicated or invented."""
+        sequence = SimpleNamespace(next_value=10, free_ids=[2, 8])
+        self.assertTrue(give_back(sequence, 5))
+        self.assertEqual(sequence.free_ids, [2, 5, 8])
+        self.assertFalse(give_back(sequence, 5))
+        self.assertFalse(give_back(sequence, 10))
+        self.assertFalse(give_back(sequence, 0))
+        self.assertEqual(sequence.free_ids, [2, 5, 8])
@@ -0,0 +1,45 @@
+"""
+Test cases for the +sheet render cache.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from django.test import TestCase
+from world.wod20th.utils.sheet_cache import SheetCache
+
+
+class TestSheetCache(TestCase):
+    def setUp(self):
+        """Set up an empty cache and a builder that counts calls."""
+        self.cache = SheetCache(max_entries=2)
+        self.build = MagicMock(return_value="Identity")
+        self.character = SimpleNamespace(id=1)
+
+    def test_hit_after_miss(self):
+        """Test a section is built once per signature."""
+        key = self.cache.make_key(self.character, 'staff', 78)
+        self.assertEqual(self.cache.section(key, (1,), 'identity', self.build), "Identity")
+        self.assertEqual(self.cache.section(key, (1,), 'identity', self.build), "Identity")
+        self.assertEqual(self.build.call_count, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_signature_change_rebuilds(self):
+        """Test a new stat version drops the cached sections."""
+        key = self.cache.make_key(self.character, 'staff', 78)
+        self.cache.section(key, (1,), 'identity', self.build)
+        self.cache.section(key, (2,), 'identity', self.build)
+        self.assertEqual(self.build.call_count, 2)
+
+    def test_viewer_classes_are_separate(self):
+        """Test owner and staff renders are cached independently."""
+        self.cache.section(self.cache.make_key(self.character, 'owner', 78), (1,), 'identity', self.build)
+        self.cache.section(self.cache.make_key(self.character, 'staff', 78), (1,), 'identity', self.build)
+        self.assertEqual(self.build.call_count, 2)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted."""
+        for char_id in (1, 2, 3):
+            key = self.cache.make_key(SimpleNamespace(id=char_id), 'staff', 78)
+            self.cache.section(key, (1,), 'identity', self.build)
+        self.assertEqual(self.cache.stats()['entries'], 2)
+        self.cache.invalidate(SimpleNamespace(id=3))
+        self.assertEqual(self.cache.stats()['entries'], 1)
@@ -0,0 +1,52 @@
+"""
+Test cases for the cached stat catalog.
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+from django.test import TestCase
+from world.wod20th.utils.stat_catalog import StatCatalog
+
+
+def make_stat(stat_id, name, category, stat_type, splat=None, gift_alias=None):
+    return SimpleNamespace(id=stat_id, name=name, category=category, stat_type=stat_type,
+                           splat=splat, gift_alias=gift_alias)
+
+
+class TestStatCatalog(TestCase):
+    def setUp(self):
+        """Set up a catalog over a handful of stats."""
+        self.stats = [
+            make_stat(1, 'Alertness', 'abilities', 'talent'),
+            make_stat(2, 'Razor Claws', 'powers', 'gift', 'Shifter', ['Claws of the Wyld']),
+            make_stat(3, 'Dominate', 'powers', 'discipline', 'Vampire'),
+        ]
+        patcher = patch('world.wod20th.models.Stat.objects')
+        self.mock_objects = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_objects.order_by.return_value = self.stats
+        self.catalog = StatCatalog()
+
+    def test_case_insensitive_name(self):
+        """Test lookup by name ignores case."""
+        self.assertEqual(self.catalog.get('alertness').id, 1)
+        self.assertIsNone(self.catalog.get('Athletics'))
+
+    def test_alias_lookup(self):
+        """Test gift aliases are only matched when asked for."""
+        self.assertIsNone(self.catalog.get('claws of the wyld'))
+        self.assertEqual(self.catalog.get_gift('claws of the wyld').name, 'Razor Claws')
+
+    def test_filters(self):
+        """Test category, type and splat filters."""
+        self.assertEqual([s.id for s in self.catalog.filter(category='powers')], [2, 3])
+        self.assertEqual([s.id for s in self.catalog.filter(splat='vampire')], [3])
+        self.assertIsNone(self.catalog.get('Dominate', stat_type='gift'))
+
+    def test_invalidate_reloads(self):
+        """Test rows are loaded once and reloaded after invalidation."""
+        self.catalog.all()
+        self.catalog.all()
+        self.assertEqual(self.mock_objects.order_by.call_count, 1)
+        self.catalog.invalidate()
+        self.catalog.all()
+        self.assertEqual(self.mock_objects.order_by.call_count, 2)
@@ -0,0 +1,114 @@
+"""
+Test cases for the incremental stat loader.
+"""
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from django.db import DatabaseError
+from django.test import TestCase
+from world.wod20th.utils.stat_loader import StatLoader, file_sha256
+
+FIELDS = ('id', 'name', 'category', 'stat_type', 'splat', 'description')
+
+
+class FakeStat:
+    """Stand-in for the Stat model that records no database state."""
+    _meta = SimpleNamespace(concrete_fields=[
+        SimpleNamespace(name=name, primary_key=(name == 'id')) for name in FIELDS
+    ])
+    objects = MagicMock()
+
+    def __init__(self, **values):
+        for name in FIELDS:
+            setattr(self, name, None)
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    @property
+    def pk(self):
+        return self.id
+
+    @pk.setter
+    def pk(self, value):
+        self.id = value
+
+    def apply_defaults(self):
+        pass
+
+    def save(self, update_fields=None):
+        if self.name == 'Broken':
+            raise DatabaseError("value too long")
+        if self.id is None:
+            self.id = 99
+
+
+def rows(data):
+    return [dict(row) for row in data]
+
+
+class TestStatLoader(TestCase):
+    def setUp(self):
+        """Set up a data file and patched models."""
+        handle, self.path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as f:
+            json.dump([
+                {'name': 'Alertness', 'category': 'abilities', 'stat_type': 'talent', 'description': 'Awareness'},
+                {'name': 'Athletics', 'category': 'abilities', 'stat_type': 'talent', 'description': 'Sports'},
+            ], f)
+        self.addCleanup(os.remove, self.path)
+
+        FakeStat.objects = MagicMock()
+        self.existing = FakeStat(id=1, name='Alertness', category='abilities',
+                                 stat_type='talent', description='Awareness')
+        FakeStat.objects.order_by.return_value = [self.existing]
+        FakeStat.objects.bulk_create.side_effect = lambda stats, **kwargs: stats
+
+        self.hashes = MagicMock()
+        for target, value in (
+            ('world.wod20th.models.Stat', FakeStat),
+            ('world.wod20th.models.DataFileHash', self.hashes),
+            ('world.wod20th.utils.stat_loader.transaction', MagicMock()),
+            ('world.wod20th.utils.stat_catalog.STAT_CATALOG', MagicMock()),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_unchanged_file_is_skipped(self):
+        """Test a file matching its recorded hash is not read."""
+        self.hashes.objects.filter.return_value.first.return_value = SimpleNamespace(
+            sha256=file_sha256(self.path))
+        FakeStat.objects.exists.return_value = True
+
+        result = StatLoader().load_file(self.path, rows)
+        self.assertTrue(result.skipped)
+        FakeStat.objects.bulk_create.assert_not_called()
+        FakeStat.objects.order_by.assert_not_called()
+
+    def test_only_new_rows_are_written(self):
+        """Test a changed file only creates rows that differ."""
+        self.hashes.objects.filter.return_value.first.return_value = None
+
+        result = StatLoader().load_file(self.path, rows)
+        self.assertEqual((result.created, result.updated, result.unchanged), (1, 0, 1))
+        created = FakeStat.objects.bulk_create.call_args[0][0]
+        self.assertEqual([stat.name for stat in created], ['Athletics'])
+        FakeStat.objects.bulk_update.assert_not_called()
+        self.hashes.objects.update_or_create.assert_called_once()
+
+    def test_bad_row_only_skips_itself(self):
+        """Test a rejected bulk write falls back to saving rows one at a time."""
+        self.hashes.objects.filter.return_value.first.return_value = None
+        FakeStat.objects.bulk_create.side_effect = DatabaseError("value too long")
+
+        def with_broken_row(data):
+            return rows(data) + [{'name': 'Broken', 'category': 'abilities', 'stat_type': 'talent'}]
+
+        result = StatLoader().load_file(self.path, with_broken_row)
+        self.assertEqual((result.created, result.unchanged), (1, 1))
+        self.assertEqual(len(result.failed), 1)
+        self.assertTrue(result.failed[0].startswith('Broken'))
+        # The hash is not recorded, so the failure is reported again next time
+        self.hashes.objects.update_or_create.assert_not_called()
@@ -0,0 +1,45 @@
+"""
+Test cases for +info full-text search.
+"""
+from django.test import TestCase
+from world.wod20th.models import Stat
+from world.wod20th.utils.stat_search import _fallback_snippet, search_stats
+
+
+class TestStatSearch(TestCase):
+    def setUp(self):
+        """Set up a few gifts and a discipline."""
+        self.claws = Stat.objects.create(
+            name="Razor Claws", description="The Garou sharpens her claws on stone.",
+            system="Spend one Rage.", game_line="Werewolf", category="powers", stat_type="gift")
+        Stat.objects.create(
+            name="Sense Wyrm", description="Smells the Wyrm, even on claws and teeth.",
+            game_line="Werewolf", category="powers", stat_type="gift")
+        Stat.objects.create(
+            name="Obfuscate", description="Hide from sight.",
+            game_line="Vampire", category="powers", stat_type="discipline")
+
+    def test_name_matches_rank_first(self):
+        """Test a name match outranks a description match."""
+        total, hits = search_stats("claws", stat_types=["gift"])
+        self.assertEqual(total, 2)
+        self.assertEqual(hits[0].stat.name, "Razor Claws")
+        self.assertIn("|y", hits[1].snippet)
+
+    def test_index_follows_saves(self):
+        """Test edits and deletes are searchable straight away."""
+        self.claws.description = "Talons like obsidian."
+        self.claws.save()
+        self.assertEqual(search_stats("obsidian")[0], 1)
+        self.claws.delete()
+        self.assertEqual(search_stats("obsidian")[0], 0)
+
+    def test_stat_type_filter(self):
+        """Test results are limited to the requested stat types."""
+        self.assertEqual(search_stats("hide", stat_types=["gift"])[0], 0)
+        self.assertEqual(search_stats("hide", stat_types=["discipline"])[0], 1)
+
+    def test_fallback_snippet(self):
+        """Test the fallback snippet highlights the matched word."""
+        snippet = _fallback_snippet(self.claws, ["stone"])
+        self.assertIn("|ystone|n", snippet)
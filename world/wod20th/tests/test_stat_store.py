@@ -0,0 +1,76 @@
+"""
+Test cases for the in-memory stat store.
+"""
+import copy
+from types import SimpleNamespace
+from django.test import TestCase
+from world.wod20th.utils.stat_store import StatStore
+
+
+class FakeAttributes:
+    """Minimal stand-in for Evennia's AttributeHandler."""
+
+    def __init__(self):
+        self.attrs = {}
+        self.saves = 0
+
+    def get(self, key, default=None, return_obj=False):
+        attr = self.attrs.get(key)
+        if attr is None:
+            return default
+        return attr if return_obj else copy.deepcopy(attr.db_value)
+
+    def add(self, key, value):
+        # Evennia pickles on save, so the stored value is always a new object
+        self.attrs[key] = SimpleNamespace(db_value=copy.deepcopy(value))
+        self.saves += 1
+
+
+class TestStatStore(TestCase):
+    def setUp(self):
+        """Set up a character with a small sheet."""
+        self.attributes = FakeAttributes()
+        self.attributes.add('stats', {
+            'abilities': {'talent': {'Alertness': {'perm': 2, 'temp': 2}}},
+            'secondary_abilities': {'secondary_skill': {'Archery': {'perm': 1, 'temp': 1}}},
+        })
+        self.attributes.saves = 0
+        self.store = StatStore(SimpleNamespace(attributes=self.attributes))
+
+    def test_get(self):
+        """Test reading values and defaults."""
+        self.assertEqual(self.store.get('abilities', 'talent', 'Alertness'), 2)
+        self.assertEqual(self.store.get('abilities', 'talent', 'Athletics'), 0)
+        self.assertEqual(self.store.find_name('secondary_abilities', 'secondary_skill', 'archery'), 'Archery')
+
+    def test_set_writes_through(self):
+        """Test that each set outside a batch is persisted."""
+        self.store.set('abilities', 'talent', 'Athletics', 3)
+        self.assertEqual(self.attributes.saves, 1)
+        stored = self.attributes.attrs['stats'].db_value
+        self.assertEqual(stored['abilities']['talent']['Athletics'], {'perm': 3, 'temp': 0})
+
+    def test_batch_flushes_once(self):
+        """Test that a batch coalesces writes into one save."""
+        with self.store.batch():
+            self.store.set('abilities', 'talent', 'Athletics', 3)
+            self.store.set('abilities', 'talent', 'Athletics', 3, temp=True)
+            self.store.delete('abilities', 'talent', 'Alertness')
+        self.assertEqual(self.attributes.saves, 1)
+        stored = self.attributes.attrs['stats'].db_value
+        self.assertNotIn('Alertness', stored['abilities']['talent'])
+
+    def test_version_bumps(self):
+        """Test that the version changes on every write."""
+        self.store.get('abilities', 'talent', 'Alertness')
+        before = self.store.version
+        self.store.set('abilities', 'talent', 'Alertness', 4)
+        self.assertGreater(self.store.version, before)
+
+    def test_external_write_reloads(self):
+        """Test that a direct write to the Attribute is picked up."""
+        self.assertEqual(self.store.get('abilities', 'talent', 'Alertness'), 2)
+        stats = self.attributes.get('stats')
+        stats['abilities']['talent']['Alertness']['perm'] = 5
+        self.attributes.add('stats', stats)
+        self.assertEqual(self.store.get('abilities', 'talent', 'Alertness'), 5)
@@ -0,0 +1,51 @@
+"""
+Test cases for the +watch reverse index.
+"""
+from unittest.mock import MagicMock
+from django.test import TestCase
+from utils.watch_index import WatchIndex
+
+
+def make_character(char_id, key, **attrs):
+    """Build a character double whose watch Attributes come from attrs."""
+    character = MagicMock()
+    character.id = char_id
+    character.key = key
+    character.attributes.get.side_effect = lambda name, default=None: attrs.get(name, default)
+    return character
+
+
+class TestWatchIndex(TestCase):
+    def setUp(self):
+        """Set up an index that skips the session rebuild."""
+        self.index = WatchIndex()
+        self.index._built = True
+        self.target = make_character(1, "Alice")
+
+    def test_only_watchers_are_returned(self):
+        """Test a notice reaches list and watch-all watchers only."""
+        fan = make_character(2, "Bob", watch_list=["alice"])
+        everyone = make_character(3, "Carol", watch_all=True)
+        other = make_character(4, "Dave", watch_list=["Erin"])
+        for watcher in (fan, everyone, other):
+            self.index.add(watcher)
+        self.assertCountEqual(self.index.watchers_of(self.target), [fan, everyone])
+
+    def test_inactive_and_offline_watchers_are_skipped(self):
+        """Test +watch/off and logging out drop a watcher."""
+        off = make_character(2, "Bob", watch_list=["Alice"], watch_active=False)
+        fan = make_character(3, "Carol", watch_list=["Alice"])
+        self.index.add(off)
+        self.index.add(fan)
+        self.index.discard(fan)
+        self.assertEqual(self.index.watchers_of(self.target), [])
+
+    def test_refresh_picks_up_list_changes(self):
+        """Test re-indexing after +watch/del removes the old entry."""
+        attrs = {"watch_list": ["Alice"]}
+        fan = make_character(2, "Bob")
+        fan.attributes.get.side_effect = lambda name, default=None: attrs.get(name, default)
+        self.index.add(fan)
+        attrs["watch_list"] = []
+        self.index.refresh(fan)
+        self.assertEqual(self.index.watchers_of(self.target), [])
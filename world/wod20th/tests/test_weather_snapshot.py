@@ -0,0 +1,50 @@
+"""
+Test cases for the shared weather snapshot.
+"""
+from datetime import datetime
+from unittest.mock import patch
+from django.test import TestCase
+from world.wod20th.utils.weather_snapshot import (
+    TIMEZONE, WeatherService, WeatherSnapshot, moon_phase_name, parse_tides
+)
+
+TIDE_DATA = {'predictions': [
+    {'t': '2024-06-01 03:10', 'type': 'L', 'v': '0.52'},
+    {'t': '2024-06-01 09:40', 'type': 'H', 'v': '4.81'},
+    {'t': '2024-06-01 15:05', 'type': 'L', 'v': '1.20'},
+    {'t': '2024-06-01 21:30', 'type': 'H', 'v': '5.97'},
+]}
+
+
+class TestWeatherSnapshot(TestCase):
+    def test_moon_phase_names(self):
+        """Test ephem phase values map to the names +weather shows."""
+        self.assertEqual(moon_phase_name(0), "New Moon")
+        self.assertEqual(moon_phase_name(50), "First Quarter")
+        self.assertEqual(moon_phase_name(100), "Full Moon")
+        self.assertEqual(moon_phase_name(170), "Waning Crescent")
+
+    def test_upcoming_tides_skip_past_ones(self):
+        """Test only tides after now are listed, two at most."""
+        snapshot = WeatherSnapshot(refreshed_at=0, moon_phase="New Moon", tides=parse_tides(TIDE_DATA))
+        now = TIMEZONE.localize(datetime(2024, 6, 1, 10, 0))
+        self.assertEqual(snapshot.upcoming_tides(now=now), [
+            ("Low", "03:05 PM", "1.2 ft"),
+            ("High", "09:30 PM", "6.0 ft"),
+        ])
+
+    @patch("world.wod20th.utils.weather_snapshot.compute_moon_phase", return_value="Full Moon")
+    @patch("evennia.server.models.ServerConfig")
+    def test_failed_lookups_keep_previous_values(self, server_config, moon):
+        """Test a refresh whose weather lookup failed keeps the last good weather."""
+        service = WeatherService()
+        service._snapshot = WeatherSnapshot(
+            refreshed_at=0, moon_phase="New Moon", weather={'temp': 70}, forecast={'temp': 68}
+        )
+        snapshot = service._store((None, {'temp': 72}, parse_tides(TIDE_DATA)))
+        self.assertEqual(snapshot.weather, {'temp': 70})
+        self.assertEqual(snapshot.forecast, {'temp': 72})
+        self.assertEqual(snapshot.moon_phase, "Full Moon")
+        self.assertEqual(len(snapshot.tides), 4)
+        self.assertIs(service.current(), snapshot)
+        server_config.objects.conf.assert_called_once_with("weather_snapshot", snapshot._asdict())
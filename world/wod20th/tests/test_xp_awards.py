@@ -0,0 +1,66 @@
+"""
+Test cases for batch weekly XP awards.
+"""
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+from django.test import TestCase
+from world.wod20th.utils.xp_awards import Candidate, parse_xp_data, plan_weekly_xp
+
+
+def make_candidate(key, xp, is_staff=False):
+    """Build a candidate whose xp Attribute holds the given value."""
+    character = MagicMock()
+    character.key = key
+    attribute = MagicMock()
+    attribute.db_value = xp
+    return Candidate(character, attribute if xp is not None else None, is_staff)
+
+
+@patch("evennia.utils.dbserialize.from_pickle", side_effect=lambda value: value)
+class TestWeeklyXPPlan(TestCase):
+    def test_only_active_players_are_awarded(self, from_pickle):
+        """Test players with scenes get XP; idle players, staff and bad data don't."""
+        active = make_candidate("Active", {'total': Decimal('10.00'), 'current': Decimal('3.00'),
+                                           'ic_xp': Decimal('8.00'), 'scenes_this_week': 2})
+        idle = make_candidate("Idle", {'total': Decimal('5.00'), 'current': Decimal('5.00'),
+                                       'scenes_this_week': 0})
+        staff = make_candidate("Staff", {'scenes_this_week': 9}, is_staff=True)
+        missing = make_candidate("Missing", None)
+        plan = plan_weekly_xp([active, idle, staff, missing], now=datetime(2024, 6, 1))
+
+        self.assertEqual([award.character.key for award in plan.awards], ["Active"])
+        self.assertEqual([name for name, _ in plan.ineligible], ["Idle"])
+        self.assertEqual(plan.issues, [("Missing", "No XP data found")])
+        self.assertEqual(plan.checked, 3)
+        self.assertEqual(plan.total_xp, Decimal('4.00'))
+
+        after = plan.awards[0].after
+        self.assertEqual(after['total'], Decimal('14.00'))
+        self.assertEqual(after['current'], Decimal('7.00'))
+        self.assertEqual(after['ic_xp'], Decimal('12.00'))
+        self.assertEqual(after['scenes_this_week'], 0)
+        self.assertEqual(after['spends'][0]['reason'], 'Weekly Activity')
+        # The plan never touches the stored data
+        self.assertEqual(active.attribute.db_value['scenes_this_week'], 2)
+
+    def test_report_summarises_the_plan(self, from_pickle):
+        """Test the dry-run report lists eligibility and totals."""
+        plan = plan_weekly_xp([make_candidate("Active", {'current': 1, 'scenes_this_week': 1})])
+        report = plan.report()
+        self.assertIn("Status: ELIGIBLE for 4.00 XP", report)
+        self.assertIn("New total would be: 5.00", report)
+        self.assertIn("- Total XP that would be awarded: 4.00", report)
+
+
+class TestParseXPData(TestCase):
+    def test_legacy_string_data(self):
+        """Test the repr of an old XP dict is parsed back into Decimals."""
+        data = parse_xp_data("{'total': Decimal('12.50'), 'current': Decimal('2.00'), 'scenes_this_week': 1}")
+        self.assertEqual(data['total'], Decimal('12.50'))
+        self.assertEqual(data['scenes_this_week'], 1)
+
+    def test_invalid_data_raises(self):
+        """Test data that is not a dict is rejected."""
+        with self.assertRaises(ValueError):
+            parse_xp_data("not xp")
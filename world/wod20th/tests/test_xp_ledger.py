@@ -0,0 +1,88 @@
+"""
+Test cases for the XP ledger and the XPMonitor cursor.
+"""
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from django.test import TestCase
+from world.wod20th.scripts.weekly_xp import XPMonitor
+from world.wod20th.utils.xp_ledger import record_xp_event
+
+
+class TestXPLedger(TestCase):
+    def make_character(self, xp):
+        """A character stand-in whose xp Attribute holds the given value."""
+        return SimpleNamespace(key="Lysander", attributes=SimpleNamespace(get={'xp': xp}.get))
+
+    @patch("world.wod20th.models.XPLedgerEntry")
+    def test_entry_snapshots_xp_after_the_change(self, entry_model):
+        """Test an entry records the amount and the XP totals after the change."""
+        character = self.make_character({'total': 14, 'current': '7.5', 'spent': Decimal('6.499'),
+                                         'ic_xp': None, 'scenes_this_week': 3})
+        record_xp_event(character, 'receive', 4.005, "Weekly Activity" * 30)
+
+        fields = entry_model.objects.create.call_args.kwargs
+        self.assertIs(fields['character'], character)
+        self.assertEqual(fields['event'], 'receive')
+        self.assertEqual(fields['amount'], Decimal('4.00'))
+        self.assertEqual(len(fields['reason']), 255)
+        self.assertEqual((fields['total'], fields['current'], fields['spent'], fields['ic_xp']),
+                         (Decimal('14.00'), Decimal('7.50'), Decimal('6.50'), Decimal('0.00')))
+        self.assertEqual(fields['scenes_this_week'], 3)
+
+    @patch("world.wod20th.models.XPLedgerEntry")
+    def test_failed_write_returns_none(self, entry_model):
+        """Test a ledger failure is logged rather than breaking the XP change."""
+        entry_model.objects.create.side_effect = RuntimeError("database is locked")
+        self.assertIsNone(record_xp_event(self.make_character(None), 'spend', 1))
+
+
+class TestXPMonitorCursor(TestCase):
+    def make_monitor(self, last_ledger_id, states=None):
+        """A stand-in for the script's Attribute storage."""
+        return SimpleNamespace(db=SimpleNamespace(last_ledger_id=last_ledger_id, last_xp_states=states))
+
+    def make_entry(self, entry_id, key, total):
+        entry = MagicMock(id=entry_id)
+        entry.character.key = key
+        entry.as_state.return_value = {'total': Decimal(total)}
+        return entry
+
+    @patch("world.wod20th.scripts.weekly_xp.get_latest_xp_event_id", return_value=41)
+    def test_new_monitor_starts_at_end_of_ledger(self, latest):
+        """Test a fresh monitor skips history instead of replaying it."""
+        monitor = self.make_monitor(None)
+        XPMonitor.at_start(monitor)
+        self.assertEqual(monitor.db.last_ledger_id, 41)
+
+        monitor.db.last_ledger_id = 50
+        XPMonitor.at_start(monitor)
+        self.assertEqual(monitor.db.last_ledger_id, 50)
+
+    @patch("world.wod20th.scripts.weekly_xp.get_xp_events_since")
+    def test_consumes_only_new_entries(self, events_since):
+        """Test each tick reads past the cursor, keeps the latest state and advances."""
+        events_since.return_value = [
+            self.make_entry(42, "Lysander", '10'),
+            self.make_entry(43, "Lyssa", '5'),
+            self.make_entry(44, "Lysander", '14'),
+        ]
+        monitor = self.make_monitor(41, {"Bob": {'total': Decimal('3')}})
+        XPMonitor.at_repeat(monitor)
+
+        events_since.assert_called_once_with(41)
+        self.assertEqual(monitor.db.last_ledger_id, 44)
+        self.assertEqual(monitor.db.last_xp_states, {
+            "Bob": {'total': Decimal('3')},
+            "Lysander": {'total': Decimal('14')},
+            "Lyssa": {'total': Decimal('5')},
+        })
+
+    @patch("world.wod20th.scripts.weekly_xp.get_xp_events_since", return_value=[])
+    def test_idle_tick_writes_nothing(self, events_since):
+        """Test a tick with no new entries leaves the stored state alone."""
+        states = {"Bob": {'total': Decimal('3')}}
+        monitor = self.make_monitor(44, states)
+        XPMonitor.at_repeat(monitor)
+        self.assertEqual(monitor.db.last_ledger_id, 44)
+        self.assertIs(monitor.db.last_xp_states, states)
@@ -0,0 +1,210 @@
+"""
+Population census for +census.
+
+Each +census breakdown used to query every character and unpickle its
+``stats`` Attribute again, so one census read the whole roster about ten
+times. The Census reads the ``stats`` and ``approved`` Attributes of every
+character in one query, works out what each character contributes to every
+breakdown in a single pass, and keeps the totals in memory.
+
+Characters are kept up to date one at a time: touch() marks a character
+whose sheet or approval changed, and the next read recomputes just those
+characters. StatStore touches the census whenever it writes a sheet or
+notices an external write, and the approval commands touch it too. Edits
+that bypass both are picked up by a full rebuild once the totals are
+REBUILD_AFTER seconds old.
+
+Usage:
+    from world.wod20th.utils.census import CENSUS
+
+    CENSUS.counts('splat')              # {'Vampire': 12, 'Mage': 7, ...}
+    CENSUS.touch(character)
+"""
+import time
+from collections import Counter
+from typing import Dict, Tuple
+
+from world.wod20th.utils.changeling_utils import KITH
+from world.wod20th.utils.mage_utils import CONVENTION, NEPHANDI_FACTION, TRADITION
+from world.wod20th.utils.mortalplus_utils import MORTALPLUS_TYPE_CHOICES
+from world.wod20th.utils.shifter_utils import GAROU_TRIBE_CHOICES
+from world.wod20th.utils.stat_store import add_change_listener
+from world.wod20th.utils.vampire_utils import CLAN_CHOICES
+
+CHARACTER_TYPECLASS = 'typeclasses.characters.Character'
+# Seconds before the totals are rebuilt from the database regardless
+REBUILD_AFTER = 3600
+
+BREAKDOWNS = (
+    'splat', 'mage', 'mortal+', 'changeling', 'vampire', 'shifter', 'garou',
+    'discipline', 'merits', 'spheres',
+)
+
+VALID_SPLATS = {
+    'vampire': 'Vampire',
+    'mage': 'Mage',
+    'shifter': 'Shifter',
+    'changeling': 'Changeling',
+    'mortal+': 'Mortal+',
+    'mortal': 'Mortal',
+    'companion': 'Companion',
+    'possessed': 'Possessed',
+}
+VALID_AFFILIATIONS = {name.lower(): name for name in (*TRADITION, *CONVENTION, *NEPHANDI_FACTION)}
+VALID_MORTALPLUS_TYPES = {choice[0].lower(): choice[1] for choice in MORTALPLUS_TYPE_CHOICES}
+VALID_KITHS = {kith.lower(): kith for kith in KITH}
+VALID_CLANS = {choice[0].lower(): choice[1] for choice in CLAN_CHOICES}
+VALID_TRIBES = {choice[0].lower(): choice[1] for choice in GAROU_TRIBE_CHOICES}
+
+Contribution = Dict[str, Tuple[str, ...]]
+
+
+def _perm(stats, stat_type, category, name, default=''):
+    entry = stats.get(stat_type, {}).get(category, {}).get(name, {})
+    return entry.get('perm', default) if isinstance(entry, dict) else default
+
+
+def _named(value, valid):
+    """Normalise a lineage value, or return None for blanks and 'none'/'unknown'."""
+    if not value or not isinstance(value, str) or value.lower() in ('none', 'unknown'):
+        return None
+    return valid.get(value.lower(), value)
+
+
+def _rated(stats, stat_type, category):
+    """Return the names in a category with a perm rating above zero."""
+    entries = stats.get(stat_type, {}).get(category, {})
+    if not isinstance(entries, dict):
+        return ()
+    rated = []
+    for name, entry in entries.items():
+        try:
+            if isinstance(entry, dict) and entry.get('perm', 0) > 0:
+                rated.append(name)
+        except TypeError:
+            continue
+    return tuple(rated)
+
+
+def character_census(stats, approved) -> Contribution:
+    """
+    Work out what one character adds to each breakdown.
+
+    Returns:
+        dict: Breakdown name to the keys this character counts towards.
+            Empty for unapproved characters and characters without stats.
+    """
+    if not stats or not approved or not isinstance(stats, dict):
+        return {}
+    contribution = {}
+
+    def add(breakdown, *keys):
+        keys = tuple(key for key in keys if key is not None)
+        if keys:
+            contribution[breakdown] = keys
+
+    splat = _perm(stats, 'other', 'splat', 'Splat')
+    add('splat', _named(splat, VALID_SPLATS))
+    add('merits', *_rated(stats, 'merits', 'merit'))
+
+    if splat == 'Mage':
+        add('mage', _named(_perm(stats, 'identity', 'lineage', 'Tradition'), VALID_AFFILIATIONS))
+        add('spheres', *_rated(stats, 'powers', 'sphere'))
+    elif splat == 'Mortal+':
+        add('mortal+', _named(_perm(stats, 'identity', 'lineage', 'Type'), VALID_MORTALPLUS_TYPES))
+    elif splat == 'Changeling':
+        add('changeling', _named(_perm(stats, 'identity', 'lineage', 'Kith'), VALID_KITHS))
+    elif splat == 'Vampire':
+        add('vampire', _named(_perm(stats, 'identity', 'lineage', 'Clan'), VALID_CLANS))
+    elif splat == 'Shifter':
+        shifter_type = _perm(stats, 'identity', 'lineage', 'Type', default='Unknown')
+        add('shifter', shifter_type)
+        if shifter_type == 'Garou':
+            add('garou', _named(_perm(stats, 'identity', 'lineage', 'Tribe'), VALID_TRIBES))
+    if splat in ('Vampire', 'Mortal+'):  # Include ghouls
+        add('discipline', *_rated(stats, 'powers', 'discipline'))
+    return contribution
+
+
+class Census:
+    """Census totals for approved characters, updated per character."""
+
+    def __init__(self):
+        self._contributions: Dict[int, Contribution] = {}
+        self._totals: Dict[str, Counter] = {name: Counter() for name in BREAKDOWNS}
+        self._dirty = set()
+        self._built_at = None
+
+    def counts(self, breakdown: str) -> Dict[str, int]:
+        """Return the current counts for one breakdown."""
+        if breakdown not in self._totals:
+            raise KeyError(f"Unknown census breakdown: {breakdown}")
+        self._refresh()
+        return {key: total for key, total in self._totals[breakdown].items() if total > 0}
+
+    def touch(self, character):
+        """Recount a character on the next read."""
+        if self._built_at is not None:
+            self._dirty.add(character.id)
+
+    def invalidate(self):
+        """Rebuild everything on the next read."""
+        self._built_at = None
+        self._dirty.clear()
+
+    def _refresh(self):
+        if self._built_at is None or time.time() - self._built_at > REBUILD_AFTER:
+            self.rebuild()
+        elif self._dirty:
+            self._recount(self._dirty)
+            self._dirty = set()
+
+    def rebuild(self):
+        """Recount every character from the database in one query."""
+        from evennia.objects.models import ObjectDB
+        from evennia.utils.dbserialize import from_pickle
+
+        values = {}
+        rows = ObjectDB.db_attributes.through.objects.filter(
+            objectdb__db_typeclass_path__contains=CHARACTER_TYPECLASS,
+            attribute__db_key__in=('stats', 'approved'),
+            attribute__db_category__isnull=True,
+        ).values_list('objectdb_id', 'attribute__db_key', 'attribute__db_value')
+        for char_id, key, value in rows:
+            values.setdefault(char_id, {})[key] = value
+
+        self._contributions = {}
+        self._totals = {name: Counter() for name in BREAKDOWNS}
+        self._dirty = set()
+        for char_id, attrs in values.items():
+            if not attrs.get('approved') or not attrs.get('stats'):
+                continue
+            self._apply(char_id, character_census(from_pickle(attrs['stats']), True))
+        self._built_at = time.time()
+
+    def _recount(self, char_ids):
+        """Recompute the contributions of a few characters."""
+        from evennia.objects.models import ObjectDB
+
+        found = set()
+        for character in ObjectDB.objects.filter(id__in=char_ids):
+            found.add(character.id)
+            store = getattr(character, 'stat_store', None)
+            stats = store.stats if store else character.attributes.get('stats')
+            self._apply(character.id, character_census(stats, character.attributes.get('approved')))
+        for char_id in set(char_ids) - found:
+            self._apply(char_id, {})
+
+    def _apply(self, char_id: int, contribution: Contribution):
+        """Swap a character's previous contribution for a new one."""
+        previous = self._contributions.pop(char_id, {})
+        for breakdown, keys in previous.items():
+            self._totals[breakdown].subtract(keys)
+        for breakdown, keys in contribution.items():
+            self._totals[breakdown].update(keys)
+        if contribution:
+            self._contributions[char_id] = contribution
+
+
+CENSUS = Census()
+add_change_listener(CENSUS.touch)
@@ -0,0 +1,226 @@
+"""
+Denormalized directory of player characters for the website.
+
+The web character list and the wiki search used to load every character,
+query its permission tags and read half a dozen Attributes each, then
+filter, sort and page in Python. CharacterDirectoryEntry keeps one row per
+player character with everything those pages need: name, approval, staff
+and storyteller flags, splat and profile text. Both pages are now a single
+paginated query on that table.
+
+Rows are kept current by the signal handlers in world.wod20th.signals:
+renames, permission tag changes, saves of the profile Attributes and
+StatStore writes (for the splat). rebuild_directory() repopulates the whole
+table in a handful of queries; it runs at server start when the table is
+empty and from the rebuild_character_directory management command.
+
+Usage:
+    from world.wod20th.utils.character_directory import listed_entries, search_entries
+
+    listed_entries()                    # approved, non-staff characters by name
+    search_entries(["alice", "hooks"])  # matching entries with .search_rank
+"""
+from django.db import transaction
+from django.db.models import Q
+
+# Characters for the website: any character typeclass except NPCs
+CHARACTER_TYPECLASS = 'character'
+NPC_TYPECLASS = 'npc'
+STAFF_PERMISSIONS = frozenset(("developer", "admin", "builder"))
+STORYTELLER_PERMISSION = "storyteller"
+# Profile Attributes shown on and searched by the website, in search order
+PROFILE_FIELDS = ('biography', 'rp_hooks', 'full_name', 'appears_as', 'occupation', 'affiliation')
+# Attributes whose saves change a directory row
+DIRECTORY_ATTRIBUTES = frozenset(PROFILE_FIELDS) | {'approved'}
+BULK_BATCH_SIZE = 500
+
+
+def is_directory_character(obj) -> bool:
+    """Return True if an object belongs in the directory."""
+    path = (getattr(obj, 'db_typeclass_path', None) or '').lower()
+    return CHARACTER_TYPECLASS in path and NPC_TYPECLASS not in path
+
+
+def _splat(stats) -> str:
+    try:
+        splat = stats['other']['splat']['Splat']['perm']
+    except (KeyError, TypeError):
+        return ''
+    return splat if isinstance(splat, str) else ''
+
+
+def entry_fields(name, attributes, permissions, stats) -> dict:
+    """
+    Build the directory columns for one character.
+
+    Args:
+        name (str): The character's key.
+        attributes (dict): Attribute key to value for DIRECTORY_ATTRIBUTES.
+        permissions (iterable): The character's permission tag keys.
+        stats (dict): The character's sheet, for the splat.
+    """
+    permissions = {str(perm).lower() for perm in permissions}
+    fields = {
+        'name': name,
+        'approved': bool(attributes.get('approved')),
+        'is_staff': bool(permissions & STAFF_PERMISSIONS),
+        'is_storyteller': STORYTELLER_PERMISSION in permissions,
+        'splat': _splat(stats)[:50],
+    }
+    for field in PROFILE_FIELDS:
+        value = attributes.get(field)
+        fields[field] = value if isinstance(value, str) else ''
+    fields['search_text'] = "\n".join(fields[field] for field in PROFILE_FIELDS).lower()
+    return fields
+
+
+def _load_attributes(exclude_attribute=None, **scope):
+    """Return {character id: {key: value}} for the directory Attributes in scope."""
+    from evennia.objects.models import ObjectDB
+    from evennia.utils.dbserialize import from_pickle
+
+    rows = ObjectDB.db_attributes.through.objects.filter(
+        attribute__db_key__in=DIRECTORY_ATTRIBUTES | {'stats'},
+        attribute__db_category__isnull=True, **scope,
+    )
+    if exclude_attribute is not None:
+        rows = rows.exclude(attribute_id=exclude_attribute)
+    attributes = {}
+    for char_id, key, value in rows.values_list('objectdb_id', 'attribute__db_key', 'attribute__db_value'):
+        attributes.setdefault(char_id, {})[key] = from_pickle(value)
+    return attributes
+
+
+def _load_permissions(**scope):
+    """Return {character id: [permission tag keys]} for the characters in scope."""
+    from evennia.objects.models import ObjectDB
+
+    permissions = {}
+    for char_id, perm in ObjectDB.db_tags.through.objects.filter(
+        tag__db_tagtype='permission', **scope,
+    ).values_list('objectdb_id', 'tag__db_key'):
+        permissions.setdefault(char_id, []).append(perm)
+    return permissions
+
+
+def refresh_entry(character, exclude_attribute=None):
+    """
+    Write the directory row for one character, or drop it if it no longer belongs.
+
+    Attributes and tags are read from the database rather than the
+    character's handlers, whose caches lag behind during the save signals
+    that call this.
+
+    Args:
+        character (ObjectDB): The character.
+        exclude_attribute (int, optional): Id of an Attribute that is being
+            deleted and should be treated as already gone.
+    """
+    from world.wod20th.models import CharacterDirectoryEntry
+
+    if not is_directory_character(character):
+        CharacterDirectoryEntry.objects.filter(character_id=character.id).delete()
+        return None
+    attributes = _load_attributes(exclude_attribute, objectdb_id=character.id).get(character.id, {})
+    permissions = _load_permissions(objectdb_id=character.id).get(character.id, ())
+    entry, _ = CharacterDirectoryEntry.objects.update_or_create(
+        character_id=character.id,
+        defaults=entry_fields(character.db_key, attributes, permissions, attributes.get('stats')),
+    )
+    return entry
+
+
+def update_splat(character):
+    """Bring a character's splat up to date after a sheet write."""
+    from world.wod20th.models import CharacterDirectoryEntry
+
+    char_id = getattr(character, 'id', None)
+    if char_id is None:
+        return
+    store = getattr(character, 'stat_store', None)
+    splat = _splat(store.stats if store else character.attributes.get('stats'))[:50]
+    CharacterDirectoryEntry.objects.filter(character_id=char_id).exclude(splat=splat).update(splat=splat)
+
+
+def rebuild_directory() -> int:
+    """
+    Repopulate the whole directory.
+
+    Four queries regardless of the number of characters: characters, their
+    directory Attributes, their permission tags, and the bulk insert.
+
+    Returns:
+        int: The number of rows written.
+    """
+    from evennia.objects.models import ObjectDB
+    from world.wod20th.models import CharacterDirectoryEntry
+
+    characters = ObjectDB.objects.filter(
+        db_typeclass_path__icontains=CHARACTER_TYPECLASS
+    ).exclude(db_typeclass_path__icontains=NPC_TYPECLASS).values_list('id', 'db_key')
+    in_scope = {'objectdb__db_typeclass_path__icontains': CHARACTER_TYPECLASS}
+    attributes = _load_attributes(**in_scope)
+    permissions = _load_permissions(**in_scope)
+
+    entries = []
+    for char_id, name in characters:
+        attrs = attributes.get(char_id, {})
+        entries.append(CharacterDirectoryEntry(
+            character_id=char_id,
+            **entry_fields(name, attrs, permissions.get(char_id, ()), attrs.get('stats')),
+        ))
+    with transaction.atomic():
+        CharacterDirectoryEntry.objects.all().delete()
+        CharacterDirectoryEntry.objects.bulk_create(entries, batch_size=BULK_BATCH_SIZE)
+    return len(entries)
+
+
+def ensure_directory():
+    """Build the directory if it has never been built."""
+    from world.wod20th.models import CharacterDirectoryEntry
+
+    if not CharacterDirectoryEntry.objects.exists():
+        return rebuild_directory()
+    return 0
+
+
+def listed_entries():
+    """Approved player characters, excluding staff and storytellers, by name."""
+    from world.wod20th.models import CharacterDirectoryEntry
+
+    return CharacterDirectoryEntry.objects.filter(
+        approved=True, is_staff=False, is_storyteller=False
+    ).select_related('character').order_by('name')
+
+
+def search_rank(entry, words) -> int:
+    """Score an entry the way the wiki search always has."""
+    name = entry.name.lower()
+    score = 0
+    for word in words:
+        if word in name:
+            score += 50 if word == name else 10
+    for field in PROFILE_FIELDS:
+        value = getattr(entry, field).lower()
+        score += 2 * sum(1 for word in words if word in value)
+    return score
+
+
+def search_entries(words):
+    """
+    Return the entries whose name or profile contains any of the words.
+
+    Each entry is given a ``search_rank``. Only matching rows are loaded.
+    """
+    from world.wod20th.models import CharacterDirectoryEntry
+
+    words = [word.lower() for word in words if word]
+    if not words:
+        return []
+    query = Q()
+    for word in words:
+        query |= Q(name__icontains=word) | Q(search_text__contains=word)
+    entries = list(CharacterDirectoryEntry.objects.filter(query))
+    for entry in entries:
+        entry.search_rank = search_rank(entry, words)
+    return entries
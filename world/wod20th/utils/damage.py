@@ -1,7 +1,127 @@
 from evennia.utils.ansi import ANSIString
+from typing import NamedTuple, Tuple
 import time
 
 
+# Health levels above Incapacitated: (bonus key, display name, penalty suffix)
+HEALTH_LEVELS = (
+    ('bruised', "Bruised", ""),
+    ('hurt', "Hurt", " (-1)"),
+    ('injured', "Injured", " (-1)"),
+    ('wounded', "Wounded", " (-2)"),
+    ('mauled', "Mauled", " (-2)"),
+    ('crippled', "Crippled", " (-5)"),
+)
+# Seconds a Gurahl Rage health boost lasts
+RAGE_BOOST_DURATION = 28800
+
+
+class HealthTrack(NamedTuple):
+    """A character's health levels, worked out from their sheet and Rage boost."""
+    # Bonus boxes per level, in HEALTH_LEVELS order
+    bonuses: Tuple[int, ...]
+    # (name, penalty suffix) for every box from Bruised to Incapacitated
+    levels: Tuple[Tuple[str, str], ...]
+    # What lies past Incapacitated: ('Dead',) or ('Torpor', 'Final Death')
+    final: Tuple[str, ...]
+
+    @property
+    def bonus(self) -> int:
+        """Total bonus health levels."""
+        return sum(self.bonuses)
+
+    def injury(self, total_damage, agg_damage=0) -> Tuple[str, str]:
+        """
+        Return the injury marker for an amount of damage: the (name, penalty
+        suffix) of the last box it fills, or ('Healthy', '') if unhurt.
+
+        Damage is not part of the track, so this is worked out per call.
+        """
+        past_incapacitated = agg_damage - len(self.levels)
+        if past_incapacitated > 0:
+            return self.final[min(past_incapacitated, len(self.final)) - 1], ""
+        if total_damage <= 0:
+            return "Healthy", ""
+        return self.levels[min(total_damage, len(self.levels)) - 1]
+
+
+def build_health_track(bruised_bonus=0, rage_bonus=0, rage_level=None, vampire=False):
+    """
+    Build a HealthTrack from its inputs. Pure; reads and writes nothing.
+
+    Args:
+        bruised_bonus (int): Extra Bruised levels from merits, kith, phyla and auspice
+        rage_bonus (int): Extra levels bought with Gurahl Rage
+        rage_level (str): Which level the Rage levels are added to; Bruised if unset
+        vampire (bool): Whether the track ends in Torpor and Final Death
+    """
+    rage_level = (rage_level or 'bruised').lower()
+    bonuses = []
+    levels = []
+    for key, name, penalty in HEALTH_LEVELS:
+        bonus = bruised_bonus if key == 'bruised' else 0
+        if rage_bonus and key == rage_level:
+            bonus += rage_bonus
+        bonuses.append(bonus)
+        levels.extend([(name, penalty)] * (1 + bonus))
+    levels.append(("Incapacitated", ""))
+    final = ("Torpor", "Final Death") if vampire else ("Dead",)
+    return HealthTrack(tuple(bonuses), tuple(levels), final)
+
+
+def _bruised_bonus(character):
+    """Extra Bruised levels from Huge Size, Troll kith, Glome phyla and Warrior auspice."""
+    bonus = 0
+    # Huge Size always grants 1 additional Bruised level regardless of rating
+    if (character.get_stat('merits', 'physical', 'Huge Size', temp=False)
+            or character.get_stat('merits', 'merit', 'Huge Size', temp=False)):
+        bonus += 1
+    for stat, value, levels in (('Kith', 'troll', 1), ('Phyla', 'glome', 2), ('Auspice', 'warrior', 1)):
+        found = character.get_stat('identity', 'lineage', stat)
+        if isinstance(found, str) and found.lower() == value:
+            bonus += levels
+    return bonus
+
+
+def rage_health_boost(character, now=None):
+    """
+    Return (levels, level type) of a character's live Gurahl Rage health boost.
+
+    An expired boost counts as (0, None); expire_rage_health() clears it.
+    """
+    amount = character.attributes.get('bonus_health_from_rage') or 0
+    if not amount:
+        return 0, None
+    started = character.attributes.get('health_boost_timestamp')
+    if started is None or (now or time.time()) - started > RAGE_BOOST_DURATION:
+        return 0, None
+    return amount, character.attributes.get('rage_health_level_type')
+
+
+def health_track(character):
+    """
+    Return the character's HealthTrack without writing anything.
+
+    The track is cached on the character (in ndb) against its StatStore
+    version and Rage boost, so display paths recompute it only after the
+    sheet changes.
+    """
+    rage = rage_health_boost(character)
+    store = getattr(character, 'stat_store', None)
+    key = (store.current_version(), rage) if store else None
+    cached = character.ndb.health_track
+    if key is not None and cached and cached[0] == key:
+        return cached[1]
+
+    track = build_health_track(
+        _bruised_bonus(character), rage[0], rage[1],
+        vampire=character.get_stat('other', 'splat', 'Splat') == "Vampire",
+    )
+    if key is not None:
+        character.ndb.health_track = (key, track)
+    return track
+
+
 def calculate_total_health_levels(character):
     """Calculate total health levels including all bonuses.
     
@@ -12,94 +132,34 @@ def calculate_total_health_levels(character):
     - Ratkin Warrior auspice: 1 additional Bruised level
     - Gurahl Rage boost: X additional levels at specific positions (based on Rage spent)
 
+    Read-only; see health_track().
     """
-    # Basic health level counts
-    bonus_bruised = 0
-    
-    # Check for Huge Size merit - check both locations
-    huge_size = character.get_stat('merits', 'physical', 'Huge Size', temp=False)
-    if not huge_size:  # Check alternate location
-        huge_size = character.get_stat('merits', 'merit', 'Huge Size', temp=False)
-    
-    if huge_size:
-        # Huge Size always grants 1 additional Bruised level regardless of rating
-        bonus_bruised += 1
-    
-    # Check for Troll kith
-    kith = character.get_stat('identity', 'lineage', 'Kith')
-    if kith and kith.lower() == 'troll':
-        bonus_bruised += 1
-        
-    # Check for Glome phyla
-    phyla = character.get_stat('identity', 'lineage', 'Phyla')
-    if phyla and phyla.lower() == 'glome':
-        bonus_bruised += 2
-
-    # Check for Warrior auspice
-    auspice = character.get_stat('identity', 'lineage', 'Auspice')
-    if auspice and auspice.lower() == 'warrior':
-        bonus_bruised += 1
-    
-    # Initialize health level bonuses if it doesn't exist or is None
-    if not hasattr(character.db, 'health_level_bonuses') or character.db.health_level_bonuses is None:
-        character.db.health_level_bonuses = {
-            'bruised': bonus_bruised,
-            'hurt': 0,
-            'injured': 0,
-            'wounded': 0,
-            'mauled': 0,
-            'crippled': 0
-        }
-    else:
-        # Update the base bruised level bonuses (from merits, etc.)
-        character.db.health_level_bonuses['bruised'] = bonus_bruised
-        
-    # Add bonus health from Gurahl Rage expenditure
-    if hasattr(character.db, 'bonus_health_from_rage') and character.db.bonus_health_from_rage:
-        # Check if the health boost is stale (older than 8 hours)
-        current_time = time.time()
-        health_boost_time = getattr(character.db, 'health_boost_timestamp', None)
-        
-        # If there's no timestamp or it's older than 8 hours (28800 seconds), clear the boost
-        if health_boost_time is None or (current_time - health_boost_time > 28800):
-            # Clear stale health boost
-            character.db.bonus_health_from_rage = 0
-            character.db.rage_health_level_type = None
-            
-            # Also remove from attribute_boosts if it exists there
-            if hasattr(character.db, 'attribute_boosts') and character.db.attribute_boosts:
-                for stat_name, boost_info in list(character.db.attribute_boosts.items()):
-                    if boost_info.get('is_health_boost', False):
-                        del character.db.attribute_boosts[stat_name]
-                        break
-            
-            # Log the automatic cleanup
-            character.msg("|yYour Rage health boost has expired.|n")
-        else:
-            # Not stale, apply the boost normally
-            rage_bonus = character.db.bonus_health_from_rage
-            # Get the level type with a proper null check
-            rage_level_type = None
-            if hasattr(character.db, 'rage_health_level_type'):
-                rage_level_type = character.db.rage_health_level_type
-                if rage_level_type is not None:
-                    rage_level_type = rage_level_type.lower()
-            
-            # Default to 'bruised' if not set or None
-            if not rage_level_type:
-                rage_level_type = 'bruised'
-            
-            # Add the rage bonus to the appropriate level type
-            if rage_level_type in character.db.health_level_bonuses:
-                character.db.health_level_bonuses[rage_level_type] += rage_bonus
-    
-    # Calculate total bonus health
-    total_bonus = sum(character.db.health_level_bonuses.values())
-    
-    # Store total bonus health for use in other functions
-    character.db.bonus_health = total_bonus
-        
-    return total_bonus
+    return health_track(character).bonus
+
+
+def expire_rage_health(character):
+    """
+    Clear a Gurahl Rage health boost that has run out. Returns True if one did.
+
+    Called by the damage and healing APIs; display paths just ignore a stale boost.
+    """
+    if not character.attributes.get('bonus_health_from_rage'):
+        return False
+    if rage_health_boost(character)[0]:
+        return False
+    character.db.bonus_health_from_rage = 0
+    character.db.rage_health_level_type = None
+
+    # Also remove from attribute_boosts if it exists there
+    boosts = character.db.attribute_boosts
+    if boosts:
+        for stat_name, boost_info in list(boosts.items()):
+            if boost_info.get('is_health_boost', False):
+                del character.db.attribute_boosts[stat_name]
+                break
+
+    character.msg("|yYour Rage health boost has expired.|n")
+    return True
 
 def apply_damage_or_healing(character, change, damage_type):
     """Apply damage or healing to a character.
@@ -115,15 +175,12 @@ def apply_damage_or_healing(character, change, damage_type):
     current_bashing = character.db.bashing or 0
     current_lethal = character.db.lethal or 0
     current_agg = character.db.agg or 0
-    base_health = character.get_stat('other', 'other', 'Health') or 7
-    
-    # Calculate bonus health levels
-    bonus_health = calculate_total_health_levels(character)
-    
-    # Add bonus health to base health
-    health_levels = base_health + bonus_health
-    
-    char_type = character.db.char_type or "mortal"
+
+    # Seven boxes from Bruised to Incapacitated, plus any bonus levels
+    expire_rage_health(character)
+    track = health_track(character)
+    health_levels = len(track.levels)
+
     injury_level = character.db.injury_level or "Healthy"
 
     new_bashing = current_bashing
@@ -187,7 +244,7 @@ def apply_damage_or_healing(character, change, damage_type):
                 new_agg -= heal_amount
 
     total_damage = new_bashing + new_lethal + new_agg
-    new_injury_level = calculate_injury_level(total_damage, health_levels, new_agg, char_type)
+    new_injury_level = track.injury(total_damage, new_agg)[0]
 
     # Update character attributes
     character.db.bashing = new_bashing
@@ -197,36 +254,6 @@ def apply_damage_or_healing(character, change, damage_type):
 
     return new_injury_level
 
-def calculate_injury_level(total_damage, health_levels, agg_damage, char_type):
-    """Calculate injury level based on damage and health levels."""
-    if char_type == "vampire":
-        if agg_damage >= health_levels + 2:
-            return "Final Death"
-        elif agg_damage >= health_levels + 1:
-            return "Torpor"
-    else:
-        if agg_damage >= health_levels + 1:
-            return "Dead"
-            
-    # Defines the injury levels and thresholds based on a standard character
-    # This needs to account for the variable number of each health level type
-    # For now, we'll use a simpler approach based on total damage vs. health levels remaining (so when crippled, you have 1 health level remaining for instance)
-    if total_damage >= health_levels:
-        return "Incapacitated"
-    elif total_damage >= health_levels - 1:
-        return "Crippled"
-    elif total_damage >= health_levels - 2:
-        return "Mauled"
-    elif total_damage >= health_levels - 3:
-        return "Wounded"
-    elif total_damage >= health_levels - 4:
-        return "Injured"
-    elif total_damage >= health_levels - 5:
-        return "Hurt"
-    elif total_damage > 0:
-        return "Bruised"
-    return "Healthy"
-
 def format_damage(character):
     """Format damage markers for display."""
     # Get base health levels
@@ -258,66 +285,10 @@ def format_damage(character):
 
 def format_damage_stacked(character):
     """Format character's health levels with damage markers."""
-    # Define standard health levels - one of each by default
-    health_levels = [
-        (ANSIString("Bruised"), ANSIString("|g[ ]|n"), ""),
-        (ANSIString("Hurt"), ANSIString("|g[ ]|n"), " (-1)"),
-        (ANSIString("Injured"), ANSIString("|g[ ]|n"), " (-1)"),
-        (ANSIString("Wounded"), ANSIString("|g[ ]|n"), " (-2)"),
-        (ANSIString("Mauled"), ANSIString("|g[ ]|n"), " (-2)"),
-        (ANSIString("Crippled"), ANSIString("|g[ ]|n"), " (-5)"),
-        (ANSIString("Incapacitated"), ANSIString("|g[ ]|n"), "")
-    ]
-    
-    # Ensure health_level_bonuses exists and is properly initialized
-    if not hasattr(character.db, 'health_level_bonuses') or character.db.health_level_bonuses is None:
-        calculate_total_health_levels(character)
-    
-    # Create the full health levels list with bonuses
-    full_health_levels = []
-    
-    # Add the standard Bruised level plus any bonus Bruised levels
-    bruised_count = 1 + character.db.health_level_bonuses.get('bruised', 0)
-    for _ in range(bruised_count):
-        full_health_levels.append((ANSIString("Bruised"), ANSIString("|g[ ]|n"), ""))
-    
-    # Add Hurt level plus any bonus Hurt levels
-    hurt_count = 1 + character.db.health_level_bonuses.get('hurt', 0)
-    for _ in range(hurt_count):
-        full_health_levels.append((ANSIString("Hurt"), ANSIString("|g[ ]|n"), " (-1)"))
-    
-    # Add Injured level plus any bonus Injured levels
-    injured_count = 1 + character.db.health_level_bonuses.get('injured', 0)
-    for _ in range(injured_count):
-        full_health_levels.append((ANSIString("Injured"), ANSIString("|g[ ]|n"), " (-1)"))
-    
-    # Add Wounded level plus any bonus Wounded levels
-    wounded_count = 1 + character.db.health_level_bonuses.get('wounded', 0)
-    for _ in range(wounded_count):
-        full_health_levels.append((ANSIString("Wounded"), ANSIString("|g[ ]|n"), " (-2)"))
-    
-    # Add Mauled level plus any bonus Mauled levels
-    mauled_count = 1 + character.db.health_level_bonuses.get('mauled', 0)
-    for _ in range(mauled_count):
-        full_health_levels.append((ANSIString("Mauled"), ANSIString("|g[ ]|n"), " (-2)"))
-    
-    # Add Crippled level plus any bonus Crippled levels
-    crippled_count = 1 + character.db.health_level_bonuses.get('crippled', 0)
-    for _ in range(crippled_count):
-        full_health_levels.append((ANSIString("Crippled"), ANSIString("|g[ ]|n"), " (-5)"))
-    
-    # Add the Incapacitated level
-    full_health_levels.append((ANSIString("Incapacitated"), ANSIString("|g[ ]|n"), ""))
-    
-    # Add the appropriate final health level
-    splat = character.get_stat('other', 'splat', 'Splat')
-    if splat == "Vampire":
-        full_health_levels.extend([
-            (ANSIString("Torpor"), ANSIString("|g[ ]|n"), ""),
-            (ANSIString("Final Death"), ANSIString("|g[ ]|n"), "")
-        ])
-    else:
-        full_health_levels.append((ANSIString("Dead"), ANSIString("|g[ ]|n"), ""))
+    track = health_track(character)
+    blank = ANSIString("|g[ ]|n")
+    full_health_levels = [(ANSIString(name), blank, penalty) for name, penalty in track.levels]
+    full_health_levels.extend((ANSIString(name), blank, "") for name in track.final)
 
     # Apply damage markers
     agg = character.db.agg or 0
@@ -350,24 +321,23 @@ def format_damage_stacked(character):
 
 
 def format_status(character):
-    injury_level = character.db.injury_level or "Healthy"
+    agg = character.db.agg or 0
+    total_damage = agg + (character.db.lethal or 0) + (character.db.bashing or 0)
+    injury_level, suffix = health_track(character).injury(total_damage, agg)
 
-    status_mapping = {
-        "Bruised": ("|y", ""),
-        "Hurt": ("|y", " (-1)"),
-        "Injured": ("|y", " (-1)"),
-        "Wounded": ("|r", " (-2)"),
-        "Mauled": ("|r", " (-2)"),
-        "Crippled": ("|r", " (-5)"),
-        "Incapacitated": ("|h|r", ""),
-        "Torpor": ("|h|r", ""),
-        "Final Death": ("|h|r", "")
+    status_colors = {
+        "Bruised": "|y",
+        "Hurt": "|y",
+        "Injured": "|y",
+        "Wounded": "|r",
+        "Mauled": "|r",
+        "Crippled": "|r",
+        "Incapacitated": "|h|r",
+        "Torpor": "|h|r",
+        "Final Death": "|h|r"
     }
 
-    if injury_level == "Dead" and character.get_stat('other', 'other', 'Splat') == 'Vampire':
-        injury_level = "Torpor"
-
-    color, suffix = status_mapping.get(injury_level, ("|h|g", ""))
+    color = status_colors.get(injury_level, "|h|g")
     injury_level = ANSIString(f"{color}{injury_level}{suffix}|n")
 
     return injury_level
\ No newline at end of file
@@ -1,5 +1,5 @@
-from random import randint
 from typing import List, Tuple
+from world.wod20th.utils.dice_engine import DICE
 
 def roll_dice(dice_pool: int, difficulty: int) -> Tuple[List[int], int, int]:
     """
@@ -15,12 +15,7 @@ def roll_dice(dice_pool: int, difficulty: int) -> Tuple[List[int], int, int]:
         - Number of successes
         - Number of ones (potential botches)
     """
-    rolls = [randint(1, 10) for _ in range(max(0, dice_pool))]
-    successes = sum(1 for roll in rolls if roll >= difficulty)
-    ones = sum(1 for roll in rolls if roll == 1)
-    successes = successes - ones
-    
-    return rolls, successes, ones
+    return DICE.roll(dice_pool, difficulty)
 
 def interpret_roll_results(successes, ones, rolls=None, diff=6, nightmare_dice=0):
     """
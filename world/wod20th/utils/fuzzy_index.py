@@ -0,0 +1,231 @@
+"""
+Fuzzy lookup over fixed vocabularies for "did you mean" suggestions.
+
+A FuzzyIndex folds each term to lower case once and keeps three structures:
+a dict for exact matches, trigram posting lists that narrow substring
+matches to a handful of candidates, and padded trigram posting lists that
+narrow typo matches to the few terms that can be within the allowed
+Levenshtein distance. Suggestions are ranked exact, prefix, substring, then
+by edit distance.
+
+STAT_NAMES indexes every stat name and gift alias. It is rebuilt lazily
+after the Stat catalog is invalidated. Identity vocabularies (kiths,
+traditions, breeds...) get an index of their own through ``index_for()``,
+which caches one per distinct set of values.
+
+Usage:
+    from world.wod20th.utils.fuzzy_index import STAT_NAMES, index_for
+
+    STAT_NAMES.suggest('Alertnes')          # ['Alertness']
+    index_for(KITH).match('sidhe')          # 'Sidhe'
+"""
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def levenshtein(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    Return the edit distance between two strings.
+
+    With a limit, stop early and return limit + 1 once the distance is
+    known to exceed it.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def padded_trigrams(text: str) -> Set[str]:
+    """Return the trigrams of text padded with two spaces each side."""
+    return trigrams(f"  {text}  ")
+
+
+class FuzzyIndex:
+    """Exact, substring, word-prefix and typo lookup over a set of terms."""
+
+    def __init__(self, terms: Iterable[str]):
+        self._display: Dict[str, str] = {}
+        for term in terms:
+            if isinstance(term, str) and term.strip():
+                self._display.setdefault(term.strip().lower(), term.strip())
+        # Plain trigrams, for substring matches
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        # Padded trigrams, for the typo filter
+        self._padded: Dict[str, Set[str]] = defaultdict(set)
+        for folded in self._display:
+            for gram in trigrams(folded):
+                self._postings[gram].add(folded)
+            for gram in padded_trigrams(folded):
+                self._padded[gram].add(folded)
+
+    def __len__(self):
+        return len(self._display)
+
+    def __contains__(self, value):
+        return self.match(value) is not None
+
+    @property
+    def values(self) -> List[str]:
+        """All terms in their stored case."""
+        return list(self._display.values())
+
+    def match(self, value: str) -> Optional[str]:
+        """Return the stored spelling of value, matched case-insensitively."""
+        if not isinstance(value, str):
+            return None
+        return self._display.get(value.strip().lower())
+
+    def _containing(self, folded: str) -> Iterable[str]:
+        """Terms that contain folded as a substring."""
+        grams = trigrams(folded)
+        if not grams:
+            # Too short for trigrams; short queries are rare enough to scan
+            return [term for term in self._display if folded in term]
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set.intersection(*postings) if postings[0] else set()
+        return [term for term in candidates if folded in term]
+
+    def _within(self, folded: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        Terms within max_distance edits of folded, as (distance, term).
+
+        One edit removes at most three padded trigrams, so a term within k
+        edits shares at least len(grams) - 3k of them with the query. Only
+        terms over that threshold, and of a compatible length, are checked
+        with a real edit distance.
+        """
+        grams = padded_trigrams(folded)
+        needed = len(grams) - 3 * max_distance
+        if needed <= 0:
+            # Too short for the filter to prune anything
+            candidates = self._display
+        else:
+            shared = Counter(chain.from_iterable(self._padded.get(gram, ()) for gram in grams))
+            candidates = [term for term, count in shared.items() if count >= needed]
+        found = []
+        for term in candidates:
+            if abs(len(term) - len(folded)) > max_distance:
+                continue
+            distance = levenshtein(folded, term, max_distance)
+            if distance <= max_distance:
+                found.append((distance, term))
+        return found
+
+    def suggest(self, value: str, limit: Optional[int] = 10,
+                max_distance: Optional[int] = None, substrings: bool = True) -> List[str]:
+        """
+        Return terms close to value, best first.
+
+        Args:
+            value (str): What the user typed.
+            limit (int, optional): Most suggestions to return; None for all.
+            max_distance (int, optional): Largest edit distance to accept.
+                Defaults to 1 for short input and 2 otherwise; 0 disables
+                typo matching.
+            substrings (bool): Also suggest terms containing value.
+        """
+        folded = value.strip().lower() if isinstance(value, str) else ""
+        if not folded:
+            return []
+        if max_distance is None:
+            max_distance = 0 if len(folded) <= 3 else 1 if len(folded) <= 5 else 2
+
+        ranked: Dict[str, tuple] = {}
+
+        def rank(term, score):
+            if term not in ranked or score < ranked[term]:
+                ranked[term] = score
+
+        if folded in self._display:
+            rank(folded, (0, 0, len(folded)))
+        if substrings:
+            for term in self._containing(folded):
+                if term.startswith(folded):
+                    rank(term, (1, 0, len(term)))
+                elif any(word.startswith(folded) for word in term.split()):
+                    rank(term, (1, 1, len(term)))
+                else:
+                    rank(term, (2, 0, len(term)))
+        if max_distance:
+            for distance, term in self._within(folded, max_distance):
+                rank(term, (3, distance, len(term)))
+
+        ordered = sorted(ranked, key=lambda term: (ranked[term], term))
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [self._display[term] for term in ordered]
+
+
+class StatNameIndex:
+    """Lazily built FuzzyIndex over all stat names and gift aliases."""
+
+    def __init__(self):
+        self._index = None
+        self._listening = False
+
+    def invalidate(self, **kwargs):
+        """Drop the index; it is rebuilt from the catalog on next use."""
+        self._index = None
+
+    @property
+    def index(self) -> FuzzyIndex:
+        if self._index is None:
+            from world.wod20th.utils.stat_catalog import STAT_CATALOG
+
+            if not self._listening:
+                STAT_CATALOG.add_listener(self.invalidate)
+                self._listening = True
+            terms = []
+            for stat in STAT_CATALOG.all():
+                terms.append(stat.name)
+                aliases = stat.gift_alias
+                if isinstance(aliases, str):
+                    aliases = [aliases]
+                if isinstance(aliases, (list, tuple)):
+                    terms.extend(alias for alias in aliases if isinstance(alias, str))
+            self._index = FuzzyIndex(terms)
+        return self._index
+
+    def match(self, value: str) -> Optional[str]:
+        """Return the stored spelling of a stat name or alias."""
+        return self.index.match(value)
+
+    def suggest(self, value: str, **kwargs) -> List[str]:
+        """Return stat names and aliases close to value; see FuzzyIndex.suggest."""
+        return self.index.suggest(value, **kwargs)
+
+
+STAT_NAMES = StatNameIndex()
+
+
+@lru_cache(maxsize=256)
+def _cached_index(values: frozenset) -> FuzzyIndex:
+    return FuzzyIndex(values)
+
+
+def index_for(values: Iterable[str]) -> FuzzyIndex:
+    """Return a cached FuzzyIndex for a fixed vocabulary such as KITH or TRADITION."""
+    return _cached_index(frozenset(value for value in values if isinstance(value, str)))
@@ -1048,17 +1048,12 @@ def handle_kinfolk_gift_cost(character, stat_name, new_rating, current_rating):
         tuple: (cost, message, requires_approval)
     """
     from evennia.utils import logger
-    from django.db.models import Q
-    from world.wod20th.models import Stat
+    from world.wod20th.utils.stat_catalog import STAT_CATALOG
     
     logger.log_info(f"Handling Kinfolk gift cost for {character.name}: {stat_name} {current_rating}->{new_rating}")
     
-    # Find the gift in database
-    gift = Stat.objects.filter(
-        Q(name__iexact=stat_name) | Q(gift_alias__icontains=stat_name),
-        category='powers',
-        stat_type='gift'
-    ).first()
+    # Find the gift in the stat catalog
+    gift = STAT_CATALOG.get_gift(stat_name)
     
     if not gift:
         logger.log_info(f"Gift '{stat_name}' not found in database")
@@ -0,0 +1,239 @@
+"""
+One expiry queue for every temporary NPC.
+
+Temporary NPCs created by +init used to get their own hourly
+NPCExpirationScript plus a per-object heartbeat check, so a busy night left
+hundreds of timers ticking just to compare ``datetime.now()`` against
+``expiration_time``. NPC_EXPIRY now keeps a single min-heap of
+(expires_at, npc_id) and one timer armed for the head of the heap: nothing
+runs until the next NPC is due, and due NPCs are deleted in batches of
+BATCH_SIZE per reactor turn.
+
+The schedule is saved on the ``npc_expiry`` script (NPCExpiryScript) so it
+survives reloads; if that script is new, the schedule is seeded from the
+``expiration_time`` Attributes of the temporary NPCs already in the game,
+whatever their typeclass. NPCs scheduled before start() are kept in memory
+and merged into the loaded schedule.
+
+Entries are never removed from the middle of the heap. Cancelling or
+rescheduling an NPC just updates its entry in ``_expiry``; heap entries that
+no longer match it are skipped when they reach the top.
+
+Usage:
+    from world.wod20th.utils.npc_expiry import NPC_EXPIRY
+
+    NPC_EXPIRY.schedule(npc)        # after setting npc.db.expiration_time
+    NPC_EXPIRY.cancel(npc)
+    for expires_at, npc_id in NPC_EXPIRY.upcoming(20):
+        ...
+"""
+import heapq
+import time
+
+from evennia.utils import logger
+from evennia.utils.utils import delay
+
+SCRIPT_KEY = "npc_expiry"
+BATCH_SIZE = 50
+
+
+class NPCExpiryQueue:
+    """Min-heap of (expires_at, npc_id), timestamps in seconds since the epoch."""
+
+    def __init__(self):
+        self._heap = []
+        self._expiry = {}  # npc_id -> expires_at of its live heap entry
+        self._timer = None
+        self._script = None
+        self._started = False
+
+    def __len__(self):
+        return len(self._expiry)
+
+    # Heap bookkeeping
+
+    def push(self, npc_id, expires_at):
+        """
+        Set when an NPC expires.
+
+        Returns:
+            bool: True if it is now the next NPC due.
+        """
+        expires_at = float(expires_at)
+        self._expiry[npc_id] = expires_at
+        heapq.heappush(self._heap, (expires_at, npc_id))
+        return self.next_due() == expires_at
+
+    def discard(self, npc_id):
+        """Forget an NPC; its heap entry goes stale and is skipped later."""
+        return self._expiry.pop(npc_id, None) is not None
+
+    def _drop_stale(self):
+        """Pop stale entries off the top of the heap."""
+        while self._heap and self._expiry.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def next_due(self):
+        """Return when the next NPC is due, or None if nothing is scheduled."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now=None, limit=BATCH_SIZE):
+        """Remove and return the ids of up to limit NPCs due by now, soonest first."""
+        now = time.time() if now is None else now
+        due = []
+        while len(due) < limit:
+            next_due = self.next_due()
+            if next_due is None or next_due > now:
+                break
+            expires_at, npc_id = heapq.heappop(self._heap)
+            del self._expiry[npc_id]
+            due.append(npc_id)
+        return due
+
+    def upcoming(self, limit=None):
+        """Return (expires_at, npc_id) pairs, soonest first."""
+        if limit is None:
+            return sorted((expires_at, npc_id) for npc_id, expires_at in self._expiry.items())
+        return heapq.nsmallest(limit, ((expires_at, npc_id) for npc_id, expires_at in self._expiry.items()))
+
+    def load(self, entries):
+        """Replace the schedule with saved (npc_id, expires_at) pairs."""
+        self._expiry = {int(npc_id): float(expires_at) for npc_id, expires_at in entries or ()}
+        self._heap = [(expires_at, npc_id) for npc_id, expires_at in self._expiry.items()]
+        heapq.heapify(self._heap)
+
+    def entries(self):
+        """Return the schedule as (npc_id, expires_at) pairs for saving."""
+        return list(self._expiry.items())
+
+    # NPC-facing API
+
+    def schedule(self, npc):
+        """Queue a temporary NPC for deletion at its ``expiration_time``."""
+        expiration = npc.db.expiration_time
+        if not expiration:
+            return self.cancel(npc)
+        if self.push(npc.id, expiration.timestamp()):
+            self._arm()
+        self._save()
+
+    def cancel(self, npc):
+        """Take an NPC off the schedule, e.g. when it is made permanent or deleted."""
+        if self.discard(npc.id):
+            self._save()
+
+    # Persistence and the timer
+
+    def start(self):
+        """Load the saved schedule and arm the timer; called at server start."""
+        script = self._get_script()
+        entries = script.attributes.get("entries")
+        if entries is None:
+            entries = seed_entries()
+            logger.log_info(f"Seeded the NPC expiry queue with {len(entries)} temporary NPCs")
+        pending = self.entries()
+        self.load(entries)
+        for npc_id, expires_at in pending:
+            self.push(npc_id, expires_at)
+        self._started = True
+        self._save()
+        self._arm()
+
+    def _get_script(self):
+        """Return the script the schedule is saved on, creating it if needed."""
+        if self._script is None or not self._script.pk:
+            from evennia import create_script
+            from evennia.scripts.models import ScriptDB
+
+            script = ScriptDB.objects.filter(db_key=SCRIPT_KEY).first()
+            if script is None:
+                script = create_script(
+                    "world.wod20th.scripts.npc_expiry.NPCExpiryScript",
+                    key=SCRIPT_KEY,
+                    persistent=True,
+                    desc="Deletes temporary NPCs once they expire",
+                )
+            self._script = script
+        return self._script
+
+    def _save(self):
+        """Write the schedule to the script in one Attribute write."""
+        if not self._started:
+            return
+        try:
+            self._get_script().attributes.add("entries", self.entries())
+        except Exception as e:
+            logger.log_err(f"Error saving the NPC expiry queue: {e}")
+
+    def _arm(self, seconds=None):
+        """(Re)start the timer for the next NPC due."""
+        if not self._started:
+            return
+        if self._timer is not None and self._timer.active():
+            self._timer.cancel()
+        self._timer = None
+        if seconds is None:
+            next_due = self.next_due()
+            if next_due is None:
+                return
+            seconds = max(0, next_due - time.time())
+        self._timer = delay(seconds, self.expire_due)
+
+    def expire_due(self):
+        """Delete one batch of due NPCs, then wait for the next batch or NPC."""
+        from evennia.objects.models import ObjectDB
+
+        self._timer = None
+        now = time.time()
+        npc_ids = self.pop_due(now)
+        for npc in ObjectDB.objects.filter(id__in=npc_ids):
+            try:
+                self._expire(npc, now)
+            except Exception as e:
+                logger.log_err(f"Error expiring temporary NPC {npc.key}: {e}")
+        if npc_ids:
+            self._save()
+        next_due = self.next_due()
+        # Leave the reactor free between batches
+        self._arm(0 if next_due is not None and next_due <= now else None)
+
+    def _expire(self, npc, now):
+        """Delete an NPC that is due, unless it was made permanent or extended."""
+        if not npc.db.is_temporary or not npc.db.expiration_time:
+            return
+        if npc.db.expiration_time.timestamp() > now:
+            self.push(npc.id, npc.db.expiration_time.timestamp())
+            return
+        logger.log_info(f"Temporary NPC {npc.key} has expired and will be deleted")
+        if npc.location:
+            npc.location.msg_contents(f"{npc.key} has left the scene.")
+        npc.delete()
+
+
+def seed_entries():
+    """
+    Read (npc_id, expires_at) pairs for every temporary NPC.
+
+    NPCs of any typeclass carry an ``is_npc`` Attribute, so the seed goes by
+    that rather than by typeclass path.
+    """
+    from evennia.objects.models import ObjectDB
+
+    rows = ObjectDB.db_attributes.through.objects.filter(attribute__db_category__isnull=True)
+    npc_ids = rows.filter(attribute__db_key="is_npc").values("objectdb_id")
+    expirations = dict(
+        rows.filter(objectdb_id__in=npc_ids, attribute__db_key="expiration_time")
+        .values_list("objectdb_id", "attribute__db_value")
+    )
+    temporary = {
+        npc_id for npc_id, is_temporary in
+        rows.filter(objectdb_id__in=list(expirations), attribute__db_key="is_temporary")
+        .values_list("objectdb_id", "attribute__db_value")
+        if is_temporary
+    }
+    return [(npc_id, expiration.timestamp()) for npc_id, expiration in expirations.items()
+            if expiration and npc_id in temporary]
+
+
+NPC_EXPIRY = NPCExpiryQueue()
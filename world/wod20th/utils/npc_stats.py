@@ -0,0 +1,115 @@
+"""
+Shared NPC stat blocks and per-room NPC rosters.
+
+Every NPC used to be copied into ``room.db_npcs`` with its whole stat block
+and health, and each stat or health change searched for every room the NPC
+was registered in to copy the change across. NPC_STATS now holds the one
+authoritative stat block per NPC, keyed by NPC id: it is loaded from the
+NPC's ``stats`` Attribute on first use and written back in a single
+Attribute write when it changes.
+
+Rooms keep only a lightweight roster in ``room.ndb.npcs`` mapping the NPC's
+name to a reference (the NPC object, its scene number, initiative modifier
+and who is inhabiting it). Rosters are rebuilt from the room's contents
+after a reload, so nothing about them has to be saved.
+
+Usage:
+    from world.wod20th.utils.npc_stats import NPC_STATS, room_npcs
+
+    for name, ref in room_npcs(room).items():
+        health = NPC_STATS.health(ref["npc_object"])
+    NPC_STATS.change_health(npc, "lethal", 2)
+"""
+from evennia.utils.dbserialize import deserialize
+
+DAMAGE_TYPES = ("bashing", "lethal", "aggravated")
+
+
+def empty_health():
+    """Return an undamaged health block."""
+    return {damage_type: 0 for damage_type in DAMAGE_TYPES}
+
+
+def health_status(health):
+    """Return the wound level an NPC health block adds up to."""
+    total_damage = sum((health or {}).get(damage_type, 0) for damage_type in DAMAGE_TYPES)
+    levels = ("Healthy", "Bruised", "Hurt", "Injured", "Wounded", "Mauled", "Crippled")
+    return levels[total_damage] if total_damage < len(levels) else "Incapacitated"
+
+
+def is_scene_npc(obj):
+    """Return True for NPC typeclass objects, whose stats live in NPC_STATS."""
+    return bool(getattr(obj, "is_npc", False)) and hasattr(obj, "register_in_room")
+
+
+class NPCStatStore:
+    """NPC id -> stat block."""
+
+    def __init__(self):
+        self._blocks = {}
+
+    def stats(self, npc):
+        """Return the NPC's stat block, loading it from its Attribute once."""
+        block = self._blocks.get(npc.id)
+        if block is None:
+            block = deserialize(npc.attributes.get("stats")) or {}
+            self._blocks[npc.id] = block
+        return block
+
+    def health(self, npc):
+        """Return the NPC's health block (bashing, lethal and aggravated damage)."""
+        block = self.stats(npc)
+        if not block.get("health"):
+            block["health"] = empty_health()
+        return block["health"]
+
+    def set_stats(self, npc, stats):
+        """Replace the NPC's stat block."""
+        self._blocks[npc.id] = deserialize(stats) or {}
+        self.save(npc)
+
+    def change_health(self, npc, damage_type, amount):
+        """
+        Add damage (or heal, with a negative amount) and save it.
+
+        Returns:
+            dict: The NPC's new health block.
+        """
+        health = self.health(npc)
+        health[damage_type] = max(0, health.get(damage_type, 0) + amount)
+        self.save(npc)
+        return health
+
+    def save(self, npc):
+        """Write the NPC's stat block back to its ``stats`` Attribute."""
+        npc.attributes.add("stats", self.stats(npc))
+
+    def forget(self, npc):
+        """Drop a cached block, e.g. when the NPC is deleted."""
+        self._blocks.pop(npc.id, None)
+
+
+NPC_STATS = NPCStatStore()
+
+
+def room_npcs(room):
+    """
+    Return a room's NPC roster: name -> reference dict.
+
+    The roster lives in ``room.ndb.npcs``; after a reload it is rebuilt from
+    the NPCs standing in the room, keeping their scene numbers.
+    """
+    roster = room.ndb.npcs
+    if roster is None:
+        roster = room.ndb.npcs = {}
+        room.ndb.npc_counter = 0
+        for obj in room.contents:
+            if is_scene_npc(obj):
+                obj.register_in_room(room, number=obj.db.npc_number)
+    return roster
+
+
+def roster_object(room, name):
+    """Return the NPC object registered under name in a room, or None."""
+    ref = room_npcs(room).get(name)
+    return ref.get("npc_object") if ref else None
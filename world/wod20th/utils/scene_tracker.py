@@ -0,0 +1,268 @@
+"""
+In-memory scene tracking for WoD20th.
+
+Every say, pose and emote records scene activity. Doing that straight
+against Attributes meant several writes per line of RP, so the tracker keeps
+room and character scene state in memory and writes it back on a timer, when
+a scene ends, and when the server stops.
+
+The weekly scene count used for XP (``xp['scenes_this_week']``) is still
+written as soon as it changes, which is at most once per character every
+SCENE_XP_WINDOW seconds, so WeeklyXPScript sees exactly the same counts.
+"""
+from datetime import datetime
+from evennia.utils import logger
+from evennia.utils.utils import delay
+
+# Start a new room scene after this many hours without activity
+SCENE_INACTIVITY_HOURS = 2
+# Minimum gap between two counted scenes for the same character
+SCENE_XP_WINDOW = 1200  # 20 minutes
+# How long coalesced scene data may stay unwritten
+FLUSH_INTERVAL = 300  # 5 minutes
+
+_UNKNOWN = object()
+
+
+class RoomScene:
+    """Scene state for a single room."""
+
+    __slots__ = ("room", "start_time", "participants", "last_activity", "completed")
+
+    def __init__(self, room, data=None):
+        self.room = room
+        data = data if isinstance(data, dict) else {}
+        start_time = data.get('start_time')
+        if isinstance(start_time, str):
+            start_time = datetime.fromisoformat(start_time)
+        last_activity = data.get('last_activity')
+        if isinstance(last_activity, str):
+            last_activity = datetime.fromisoformat(last_activity)
+        participants = data.get('participants')
+        self.start_time = start_time
+        self.participants = set(participants) if isinstance(participants, (set, list, tuple)) else set()
+        self.last_activity = last_activity
+        self.completed = data.get('completed', False)
+
+    def reset(self, now):
+        """Start a fresh scene."""
+        self.start_time = now
+        self.participants = set()
+        self.last_activity = now
+        self.completed = False
+
+    def to_dict(self):
+        return {
+            'start_time': self.start_time,
+            'participants': set(self.participants),
+            'last_activity': self.last_activity,
+            'completed': self.completed,
+        }
+
+
+class SceneTracker:
+    """
+    Process-wide registry of scene activity.
+
+    Rooms and characters are keyed by id; their pending state is written
+    back to ``scene_data`` Attributes by flush().
+    """
+
+    def __init__(self):
+        self._rooms = {}
+        self._characters = {}
+        self._last_scene = {}
+        self._dirty_rooms = set()
+        self._dirty_characters = set()
+        self._flush_pending = False
+
+    # ------------------------------------------------------------------
+    # Rooms
+    # ------------------------------------------------------------------
+
+    def get_room_scene(self, room):
+        """Return the RoomScene for a room, loading it from the room on first use."""
+        scene = self._rooms.get(room.id)
+        if scene is None:
+            scene = RoomScene(room, room.attributes.get('scene_data'))
+            self._rooms[room.id] = scene
+        return scene
+
+    def get_participants(self, room):
+        """Return the set of character keys taking part in a room's scene."""
+        return set(self.get_room_scene(room).participants)
+
+    def add_participant(self, room, character, now=None):
+        """Add a character to a room's scene, starting one if none is running."""
+        now = now or datetime.now()
+        scene = self.get_room_scene(room)
+        if not scene.start_time:
+            scene.start_time = now
+            scene.completed = False
+        scene.participants.add(character.key)
+        scene.last_activity = now
+        self._mark_room(scene)
+
+    def discard_participant(self, room, character):
+        """Remove a character from a room's scene and return who is left."""
+        scene = self.get_room_scene(room)
+        if character.key in scene.participants:
+            scene.participants.discard(character.key)
+            self._mark_room(scene)
+        return set(scene.participants)
+
+    def forget_room(self, room):
+        """Drop the cached scene for a room, e.g. after its Attribute was reset."""
+        self._rooms.pop(room.id, None)
+        self._dirty_rooms.discard(room.id)
+
+    # ------------------------------------------------------------------
+    # Activity
+    # ------------------------------------------------------------------
+
+    def record_activity(self, character, now=None):
+        """
+        Record a line of RP by a character in its current location.
+
+        Args:
+            character (Character): The character that acted.
+            now (datetime, optional): Time of the activity.
+        """
+        room = character.location
+        if not room:
+            return
+        now = now or datetime.now()
+
+        scene = self.get_room_scene(room)
+        if not scene.start_time:
+            scene.reset(now)
+        elif scene.last_activity and (now - scene.last_activity).total_seconds() > SCENE_INACTIVITY_HOURS * 3600:
+            scene.reset(now)
+        scene.participants.add(character.key)
+        scene.last_activity = now
+        self._mark_room(scene)
+
+        self._characters[character.id] = (character, {
+            'current_scene': scene.start_time,
+            'scene_location': room,
+            'last_activity': now,
+        })
+        self._dirty_characters.add(character.id)
+        self._schedule_flush()
+
+        self._count_scene(character, now)
+
+    def _count_scene(self, character, now):
+        """Bump the weekly scene count if the XP window has passed."""
+        last_scene = self._last_scene.get(character.id, _UNKNOWN)
+        if last_scene is _UNKNOWN:
+            xp = character.attributes.get('xp')
+            last_scene = xp.get('last_scene') if xp else None
+            if isinstance(last_scene, str):
+                last_scene = datetime.fromisoformat(last_scene)
+            elif last_scene is not None:
+                # Unrecognised value; leave it alone like the old tracker did
+                last_scene = False
+            self._last_scene[character.id] = last_scene
+
+        if last_scene is False:
+            return
+        if last_scene and (now - last_scene).total_seconds() <= SCENE_XP_WINDOW:
+            return
+
+        xp = character.attributes.get('xp')
+        if xp:
+            xp = xp.deserialize() if hasattr(xp, 'deserialize') else dict(xp)
+        else:
+            from decimal import Decimal
+            xp = {
+                'total': Decimal('0.00'),
+                'current': Decimal('0.00'),
+                'spent': Decimal('0.00'),
+                'ic_xp': Decimal('0.00'),
+                'monthly_spent': Decimal('0.00'),
+                'last_reset': now,
+                'spends': [],
+                'last_scene': None,
+                'scenes_this_week': 0
+            }
+        xp['last_scene'] = now.isoformat()
+        xp['scenes_this_week'] = xp.get('scenes_this_week', 0) + 1
+        character.attributes.add('xp', xp)
+        self._last_scene[character.id] = now
+
+    def forget_character(self, character):
+        """Drop cached XP timing for a character, e.g. after its XP was reset."""
+        self._last_scene.pop(character.id, None)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _mark_room(self, scene):
+        self._dirty_rooms.add(scene.room.id)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_pending:
+            return
+        self._flush_pending = True
+        delay(FLUSH_INTERVAL, self._timed_flush)
+
+    def _timed_flush(self):
+        self._flush_pending = False
+        self.flush()
+
+    def flush_room(self, room):
+        """Write a single room's pending scene state."""
+        if room.id not in self._dirty_rooms:
+            return
+        self._dirty_rooms.discard(room.id)
+        scene = self._rooms.get(room.id)
+        if scene:
+            room.attributes.add('scene_data', scene.to_dict())
+
+    def flush_character(self, character):
+        """Write a single character's pending scene state."""
+        if character.id not in self._dirty_characters:
+            return
+        self._dirty_characters.discard(character.id)
+        _, pending = self._characters.pop(character.id, (None, None))
+        if not pending:
+            return
+        scene_data = character.attributes.get('scene_data')
+        if scene_data and hasattr(scene_data, 'deserialize'):
+            scene_data = scene_data.deserialize()
+        if not isinstance(scene_data, dict):
+            scene_data = {
+                'current_scene': None,
+                'scene_location': None,
+                'last_activity': None,
+                'completed_scenes': 0
+            }
+        scene_data.update(pending)
+        character.attributes.add('scene_data', scene_data)
+
+    def flush(self):
+        """Write all pending room and character scene state."""
+        for room_id in list(self._dirty_rooms):
+            scene = self._rooms.get(room_id)
+            if not scene:
+                self._dirty_rooms.discard(room_id)
+                continue
+            try:
+                self.flush_room(scene.room)
+            except Exception as e:
+                logger.log_err(f"Error flushing scene data for room {room_id}: {e}")
+        for char_id in list(self._dirty_characters):
+            character, _ = self._characters.get(char_id, (None, None))
+            if not character:
+                self._dirty_characters.discard(char_id)
+                continue
+            try:
+                self.flush_character(character)
+            except Exception as e:
+                logger.log_err(f"Error flushing scene data for character {char_id}: {e}")
+
+
+SCENE_TRACKER = SceneTracker()
@@ -0,0 +1,117 @@
+"""
+Shared allocator for player-facing ID sequences.
+
+Job numbers, archive numbers, group IDs, hangout IDs and board IDs used to
+be worked out on every create by scanning the table for its highest (or
+first missing) ID, which cost a full scan per create and handed the same
+number to two staffers acting at once. Each sequence now lives in one
+IdSequence row: allocate() locks the row with select_for_update, takes the
+next number and writes the row back, so a create costs one locked read and
+one write however large the table grows.
+
+Sequences that reuse gaps (groups and boards, whose IDs people type) keep a
+free-list of released numbers; release() puts a number back when its owner
+is deleted, and allocate() hands out the smallest free number first.
+
+A sequence's row is created on first use from the IDs already in the table,
+so existing games keep their numbering. reset() drops the row, and the next
+allocation seeds it again.
+
+Usage:
+    from world.wod20th.utils.sequences import allocate, release
+
+    group.group_id = allocate('groups.group', lambda: Group.objects.values_list('group_id', flat=True),
+                              reuse_gaps=True)
+    release('groups.group', group.group_id)
+"""
+from bisect import insort
+from typing import Callable, Iterable, List, Tuple
+
+from django.db import IntegrityError, transaction
+
+
+def seed_values(used_ids: Iterable, reuse_gaps: bool = False) -> Tuple[int, List[int]]:
+    """
+    Work out a new sequence's next value and free-list from the IDs in use.
+
+    Returns:
+        tuple: (next_value, free_ids); free_ids is empty unless reuse_gaps.
+    """
+    used = {int(value) for value in used_ids if value}
+    next_value = max(used, default=0) + 1
+    free_ids = sorted(set(range(1, next_value)) - used) if reuse_gaps else []
+    return next_value, free_ids
+
+
+def take(sequence, reuse_gaps: bool = False) -> int:
+    """Take the next ID from a locked sequence row, updating it in place."""
+    if reuse_gaps and sequence.free_ids:
+        return sequence.free_ids.pop(0)
+    value = sequence.next_value
+    sequence.next_value += 1
+    return value
+
+
+def give_back(sequence, value: int) -> bool:
+    """Put a released ID on a sequence row's free-list. Returns True if it changed."""
+    value = int(value)
+    if value < 1 or value >= sequence.next_value or value in sequence.free_ids:
+        return False
+    insort(sequence.free_ids, value)
+    return True
+
+
+def _locked(name: str, used_ids: Callable[[], Iterable], reuse_gaps: bool):
+    """Return the sequence row locked for this transaction, seeding it if new."""
+    from world.wod20th.models import IdSequence
+
+    sequence = IdSequence.objects.select_for_update().filter(name=name).first()
+    if sequence is not None:
+        return sequence
+    next_value, free_ids = seed_values(used_ids(), reuse_gaps)
+    try:
+        with transaction.atomic():
+            return IdSequence.objects.create(name=name, next_value=next_value, free_ids=free_ids)
+    except IntegrityError:
+        # Someone else seeded it first; wait for their row
+        return IdSequence.objects.select_for_update().get(name=name)
+
+
+def allocate(name: str, used_ids: Callable[[], Iterable], reuse_gaps: bool = False) -> int:
+    """
+    Allocate the next ID in a sequence.
+
+    Args:
+        name (str): Sequence name, e.g. 'jobs.job'
+        used_ids (callable): Returns the IDs already in use; only called the
+            first time the sequence is seen. Without reuse_gaps it only needs
+            to yield the highest ID.
+        reuse_gaps (bool): Hand out released and never-used IDs first
+
+    Returns:
+        int: An ID no other caller will be given.
+    """
+    with transaction.atomic():
+        sequence = _locked(name, used_ids, reuse_gaps)
+        value = take(sequence, reuse_gaps)
+        sequence.save(update_fields=['next_value', 'free_ids'])
+    return value
+
+
+def release(name: str, value) -> None:
+    """Return an ID to a gap-reusing sequence once its owner is deleted."""
+    from world.wod20th.models import IdSequence
+
+    if value is None:
+        return
+    with transaction.atomic():
+        sequence = IdSequence.objects.select_for_update().filter(name=name).first()
+        if sequence is not None and give_back(sequence, value):
+            sequence.save(update_fields=['free_ids'])
+
+
+def reset(name: str) -> None:
+    """Forget a sequence; the next allocation seeds it from the table again."""
+    from world.wod20th.models import IdSequence
+
+    IdSequence.objects.filter(name=name).delete()
@@ -0,0 +1,108 @@
+"""
+Render cache for +sheet.
+
+Building a sheet runs dozens of stat lookups plus per-splat power processing,
+and staff page through the same sheets over and over during approvals. The
+cache keeps each rendered section per (character, viewer class, width) and
+tags it with a signature of everything the sections read: the character's
+StatStore version, the stat catalog generation and the few non-stat
+Attributes the sheet shows (current form and attribute boosts). A signature
+change drops the character's cached sections.
+
+Health and status are not cached; they show damage Attributes the signature
+doesn't cover. The health track behind them is memoized by
+world.wod20th.utils.damage.health_track.
+
+Usage:
+    from world.wod20th.utils.sheet_cache import SHEET_CACHE
+
+    key = SHEET_CACHE.make_key(character, 'staff', 78)
+    signature = SHEET_CACHE.signature(character)
+    text = SHEET_CACHE.section(key, signature, 'identity', build_identity)
+"""
+from collections import OrderedDict
+
+# How many (character, viewer class, width) entries to keep
+MAX_ENTRIES = 500
+
+
+class SheetCache:
+    """LRU cache of rendered sheet sections with hit/miss counters."""
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(character, viewer_class, width):
+        """Return the cache key for one character as seen by one viewer class."""
+        return (character.id, viewer_class, width)
+
+    @staticmethod
+    def signature(character):
+        """Return a value that changes whenever a cached section could change."""
+        from world.wod20th.utils.stat_catalog import STAT_CATALOG
+
+        store = getattr(character, 'stat_store', None)
+        version = store.current_version() if store else None
+        boosts = character.attributes.get('attribute_boosts') or {}
+        return (
+            version,
+            STAT_CATALOG.generation,
+            character.attributes.get('current_form'),
+            tuple(sorted(str(name) for name in boosts)),
+        )
+
+    def section(self, key, signature, name, build):
+        """
+        Return a cached section, building and storing it on a miss.
+
+        Args:
+            key (tuple): From make_key().
+            signature (tuple): From signature(), taken before rendering.
+            name (str): Section name.
+            build (callable): Renders the section.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry['signature'] != signature:
+            entry = {'signature': signature, 'sections': {}}
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+
+        sections = entry['sections']
+        if name in sections:
+            self.hits += 1
+            return sections[name]
+        self.misses += 1
+        value = sections[name] = build()
+        return value
+
+    def invalidate(self, character=None):
+        """Drop cached sections for one character, or for everyone."""
+        if character is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == character.id]:
+            del self._entries[key]
+
+    def stats(self):
+        """Return hit/miss counters and the current size."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0,
+            'entries': len(self._entries),
+        }
+
+    def reset_stats(self):
+        """Zero the hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+
+SHEET_CACHE = SheetCache()
@@ -2,6 +2,7 @@
 Utility functions for handling Shifter-specific character initialization and updates.
 """
 from world.wod20th.utils.xp_utils import get_stat_model
+from world.wod20th.utils.stat_catalog import STAT_CATALOG
 from world.wod20th.utils.banality import get_default_banality
 from world.wod20th.utils.stat_mappings import SHIFTER_BACKGROUNDS
 from typing import Dict, Union, List, Tuple, Set, Optional
@@ -399,13 +400,8 @@ def calculate_gift_cost(character, gift_name, new_rating, current_rating=None) -
         if current_rating is None:
             current_rating = character.get_stat('powers', 'gift', gift_name, temp=False) or 0
         
-        # Get the gift from the database
-        Stat = get_stat_model()
-        gift = Stat.objects.filter(
-            Q(name__iexact=gift_name) | Q(gift_alias__icontains=gift_name),
-            category='powers',
-            stat_type='gift'
-        ).first()
+        # Get the gift from the stat catalog
+        gift = STAT_CATALOG.get_gift(gift_name)
         
         if not gift:
             logger.log_info(f"Gift '{gift_name}' not found in database, using default cost.")
@@ -0,0 +1,179 @@
+"""
+Process-wide catalog of Stat definitions.
+
+Stat rows are read-mostly: they change when data files are loaded or staff
+edit them in the admin, but are looked up on nearly every chargen, sheet and
+XP command. The catalog loads every row once and indexes them by lowercased
+name, gift alias, (category, stat_type), category and splat. It is
+invalidated by the Stat post_save/post_delete signals (see
+world/wod20th/signals.py); code that writes with queryset.update() or
+bulk_create() must call STAT_CATALOG.invalidate() itself.
+
+Usage:
+    from world.wod20th.utils.stat_catalog import STAT_CATALOG
+
+    stat = STAT_CATALOG.get('Alertness')
+    gift = STAT_CATALOG.get('Razor Claws', category='powers', stat_type='gift', include_aliases=True)
+    talents = STAT_CATALOG.filter(category='abilities', stat_type='talent')
+"""
+from collections import defaultdict
+from evennia.utils import logger
+
+
+def _fold(value):
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+def _aliases(stat):
+    """Return a stat's gift aliases as a list of strings."""
+    aliases = stat.gift_alias
+    if not aliases:
+        return []
+    if isinstance(aliases, str):
+        return [aliases]
+    if isinstance(aliases, (list, tuple)):
+        return [alias for alias in aliases if isinstance(alias, str)]
+    return []
+
+
+class StatCatalog:
+    """Cached, indexed view over all Stat rows."""
+
+    def __init__(self):
+        self._loaded = False
+        self._stats = []
+        self._by_id = {}
+        self._by_name = {}
+        self._by_alias = {}
+        self._by_type = {}
+        self._by_category = {}
+        self._by_splat = {}
+        self.generation = 0
+        self._listeners = []
+
+    def _load(self):
+        from world.wod20th.models import Stat
+
+        stats = list(Stat.objects.order_by('id'))
+        by_name = defaultdict(list)
+        by_alias = defaultdict(list)
+        by_type = defaultdict(list)
+        by_category = defaultdict(list)
+        by_splat = defaultdict(list)
+        for stat in stats:
+            by_name[_fold(stat.name)].append(stat)
+            for alias in _aliases(stat):
+                by_alias[_fold(alias)].append(stat)
+            by_type[(stat.category, stat.stat_type)].append(stat)
+            by_category[stat.category].append(stat)
+            by_splat[_fold(stat.splat)].append(stat)
+
+        self._stats = stats
+        self._by_id = {stat.id: stat for stat in stats}
+        self._by_name = dict(by_name)
+        self._by_alias = dict(by_alias)
+        self._by_type = dict(by_type)
+        self._by_category = dict(by_category)
+        self._by_splat = dict(by_splat)
+        self._loaded = True
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._load()
+
+    def invalidate(self, **kwargs):
+        """Drop the cached rows; they are reloaded on next use."""
+        self._loaded = False
+        self.generation += 1
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception as e:
+                logger.log_err(f"Error in stat catalog listener: {e}")
+
+    def add_listener(self, callback):
+        """Register a callable to run whenever the catalog is invalidated."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def all(self):
+        """Return every Stat, ordered by id."""
+        self._ensure_loaded()
+        return list(self._stats)
+
+    def get_by_id(self, stat_id):
+        """Return the Stat with the given primary key, or None."""
+        self._ensure_loaded()
+        return self._by_id.get(stat_id)
+
+    def filter(self, name=None, category=None, stat_type=None, splat=None, include_aliases=False):
+        """
+        Return all Stats matching the given fields.
+
+        Args:
+            name (str, optional): Case-insensitive stat name.
+            category (str, optional): Stat category, e.g. 'powers'.
+            stat_type (str, optional): Stat type, e.g. 'gift'.
+            splat (str, optional): Case-insensitive splat.
+            include_aliases (bool): Also match name against gift aliases.
+
+        Returns:
+            list: Matching Stat objects, name matches before alias matches.
+        """
+        self._ensure_loaded()
+
+        if name is not None:
+            key = _fold(name)
+            candidates = list(self._by_name.get(key, ()))
+            if include_aliases:
+                candidates.extend(
+                    stat for stat in self._by_alias.get(key, ()) if stat not in candidates
+                )
+        elif category is not None and stat_type is not None:
+            candidates = self._by_type.get((category, stat_type), [])
+        elif category is not None:
+            candidates = self._by_category.get(category, [])
+        elif splat is not None:
+            candidates = self._by_splat.get(_fold(splat), [])
+        else:
+            candidates = self._stats
+
+        folded_splat = _fold(splat)
+        return [
+            stat for stat in candidates
+            if (category is None or stat.category == category)
+            and (stat_type is None or stat.stat_type == stat_type)
+            and (splat is None or _fold(stat.splat) == folded_splat)
+        ]
+
+    def get(self, name, category=None, stat_type=None, splat=None, include_aliases=False):
+        """Return the first Stat matching the given fields, or None."""
+        matches = self.filter(name=name, category=category, stat_type=stat_type,
+                              splat=splat, include_aliases=include_aliases)
+        return matches[0] if matches else None
+
+    def exists(self, name, category=None, stat_type=None, include_aliases=False):
+        """Return True if any Stat matches."""
+        return self.get(name, category=category, stat_type=stat_type,
+                        include_aliases=include_aliases) is not None
+
+    def get_gift(self, name):
+        """Return the gift whose name or alias matches name, or None."""
+        return self.get(name, category='powers', stat_type='gift', include_aliases=True)
+
+    def names(self):
+        """Return the set of all stat names in their stored case."""
+        self._ensure_loaded()
+        return {stat.name for stat in self._stats}
+
+    def aliases(self):
+        """Return a mapping of lowercased alias to the Stats that carry it."""
+        self._ensure_loaded()
+        return dict(self._by_alias)
+
+
+STAT_CATALOG = StatCatalog()
@@ -3,44 +3,13 @@ Functions for initializing basic stats in the database.
 """
 from world.wod20th.models import Stat
 from world.wod20th.utils.sheet_constants import ATTRIBUTES, ABILITIES, ADVANTAGES
+from world.wod20th.utils.fuzzy_index import STAT_NAMES
 from typing import List, Tuple
 from django.db.models import Q
 
 def find_similar_stats(stat_name: str) -> List[str]:
-    """Find similar stat names in the database."""
-    # Convert to lowercase for case-insensitive comparison
-    stat_name_lower = stat_name.lower()
-    
-    # Get all stats
-    all_stats = Stat.objects.all()
-    
-    # Find similar stats using basic string matching
-    similar_stats = []
-    for stat in all_stats:
-        # Exact match ignoring case
-        if stat.name.lower() == stat_name_lower:
-            similar_stats.append(stat.name)
-            continue
-            
-        # Contains the search term
-        if stat_name_lower in stat.name.lower():
-            similar_stats.append(stat.name)
-            continue
-            
-        # Simple Levenshtein distance (for typos)
-        if len(stat_name) > 3:  # Only for longer names to avoid false positives
-            distance = 0
-            shorter = stat_name_lower if len(stat_name_lower) < len(stat.name.lower()) else stat.name.lower()
-            longer = stat_name_lower if len(stat_name_lower) >= len(stat.name.lower()) else stat.name.lower()
-            
-            for i in range(len(shorter)):
-                if shorter[i] != longer[i]:
-                    distance += 1
-            
-            if distance <= 2:  # Allow up to 2 character differences
-                similar_stats.append(stat.name)
-    
-    return similar_stats
+    """Find stat names and gift aliases similar to stat_name, best match first."""
+    return STAT_NAMES.suggest(stat_name)
 
 def check_stat_exists(stat_name: str, category: str = None, stat_type: str = None) -> Tuple[bool, List[str]]:
     """
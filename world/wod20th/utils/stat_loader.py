@@ -0,0 +1,259 @@
+"""
+Incremental loader for Stat data files.
+
+Every boot used to re-read each JSON data file and run a filter/save or
+update_or_create per row. The loader instead hashes each file and skips it
+when the content matches the hash recorded in DataFileHash at its last load.
+Changed files are diffed against the existing rows in memory, and only new
+or modified Stats are written, with bulk_create/bulk_update inside a single
+transaction per file. A row that cannot be built is reported and skipped;
+if a bulk write is rejected, its rows are retried one at a time so a bad
+row only costs itself.
+
+Bulk writes do not send post_save, so the loader invalidates STAT_CATALOG
+itself once anything has been written.
+
+Usage:
+    from world.wod20th.utils.stat_loader import StatLoader
+
+    loader = StatLoader()
+    result = loader.load_file(path, build_rows)
+    print(result.summary())
+"""
+import hashlib
+import json
+import os
+import time
+from django.db import DatabaseError, transaction
+from evennia.utils import logger
+
+# The model's unique_together
+DEFAULT_KEY_FIELDS = ('name', 'category', 'stat_type', 'splat')
+BULK_BATCH_SIZE = 500
+
+
+def file_sha256(path):
+    """Return the hex sha256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LoadResult:
+    """Outcome and timing of loading one data file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.sha256 = None
+        self.skipped = False
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.failed = []
+        self.error = None
+        self.elapsed = 0.0
+
+    @property
+    def written(self):
+        return self.created + self.updated
+
+    def summary(self):
+        name = os.path.basename(self.path)
+        if self.error:
+            return f"{name}: failed ({self.error})"
+        if self.skipped:
+            return f"{name}: unchanged, skipped ({self.elapsed * 1000:.1f}ms)"
+        return (f"{name}: {self.created} created, {self.updated} updated, "
+                f"{self.unchanged} unchanged, {len(self.failed)} failed "
+                f"({self.elapsed * 1000:.1f}ms)")
+
+
+class StatLoader:
+    """
+    Loads Stat rows from JSON files, skipping files whose hash is unchanged.
+
+    Args:
+        key_fields (tuple): Fields identifying an existing Stat to update.
+        force (bool): Load files even if their hash matches the last load.
+    """
+
+    def __init__(self, key_fields=DEFAULT_KEY_FIELDS, force=False):
+        self.key_fields = tuple(key_fields)
+        self.force = force
+        self._existing = None
+        self._field_names = None
+
+    def _fields(self):
+        if self._field_names is None:
+            from world.wod20th.models import Stat
+            self._field_names = [
+                field.name for field in Stat._meta.concrete_fields if not field.primary_key
+            ]
+        return self._field_names
+
+    def _key(self, values):
+        return tuple(values.get(field) for field in self.key_fields)
+
+    def _existing_index(self):
+        """Return existing Stats keyed on key_fields, loaded with one query."""
+        if self._existing is None:
+            from world.wod20th.models import Stat
+            index = {}
+            for stat in Stat.objects.order_by('id'):
+                key = tuple(getattr(stat, field) for field in self.key_fields)
+                index.setdefault(key, stat)
+            self._existing = index
+        return self._existing
+
+    def _is_unchanged(self, path, sha256):
+        from world.wod20th.models import DataFileHash, Stat
+
+        if self.force:
+            return False
+        record = DataFileHash.objects.filter(filename=path).first()
+        if not record or record.sha256 != sha256:
+            return False
+        # An emptied table means the recorded hashes are stale
+        return Stat.objects.exists()
+
+    def _write(self, path, to_create, to_update, changed_fields, result):
+        """
+        Write new and changed Stats in bulk, falling back to one row at a time
+        if the database rejects a bulk write.
+
+        Returns:
+            tuple: (created stats, updated stats) that were written.
+        """
+        from world.wod20th.models import Stat
+
+        existing = self._existing_index()
+        try:
+            with transaction.atomic():
+                if to_create:
+                    created = Stat.objects.bulk_create(list(to_create.values()), batch_size=BULK_BATCH_SIZE)
+                    if any(stat.pk is None for stat in created):
+                        # Backend could not return keys; reload before the next file
+                        self._existing = None
+                    else:
+                        existing.update(to_create)
+                if to_update:
+                    Stat.objects.bulk_update(list(to_update.values()), changed_fields,
+                                             batch_size=BULK_BATCH_SIZE)
+            return list(to_create.values()), list(to_update.values())
+        except (DatabaseError, ValueError) as e:
+            logger.log_warn(f"Bulk write for {path} failed ({e}); retrying row by row")
+
+        # Rejected updates leave edited instances in the index
+        self._existing = None
+        for stat in to_create.values():
+            # Keys from batches that were rolled back
+            stat.pk = None
+        created, updated = [], []
+        for stat, fields in [(stat, None) for stat in to_create.values()] + \
+                            [(stat, changed_fields) for stat in to_update.values()]:
+            try:
+                with transaction.atomic():
+                    stat.save(update_fields=fields)
+            except (DatabaseError, ValueError) as e:
+                result.failed.append(f"{stat.name}: {e}")
+                logger.log_err(f"Error saving stat {stat.name} from {path}: {e}")
+                continue
+            (updated if fields else created).append(stat)
+        return created, updated
+
+    def load_file(self, path, build_rows):
+        """
+        Load one JSON file.
+
+        Args:
+            path (str): Path to the JSON file.
+            build_rows (callable): Called with the parsed JSON; returns an
+                iterable of dicts of Stat field values. A row may instead be
+                an Exception describing a malformed entry.
+
+        Returns:
+            LoadResult: What was written and how long it took.
+        """
+        from world.wod20th.models import DataFileHash, Stat
+
+        start = time.monotonic()
+        path = os.path.abspath(path)
+        result = LoadResult(path)
+        try:
+            result.sha256 = file_sha256(path)
+            if self._is_unchanged(path, result.sha256):
+                result.skipped = True
+                return result
+
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            field_names = self._fields()
+            existing = self._existing_index()
+            to_create = {}
+            to_update = {}
+            changed_fields = set()
+            row_count = 0
+
+            for row in build_rows(data):
+                if isinstance(row, Exception):
+                    result.failed.append(str(row))
+                    continue
+                row_count += 1
+                try:
+                    values = {field: value for field, value in row.items() if field in field_names}
+                    key = self._key(values)
+                    stat = to_create.get(key) or existing.get(key)
+
+                    if stat is None:
+                        stat = Stat(**values)
+                        stat.apply_defaults()
+                        to_create[key] = stat
+                        continue
+
+                    before = {field: getattr(stat, field) for field in field_names}
+                    for field, value in values.items():
+                        setattr(stat, field, value)
+                    stat.apply_defaults()
+                except Exception as e:
+                    result.failed.append(f"{row.get('name', '?')}: {e}")
+                    logger.log_err(f"Skipping stat {row.get('name', '?')} in {path}: {e}")
+                    continue
+                if key in to_create:
+                    continue
+                changed = [field for field in field_names if getattr(stat, field) != before[field]]
+                if changed:
+                    changed_fields.update(changed)
+                    to_update[stat.pk] = stat
+                elif stat.pk not in to_update:
+                    result.unchanged += 1
+
+            with transaction.atomic():
+                created, updated = self._write(path, to_create, to_update, sorted(changed_fields), result)
+                if result.failed:
+                    # Leave the hash unrecorded so the failed rows are retried and reported next boot
+                    DataFileHash.objects.filter(filename=path).delete()
+                else:
+                    DataFileHash.objects.update_or_create(
+                        filename=path,
+                        defaults={'sha256': result.sha256, 'row_count': row_count},
+                    )
+            result.created = len(created)
+            result.updated = len(updated)
+        except json.JSONDecodeError as e:
+            result.error = 'Invalid JSON format'
+            logger.log_err(f"Invalid JSON in stat file {path}: {e}")
+        except Exception as e:
+            # Failed writes leave the in-memory index out of step with the table
+            self._existing = None
+            result.error = str(e)
+            logger.log_err(f"Error loading stats from {path}: {e}")
+        finally:
+            result.elapsed = time.monotonic() - start
+
+        if result.written:
+            from world.wod20th.utils.stat_catalog import STAT_CATALOG
+            STAT_CATALOG.invalidate()
+        return result
@@ -0,0 +1,288 @@
+"""
+Full-text search over Stat name, description, system and source.
+
+On SQLite the text lives in an FTS5 table, ``wod20th_stat_fts``, that
+mirrors ``wod20th_stat``. Triggers keep it current on every insert, update
+and delete, including bulk writes that skip Django signals. On PostgreSQL a
+stored, generated ``search_vector`` tsvector column with a GIN index does
+the same job. Both are created by migration 0006. ``install()`` is
+idempotent and is re-run at server start, because Django rebuilds SQLite
+tables on some schema changes and drops their triggers.
+
+``search_stats()`` returns ranked hits with a highlighted snippet and the
+total match count in one query. Name matches weigh most, then system text,
+then description, then source. Other databases, or a database where the
+index is missing, fall back to a single icontains query.
+
+Usage:
+    from world.wod20th.utils.stat_search import search_stats
+
+    total, hits = search_stats('claws', stat_types=['gift', 'rite'])
+    for hit in hits:
+        hit.stat, hit.snippet
+"""
+import re
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from django.db import connection
+
+STAT_TABLE = "wod20th_stat"
+FTS_TABLE = "wod20th_stat_fts"
+HIGHLIGHT_START = "|y"
+HIGHLIGHT_END = "|n"
+SNIPPET_WORDS = 10
+
+# Column weights, in (name, description, system, source) order
+WEIGHTS = (10.0, 1.0, 2.0, 0.5)
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Vendor -> whether the index exists, checked once per process
+_available = {}
+
+SQLITE_INSTALL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        name, description, system, source,
+        content='{STAT_TABLE}', content_rowid='id',
+        tokenize='porter unicode61'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {STAT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, description, system, source)
+        VALUES (new.id, new.name, new.description, new.system, new.source);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {STAT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description, system, source)
+        VALUES ('delete', old.id, old.name, old.description, old.system, old.source);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON {STAT_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description, system, source)
+        VALUES ('delete', old.id, old.name, old.description, old.system, old.source);
+        INSERT INTO {FTS_TABLE}(rowid, name, description, system, source)
+        VALUES (new.id, new.name, new.description, new.system, new.source);
+    END""",
+]
+
+SQLITE_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+POSTGRES_INSTALL = [
+    f"""ALTER TABLE {STAT_TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(system, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(source, '')), 'D')
+        ) STORED""",
+    f"CREATE INDEX IF NOT EXISTS {STAT_TABLE}_search_gin ON {STAT_TABLE} USING GIN (search_vector)",
+]
+
+POSTGRES_UNINSTALL = [
+    f"DROP INDEX IF EXISTS {STAT_TABLE}_search_gin",
+    f"ALTER TABLE {STAT_TABLE} DROP COLUMN IF EXISTS search_vector",
+]
+
+
+class SearchHit(NamedTuple):
+    """One ranked search result."""
+    stat: object
+    snippet: str
+
+
+def install(conn=None, rebuild=False):
+    """
+    Create the search index for the current database if it is missing.
+
+    Args:
+        conn: Database connection, default connection if omitted.
+        rebuild (bool): Re-read every Stat row into the SQLite index.
+
+    Returns:
+        bool: True if the database has a full-text index afterwards.
+    """
+    conn = conn or connection
+    vendor = conn.vendor
+    with conn.cursor() as cursor:
+        if vendor == "sqlite":
+            try:
+                cursor.execute(
+                    "SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE]
+                )
+                existed = cursor.fetchone()[0]
+                for statement in SQLITE_INSTALL:
+                    cursor.execute(statement)
+                if rebuild or not existed:
+                    cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+            except Exception:
+                # SQLite built without FTS5
+                _available[vendor] = False
+                return False
+        elif vendor == "postgresql":
+            for statement in POSTGRES_INSTALL:
+                cursor.execute(statement)
+        else:
+            _available[vendor] = False
+            return False
+    _available[vendor] = True
+    return True
+
+
+def uninstall(conn=None):
+    """Remove the search index."""
+    conn = conn or connection
+    statements = {"sqlite": SQLITE_UNINSTALL, "postgresql": POSTGRES_UNINSTALL}.get(conn.vendor, [])
+    with conn.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    _available.pop(conn.vendor, None)
+
+
+def is_available() -> bool:
+    """Return True if the current database has the search index."""
+    vendor = connection.vendor
+    if vendor not in _available:
+        with connection.cursor() as cursor:
+            if vendor == "sqlite":
+                cursor.execute(
+                    "SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE]
+                )
+            elif vendor == "postgresql":
+                cursor.execute(
+                    "SELECT count(*) FROM information_schema.columns "
+                    "WHERE table_name = %s AND column_name = 'search_vector'", [STAT_TABLE]
+                )
+            else:
+                _available[vendor] = False
+                return False
+            _available[vendor] = bool(cursor.fetchone()[0])
+    return _available[vendor]
+
+
+def _terms(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _type_filter(stat_types: Optional[Iterable[str]], column: str) -> Tuple[str, list]:
+    if stat_types is None:
+        return "", []
+    stat_types = list(stat_types)
+    if not stat_types:
+        return " AND 0 = 1", []
+    return f" AND {column} IN ({', '.join(['%s'] * len(stat_types))})", stat_types
+
+
+def _sqlite_search(text, terms, stat_types, limit):
+    from world.wod20th.models import Stat
+
+    # Every word must appear; the last may be a prefix of a longer word
+    match = " ".join(f'"{term}"' for term in terms[:-1])
+    match = f'{match} "{terms[-1]}"*'.strip()
+    type_sql, type_params = _type_filter(stat_types, "s.stat_type")
+    # FTS5 auxiliary functions can't share a query level with a window
+    sql = (
+        f"SELECT s.*, hit.search_snippet, COUNT(*) OVER () AS search_total "
+        f"FROM (SELECT rowid AS stat_id, "
+        f"bm25({FTS_TABLE}, {', '.join(str(weight) for weight in WEIGHTS)}) AS search_rank, "
+        f"snippet({FTS_TABLE}, -1, %s, %s, '...', {SNIPPET_WORDS}) AS search_snippet "
+        f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s) hit "
+        f"JOIN {STAT_TABLE} s ON s.id = hit.stat_id "
+        f"WHERE 1 = 1{type_sql} "
+        f"ORDER BY lower(s.name) = %s DESC, hit.search_rank, s.name "
+        f"LIMIT %s"
+    )
+    params = [HIGHLIGHT_START, HIGHLIGHT_END, match, *type_params, text.lower(), limit]
+    return list(Stat.objects.raw(sql, params))
+
+
+def _postgres_search(text, terms, stat_types, limit):
+    from world.wod20th.models import Stat
+
+    query = " & ".join(f"{term}:*" for term in terms)
+    type_sql, type_params = _type_filter(stat_types, "s.stat_type")
+    options = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords={SNIPPET_WORDS}, MinWords=4"
+    sql = (
+        f"SELECT hit.*, ts_headline('english', "
+        f"coalesce(nullif(hit.description, ''), hit.system, hit.name), "
+        f"to_tsquery('english', %s), %s) AS search_snippet "
+        f"FROM (SELECT s.*, COUNT(*) OVER () AS search_total, "
+        f"lower(s.name) = %s AS search_exact, "
+        f"ts_rank(s.search_vector, to_tsquery('english', %s)) AS search_rank "
+        f"FROM {STAT_TABLE} s "
+        f"WHERE s.search_vector @@ to_tsquery('english', %s){type_sql} "
+        f"ORDER BY search_exact DESC, search_rank DESC, s.name LIMIT %s) hit "
+        f"ORDER BY hit.search_exact DESC, hit.search_rank DESC, hit.name"
+    )
+    params = [query, options, text.lower(), query, query, *type_params, limit]
+    return list(Stat.objects.raw(sql, params))
+
+
+def _fallback_snippet(stat, terms):
+    """Highlight the first matched word in a stat's description."""
+    text = stat.description or stat.system or ""
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms if lowered.find(term) >= 0]
+    if not positions:
+        return " ".join(text.split()[:SNIPPET_WORDS])
+    start = min(positions)
+    words_before = text[:start].split()[-3:]
+    words_after = text[start:].split()[:SNIPPET_WORDS - len(words_before)]
+    snippet = " ".join(words_before + words_after)
+    for term in terms:
+        snippet = re.sub(f"({re.escape(term)})", f"{HIGHLIGHT_START}\\1{HIGHLIGHT_END}",
+                         snippet, flags=re.IGNORECASE)
+    return ("..." if words_before else "") + snippet + "..."
+
+
+def _fallback_search(text, terms, stat_types, limit):
+    from django.db.models import Case, Count, IntegerField, Q, Value, When, Window
+    from world.wod20th.models import Stat
+
+    matches = Q()
+    for term in terms:
+        matches &= (Q(name__icontains=term) | Q(description__icontains=term)
+                    | Q(system__icontains=term) | Q(source__icontains=term))
+    queryset = Stat.objects.filter(matches)
+    if stat_types is not None:
+        queryset = queryset.filter(stat_type__in=list(stat_types))
+    queryset = queryset.annotate(
+        search_total=Window(Count("id")),
+        search_rank=Case(
+            When(name__iexact=text, then=Value(0)),
+            When(name__icontains=text, then=Value(1)),
+            When(system__icontains=text, then=Value(2)),
+            default=Value(3),
+            output_field=IntegerField(),
+        ),
+    ).order_by("search_rank", "name")[:limit]
+    hits = list(queryset)
+    for stat in hits:
+        stat.search_snippet = _fallback_snippet(stat, terms)
+    return hits
+
+
+def search_stats(text: str, stat_types: Optional[Iterable[str]] = None,
+                 limit: int = 10) -> Tuple[int, List[SearchHit]]:
+    """
+    Search stats by relevance.
+
+    Args:
+        text (str): Words to look for; all must match, the last as a prefix.
+        stat_types (iterable, optional): Only return these stat types.
+        limit (int): Most hits to return.
+
+    Returns:
+        tuple: (total matches, list of SearchHit), exact name matches first.
+    """
+    terms = _terms(text)
+    if not terms:
+        return 0, []
+    if is_available():
+        search = _sqlite_search if connection.vendor == "sqlite" else _postgres_search
+    else:
+        search = _fallback_search
+    rows = search(text.strip(), terms, stat_types, limit)
+    total = rows[0].search_total if rows else 0
+    return total, [SearchHit(row, row.search_snippet or "") for row in rows]
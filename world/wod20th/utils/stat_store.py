@@ -0,0 +1,243 @@
+"""
+In-memory stat storage for WoD20th characters.
+
+Character sheets live in a single ``stats`` Attribute shaped as
+``{stat_type: {category: {stat_name: {'perm': x, 'temp': y}}}}``. Reading it
+through ``character.db.stats`` unpickles the whole tree on every access and
+every nested write re-pickles it. The StatStore keeps a plain-dict copy of
+the sheet plus a flat (stat_type, category, name) index, serves reads from
+memory and writes the tree back as one Attribute save - immediately, or once
+at the end of a ``batch()``.
+
+Code that still edits ``character.db.stats`` directly keeps working: the
+store notices the Attribute has been saved behind its back and reloads.
+"""
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Dict, NamedTuple, Optional
+
+# Process-wide version counter. Every change to any sheet takes the next
+# value, so a version number is never reused between two characters or two
+# handler instances of the same character.
+_VERSIONS = count(1)
+
+_UNLOADED = object()
+
+
+# Callables run with the character whenever its stored sheet changes
+_listeners = []
+
+
+def add_change_listener(callback):
+    """Register a callable to run with the character after its sheet is saved or reloaded."""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def _notify(obj):
+    for listener in list(_listeners):
+        listener(obj)
+
+
+class StatKey(NamedTuple):
+    """Address of a single stat entry inside a sheet."""
+    stat_type: str
+    category: str
+    name: str
+
+
+class StatStore:
+    """
+    Write-through stat index for one character.
+
+    Usage:
+        store = character.stat_store
+        store.get('abilities', 'talent', 'Alertness')
+        with store.batch():
+            store.set('abilities', 'talent', 'Alertness', 3)
+            store.set('abilities', 'talent', 'Alertness', 3, temp=True)
+    """
+
+    attr_key = "stats"
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.version = 0
+        self._source = _UNLOADED
+        self._stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._index: Dict[StatKey, Any] = {}
+        self._folded: Dict[StatKey, str] = {}
+        self._dirty = False
+        self._batch_depth = 0
+
+    # ------------------------------------------------------------------
+    # Loading and flushing
+    # ------------------------------------------------------------------
+
+    def _attribute(self):
+        """Return the backing Attribute object without unpickling its value."""
+        return self.obj.attributes.get(self.attr_key, return_obj=True)
+
+    def _sync(self):
+        """Reload from the Attribute if it was saved by someone else."""
+        if self._dirty:
+            # Pending local writes win until they are flushed.
+            return
+        attr = self._attribute()
+        source = attr.db_value if attr else None
+        if source is self._source:
+            return
+        self._rebuild(source)
+
+    def _rebuild(self, source):
+        """Build the plain tree and flat indexes from a stored value."""
+        stats = {}
+        index = {}
+        folded = {}
+        if isinstance(source, dict):
+            for stat_type, categories in source.items():
+                if not isinstance(categories, dict):
+                    stats[stat_type] = categories
+                    continue
+                stats[stat_type] = {}
+                for category, entries in categories.items():
+                    if not isinstance(entries, dict):
+                        stats[stat_type][category] = entries
+                        continue
+                    stats[stat_type][category] = {}
+                    for name, entry in entries.items():
+                        if isinstance(entry, dict):
+                            entry = dict(entry)
+                        stats[stat_type][category][name] = entry
+                        index[StatKey(stat_type, category, name)] = entry
+                        if isinstance(name, str):
+                            folded[StatKey(stat_type, category, name.lower())] = name
+        if self._source is not _UNLOADED:
+            # Someone else rewrote the sheet
+            _notify(self.obj)
+        self._stats = stats
+        self._index = index
+        self._folded = folded
+        self._source = source
+        self.version = next(_VERSIONS)
+
+    def _changed(self):
+        """Mark the sheet dirty and write it out unless a batch is open."""
+        self._dirty = True
+        self.version = next(_VERSIONS)
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self):
+        """Write pending changes back to the ``stats`` Attribute in one save."""
+        if not self._dirty:
+            return
+        self.obj.attributes.add(self.attr_key, self._stats)
+        attr = self._attribute()
+        self._source = attr.db_value if attr else None
+        self._dirty = False
+        _notify(self.obj)
+
+    @contextmanager
+    def batch(self):
+        """Defer the Attribute write until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def current_version(self) -> int:
+        """Return the version of the sheet, picking up external writes first."""
+        self._sync()
+        return self.version
+
+    def reload(self):
+        """Drop the in-memory copy and re-read the Attribute on next access."""
+        self._source = _UNLOADED
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        The sheet as a plain nested dict. Treat it as read-only; use
+        set/put/delete so the change is indexed and persisted.
+        """
+        self._sync()
+        return self._stats
+
+    def entry(self, stat_type: str, category: str, name: str) -> Optional[Any]:
+        """Return the raw stored entry for a stat, or None if it is missing."""
+        self._sync()
+        return self._index.get(StatKey(stat_type, category, name))
+
+    def get(self, stat_type: str, category: str, name: str, temp: bool = False, default: Any = 0) -> Any:
+        """Return the perm (or temp) value of a stat."""
+        entry = self.entry(stat_type, category, name)
+        if entry is None:
+            return default
+        if isinstance(entry, dict):
+            return entry.get('temp' if temp else 'perm', default)
+        return entry
+
+    def has(self, stat_type: str, category: str, name: str) -> bool:
+        """Return True if the stat exists on the sheet."""
+        return self.entry(stat_type, category, name) is not None
+
+    def find_name(self, stat_type: str, category: str, name: str) -> Optional[str]:
+        """Return the stored spelling of a stat name, matched case-insensitively."""
+        self._sync()
+        return self._folded.get(StatKey(stat_type, category, name.lower()))
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _bucket(self, stat_type: str, category: str) -> Dict[str, Any]:
+        self._sync()
+        categories = self._stats.get(stat_type)
+        if not isinstance(categories, dict):
+            categories = self._stats[stat_type] = {}
+        bucket = categories.get(category)
+        if not isinstance(bucket, dict):
+            bucket = categories[category] = {}
+        return bucket
+
+    def _store(self, key: StatKey, value: Any):
+        self._bucket(key.stat_type, key.category)[key.name] = value
+        self._index[key] = value
+        self._folded[StatKey(key.stat_type, key.category, key.name.lower())] = key.name
+
+    def set(self, stat_type: str, category: str, name: str, value: Any, temp: bool = False):
+        """Set the perm (or temp) value of a stat, creating it if needed."""
+        key = StatKey(stat_type, category, name)
+        entry = self.entry(*key)
+        if not isinstance(entry, dict):
+            entry = {'perm': 0, 'temp': 0}
+            self._store(key, entry)
+        entry['temp' if temp else 'perm'] = value
+        self._changed()
+
+    def put(self, stat_type: str, category: str, name: str, entry: Any):
+        """Replace a stat entry wholesale."""
+        if isinstance(entry, dict):
+            entry = dict(entry)
+        self._store(StatKey(stat_type, category, name), entry)
+        self._changed()
+
+    def delete(self, stat_type: str, category: str, name: str) -> bool:
+        """Remove a stat. Returns True if it existed."""
+        key = StatKey(stat_type, category, name)
+        if self.entry(*key) is None:
+            return False
+        del self._stats[stat_type][category][name]
+        del self._index[key]
+        self._folded.pop(StatKey(stat_type, category, name.lower()), None)
+        self._changed()
+        return True
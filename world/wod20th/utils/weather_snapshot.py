@@ -0,0 +1,211 @@
+"""
+Shared weather, moon and tide snapshot.
+
++weather used to compute the moon with ephem and call the OpenWeatherMap
+and NOAA APIs on every use, although the answer only changes every few
+minutes and is the same for every player. WeatherRefreshScript now
+refreshes a single WeatherSnapshot every REFRESH_INTERVAL seconds, and
+readers get it from memory.
+
+The last good snapshot is stored in ServerConfig, so a cold start has
+something to show before the first refresh lands. If one of the lookups
+fails, that part keeps its previous value. If the script falls behind,
+the first reader to notice starts a background refresh itself.
+
+Usage:
+    from world.wod20th.utils.weather_snapshot import WEATHER
+
+    WEATHER.moon_phase()                # 'Waxing Gibbous'
+    snapshot = WEATHER.current()
+    snapshot.weather, snapshot.upcoming_tides()
+"""
+import time
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+
+import ephem
+import pytz
+from evennia.utils import logger
+
+TIMEZONE = pytz.timezone('America/Los_Angeles')
+REFRESH_INTERVAL = 600  # 10 minutes
+# Readers refresh the snapshot themselves once it is this old
+STALE_AFTER = REFRESH_INTERVAL * 3
+CONFIG_KEY = "weather_snapshot"
+
+OWM_API_KEY = "549ac137ad7db9fb5d6f68b590d488a6"
+SAN_DIEGO_CITY_ID = "5391811"
+WEATHER_URL = f"http://api.openweathermap.org/data/2.5/weather?id={SAN_DIEGO_CITY_ID}&appid={OWM_API_KEY}&units=imperial"
+FORECAST_URL = f"http://api.openweathermap.org/data/2.5/forecast?id={SAN_DIEGO_CITY_ID}&appid={OWM_API_KEY}&units=imperial"
+TIDE_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter?date=today&station=9410170&product=predictions&datum=STND&time_zone=lst_ldt&interval=hilo&units=english&format=json"
+
+# (upper bound of ephem's Moon.phase, name)
+MOON_PHASES = (
+    (6.25, "New Moon"),
+    (43.75, "Waxing Crescent"),
+    (56.25, "First Quarter"),
+    (93.75, "Waxing Gibbous"),
+    (106.25, "Full Moon"),
+    (143.75, "Waning Gibbous"),
+    (156.25, "Last Quarter"),
+)
+
+
+def moon_phase_name(phase: float) -> str:
+    """Name the moon phase for an ephem Moon.phase value."""
+    for limit, name in MOON_PHASES:
+        if phase < limit:
+            return name
+    return "Waning Crescent"
+
+
+def compute_moon_phase() -> str:
+    """Compute the current moon phase name."""
+    moon = ephem.Moon()
+    moon.compute()
+    return moon_phase_name(moon.phase)
+
+
+def parse_weather(data: dict) -> dict:
+    """Keep the fields +weather shows from an OpenWeatherMap weather reply."""
+    return {
+        'description': data['weather'][0]['description'],
+        'temp': data['main']['temp'],
+        'feels_like': data['main']['feels_like'],
+        'humidity': data['main']['humidity'],
+        'wind_speed': data['wind']['speed'],
+        'wind_deg': data['wind']['deg'],
+        'sunrise': data['sys']['sunrise'],
+        'sunset': data['sys']['sunset'],
+    }
+
+
+def parse_forecast(data: dict) -> dict:
+    """Keep tomorrow's temperature and description from a forecast reply."""
+    tomorrow = data['list'][8]  # Roughly 24 hours from now
+    return {
+        'temp': tomorrow['main']['temp'],
+        'description': tomorrow['weather'][0]['description'],
+    }
+
+
+def parse_tides(data: dict) -> Tuple[Tuple[str, str, float], ...]:
+    """Return today's NOAA tide predictions as (local time, 'H'/'L', feet)."""
+    return tuple(
+        (tide['t'], tide['type'], float(tide['v']))
+        for tide in data.get('predictions', [])
+    )
+
+
+class WeatherSnapshot(NamedTuple):
+    """Everything +weather shows apart from the clock."""
+    refreshed_at: float
+    moon_phase: str
+    weather: Optional[dict] = None
+    forecast: Optional[dict] = None
+    tides: Tuple[Tuple[str, str, float], ...] = ()
+
+    def upcoming_tides(self, count=2, now=None):
+        """Return the next tides as (High/Low, time, height) strings."""
+        now = now or datetime.now(TIMEZONE)
+        upcoming = []
+        for when, kind, height in self.tides:
+            tide_time = TIMEZONE.localize(datetime.strptime(when, "%Y-%m-%d %H:%M"))
+            if tide_time > now:
+                upcoming.append((
+                    "High" if kind == 'H' else "Low",
+                    tide_time.strftime("%I:%M %p"),
+                    f"{height:.1f} ft"
+                ))
+                if len(upcoming) == count:
+                    break
+        return upcoming
+
+
+def _drop_failure(failure, what):
+    logger.log_err(f"Weather refresh: could not read {what}: {failure.getErrorMessage()}")
+    return None
+
+
+class WeatherService:
+    """Holds the current WeatherSnapshot and refreshes it."""
+
+    def __init__(self):
+        self._snapshot = None
+        self._refreshing = None
+
+    def _load(self) -> WeatherSnapshot:
+        """Start from the stored snapshot, with the moon brought up to date."""
+        from evennia.server.models import ServerConfig
+
+        stored = ServerConfig.objects.conf(CONFIG_KEY)
+        if isinstance(stored, dict):
+            try:
+                return WeatherSnapshot(**stored)._replace(moon_phase=compute_moon_phase())
+            except TypeError:
+                pass
+        return WeatherSnapshot(refreshed_at=0, moon_phase=compute_moon_phase())
+
+    def current(self) -> WeatherSnapshot:
+        """Return the latest snapshot, starting a refresh if it is stale."""
+        if self._snapshot is None:
+            self._snapshot = self._load()
+        if time.time() - self._snapshot.refreshed_at > STALE_AFTER:
+            self.refresh()
+        return self._snapshot
+
+    def moon_phase(self) -> str:
+        """Return the current moon phase name."""
+        return self.current().moon_phase
+
+    def refresh(self):
+        """
+        Fetch weather, forecast and tides in the background.
+
+        Returns:
+            Deferred: Fires with the new snapshot. Only one refresh runs at
+                a time; a second call returns the one already running.
+        """
+        if self._refreshing is not None:
+            return self._refreshing
+        from twisted.internet import defer
+        from utils.http_client import fetch_json
+
+        lookups = []
+        for what, url, parse in (("weather", WEATHER_URL, parse_weather),
+                                 ("forecast", FORECAST_URL, parse_forecast),
+                                 ("tides", TIDE_URL, parse_tides)):
+            lookup = fetch_json(url).addCallback(parse)
+            lookups.append(lookup.addErrback(_drop_failure, what))
+        refreshing = defer.gatherResults(lookups)
+        refreshing.addCallback(self._store)
+        refreshing.addErrback(lambda failure: logger.log_err(
+            f"Weather refresh failed: {failure.getErrorMessage()}"))
+        refreshing.addBoth(self._finished)
+        if not refreshing.called:
+            self._refreshing = refreshing
+        return refreshing
+
+    def _finished(self, result):
+        self._refreshing = None
+        return result
+
+    def _store(self, results) -> WeatherSnapshot:
+        """Build the new snapshot, keeping old values for failed lookups."""
+        from evennia.server.models import ServerConfig
+
+        weather, forecast, tides = results
+        previous = self._snapshot or self._load()
+        snapshot = WeatherSnapshot(
+            refreshed_at=time.time(),
+            moon_phase=compute_moon_phase(),
+            weather=weather or previous.weather,
+            forecast=forecast or previous.forecast,
+            tides=tides if tides is not None else previous.tides,
+        )
+        self._snapshot = snapshot
+        ServerConfig.objects.conf(CONFIG_KEY, snapshot._asdict())
+        return snapshot
+
+
+WEATHER = WeatherService()
@@ -0,0 +1,303 @@
+"""
+Batch weekly XP awards for WoD20th.
+
+The weekly award used to walk every character one at a time, with a
+permission check, an Attribute load and a write for each. It now runs in
+three steps:
+
+1. load_candidates() reads every character, its ``xp`` Attribute, and the
+   permission tags of the character and its account in a handful of queries.
+2. plan_weekly_xp() works out eligibility and the new totals in memory.
+   Nothing is written, so the plan doubles as the staff dry-run report.
+3. apply_weekly_xp() writes every award in one transaction. That covers the
+   XP Attributes (one bulk update), the XP ledger entries (one bulk insert)
+   and an XPAwardRun audit record holding the report.
+
+Usage:
+    from world.wod20th.utils.xp_awards import award_weekly_xp, plan_weekly_xp
+
+    plan = plan_weekly_xp()             # dry run
+    print(plan.report())
+    run = award_weekly_xp()             # commit
+"""
+import ast
+from datetime import datetime
+from decimal import Decimal, InvalidOperation, ROUND_DOWN
+from typing import List, NamedTuple, Optional, Tuple
+
+from django.db import transaction
+from evennia.utils import logger
+
+WEEKLY_XP_AMOUNT = Decimal('4.00')
+CHARACTER_TYPECLASS = 'typeclasses.characters.Character'
+XP_FIELDS = ('total', 'current', 'spent', 'ic_xp', 'monthly_spent')
+# Permissions at or above Builder; staff characters get no weekly XP
+STAFF_PERMISSIONS = frozenset((
+    'builder', 'builders', 'admin', 'admins', 'developer', 'developers',
+    'wizard', 'wizards', 'immortal', 'immortals',
+))
+# Recent XP log entries kept in xp['spends']
+SPENDS_KEPT = 10
+BULK_BATCH_SIZE = 500
+
+
+class Candidate(NamedTuple):
+    """A character with its XP Attribute, as loaded for a weekly run."""
+    character: object
+    attribute: Optional[object]
+    is_staff: bool
+
+
+class PlannedAward(NamedTuple):
+    """One character's award and the XP data it will have afterwards."""
+    character: object
+    attribute: object
+    before: dict
+    after: dict
+
+
+class WeeklyXPPlan:
+    """The outcome of a weekly XP pass, before anything is written."""
+
+    def __init__(self, amount=WEEKLY_XP_AMOUNT):
+        self.amount = amount
+        self.checked = 0
+        self.awards: List[PlannedAward] = []
+        self.ineligible: List[Tuple[str, dict]] = []
+        self.issues: List[Tuple[str, str]] = []
+
+    @property
+    def total_xp(self) -> Decimal:
+        return self.amount * len(self.awards)
+
+    def report(self, detailed=True) -> str:
+        """Return the staff report, in the format +xp/forceweekly has always shown."""
+        lines = [f"\nChecking {self.checked} characters for weekly XP eligibility...", "=" * 60]
+        if detailed:
+            for award in self.awards:
+                lines.extend(_describe(award.character.key, award.before))
+                lines.append(f"Status: ELIGIBLE for {self.amount} XP")
+                lines.append(f"Current XP: {award.before['current']}")
+                lines.append(f"Would receive: +{self.amount} XP")
+                lines.append(f"New total would be: {award.after['current']}")
+            for name, xp_data in self.ineligible:
+                lines.extend(_describe(name, xp_data))
+                lines.append("Status: NOT ELIGIBLE - No scenes this week")
+        if self.issues:
+            lines.append("\n" + "=" * 60)
+            lines.append("Characters with Data Issues:")
+            for name, issue in self.issues:
+                lines.append(f"- {name}: {issue}")
+        lines.append("\n" + "=" * 60)
+        lines.append("Summary:")
+        lines.append(f"- {len(self.awards)} characters eligible for weekly XP")
+        lines.append(f"- {len(self.issues)} characters with data issues")
+        lines.append(f"- Total XP that would be awarded: {self.total_xp}")
+        return "\n".join(lines)
+
+
+def _describe(name, xp_data):
+    last_scene = xp_data.get('last_scene')
+    if isinstance(last_scene, str):
+        try:
+            last_scene = datetime.fromisoformat(last_scene)
+        except ValueError:
+            last_scene = None
+    return [
+        f"\nCharacter: {name}",
+        f"Scenes this week: {xp_data.get('scenes_this_week', 0)}",
+        f"Last scene: {last_scene.strftime('%Y-%m-%d %H:%M') if isinstance(last_scene, datetime) else 'Never'}",
+    ]
+
+
+def _as_decimal(value) -> Decimal:
+    try:
+        return Decimal(str(value if value is not None else 0)).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
+    except (InvalidOperation, ValueError):
+        return Decimal('0.00')
+
+
+def parse_xp_data(value) -> dict:
+    """
+    Return XP data as a plain dict with Decimal amounts.
+
+    Old characters may hold the repr of the dict as a string; those are
+    parsed too. Raises ValueError for anything else.
+    """
+    if isinstance(value, str):
+        cleaned = value.replace("Decimal('", "'").replace("')", "'")
+        try:
+            value = ast.literal_eval(cleaned)
+        except (SyntaxError, ValueError) as err:
+            raise ValueError(f"Invalid XP data format: {err}")
+    if not isinstance(value, dict):
+        raise ValueError("XP data is not a dictionary")
+    xp_data = dict(value)
+    for key in XP_FIELDS:
+        if key in xp_data:
+            xp_data[key] = _as_decimal(xp_data[key])
+    return xp_data
+
+
+def load_candidates() -> List[Candidate]:
+    """
+    Load every character with its XP Attribute and staff status.
+
+    Five queries regardless of how many characters there are: characters,
+    their xp Attributes, character permission tags, account permission
+    tags and superuser flags.
+    """
+    from evennia.accounts.models import AccountDB
+    from evennia.objects.models import ObjectDB
+
+    characters = list(ObjectDB.objects.filter(db_typeclass_path__contains=CHARACTER_TYPECLASS))
+    in_scope = {'objectdb__db_typeclass_path__contains': CHARACTER_TYPECLASS}
+
+    attributes = {
+        row.objectdb_id: row.attribute
+        for row in ObjectDB.db_attributes.through.objects.filter(
+            attribute__db_key='xp', attribute__db_category__isnull=True, **in_scope
+        ).select_related('attribute')
+    }
+
+    staff_ids = set(
+        ObjectDB.db_tags.through.objects.filter(
+            tag__db_category='permission', tag__db_key__in=STAFF_PERMISSIONS, **in_scope
+        ).values_list('objectdb_id', flat=True)
+    )
+    account_ids = {char.db_account_id for char in characters if char.db_account_id}
+    staff_accounts = set()
+    if account_ids:
+        staff_accounts.update(
+            AccountDB.db_tags.through.objects.filter(
+                accountdb_id__in=account_ids,
+                tag__db_category='permission', tag__db_key__in=STAFF_PERMISSIONS,
+            ).values_list('accountdb_id', flat=True)
+        )
+        staff_accounts.update(
+            AccountDB.objects.filter(id__in=account_ids, is_superuser=True).values_list('id', flat=True)
+        )
+
+    return [
+        Candidate(
+            character=char,
+            attribute=attributes.get(char.id),
+            is_staff=char.id in staff_ids or char.db_account_id in staff_accounts,
+        )
+        for char in characters
+    ]
+
+
+def plan_weekly_xp(candidates: Optional[List[Candidate]] = None,
+                   amount: Decimal = WEEKLY_XP_AMOUNT, now: Optional[datetime] = None) -> WeeklyXPPlan:
+    """
+    Work out who gets weekly XP, without writing anything.
+
+    Args:
+        candidates (list, optional): From load_candidates(); loaded if omitted.
+        amount (Decimal): XP each eligible character receives.
+        now (datetime, optional): Timestamp for the award log entries.
+    """
+    from evennia.utils.dbserialize import from_pickle
+
+    if candidates is None:
+        candidates = load_candidates()
+    now = now or datetime.now()
+    plan = WeeklyXPPlan(amount)
+    for candidate in candidates:
+        if candidate.is_staff:
+            continue
+        plan.checked += 1
+        name = candidate.character.key
+        if candidate.attribute is None or not candidate.attribute.db_value:
+            plan.issues.append((name, "No XP data found"))
+            continue
+        try:
+            before = parse_xp_data(from_pickle(candidate.attribute.db_value))
+        except ValueError as err:
+            plan.issues.append((name, str(err)))
+            continue
+        if not before.get('scenes_this_week', 0):
+            plan.ineligible.append((name, before))
+            continue
+
+        after = dict(before)
+        after['total'] = before.get('total', Decimal('0.00')) + amount
+        after['current'] = before.get('current', Decimal('0.00')) + amount
+        after['ic_xp'] = before.get('ic_xp', Decimal('0.00')) + amount
+        after['scenes_this_week'] = 0
+        entry = {
+            'type': 'receive',
+            'amount': float(amount),
+            'reason': 'Weekly Activity',
+            'approved_by': 'System',
+            'timestamp': now.isoformat(),
+        }
+        after['spends'] = ([entry] + list(before.get('spends') or []))[:SPENDS_KEPT]
+        plan.awards.append(PlannedAward(candidate.character, candidate.attribute, before, after))
+    return plan
+
+
+def apply_weekly_xp(plan: WeeklyXPPlan, awarded_by: str = "System", notify: bool = True):
+    """
+    Write a plan's awards in one transaction.
+
+    Returns:
+        XPAwardRun: The audit record of the run.
+    """
+    from evennia.typeclasses.attributes import Attribute
+    from evennia.utils.dbserialize import to_pickle
+    from world.wod20th.models import XPAwardRun, XPLedgerEntry
+
+    with transaction.atomic():
+        attributes = []
+        entries = []
+        for award in plan.awards:
+            award.after['spends'][0]['approved_by'] = awarded_by
+            # The same cached Attribute instance the character's handler uses
+            award.attribute.db_value = to_pickle(award.after)
+            attributes.append(award.attribute)
+            entries.append(XPLedgerEntry(
+                character_id=award.character.id,
+                event='receive',
+                amount=plan.amount,
+                reason='Weekly Activity',
+                total=award.after['total'],
+                current=award.after['current'],
+                spent=award.after.get('spent', Decimal('0.00')),
+                ic_xp=award.after['ic_xp'],
+                scenes_this_week=0,
+            ))
+        Attribute.objects.bulk_update(attributes, ['db_value'], batch_size=BULK_BATCH_SIZE)
+        XPLedgerEntry.objects.bulk_create(entries, batch_size=BULK_BATCH_SIZE)
+        run = XPAwardRun.objects.create(
+            awarded_by=awarded_by[:255],
+            amount=plan.amount,
+            awarded_count=len(plan.awards),
+            total_xp=plan.total_xp,
+            issue_count=len(plan.issues),
+            report=plan.report(detailed=False),
+        )
+        if notify:
+            transaction.on_commit(lambda: _notify(plan))
+
+    logger.log_info(f"Weekly XP: awarded {plan.amount} XP to {len(plan.awards)} characters (run {run.id})")
+    return run
+
+
+def _notify(plan: WeeklyXPPlan):
+    for award in plan.awards:
+        character = award.character
+        if character.sessions.count():
+            character.msg(f"|gYou received {plan.amount} XP for Weekly Activity.|n")
+
+
+def award_weekly_xp(awarded_by: str = "System", amount: Decimal = WEEKLY_XP_AMOUNT) -> Tuple[WeeklyXPPlan, object]:
+    """
+    Load, plan and commit a weekly XP run.
+
+    Returns:
+        tuple: (WeeklyXPPlan, XPAwardRun)
+    """
+    plan = plan_weekly_xp(amount=amount)
+    return plan, apply_weekly_xp(plan, awarded_by=awarded_by)
@@ -0,0 +1,74 @@
+"""
+XP change ledger for WoD20th.
+
+Every XP mutation appends an XPLedgerEntry with the amount and a snapshot of
+the character's XP totals afterwards. Consumers such as XPMonitor read the
+entries past their last-seen id instead of scanning every character.
+"""
+from decimal import Decimal
+from evennia.utils import logger
+
+
+def _as_decimal(value):
+    try:
+        return Decimal(str(value or 0)).quantize(Decimal('0.01'))
+    except Exception:
+        return Decimal('0.00')
+
+
+def record_xp_event(character, event, amount, reason=""):
+    """
+    Append an XP change to the ledger.
+
+    Args:
+        character (Character): The character whose XP changed.
+        event (str): One of 'receive', 'award', 'spend' or 'deduct'.
+        amount (Decimal or float): Amount of XP involved.
+        reason (str): Why the XP changed.
+
+    Returns:
+        XPLedgerEntry or None: The new entry, or None if it could not be written.
+    """
+    from world.wod20th.models import XPLedgerEntry
+
+    try:
+        xp = character.attributes.get('xp') or {}
+        return XPLedgerEntry.objects.create(
+            character=character,
+            event=event,
+            amount=_as_decimal(amount),
+            reason=(reason or "")[:255],
+            total=_as_decimal(xp.get('total')),
+            current=_as_decimal(xp.get('current')),
+            spent=_as_decimal(xp.get('spent')),
+            ic_xp=_as_decimal(xp.get('ic_xp')),
+            scenes_this_week=xp.get('scenes_this_week', 0) or 0,
+        )
+    except Exception as e:
+        logger.log_err(f"Could not record XP {event} for {character.key}: {e}")
+        return None
+
+
+def get_xp_events_since(last_id, limit=500):
+    """
+    Return ledger entries newer than last_id, oldest first.
+
+    Args:
+        last_id (int): Id of the last entry already processed.
+        limit (int): Maximum number of entries to return.
+    """
+    from world.wod20th.models import XPLedgerEntry
+
+    return list(
+        XPLedgerEntry.objects.filter(id__gt=last_id or 0)
+        .select_related('character')
+        .order_by('id')[:limit]
+    )
+
+
+def get_latest_xp_event_id():
+    """Return the id of the newest ledger entry, or 0 if there are none."""
+    from world.wod20th.models import XPLedgerEntry
+
+    latest = XPLedgerEntry.objects.order_by('-id').values_list('id', flat=True).first()
+    return latest or 0
@@ -29,6 +29,8 @@ from world.wod20th.utils.mortalplus_utils import calculate_kinfolk_gift_cost
 from world.wod20th.utils.possessed_utils import calculate_possessed_gift_cost
 
 from world.wod20th.utils.ritual_data import THAUMATURGY_RITUALS, NECROMANCY_RITUALS
+from world.wod20th.utils.xp_ledger import record_xp_event
+from world.wod20th.utils.stat_catalog import STAT_CATALOG
 
 from world.wod20th.utils.xp_costs import (
     # General costs
@@ -1062,23 +1064,16 @@ def process_xp_purchase(character, stat_name, new_rating, category=None, subcate
                     return False, error, cost_decimal
             elif subcategory == 'gift':
                 # Special handling for gifts with canonical names
-                from world.wod20th.models import Stat
-                from django.db.models import Q
-                
                 # More flexible search for special characters like apostrophes
                 # First try for exact or partial match on canonical name
-                gift = Stat.objects.filter(
-                    name__iexact=stat_name,
-                    category='powers',
-                    stat_type='gift'
-                ).first()
+                gift = STAT_CATALOG.get(stat_name, category='powers', stat_type='gift')
                 
                 # If not found by exact match, try a similar name search
                 if not gift and len(stat_name) > 3:
                     import difflib
                     
                     # Get possible matches
-                    potential_matches = Stat.objects.filter(
+                    potential_matches = STAT_CATALOG.filter(
                         category='powers',
                         stat_type='gift'
                     )
@@ -1101,7 +1096,7 @@ def process_xp_purchase(character, stat_name, new_rating, category=None, subcate
                     import difflib
                     
                     # Search for gifts with matching alias
-                    all_gifts = Stat.objects.filter(
+                    all_gifts = STAT_CATALOG.filter(
                         category='powers',
                         stat_type='gift'
                     )
@@ -1199,9 +1194,8 @@ def process_xp_purchase(character, stat_name, new_rating, category=None, subcate
 
 def get_power_type(stat_name):
     """Determine power type from name."""
-    # Get the stat from the database using lazy loading
-    from world.wod20th.models import Stat
-    stat = Stat.objects.filter(name=stat_name).first()
+    # Get the stat from the stat catalog
+    stat = next((s for s in STAT_CATALOG.filter(name=stat_name) if s.name == stat_name), None)
     if stat:
         return stat.stat_type
     return None
@@ -1319,9 +1313,8 @@ def can_buy_stat(self, stat_name, new_rating, category=None):
 
 def _get_power_type(self, stat_name):
     """Helper method to determine power type from name."""
-    # Get the stat from the database
-    from world.wod20th.models import Stat
-    stat = Stat.objects.filter(name=stat_name).first()
+    # Get the stat from the stat catalog
+    stat = next((s for s in STAT_CATALOG.filter(name=stat_name) if s.name == stat_name), None)
     if stat:
         return stat.stat_type
     return None
@@ -1828,9 +1821,6 @@ def _determine_stat_category(stat_name):
         return ('powers', 'sphere')
     
     # Check the database for a gift with this name
-    from world.wod20th.models import Stat
-    from django.db.models import Q
-    
     # Check for Changeling Arts first (to take precedence over gifts with similar names)
     CHANGELING_ARTS = ['Autumn', 'Chicanery', 'Chronos', 'Contract', "Dragon's Ire", 'Legerdemain', 'Metamorphosis', 'Naming', 
                        'Oneiromancy', 'Primal', 'Pyretics', 'Skycraft', 'Soothsay', 'Sovereign', 'Spring', 'Summer', 'Wayfare', 'Winter',
@@ -1842,17 +1832,13 @@ def _determine_stat_category(stat_name):
     if stat_name.lower() == "mother's touch":
         return ('powers', 'gift')
         
-    # Check for gifts in database
-    gift = Stat.objects.filter(
-        (Q(name__iexact=stat_name) | Q(gift_alias__icontains=stat_name)),
-        category='powers',
-        stat_type='gift'
-    ).first()
+    # Check for gifts in the stat catalog
+    gift = STAT_CATALOG.get_gift(stat_name)
     
     # If not found by exact name, check aliases but be more precise
     if not gift:
         # For aliases, we need to be careful not to match partial words
-        gifts = Stat.objects.filter(
+        gifts = STAT_CATALOG.filter(
             category='powers',
             stat_type='gift'
         )
@@ -2016,14 +2002,7 @@ def calculate_gift_cost(character, gift_name, new_rating, current_rating=None):
         logger.log_info(f"Gift '{gift_name}' is not a general gift for {shifter_type}. Using standard cost calculation.")
     
         # Get the gift details from the database
-        from world.wod20th.models import Stat
-        from django.db.models import Q
-        
-        gift = Stat.objects.filter(
-            Q(name__iexact=gift_name) | Q(gift_alias__icontains=gift_name),
-            category='powers',
-            stat_type='gift'
-        ).first()
+        gift = STAT_CATALOG.get_gift(gift_name)
         
         if gift:
             logger.log_info(f"Found gift in database: {gift.name}")
@@ -2127,122 +2106,10 @@ def check_weekly_xp_eligibility():
     Check all characters for weekly XP eligibility.
     Returns a tuple of (eligible_count, total_xp_to_award, detailed_report)
     """
-    # Find all character objects
-    characters = ObjectDB.objects.filter(
-        db_typeclass_path__contains='typeclasses.characters.Character'
-    )
-    
-    report_lines = []
-    report_lines.append(f"\nChecking {len(characters)} characters for weekly XP eligibility...")
-    report_lines.append("=" * 60)
-    
-    eligible_count = 0
-    error_count = 0
-    base_xp = Decimal('4.00')
-    
-    # Track characters with data issues
-    data_issues = []
-    
-    for char in characters:
-        try:
-            # Skip if character is staff
-            if hasattr(char, 'check_permstring') and char.check_permstring("builders"):
-                continue
-                
-            # Get character's XP data
-            xp_data = None
-            if hasattr(char, 'db') and hasattr(char.db, 'xp'):
-                xp_data = char.db.xp
-            if not xp_data:
-                xp_data = char.attributes.get('xp')
-                
-            if not xp_data:
-                report_lines.append(f"{char.key}: No XP data found")
-                data_issues.append((char.key, "No XP data found"))
-                continue
-                
-            # Handle string XP data
-            if isinstance(xp_data, str):
-                try:
-                    # First try to clean up the string for evaluation
-                    cleaned_str = xp_data.replace("Decimal('", "'")
-                    cleaned_str = cleaned_str.replace("')", "'")
-                    
-                    # Try to parse the cleaned string
-                    parsed_data = ast.literal_eval(cleaned_str)
-                    
-                    # Convert string values back to Decimal objects
-                    if isinstance(parsed_data, dict):
-                        for key in ['total', 'current', 'spent', 'ic_xp', 'monthly_spent']:
-                            if key in parsed_data and isinstance(parsed_data[key], str):
-                                parsed_data[key] = Decimal(parsed_data[key])
-                        xp_data = parsed_data
-                    else:
-                        raise ValueError("Parsed data is not a dictionary")
-                except Exception as e:
-                    error_msg = f"Invalid XP data format: {str(e)}"
-                    report_lines.append(f"{char.key}: {error_msg}")
-                    data_issues.append((char.key, error_msg))
-                    error_count += 1
-                    continue
-            
-            # Check scenes this week
-            scenes_this_week = xp_data.get('scenes_this_week', 0)
-            
-            # Get last scene time
-            last_scene = None
-            if xp_data.get('last_scene'):
-                try:
-                    last_scene = datetime.fromisoformat(xp_data['last_scene'])
-                except (ValueError, TypeError):
-                    last_scene = None
-            
-            # Add character status to report
-            report_lines.append(f"\nCharacter: {char.key}")
-            report_lines.append(f"Scenes this week: {scenes_this_week}")
-            report_lines.append(f"Last scene: {last_scene.strftime('%Y-%m-%d %H:%M') if last_scene else 'Never'}")
-            
-            # Check eligibility
-            if scenes_this_week > 0:
-                eligible_count += 1
-                report_lines.append(f"Status: ELIGIBLE for {base_xp} XP")
-                
-                # Calculate what their new totals would be
-                try:
-                    current = Decimal(str(xp_data.get('current', '0.00')))
-                    total = Decimal(str(xp_data.get('total', '0.00')))
-                    ic_xp = Decimal(str(xp_data.get('ic_xp', '0.00')))
-                    
-                    report_lines.append(f"Current XP: {current}")
-                    report_lines.append(f"Would receive: +{base_xp} XP")
-                    report_lines.append(f"New total would be: {current + base_xp}")
-                except Exception as e:
-                    error_msg = f"Error calculating XP totals: {str(e)}"
-                    report_lines.append(error_msg)
-                    data_issues.append((char.key, error_msg))
-            else:
-                report_lines.append("Status: NOT ELIGIBLE - No scenes this week")
-                
-        except Exception as e:
-            error_msg = f"Unexpected error processing character: {str(e)}"
-            report_lines.append(f"{char.key}: {error_msg}")
-            data_issues.append((char.key, error_msg))
-            error_count += 1
-    
-    # Add data issues summary to report
-    if data_issues:
-        report_lines.append("\n" + "=" * 60)
-        report_lines.append("Characters with Data Issues:")
-        for char_name, issue in data_issues:
-            report_lines.append(f"- {char_name}: {issue}")
-    
-    report_lines.append("\n" + "=" * 60)
-    report_lines.append(f"Summary:")
-    report_lines.append(f"- {eligible_count} characters eligible for weekly XP")
-    report_lines.append(f"- {error_count} characters with data issues")
-    report_lines.append(f"- Total XP that would be awarded: {base_xp * eligible_count}")
-    
-    return eligible_count, base_xp * eligible_count, "\n".join(report_lines)
+    from world.wod20th.utils.xp_awards import plan_weekly_xp
+
+    plan = plan_weekly_xp()
+    return len(plan.awards), plan.total_xp, plan.report()
 
 def _check_shifter_gift_match(character, gift_data, shifter_type):
     """Helper function to check if a gift matches a shifter's breed/auspice/tribe.
@@ -2877,15 +2744,8 @@ def process_xp_spend(character, stat_name, new_rating, category=None, subcategor
         # Special handling for gifts - check if this is an alias
         canonical_gift_name = None
         if category == 'powers' and subcategory == 'gift':
-            from world.wod20th.models import Stat
-            from django.db.models import Q
-            
             # Try to find the gift by name or alias
-            gift = Stat.objects.filter(
-                Q(name__iexact=stat_name) | Q(gift_alias__icontains=stat_name),
-                category='powers',
-                stat_type='gift'
-            ).first()
+            gift = STAT_CATALOG.get_gift(stat_name)
             
             if gift and gift.name.lower() != stat_name.lower():
                 # We found a gift by alias
@@ -2894,11 +2754,7 @@ def process_xp_spend(character, stat_name, new_rating, category=None, subcategor
                 
             # Special validation for gifts - check if level is valid
             gift_name_to_check = canonical_gift_name or stat_name
-            gift_to_validate = Stat.objects.filter(
-                name__iexact=gift_name_to_check,
-                category='powers',
-                stat_type='gift'
-            ).first()
+            gift_to_validate = STAT_CATALOG.get(gift_name_to_check, category='powers', stat_type='gift')
             
             if gift_to_validate:
                 # Check for shifter-specific level restrictions
@@ -3075,7 +2931,7 @@ def get_canonical_stat_name(self, stat_name: str) -> str:
             instance = stat_name.split('(', 1)[1].split(')', 1)[0].strip()
         
         # First try direct exact match
-        stat = Stat.objects.filter(name__iexact=base_name).first()
+        stat = STAT_CATALOG.get(base_name)
         
         # If not found, try partial match
         if not stat:
@@ -3277,26 +3133,15 @@ def get_proper_stat_name(stat_name, category=None, subcategory=None, character=N
                 else:
                     stat_name = ""
             
-            # Use the database to validate and get the proper case
-            from world.wod20th.models import Stat
-            from django.db.models import Q
-            
+            # Use the stat catalog to validate and get the proper case
             # Check for an exact match first
-            exact_match = Stat.objects.filter(
-                name__iexact=stat_name,
-                category='powers',
-                stat_type='gift'
-            ).first()
+            exact_match = STAT_CATALOG.get(stat_name, category='powers', stat_type='gift')
             
             if exact_match:
                 return exact_match.name
                 
             # If no exact match, try alias matching
-            alias_match = Stat.objects.filter(
-                gift_alias__icontains=stat_name,
-                category='powers',
-                stat_type='gift'
-            ).first()
+            alias_match = STAT_CATALOG.get_gift(stat_name)
             
             if alias_match:
                 return alias_match.name
@@ -3604,6 +3449,7 @@ def deduct_xp_and_log(character, cost, stat_name, current_rating, new_rating, re
         # Add the spend to the log
         character.db.xp['spends'].insert(0, spend_entry)
         
+        record_xp_event(character, 'deduct', cost_decimal, reason or f"{stat_name} {current_rating} -> {new_rating}")
         return True, f"Successfully deducted {cost_decimal} XP for {stat_name}"
         
     except Exception as e: